@@ -1,29 +1,139 @@
 """AutoCare API client library."""
 
-from autocare.client import (
-    AutoCareAPI,
-    create_client,
-    AutoCareError,
-    AuthenticationError,
-    APIConnectionError,
-    APIResponseError,
-    DataValidationError,
-    PaginationError,
-    DatabaseInfo,
-    TableInfo,
-    APIResponse,
-)
-
-from autocare.databases import vcdb, pcdb, padb, qdb, brand
-from autocare.databases.base import BaseModel, VersionedModel, CulturedModel
-
-from autocare.standards import aces, pies
-
-from autocare.compatibility.field_mapping import (
-    migrate_aces_record,
-    migrate_vcdb_record,
-    migrate_padb_record,
-)
+import importlib
+import logging
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+if TYPE_CHECKING:
+    from autocare.client import (
+        AutoCareAPI,
+        create_client,
+        AutoCareError,
+        AuthenticationError,
+        APIConnectionError,
+        APIResponseError,
+        DataValidationError,
+        PaginationError,
+        DatabaseInfo,
+        TableInfo,
+        APIResponse,
+    )
+
+    from autocare.hooks import ClientHooks
+    from autocare.http_cache import HTTPCache
+    from autocare.lookup_cache import LookupCache
+    from autocare.metadata_cache import MetadataCache
+    from autocare.metrics import MetricsCollector
+    from autocare.stats import FetchStats
+
+    from autocare.databases import vcdb, pcdb, padb, qdb, brand
+    from autocare.databases.base import BaseModel, VersionedModel, CulturedModel
+
+    from autocare.standards import aces, pies
+
+    from autocare.compatibility.field_mapping import (
+        migrate_aces_record,
+        migrate_vcdb_record,
+        migrate_padb_record,
+        migrate_aces_records,
+        migrate_vcdb_records,
+        migrate_padb_records,
+        migrate_columns,
+    )
+
+# Library logging stays silent unless the application configures handlers
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+# Public name -> module it is imported from on first access, so that
+# "import autocare" does not pull in requests and every model module
+_LAZY: Dict[str, str] = {
+    **dict.fromkeys(
+        [
+            "AutoCareAPI",
+            "create_client",
+            "AutoCareError",
+            "AuthenticationError",
+            "APIConnectionError",
+            "APIResponseError",
+            "DataValidationError",
+            "PaginationError",
+            "DatabaseInfo",
+            "TableInfo",
+            "APIResponse",
+        ],
+        "autocare.client",
+    ),
+    "ClientHooks": "autocare.hooks",
+    "HTTPCache": "autocare.http_cache",
+    "LookupCache": "autocare.lookup_cache",
+    "MetadataCache": "autocare.metadata_cache",
+    "MetricsCollector": "autocare.metrics",
+    "FetchStats": "autocare.stats",
+    **dict.fromkeys(
+        ["BaseModel", "VersionedModel", "CulturedModel"], "autocare.databases.base"
+    ),
+    **dict.fromkeys(
+        [
+            "migrate_aces_record",
+            "migrate_vcdb_record",
+            "migrate_padb_record",
+            "migrate_aces_records",
+            "migrate_vcdb_records",
+            "migrate_padb_records",
+            "migrate_columns",
+        ],
+        "autocare.compatibility.field_mapping",
+    ),
+}
+
+# Submodules exported by name
+_LAZY_MODULES: Dict[str, str] = {
+    "vcdb": "autocare.databases.vcdb",
+    "pcdb": "autocare.databases.pcdb",
+    "padb": "autocare.databases.padb",
+    "qdb": "autocare.databases.qdb",
+    "brand": "autocare.databases.brand",
+    "aces": "autocare.standards.aces",
+    "pies": "autocare.standards.pies",
+}
+
+# Subpackages "import autocare" used to load, with the modules it loaded in
+# them; imported on first attribute access so "autocare.databases.vcdb"
+# still works after a bare "import autocare"
+_SUBPACKAGES: Dict[str, Tuple[str, ...]] = {
+    "client": (),
+    "compatibility": ("autocare.compatibility.field_mapping",),
+    "databases": (
+        "autocare.databases.base",
+        "autocare.databases.vcdb",
+        "autocare.databases.pcdb",
+        "autocare.databases.padb",
+        "autocare.databases.qdb",
+        "autocare.databases.brand",
+    ),
+    "standards": ("autocare.standards.aces", "autocare.standards.pies"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name on first access and cache it on the package."""
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name]), name)
+    elif name in _LAZY_MODULES:
+        value = importlib.import_module(_LAZY_MODULES[name])
+    elif name in _SUBPACKAGES:
+        for module in _SUBPACKAGES[name]:
+            importlib.import_module(module)
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     # Client
@@ -40,6 +150,14 @@ __all__ = [
     "DatabaseInfo",
     "TableInfo",
     "APIResponse",
+    # Caching
+    "HTTPCache",
+    "LookupCache",
+    "MetadataCache",
+    # Instrumentation
+    "ClientHooks",
+    "MetricsCollector",
+    "FetchStats",
     # Base models
     "BaseModel",
     "VersionedModel",
@@ -57,4 +175,8 @@ __all__ = [
     "migrate_aces_record",
     "migrate_vcdb_record",
     "migrate_padb_record",
+    "migrate_aces_records",
+    "migrate_vcdb_records",
+    "migrate_padb_records",
+    "migrate_columns",
 ]
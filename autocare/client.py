@@ -8,16 +8,40 @@ with proper error handling, logging, and type safety.
 
 import json
 import logging
+import os
 import time
-from typing import Dict, List, Optional, Any, Iterator, Type
-from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Any,
+    Iterator,
+    Type,
+    Union,
+)
+from dataclasses import asdict, dataclass
 import requests
 from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+
+from autocare.hooks import (
+    ClientHooks,
+    HookedRetry,
+    PageEvent,
+    RequestEvent,
+    RetryEvent,
+    emit,
+    host_of,
+)
+from autocare.metadata_cache import DEFAULT_TTL, MetadataCache
+from autocare.profiling import Profiler, enable_profiling, get_profiler
+from autocare.stats import FetchStats
+
+if TYPE_CHECKING:
+    from autocare.http_cache import CachedResponse, HTTPCache
 
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -77,6 +101,16 @@ class TableInfo:
     columns: Optional[List[str]] = None
 
 
+def _database_index(rows: List[Dict[str, Any]]) -> Dict[str, "DatabaseInfo"]:
+    """Rebuild a cached name -> DatabaseInfo mapping."""
+    return {row["name"]: DatabaseInfo(**row) for row in rows}
+
+
+def _table_index(rows: List[Dict[str, Any]]) -> Dict[str, "TableInfo"]:
+    """Rebuild a cached name -> TableInfo mapping."""
+    return {row["name"]: TableInfo(**row) for row in rows}
+
+
 @dataclass
 class APIResponse:
     """Standardized API response wrapper."""
@@ -102,6 +136,7 @@ class AutoCareAPI:
 
     BASE_URL = "https://common.autocarevip.com/api/v1.0"
     AUTH_URL = "https://autocare-identity.autocare.org/connect/token"
+    RECORD_URL = "https://{subdomain}.autocarevip.com/api/v{version}/{db}/{table}"
     DEFAULT_SCOPE = "CommonApis QDBApis PcadbApis BrandApis VcdbApis offline_access"
     DEFAULT_TIMEOUT = 30
     DEFAULT_RETRIES = 3
@@ -132,6 +167,12 @@ class AutoCareAPI:
         base_url: Optional[str] = None,
         auth_url: Optional[str] = None,
         api_versions: Optional[Dict[str, str]] = None,
+        http_cache: Optional[Union["HTTPCache", str, os.PathLike]] = None,
+        metadata_ttl: float = DEFAULT_TTL,
+        metadata_cache_path: Optional[Union[str, os.PathLike]] = None,
+        hooks: Optional[Iterable[ClientHooks]] = None,
+        profile: Optional[Union[bool, str, os.PathLike, Profiler]] = None,
+        record_url: Optional[str] = None,
     ):
         """
         Initialize the AutoCare API client.
@@ -147,6 +188,21 @@ class AutoCareAPI:
             base_url: Override default base URL
             auth_url: Override default auth URL
             api_versions: Per-database API version overrides
+            http_cache: HTTPCache, or a path to open one at, for
+                        revalidating GET responses with ETag /
+                        Last-Modified instead of downloading them again
+            metadata_ttl: Seconds database / table listings are cached;
+                          0 disables the metadata cache
+            metadata_cache_path: JSON file to persist the metadata cache in
+            hooks: ClientHooks instances notified of requests, retries,
+                   pages and authentications (e.g. a MetricsCollector)
+            profile: Profiling mode (see autocare.profiling): True or a
+                     report directory turns it on for the process, a
+                     Profiler is used for this client's fetches only, False
+                     turns it off for this client; None follows
+                     AUTOCARE_PROFILE
+            record_url: Override the record URL template; "{subdomain}",
+                        "{version}", "{db}" and "{table}" are filled in
         """
         self.client_id = client_id
         self.client_secret = client_secret
@@ -157,12 +213,48 @@ class AutoCareAPI:
 
         self.base_url = base_url or self.BASE_URL
         self.auth_url = auth_url or self.AUTH_URL
+        self.record_url = record_url or self.RECORD_URL
 
         # Merge custom api_versions over defaults
         self.api_versions = dict(self.DEFAULT_API_VERSIONS)
         if api_versions:
             self.api_versions.update(api_versions)
 
+        # Conditional-request cache; closed with the client if opened here.
+        # Its module (and sqlite3) is only imported when a cache is asked for
+        self._owns_http_cache = False
+        self.http_cache: Optional["HTTPCache"] = None
+        if http_cache is not None:
+            from autocare.http_cache import HTTPCache
+
+            if isinstance(http_cache, HTTPCache):
+                self.http_cache = http_cache
+            else:
+                self.http_cache = HTTPCache(http_cache)
+                self._owns_http_cache = True
+
+        # Catalog listings (list_databases / list_tables) with a TTL
+        self.metadata_cache = MetadataCache(metadata_ttl, metadata_cache_path)
+
+        # Instrumentation hooks (see autocare.hooks)
+        self.hooks: List[ClientHooks] = list(hooks or [])
+
+        # Profiling mode for fetch_records() runs
+        self.profiler: Optional[Profiler]
+        if isinstance(profile, Profiler):
+            self.profiler = profile
+        elif profile is True:
+            self.profiler = enable_profiling()
+        elif profile is None:
+            self.profiler = get_profiler()
+        elif profile is False:
+            self.profiler = None
+        else:
+            self.profiler = enable_profiling(profile)
+
+        # Stats of the most recent fetch_records() run
+        self.last_fetch_stats: Optional[FetchStats] = None
+
         # Token management
         self.token = None
         self.token_expires_at = 0
@@ -170,11 +262,12 @@ class AutoCareAPI:
 
         # Configure session with retry strategy
         self.session = requests.Session()
-        retry_strategy = Retry(
+        retry_strategy = HookedRetry(
             total=max_retries,
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["HEAD", "GET", "OPTIONS", "POST"],
             backoff_factor=0.3,
+            notify=self._notify_retry,
         )
         adapter = HTTPAdapter(max_retries=retry_strategy)
         self.session.mount("http://", adapter)
@@ -188,6 +281,13 @@ class AutoCareAPI:
         # Authenticate on initialization
         self.authenticate()
 
+    def add_hook(self, hook: ClientHooks) -> None:
+        """Register a ClientHooks instance for request instrumentation."""
+        self.hooks.append(hook)
+
+    def _notify_retry(self, event: RetryEvent) -> None:
+        emit(self.hooks, "on_retry", event)
+
     def _build_record_url(self, db_name: str, table_name: str, version: str) -> str:
         """
         Build the correct record-fetching URL for a given database and table.
@@ -202,7 +302,9 @@ class AutoCareAPI:
         """
         db_lower = db_name.lower()
         subdomain = self.DATABASE_SUBDOMAINS.get(db_lower, db_lower)
-        url = f"https://{subdomain}.autocarevip.com/api/v{version}/{db_lower}/{table_name}"
+        url = self.record_url.format(
+            subdomain=subdomain, version=version, db=db_lower, table=table_name
+        )
 
         logger.debug(f"Built record URL: {url}")
         return url
@@ -258,6 +360,7 @@ class AutoCareAPI:
             self.refresh_token = token_data.get("refresh_token")
 
             logger.info("Authentication successful")
+            emit(self.hooks, "on_auth", False)
             return self.token  # type: ignore  # token is guaranteed to be set above
 
         except requests.exceptions.RequestException as e:
@@ -313,6 +416,7 @@ class AutoCareAPI:
                 self.refresh_token = token_data["refresh_token"]
 
             logger.info("Token refresh successful")
+            emit(self.hooks, "on_auth", True)
             return self.token
 
         except requests.exceptions.RequestException as e:
@@ -344,6 +448,8 @@ class AutoCareAPI:
         params: Optional[Dict] = None,
         data: Optional[Dict] = None,
         headers: Optional[Dict] = None,
+        table: Optional[str] = None,
+        stats: Optional[FetchStats] = None,
     ) -> APIResponse:
         """
         Make an authenticated HTTP request.
@@ -354,6 +460,8 @@ class AutoCareAPI:
             params: Query parameters
             data: Request body data
             headers: Additional headers
+            table: Table the request reads, for instrumentation hooks
+            stats: FetchStats to add network / decode time and bytes to
 
         Returns:
             APIResponse object
@@ -366,16 +474,70 @@ class AutoCareAPI:
         if headers:
             request_headers.update(headers)
 
+        cache = self.http_cache if method.upper() == "GET" else None
+        cache_key: Optional[str] = None
+        cached: Optional["CachedResponse"] = None
+        if cache is not None:
+            cache_key = cache.key(url, params)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                request_headers.update(cached.validators())
+
+        event: Optional[RequestEvent] = None
+        if self.hooks:
+            event = RequestEvent(method, url, host_of(url), table, params)
+            emit(self.hooks, "before_request", event)
+
         try:
             logger.debug(f"Making {method} request to {url}")
-            response = self.session.request(
-                method=method,
-                url=url,
-                params=params,
-                json=data,
-                headers=request_headers,
-                timeout=self.timeout,
-            )
+            started = time.perf_counter()
+            try:
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    json=data,
+                    headers=request_headers,
+                    timeout=self.timeout,
+                )
+            except requests.exceptions.RequestException as e:
+                elapsed = time.perf_counter() - started
+                if stats is not None:
+                    stats.network_seconds += elapsed
+                if event is not None:
+                    event.elapsed = elapsed
+                    event.error = str(e) or type(e).__name__
+                    emit(self.hooks, "after_response", event)
+                raise
+
+            elapsed = time.perf_counter() - started
+            if stats is not None:
+                stats.network_seconds += elapsed
+                stats.bytes += len(response.content)
+                for attempt in self._retry_history(response):
+                    stats.retries += 1
+                    stats.throttles += attempt.status == 429
+            if event is not None:
+                event.elapsed = elapsed
+                event.status_code = response.status_code
+                event.bytes = len(response.content)
+                event.from_cache = cached is not None and response.status_code == 304
+                emit(self.hooks, "after_response", event)
+
+            if cached is not None and response.status_code == 304:
+                assert cache is not None
+                cache.record_hit(cached)
+                logger.debug(f"Not modified, served from cache: {url}")
+                decode_started = time.perf_counter()
+                cached_data = self._decode_body(cached.body)
+                if stats is not None:
+                    stats.decode_seconds += time.perf_counter() - decode_started
+                return APIResponse(
+                    success=True,
+                    data=cached_data,
+                    status_code=304,
+                    headers=dict(cached.headers),
+                )
 
             # Handle response
             if response.status_code >= 400:
@@ -398,10 +560,17 @@ class AutoCareAPI:
                 )
 
             # Parse response data
+            decode_started = time.perf_counter()
             try:
                 response_data = response.json()
             except json.JSONDecodeError:
                 response_data = response.text
+            if stats is not None:
+                stats.decode_seconds += time.perf_counter() - decode_started
+
+            if cache is not None and cache_key is not None:
+                cache.record_miss()
+                cache.put(cache_key, url, response.content, response.headers)
 
             return APIResponse(
                 success=True,
@@ -423,10 +592,27 @@ class AutoCareAPI:
             logger.error(error_msg)
             raise APIConnectionError(error_msg)
 
-    def list_databases(self) -> List[DatabaseInfo]:
+    @staticmethod
+    def _retry_history(response: requests.Response) -> tuple:
+        """Retries urllib3 made before this response (empty if unknown)."""
+        retries = getattr(response.raw, "retries", None)
+        return tuple(getattr(retries, "history", None) or ())
+
+    @staticmethod
+    def _decode_body(body: bytes) -> Any:
+        """Parse a cached response body the way live responses are parsed."""
+        try:
+            return json.loads(body)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return body.decode("utf-8", errors="replace")
+
+    def list_databases(self, refresh: bool = False) -> List[DatabaseInfo]:
         """
         List available AutoCare databases.
 
+        Args:
+            refresh: Bypass the metadata cache
+
         Returns:
             List of DatabaseInfo objects
 
@@ -434,6 +620,11 @@ class AutoCareAPI:
             APIConnectionError: If request fails
             APIResponseError: If API returns error
         """
+        if not refresh:
+            cached = self.metadata_cache.get("databases", _database_index)
+            if cached is not None:
+                return list(cached.values())
+
         response = self._make_request("GET", f"{self.base_url}/databases")
 
         if not response.success:
@@ -454,14 +645,20 @@ class AutoCareAPI:
                     databases.append(DatabaseInfo(name=db_data, version=""))
 
         logger.info(f"Found {len(databases)} databases")
+        self.metadata_cache.put(
+            "databases",
+            [asdict(database) for database in databases],
+            {database.name: database for database in databases},
+        )
         return databases
 
-    def list_tables(self, db_name: str) -> List[TableInfo]:
+    def list_tables(self, db_name: str, refresh: bool = False) -> List[TableInfo]:
         """
         List tables in a specific database.
 
         Args:
             db_name: Database name
+            refresh: Bypass the metadata cache
 
         Returns:
             List of TableInfo objects
@@ -470,9 +667,52 @@ class AutoCareAPI:
             APIConnectionError: If request fails
             APIResponseError: If API returns error
         """
+        return list(self._tables(db_name, refresh).values())
+
+    def describe_database(
+        self, db_name: str, refresh: bool = False
+    ) -> Dict[str, TableInfo]:
+        """
+        Describe every table of a database (with its columns) in one call.
+
+        Served from the metadata cache when fresh, so repeated lookups do not
+        hit the API.
+
+        Args:
+            db_name: Database name
+            refresh: Bypass the metadata cache
+
+        Returns:
+            Mapping of table name to TableInfo
+
+        Raises:
+            APIConnectionError: If request fails
+            APIResponseError: If API returns error
+        """
+        return dict(self._tables(db_name, refresh))
+
+    def invalidate_metadata(self, db_name: Optional[str] = None) -> None:
+        """
+        Drop cached catalog metadata.
+
+        Args:
+            db_name: Only drop this database's tables; default: everything
+        """
+        self.metadata_cache.invalidate(
+            None if db_name is None else f"tables:{db_name.lower()}"
+        )
+
+    def _tables(self, db_name: str, refresh: bool) -> Dict[str, TableInfo]:
+        """Cached name -> TableInfo mapping for a database."""
         if not db_name:
             raise DataValidationError("Database name is required")
 
+        key = f"tables:{db_name.lower()}"
+        if not refresh:
+            cached = self.metadata_cache.get(key, _table_index)
+            if cached is not None:
+                return cached
+
         url = f"{self.base_url}/databases/{db_name}/tables"
         response = self._make_request("GET", url)
 
@@ -481,22 +721,26 @@ class AutoCareAPI:
                 f"Failed to list tables for {db_name}: {response.error}"
             )
 
-        tables = []
+        tables: Dict[str, TableInfo] = {}
         if response.data is not None:
             for table_data in response.data:
                 if isinstance(table_data, dict):
-                    tables.append(
-                        TableInfo(
-                            name=table_data.get("TableName", ""),
-                            database=db_name,
-                            record_count=table_data.get("recordCount"),
-                            columns=table_data.get("columns"),
-                        )
+                    table = TableInfo(
+                        name=table_data.get("TableName", ""),
+                        database=db_name,
+                        record_count=table_data.get("recordCount"),
+                        columns=table_data.get("columns"),
                     )
                 elif isinstance(table_data, str):
-                    tables.append(TableInfo(name=table_data, database=db_name))
+                    table = TableInfo(name=table_data, database=db_name)
+                else:
+                    continue
+                tables[table.name] = table
 
         logger.info(f"Found {len(tables)} tables in database {db_name}")
+        self.metadata_cache.put(
+            key, [asdict(table) for table in tables.values()], tables
+        )
         return tables
 
     def fetch_records(
@@ -507,6 +751,7 @@ class AutoCareAPI:
         limit: Optional[int] = None,
         page_size: Optional[int] = None,
         model: Optional[Type] = None,
+        stats: Optional[FetchStats] = None,
     ) -> Iterator[Any]:
         """
         Fetch records from a database table with pagination support.
@@ -520,6 +765,9 @@ class AutoCareAPI:
             model: Optional typed model class with from_dict() classmethod.
                    When provided, each record dict is converted to a model instance.
                    When None, raw dicts are yielded.
+            stats: FetchStats to fill in while fetching (readable mid-stream);
+                   a fresh one is used when None. Either way the run's stats
+                   are also available as last_fetch_stats.
 
         Yields:
             Individual records as dictionaries or typed model instances
@@ -534,8 +782,9 @@ class AutoCareAPI:
 
         resolved_version = version if version is not None else self.get_version(db_name)
         base_url = self._build_record_url(db_name, table_name, resolved_version)
-        next_page: Optional[str] = base_url
-        records_fetched = 0
+        run = stats if stats is not None else FetchStats()
+        run.start(db_name, table_name)
+        self.last_fetch_stats = run
 
         params = {}
         if page_size:
@@ -543,15 +792,48 @@ class AutoCareAPI:
 
         logger.info(f"Fetching records from {db_name}.{table_name}")
 
+        pages = self._fetch_pages(
+            db_name, table_name, base_url, params, limit, model, run
+        )
+        if self.profiler is not None:
+            pages = self.profiler.profile_iterator(
+                f"fetch-{db_name}.{table_name}", pages
+            )
+        try:
+            yield from pages
+        finally:
+            run.finish()
+
+        logger.info(
+            f"Fetched {run.records} records from {db_name}.{table_name} "
+            f"in {run.elapsed:.2f}s ({run.records_per_second:,.0f} records/s)"
+        )
+
+    def _fetch_pages(
+        self,
+        db_name: str,
+        table_name: str,
+        next_page: Optional[str],
+        params: Dict[str, Any],
+        limit: Optional[int],
+        model: Optional[Type],
+        run: FetchStats,
+    ) -> Iterator[Any]:
+        """Follow X-Pagination links from next_page, yielding records."""
+        base_url = next_page
         while next_page:
             try:
                 # Make request with current pagination URL
                 current_url = next_page if not params else next_page
                 if params and next_page == base_url:
                     # Add params only to the first request
-                    response = self._make_request("GET", current_url, params=params)
+                    response = self._make_request(
+                        "GET", current_url, params=params, table=table_name, stats=run
+                    )
                 else:
-                    response = self._make_request("GET", current_url)
+                    response = self._make_request(
+                        "GET", current_url, table=table_name, stats=run
+                    )
 
                 if not response.success:
                     raise APIResponseError(f"Failed to fetch records: {response.error}")
@@ -562,13 +844,39 @@ class AutoCareAPI:
                     logger.warning(f"Unexpected response format: {type(page_records)}")
                     break
 
-                for record in page_records:
-                    if limit and records_fetched >= limit:
-                        logger.info(f"Reached record limit: {limit}")
-                        return
+                run.pages += 1
+                if self.hooks:
+                    emit(
+                        self.hooks,
+                        "on_page",
+                        PageEvent(
+                            db_name,
+                            table_name,
+                            run.pages,
+                            len(page_records),
+                            current_url,
+                        ),
+                    )
+
+                if limit:
+                    page_records = page_records[: max(0, limit - run.records)]
+                if model:
+                    converted_at = time.perf_counter()
+                    page_records = [model.from_dict(record) for record in page_records]
+                    run.convert_seconds += time.perf_counter() - converted_at
 
-                    yield model.from_dict(record) if model else record
-                    records_fetched += 1
+                # Time between yields is the consumer's
+                yielded_at = time.perf_counter()
+                try:
+                    for record in page_records:
+                        yield record
+                        run.records += 1
+                finally:
+                    run.consumer_seconds += time.perf_counter() - yielded_at
+
+                if limit and run.records >= limit:
+                    logger.info(f"Reached record limit: {limit}")
+                    return
 
                 # Handle pagination
                 next_page = None
@@ -592,14 +900,13 @@ class AutoCareAPI:
                 logger.error(f"Error fetching records: {str(e)}")
                 raise
 
-        logger.info(f"Fetched {records_fetched} records from {db_name}.{table_name}")
-
     def fetch_all_records(
         self,
         db_name: str,
         table_name: str,
         version: Optional[str] = None,
         model: Optional[Type] = None,
+        stats: Optional[FetchStats] = None,
     ) -> List[Any]:
         """
         Fetch all records from a table and return as a list.
@@ -609,11 +916,14 @@ class AutoCareAPI:
             table_name: Table name
             version: API version override. When None, uses api_versions default.
             model: Optional typed model class with from_dict() classmethod.
+            stats: FetchStats to fill in while fetching
 
         Returns:
             List of all records (dicts or model instances)
         """
-        return list(self.fetch_records(db_name, table_name, version, model=model))
+        return list(
+            self.fetch_records(db_name, table_name, version, model=model, stats=stats)
+        )
 
     def get_table_info(self, db_name: str, table_name: str) -> Optional[TableInfo]:
         """
@@ -627,10 +937,7 @@ class AutoCareAPI:
             TableInfo object or None if not found
         """
         try:
-            tables = self.list_tables(db_name)
-            for table in tables:
-                if table.name == table_name:
-                    return table
+            return self._tables(db_name, False).get(table_name)
         except Exception as e:
             logger.warning(f"Could not get table info: {e}")
 
@@ -644,7 +951,7 @@ class AutoCareAPI:
             True if credentials are valid, False otherwise
         """
         try:
-            self.list_databases()
+            self.list_databases(refresh=True)
             return True
         except Exception:
             return False
@@ -654,6 +961,8 @@ class AutoCareAPI:
         if hasattr(self, "session"):
             self.session.close()
             logger.info("API client session closed")
+        if getattr(self, "_owns_http_cache", False) and self.http_cache is not None:
+            self.http_cache.close()
 
     def __enter__(self):
         """Context manager entry."""
@@ -0,0 +1,342 @@
+"""Streaming ACES document transformer between 4.2 and 5.0.
+
+Converts whole ACES XML files in a single event-driven pass using expat:
+elements and attributes are renamed, removed attributes are dropped, and
+4.2 <References> (DiagramReference / AssetReference) are mapped to the 5.0
+<DiagramAsset> / <NonDiagramAssets> structure and back. Only the current
+element path is held in memory, so file size does not affect memory use.
+
+Command line:
+    python -m autocare.compatibility.aces_transform in.xml out.xml --to 5.0
+"""
+
+import argparse
+import gzip
+import io
+import os
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import IO, Dict, FrozenSet, List, Optional, Sequence, Tuple, Union
+from xml.parsers import expat
+from xml.sax.saxutils import escape, quoteattr
+
+from autocare.profiling import profiled
+from autocare.standards.aces import (
+    V4_TO_V5_ATTRIBUTE_RENAMES,
+    V4_TO_V5_ELEMENT_RENAMES,
+    V5_REMOVED_ATTRIBUTES,
+    V5_REMOVED_ELEMENTS,
+    V5_TO_V4_ATTRIBUTE_RENAMES,
+    V5_TO_V4_ELEMENT_RENAMES,
+    VERSIONS,
+)
+
+Source = Union[str, os.PathLike, IO[bytes]]
+
+_PARSE_BUFFER_SIZE = 1 << 20
+_IO_BUFFER_SIZE = 1 << 20
+
+# Characters that force the (slower) saxutils escaping path
+_ATTRIBUTE_ESCAPE = re.compile(r'[&<>"\n\r\t]')
+_TEXT_ESCAPE = re.compile(r"[&<>]")
+
+# 4.2 reference elements and their 5.0 asset equivalents
+_V4_TO_V5_ASSET_RENAMES = {
+    "DiagramReference": "DiagramAsset",
+    "AssetReference": "NonDiagramAsset",
+}
+_V5_TO_V4_ASSET_RENAMES = {v: k for k, v in _V4_TO_V5_ASSET_RENAMES.items()}
+
+
+@dataclass(frozen=True)
+class TransformPlan:
+    """Precomputed element and attribute rules for one direction.
+
+    Attributes:
+        element_renames: Old element name -> new element name
+        attribute_renames: Old attribute name -> new attribute name (any element)
+        removed_attributes: Element name -> attributes to drop from it
+        dropped_elements: Elements removed together with their subtree
+        unwrapped_elements: Elements whose start/end tags are removed but
+            whose children are kept
+        wrappers: New element name -> container element that consecutive
+            siblings of that name are grouped into
+    """
+
+    from_version: str
+    to_version: str
+    element_renames: Dict[str, str] = field(default_factory=dict)
+    attribute_renames: Dict[str, str] = field(default_factory=dict)
+    removed_attributes: Dict[str, FrozenSet[str]] = field(default_factory=dict)
+    dropped_elements: FrozenSet[str] = frozenset()
+    unwrapped_elements: FrozenSet[str] = frozenset()
+    wrappers: Dict[str, str] = field(default_factory=dict)
+
+
+def build_plan(from_version: str, to_version: str) -> TransformPlan:
+    """
+    Build the transform plan for a version pair.
+
+    Args:
+        from_version: Source ACES version ("4.2" or "5.0")
+        to_version: Target ACES version ("4.2" or "5.0")
+
+    Returns:
+        TransformPlan for the conversion
+
+    Raises:
+        ValueError: If either version is unsupported
+    """
+    if from_version not in VERSIONS or to_version not in VERSIONS:
+        raise ValueError(
+            f"Unsupported ACES version: {from_version} -> {to_version}. "
+            f"Supported: {VERSIONS}"
+        )
+
+    if from_version == to_version:
+        return TransformPlan(from_version, to_version)
+
+    if from_version == "4.2" and to_version == "5.0":
+        asset_renames = _V4_TO_V5_ASSET_RENAMES
+        return TransformPlan(
+            from_version,
+            to_version,
+            element_renames={**V4_TO_V5_ELEMENT_RENAMES, **asset_renames},
+            attribute_renames=dict(V4_TO_V5_ATTRIBUTE_RENAMES),
+            removed_attributes={
+                element: frozenset(attributes)
+                for element, attributes in V5_REMOVED_ATTRIBUTES.items()
+            },
+            dropped_elements=frozenset(
+                set(V5_REMOVED_ELEMENTS) - set(asset_renames) - {"References"}
+            ),
+            unwrapped_elements=frozenset({"References"}),
+            wrappers={"NonDiagramAsset": "NonDiagramAssets"},
+        )
+
+    # 5.0 -> 4.2
+    return TransformPlan(
+        from_version,
+        to_version,
+        element_renames={**V5_TO_V4_ELEMENT_RENAMES, **_V5_TO_V4_ASSET_RENAMES},
+        attribute_renames=dict(V5_TO_V4_ATTRIBUTE_RENAMES),
+        unwrapped_elements=frozenset({"NonDiagramAssets"}),
+        wrappers={
+            "DiagramReference": "References",
+            "AssetReference": "References",
+        },
+    )
+
+
+class _Transformer:
+    """expat handlers that write the transformed document."""
+
+    def __init__(self, plan: TransformPlan, out: IO[str]):
+        self.plan = plan
+        self.write = out.write
+        self.app_count = 0
+
+        # One entry per open source element: output name, or None if unwrapped
+        self._names: List[Optional[str]] = []
+        # One entry per open output element (plus the document level):
+        # the wrapper currently open inside it, if any
+        self._open_wrappers: List[Optional[str]] = [None]
+        self._drop_depth = 0
+        # True while a start tag is written but its ">" is not yet decided
+        self._pending_start = False
+        self._rules: Dict[str, Tuple[str, Optional[str], FrozenSet[str]]] = {}
+
+    def _close_pending(self) -> None:
+        if self._pending_start:
+            self.write(">")
+            self._pending_start = False
+
+    def _rule(self, name: str) -> Tuple[str, Optional[str], FrozenSet[str]]:
+        """Resolve and cache (new name, wrapper, removed attributes) for a tag."""
+        plan = self.plan
+        new_name = plan.element_renames.get(name, name)
+        rule = (
+            new_name,
+            plan.wrappers.get(new_name),
+            plan.removed_attributes.get(name, frozenset()),
+        )
+        self._rules[name] = rule
+        return rule
+
+    def start_element(self, name: str, attributes: Dict[str, str]) -> None:
+        if self._drop_depth:
+            self._drop_depth += 1
+            return
+
+        plan = self.plan
+        if name in plan.dropped_elements:
+            self._drop_depth = 1
+            return
+        if name in plan.unwrapped_elements:
+            self._names.append(None)
+            return
+
+        write = self.write
+        if self._pending_start:
+            write(">")
+        new_name, wrapper, removed = self._rules.get(name) or self._rule(name)
+
+        current_wrapper = self._open_wrappers[-1]
+        if current_wrapper != wrapper:
+            if current_wrapper:
+                write(f"</{current_wrapper}>")
+            if wrapper:
+                write(f"<{wrapper}>")
+            self._open_wrappers[-1] = wrapper
+
+        if attributes:
+            renames = plan.attribute_renames
+            parts = [f"<{new_name}"]
+            for key, value in attributes.items():
+                if key in removed:
+                    continue
+                if new_name == "ACES" and key == "version":
+                    value = plan.to_version
+                if _ATTRIBUTE_ESCAPE.search(value):
+                    parts.append(f" {renames.get(key, key)}={quoteattr(value)}")
+                else:
+                    parts.append(f' {renames.get(key, key)}="{value}"')
+            write("".join(parts))
+        else:
+            write(f"<{new_name}")
+        self._pending_start = True
+
+        if new_name == "App":
+            self.app_count += 1
+        self._names.append(new_name)
+        self._open_wrappers.append(None)
+
+    def end_element(self, name: str) -> None:
+        if self._drop_depth:
+            self._drop_depth -= 1
+            return
+
+        new_name = self._names.pop()
+        if new_name is None:
+            return
+
+        wrapper = self._open_wrappers.pop()
+        if self._pending_start:
+            self.write("/>")
+            self._pending_start = False
+            return
+        if wrapper:
+            self.write(f"</{wrapper}>")
+        self.write(f"</{new_name}>")
+
+    def character_data(self, data: str) -> None:
+        if self._drop_depth:
+            return
+        self._close_pending()
+        self.write(escape(data) if _TEXT_ESCAPE.search(data) else data)
+
+    def comment(self, data: str) -> None:
+        if self._drop_depth:
+            return
+        self._close_pending()
+        self.write(f"<!--{data}-->")
+
+
+def _open(target: Source, mode: str) -> Tuple[IO[bytes], bool]:
+    """Open a path (".gz" aware) or pass through a file object.
+
+    Returns:
+        (binary file object, whether the caller must close it)
+    """
+    if isinstance(target, (str, os.PathLike)):
+        path = os.fspath(target)
+        if path.endswith(".gz"):
+            return gzip.open(path, mode, compresslevel=6), True  # type: ignore[return-value]
+        return open(path, mode, buffering=_IO_BUFFER_SIZE), True
+    return target, False
+
+
+@profiled("transform-aces-{from_version}-{to_version}")
+def transform_aces(
+    source: Source,
+    destination: Source,
+    from_version: str = "4.2",
+    to_version: str = "5.0",
+) -> int:
+    """
+    Convert an ACES document between versions in one streaming pass.
+
+    Args:
+        source: Input path (".gz" is decompressed) or binary file object
+        destination: Output path (".gz" is compressed) or binary file object
+        from_version: Source ACES version
+        to_version: Target ACES version
+
+    Returns:
+        Number of App elements written
+
+    Raises:
+        ValueError: If either version is unsupported
+        xml.parsers.expat.ExpatError: If the input is not well-formed XML
+    """
+    plan = build_plan(from_version, to_version)
+
+    in_stream, close_in = _open(source, "rb")
+    out_binary, close_out = _open(destination, "wb")
+    out = io.TextIOWrapper(out_binary, encoding="utf-8")
+    try:
+        transformer = _Transformer(plan, out)
+        parser = expat.ParserCreate()
+        parser.buffer_text = True
+        parser.buffer_size = _PARSE_BUFFER_SIZE
+        parser.StartElementHandler = transformer.start_element
+        parser.EndElementHandler = transformer.end_element
+        parser.CharacterDataHandler = transformer.character_data
+        parser.CommentHandler = transformer.comment
+
+        out.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        parser.ParseFile(in_stream)
+        out.write("\n")
+        out.flush()
+        return transformer.app_count
+    finally:
+        if close_out:
+            out.close()
+        else:
+            out.detach()
+        if close_in:
+            in_stream.close()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(
+        description="Convert an ACES XML file between 4.2 and 5.0."
+    )
+    parser.add_argument("source", help="Input ACES file (.gz supported)")
+    parser.add_argument("destination", help="Output ACES file (.gz supported)")
+    parser.add_argument("--from", dest="from_version", default="4.2", choices=VERSIONS)
+    parser.add_argument("--to", dest="to_version", default="5.0", choices=VERSIONS)
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    try:
+        apps = transform_aces(
+            args.source, args.destination, args.from_version, args.to_version
+        )
+    except (OSError, ValueError, expat.ExpatError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    elapsed = time.perf_counter() - started
+    print(
+        f"Converted {apps} apps from ACES {args.from_version} to "
+        f"{args.to_version} in {elapsed:.1f}s"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,32 +1,404 @@
 """Field mapping functions for migrating records between API versions.
 
 Provides migrate_*_record() functions for ACES, VCdb, and PAdb that
-rename fields and add/strip versioning metadata as needed.
-"""
+rename fields and add/strip versioning metadata as needed, plus batch
+migrate_*_records() and migrate_columns() variants that validate the
+versions once and apply a precompiled MigrationPlan to every record.
 
-from typing import Any, Dict
+Single-version steps are registered in MIGRATIONS, a MigrationRegistry that
+finds the shortest chain of steps between any two versions and fuses it into
+one plan, so multi-hop migrations still take a single pass over the records.
+"""
 
+from collections import deque
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from autocare.profiling import profiled
 from autocare.standards.aces import V4_TO_V5_FIELD_RENAMES, V5_TO_V4_FIELD_RENAMES
 
 # Fields added in VCdb 2.0 / PAdb 5.0 that don't exist in earlier versions
 _VERSIONING_FIELDS = {"EffectiveDateTime", "EndDateTime", "CultureID"}
 
-_ACES_VERSIONS = {"4.2", "5.0"}
-_VCDB_VERSIONS = {"1.0", "2.0"}
-_PADB_VERSIONS = {"4.0", "5.0"}
+# Distinct record key layouts cached per apply_many() call
+_MAX_KEY_LAYOUTS = 1024
+
+
+@dataclass(frozen=True)
+class MigrationPlan:
+    """Precompiled field changes between two versions.
+
+    Applied in order: renames, then strips, then adds.
+
+    Attributes:
+        renames: Old field name -> new field name
+        strip_fields: Fields removed from the record
+        add_fields: Fields set to None when missing
+    """
+
+    renames: Mapping[str, str] = field(default_factory=dict)
+    strip_fields: FrozenSet[str] = frozenset()
+    add_fields: Tuple[str, ...] = ()
+
+    @property
+    def is_noop(self) -> bool:
+        """Whether applying the plan only copies the record."""
+        return not (self.renames or self.strip_fields or self.add_fields)
+
+    def then(self, other: "MigrationPlan") -> "MigrationPlan":
+        """
+        Fuse this plan with one applied after it.
+
+        The result transforms a record in one pass exactly as applying
+        self and then other would (for records without colliding names).
+
+        Args:
+            other: Plan applied to this plan's output
+
+        Returns:
+            Combined MigrationPlan
+        """
+        second = other.renames
+        renames: Dict[str, str] = {}
+        for old, middle in self.renames.items():
+            new = second.get(middle, middle)
+            if new != old:
+                renames[old] = new
+        for middle, new in second.items():
+            # Fields not renamed by self reach other's renames unchanged
+            if middle not in self.renames:
+                renames[middle] = new
+
+        strip_fields = (
+            frozenset(second.get(name, name) for name in self.strip_fields)
+            | other.strip_fields
+        )
+
+        add_fields: List[str] = []
+        for name in self.add_fields:
+            name = second.get(name, name)
+            if name not in other.strip_fields and name not in add_fields:
+                add_fields.append(name)
+        for name in other.add_fields:
+            if name not in add_fields:
+                add_fields.append(name)
+
+        return MigrationPlan(renames, strip_fields, tuple(add_fields))
+
+    def apply(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Migrate one record.
+
+        Args:
+            record: Source record dict (not modified)
+
+        Returns:
+            New dict for the target version
+        """
+        renames = self.renames
+        if renames and any(key in record for key in renames):
+            result = {renames.get(key, key): value for key, value in record.items()}
+        else:
+            result = dict(record)
+        for name in self.strip_fields:
+            result.pop(name, None)
+        for name in self.add_fields:
+            if name not in result:
+                result[name] = None
+        return result
+
+    def apply_many(self, records: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Migrate records lazily.
+
+        Args:
+            records: Source record dicts (not modified)
+
+        Returns:
+            Iterator of new dicts for the target version, in input order
+        """
+        if self.is_noop:
+            return map(dict, records)
+        if not self.renames:
+            return map(self._adjust_fields, records)
+        return self._rename_many(records)
+
+    def _adjust_fields(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """apply() for plans without renames: one C-level copy per record."""
+        result = dict(record)
+        for name in self.strip_fields:
+            result.pop(name, None)
+        for name in self.add_fields:
+            if name not in result:
+                result[name] = None
+        return result
+
+    def _rename_many(
+        self, records: Iterable[Dict[str, Any]]
+    ) -> Iterator[Dict[str, Any]]:
+        """Rename keys via a cache of renamed key layouts.
+
+        Snapshot records share a handful of key layouts, so the renamed
+        keys are computed once per layout and zipped with each record's
+        values.
+        """
+        renames = self.renames
+        strip_fields = self.strip_fields
+        add_fields = self.add_fields
+        layouts: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+        for record in records:
+            keys = tuple(record)
+            new_keys = layouts.get(keys)
+            if new_keys is None:
+                new_keys = tuple(renames.get(key, key) for key in keys)
+                if len(layouts) < _MAX_KEY_LAYOUTS:
+                    layouts[keys] = new_keys
+            result = dict(zip(new_keys, record.values()))
+            for name in strip_fields:
+                result.pop(name, None)
+            for name in add_fields:
+                if name not in result:
+                    result[name] = None
+            yield result
+
+    def apply_columns(
+        self, columns: Mapping[str, Sequence[Any]], length: int
+    ) -> Dict[str, Sequence[Any]]:
+        """
+        Migrate a columnar table (field name -> column of values).
+
+        Columns are renamed, dropped and added by reference: values are never
+        copied, and added columns are constant None columns.
+
+        Args:
+            columns: Field name -> column values
+            length: Number of rows
+
+        Returns:
+            New column mapping for the target version
+        """
+        renames = self.renames
+        result: Dict[str, Sequence[Any]] = {
+            renames.get(name, name): column for name, column in columns.items()
+        }
+        for name in self.strip_fields:
+            result.pop(name, None)
+        for name in self.add_fields:
+            if name not in result:
+                result[name] = ConstantColumn(None, length)
+        return result
+
+
+class ConstantColumn(Sequence[Any]):
+    """A read-only column holding the same value in every row, in O(1) memory."""
+
+    __slots__ = ("value", "length")
+
+    def __init__(self, value: Any, length: int):
+        self.value = value
+        self.length = length
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self.value] * len(range(*index.indices(self.length)))
+        if not -self.length <= index < self.length:
+            raise IndexError("ConstantColumn index out of range")
+        return self.value
+
+    def __iter__(self) -> Iterator[Any]:
+        value = self.value
+        return (value for _ in range(self.length))
+
+    def __repr__(self) -> str:
+        return f"ConstantColumn({self.value!r}, {self.length})"
+
+
+class MigrationRegistry:
+    """Single-step version migrations per standard or database.
+
+    Steps form a directed graph of versions. plan() finds the shortest
+    chain of steps between two versions and fuses it into one cached
+    MigrationPlan.
+
+    Example:
+        MIGRATIONS.register(
+            "vcdb", "2.0", "3.0", MigrationPlan(renames={"OldName": "NewName"})
+        )
+        MIGRATIONS.plan("vcdb", "1.0", "3.0")  # 1.0 -> 2.0 -> 3.0, one pass
+    """
+
+    def __init__(self) -> None:
+        # kind -> from version -> to version -> step
+        self._steps: Dict[str, Dict[str, Dict[str, MigrationPlan]]] = {}
+        self._labels: Dict[str, str] = {}
+        self._plans: Dict[Tuple[str, str, str], MigrationPlan] = {}
+
+    def register(
+        self,
+        kind: str,
+        from_version: str,
+        to_version: str,
+        plan: MigrationPlan,
+        label: Optional[str] = None,
+    ) -> None:
+        """
+        Register a single-step migration.
+
+        Args:
+            kind: Standard or database key (e.g. "aces", "vcdb")
+            from_version: Source version
+            to_version: Target version
+            plan: Field changes for this step
+            label: Display name used in error messages (e.g. "VCdb")
+        """
+        steps = self._steps.setdefault(kind, {})
+        steps.setdefault(from_version, {})[to_version] = plan
+        steps.setdefault(to_version, {})
+        if label is not None or kind not in self._labels:
+            self._labels[kind] = label or kind
+        self._plans.clear()
+
+    def kinds(self) -> List[str]:
+        """Registered standards and databases."""
+        return sorted(self._steps)
+
+    def versions(self, kind: str) -> List[str]:
+        """
+        Versions known for a kind.
+
+        Raises:
+            ValueError: If the kind has no registered migrations
+        """
+        steps = self._steps.get(kind)
+        if steps is None:
+            raise ValueError(
+                f"Unsupported migration kind: {kind}. Supported: {self.kinds()}"
+            )
+        return sorted(steps)
+
+    def path(self, kind: str, from_version: str, to_version: str) -> List[str]:
+        """
+        Shortest chain of versions from one version to another.
+
+        Returns:
+            Versions visited, including both ends
+
+        Raises:
+            ValueError: If a version is unknown or no chain of steps exists
+        """
+        versions = self.versions(kind)
+        if from_version not in versions or to_version not in versions:
+            raise ValueError(
+                f"Unsupported {self._labels[kind]} version: "
+                f"{from_version} -> {to_version}. Supported: {versions}"
+            )
+
+        steps = self._steps[kind]
+        previous: Dict[str, Optional[str]] = {from_version: None}
+        queue = deque([from_version])
+        while queue:
+            version = queue.popleft()
+            if version == to_version:
+                break
+            for target in steps[version]:
+                if target not in previous:
+                    previous[target] = version
+                    queue.append(target)
+        else:
+            raise ValueError(
+                f"No {self._labels[kind]} migration path: "
+                f"{from_version} -> {to_version}"
+            )
+
+        path = [to_version]
+        while path[-1] != from_version:
+            path.append(previous[path[-1]])  # type: ignore[arg-type]
+        path.reverse()
+        return path
+
+    def plan(self, kind: str, from_version: str, to_version: str) -> MigrationPlan:
+        """
+        Fused migration plan between two versions.
+
+        Plans are cached until the next register() and must not be modified.
+
+        Raises:
+            ValueError: If a version is unknown or no chain of steps exists
+        """
+        key = (kind, from_version, to_version)
+        plan = self._plans.get(key)
+        if plan is not None:
+            return plan
+
+        path = self.path(kind, from_version, to_version)
+        steps = self._steps[kind]
+        plan = MigrationPlan()
+        for source, target in zip(path, path[1:]):
+            plan = plan.then(steps[source][target])
+        self._plans[key] = plan
+        return plan
+
+
+MIGRATIONS = MigrationRegistry()
+
+MIGRATIONS.register(
+    "aces", "4.2", "5.0", MigrationPlan(renames=dict(V4_TO_V5_FIELD_RENAMES)), "ACES"
+)
+MIGRATIONS.register(
+    "aces", "5.0", "4.2", MigrationPlan(renames=dict(V5_TO_V4_FIELD_RENAMES))
+)
+_ADD_VERSIONING = MigrationPlan(add_fields=tuple(sorted(_VERSIONING_FIELDS)))
+_STRIP_VERSIONING = MigrationPlan(strip_fields=frozenset(_VERSIONING_FIELDS))
+MIGRATIONS.register("vcdb", "1.0", "2.0", _ADD_VERSIONING, "VCdb")
+MIGRATIONS.register("vcdb", "2.0", "1.0", _STRIP_VERSIONING)
+MIGRATIONS.register("padb", "4.0", "5.0", _ADD_VERSIONING, "PAdb")
+MIGRATIONS.register("padb", "5.0", "4.0", _STRIP_VERSIONING)
+
+
+def build_aces_plan(from_version: str, to_version: str) -> MigrationPlan:
+    """
+    Compile the ACES field migration between two versions.
+
+    Plans are cached per version pair and must not be modified.
+
+    Raises:
+        ValueError: If either version is unsupported
+    """
+    return MIGRATIONS.plan("aces", from_version, to_version)
+
+
+def build_vcdb_plan(from_version: str, to_version: str) -> MigrationPlan:
+    """
+    Compile the VCdb field migration between two versions.
+
+    Raises:
+        ValueError: If either version is unsupported
+    """
+    return MIGRATIONS.plan("vcdb", from_version, to_version)
 
 
-def _rename_fields(record: Dict[str, Any], renames: Dict[str, str]) -> Dict[str, Any]:
-    """Apply field renames to a record dict.
+def build_padb_plan(from_version: str, to_version: str) -> MigrationPlan:
+    """
+    Compile the PAdb field migration between two versions.
 
-    Returns a new dict with renamed keys. Fields not in the rename map
-    are copied as-is.
+    Raises:
+        ValueError: If either version is unsupported
     """
-    result = {}
-    for key, value in record.items():
-        new_key = renames.get(key, key)
-        result[new_key] = value
-    return result
+    return MIGRATIONS.plan("padb", from_version, to_version)
 
 
 def migrate_aces_record(
@@ -49,19 +421,7 @@ def migrate_aces_record(
     Raises:
         ValueError: If either version is unsupported
     """
-    if from_version not in _ACES_VERSIONS or to_version not in _ACES_VERSIONS:
-        raise ValueError(
-            f"Unsupported ACES version: {from_version} -> {to_version}. "
-            f"Supported: {sorted(_ACES_VERSIONS)}"
-        )
-
-    if from_version == to_version:
-        return dict(record)
-
-    if from_version == "4.2" and to_version == "5.0":
-        return _rename_fields(record, V4_TO_V5_FIELD_RENAMES)
-    else:  # 5.0 -> 4.2
-        return _rename_fields(record, V5_TO_V4_FIELD_RENAMES)
+    return build_aces_plan(from_version, to_version).apply(record)
 
 
 def migrate_vcdb_record(
@@ -85,28 +445,7 @@ def migrate_vcdb_record(
     Raises:
         ValueError: If either version is unsupported
     """
-    if from_version not in _VCDB_VERSIONS or to_version not in _VCDB_VERSIONS:
-        raise ValueError(
-            f"Unsupported VCdb version: {from_version} -> {to_version}. "
-            f"Supported: {sorted(_VCDB_VERSIONS)}"
-        )
-
-    if from_version == to_version:
-        return dict(record)
-
-    result = dict(record)
-
-    if from_version == "1.0" and to_version == "2.0":
-        # Add versioning fields if not present
-        for field in _VERSIONING_FIELDS:
-            if field not in result:
-                result[field] = None
-    else:  # 2.0 -> 1.0
-        # Strip versioning fields
-        for field in _VERSIONING_FIELDS:
-            result.pop(field, None)
-
-    return result
+    return build_vcdb_plan(from_version, to_version).apply(record)
 
 
 def migrate_padb_record(
@@ -130,23 +469,105 @@ def migrate_padb_record(
     Raises:
         ValueError: If either version is unsupported
     """
-    if from_version not in _PADB_VERSIONS or to_version not in _PADB_VERSIONS:
-        raise ValueError(
-            f"Unsupported PAdb version: {from_version} -> {to_version}. "
-            f"Supported: {sorted(_PADB_VERSIONS)}"
-        )
+    return build_padb_plan(from_version, to_version).apply(record)
 
-    if from_version == to_version:
-        return dict(record)
 
-    result = dict(record)
+@profiled("migrate-aces-{from_version}-{to_version}", lazy=True)
+def migrate_aces_records(
+    records: Iterable[Dict[str, Any]],
+    from_version: str,
+    to_version: str,
+) -> Iterator[Dict[str, Any]]:
+    """Migrate ACES records between versions.
+
+    Versions are validated and the plan compiled once, when called.
 
-    if from_version == "4.0" and to_version == "5.0":
-        for field in _VERSIONING_FIELDS:
-            if field not in result:
-                result[field] = None
-    else:  # 5.0 -> 4.0
-        for field in _VERSIONING_FIELDS:
-            result.pop(field, None)
+    Args:
+        records: Source record dicts
+        from_version: Source ACES version ("4.2" or "5.0")
+        to_version: Target ACES version ("4.2" or "5.0")
+
+    Returns:
+        Lazy iterator of migrated dicts, in input order
 
-    return result
+    Raises:
+        ValueError: If either version is unsupported
+    """
+    return build_aces_plan(from_version, to_version).apply_many(records)
+
+
+@profiled("migrate-vcdb-{from_version}-{to_version}", lazy=True)
+def migrate_vcdb_records(
+    records: Iterable[Dict[str, Any]],
+    from_version: str,
+    to_version: str,
+) -> Iterator[Dict[str, Any]]:
+    """Migrate VCdb records between versions.
+
+    Versions are validated and the plan compiled once, when called.
+
+    Args:
+        records: Source record dicts
+        from_version: Source VCdb version ("1.0" or "2.0")
+        to_version: Target VCdb version ("1.0" or "2.0")
+
+    Returns:
+        Lazy iterator of migrated dicts, in input order
+
+    Raises:
+        ValueError: If either version is unsupported
+    """
+    return build_vcdb_plan(from_version, to_version).apply_many(records)
+
+
+@profiled("migrate-padb-{from_version}-{to_version}", lazy=True)
+def migrate_padb_records(
+    records: Iterable[Dict[str, Any]],
+    from_version: str,
+    to_version: str,
+) -> Iterator[Dict[str, Any]]:
+    """Migrate PAdb records between versions.
+
+    Versions are validated and the plan compiled once, when called.
+
+    Args:
+        records: Source record dicts
+        from_version: Source PAdb version ("4.0" or "5.0")
+        to_version: Target PAdb version ("4.0" or "5.0")
+
+    Returns:
+        Lazy iterator of migrated dicts, in input order
+
+    Raises:
+        ValueError: If either version is unsupported
+    """
+    return build_padb_plan(from_version, to_version).apply_many(records)
+
+
+@profiled("migrate-columns-{kind}")
+def migrate_columns(
+    columns: Mapping[str, Sequence[Any]],
+    kind: str,
+    from_version: str,
+    to_version: str,
+) -> Dict[str, Sequence[Any]]:
+    """Migrate a columnar table (field name -> column) between versions.
+
+    Renamed, stripped and added columns cost O(1) each regardless of row
+    count; added versioning columns are ConstantColumn(None, rows).
+
+    Args:
+        columns: Field name -> column values (all the same length)
+        kind: Registered kind, e.g. "aces", "vcdb" or "padb"
+        from_version: Source version
+        to_version: Target version
+
+    Returns:
+        New column mapping for the target version
+
+    Raises:
+        ValueError: If the kind or either version is unsupported
+    """
+    plan = MIGRATIONS.plan(kind, from_version, to_version)
+    length = len(next(iter(columns.values()))) if columns else 0
+    return plan.apply_columns(columns, length)
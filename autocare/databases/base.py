@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field, fields
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Self
 
 
 @dataclass
@@ -17,7 +17,7 @@ class BaseModel:
     extra: Dict[str, Any] = field(default_factory=dict)
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "BaseModel":
+    def from_dict(cls, data: Dict[str, Any]) -> Self:
         """Create an instance from an API response dictionary.
 
         Known fields are assigned to typed attributes. Unknown fields
@@ -55,3 +55,14 @@ class CulturedModel(VersionedModel):
     """
 
     CultureID: Optional[str] = None
+
+
+def record_value(record: Any, name: str, default: Any = None) -> Any:
+    """Read a field from either a raw API dict or a typed model instance.
+
+    Lets index builders accept the output of fetch_records() with or
+    without the model parameter.
+    """
+    if isinstance(record, dict):
+        return record.get(name, default)
+    return getattr(record, name, default)
@@ -1,7 +1,9 @@
-"""Brand Table models and constants."""
+"""Brand Table models, constants, and brand hierarchy index."""
 
-from dataclasses import dataclass
-from typing import Optional
+import json
+import os
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 from autocare.databases.base import VersionedModel
 
@@ -22,3 +24,224 @@ class Brand(VersionedModel):
     SubBrandID: Optional[str] = None
     SubBrandName: Optional[str] = None
     BrandOEMFlag: Optional[str] = None
+
+
+# Fields written by BrandIndex.save(); "extra" is not persisted
+_PERSISTED_FIELDS = [f.name for f in fields(Brand) if f.name != "extra"]
+_INDEX_FORMAT_VERSION = 1
+
+
+def _clean_id(value: Optional[str]) -> Optional[str]:
+    """Normalize a brand code, treating blanks and the API's "null" as missing."""
+    if value is None:
+        return None
+    value = value.strip()
+    if not value or value.lower() == "null":
+        return None
+    return value.upper()
+
+
+def _name_key(name: Optional[str]) -> Optional[str]:
+    """Normalize a brand name for case-insensitive lookup."""
+    if name is None:
+        return None
+    key = " ".join(name.split()).casefold()
+    return key if key and key != "null" else None
+
+
+class BrandIndex:
+    """In-memory index over Brand Table records.
+
+    Resolves BrandID, SubBrandID and ParentID codes (as found in ACES
+    BrandAAIAID/BrandID attributes and PIES brand fields) with single dict
+    lookups instead of scanning the table. Codes are matched
+    case-insensitively.
+    """
+
+    def __init__(self, records: Iterable[Any] = ()):
+        """
+        Build the index.
+
+        Args:
+            records: Brand records (dicts or Brand models)
+        """
+        self.records: List[Brand] = []
+        self._by_brand_id: Dict[str, Brand] = {}
+        self._by_sub_brand_id: Dict[str, Brand] = {}
+        self._by_parent_id: Dict[str, List[Brand]] = {}
+        self._sub_brands: Dict[str, List[Brand]] = {}
+        self._by_name: Dict[str, List[Brand]] = {}
+        self._resolve: Dict[str, Brand] = {}
+
+        for record in records:
+            self._add(record if isinstance(record, Brand) else Brand.from_dict(record))
+
+        # Brand codes win over sub-brand codes when both exist
+        self._resolve = {**self._by_sub_brand_id, **self._by_brand_id}
+
+    def _add(self, record: Brand) -> None:
+        """Add one record to every index."""
+        self.records.append(record)
+        brand_id = _clean_id(record.BrandID)
+        sub_brand_id = _clean_id(record.SubBrandID)
+        parent_id = _clean_id(record.ParentID)
+
+        if brand_id:
+            existing = self._by_brand_id.get(brand_id)
+            # Prefer the brand-level row over rows that describe a sub-brand
+            if existing is None or (
+                _clean_id(existing.SubBrandID) and not sub_brand_id
+            ):
+                self._by_brand_id[brand_id] = record
+        if sub_brand_id:
+            self._by_sub_brand_id.setdefault(sub_brand_id, record)
+            if brand_id:
+                self._sub_brands.setdefault(brand_id, []).append(record)
+        if parent_id:
+            self._by_parent_id.setdefault(parent_id, []).append(record)
+
+        name_key = _name_key(record.SubBrandName if sub_brand_id else record.BrandName)
+        if name_key:
+            self._by_name.setdefault(name_key, []).append(record)
+
+    @classmethod
+    def from_client(cls, client: Any, version: Optional[str] = None) -> "BrandIndex":
+        """Build an index from the Brand Table of an AutoCareAPI client."""
+        resolved_version = (
+            version if version is not None else client.get_version("brand")
+        )
+        table_name = TABLES_V1[0] if resolved_version.startswith("1") else TABLES_V2[0]
+        return cls(client.fetch_records("brand", table_name, version=resolved_version))
+
+    def __len__(self) -> int:
+        """Number of indexed Brand Table rows."""
+        return len(self.records)
+
+    def brand(self, brand_id: str) -> Optional[Brand]:
+        """Get the brand-level record for a BrandID."""
+        return self._by_brand_id.get(_clean_id(brand_id) or "")
+
+    def sub_brand(self, sub_brand_id: str) -> Optional[Brand]:
+        """Get the record for a SubBrandID."""
+        return self._by_sub_brand_id.get(_clean_id(sub_brand_id) or "")
+
+    def brands_for_parent(self, parent_id: str) -> List[Brand]:
+        """Get every Brand Table row owned by a ParentID."""
+        return list(self._by_parent_id.get(_clean_id(parent_id) or "", []))
+
+    def sub_brands_for(self, brand_id: str) -> List[Brand]:
+        """Get the sub-brand rows of a BrandID."""
+        return list(self._sub_brands.get(_clean_id(brand_id) or "", []))
+
+    def find_by_name(self, name: str) -> List[Brand]:
+        """Find brands or sub-brands by name, ignoring case and spacing."""
+        return list(self._by_name.get(_name_key(name) or "", []))
+
+    def resolve(self, code: Optional[str]) -> Optional[Brand]:
+        """
+        Resolve a BrandID or SubBrandID code to its record.
+
+        Args:
+            code: Brand code from an ACES/PIES file
+
+        Returns:
+            Matching Brand record, or None if unknown
+        """
+        return self._resolve.get(_clean_id(code) or "")
+
+    def resolve_many(self, codes: Iterable[Optional[str]]) -> List[Optional[Brand]]:
+        """
+        Resolve a batch of BrandID/SubBrandID codes.
+
+        Returns:
+            Matching records (or None) in input order
+        """
+        resolve_get = self._resolve.get
+        return [resolve_get(_clean_id(code) or "") for code in codes]
+
+    def resolve_brand_ids(self, codes: Iterable[Optional[str]]) -> List[Optional[str]]:
+        """
+        Normalize a batch of codes to their canonical BrandID.
+
+        Sub-brand codes map to the BrandID that owns them.
+
+        Returns:
+            BrandIDs (or None for unknown codes) in input order
+        """
+        return [
+            _clean_id(record.BrandID) if record else None
+            for record in self.resolve_many(codes)
+        ]
+
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        """
+        Persist the indexed rows and the built lookup maps as compact JSON.
+
+        Rows are stored as positional lists and the maps as row positions,
+        so load() neither re-normalizes codes and names nor re-applies the
+        brand-over-sub-brand precedence rules.
+        """
+        positions = {id(record): i for i, record in enumerate(self.records)}
+
+        def position(records: Dict[str, Brand]) -> Dict[str, int]:
+            return {code: positions[id(record)] for code, record in records.items()}
+
+        def position_lists(records: Dict[str, List[Brand]]) -> Dict[str, List[int]]:
+            return {
+                code: [positions[id(record)] for record in group]
+                for code, group in records.items()
+            }
+
+        payload = {
+            "format_version": _INDEX_FORMAT_VERSION,
+            "fields": _PERSISTED_FIELDS,
+            "rows": [
+                [getattr(record, name) for name in _PERSISTED_FIELDS]
+                for record in self.records
+            ],
+            "brand_id": position(self._by_brand_id),
+            "sub_brand_id": position(self._by_sub_brand_id),
+            "parent_id": position_lists(self._by_parent_id),
+            "sub_brands": position_lists(self._sub_brands),
+            "name": position_lists(self._by_name),
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike]) -> "BrandIndex":
+        """
+        Load an index written by save() without rebuilding it.
+
+        Raises:
+            ValueError: If the file uses an unsupported format version
+        """
+        with open(path, encoding="utf-8") as f:
+            payload = json.load(f)
+
+        if payload.get("format_version") != _INDEX_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported BrandIndex format: {payload.get('format_version')}"
+            )
+
+        names = payload["fields"]
+        records = [Brand(**dict(zip(names, row))) for row in payload["rows"]]
+
+        def lists(positions: Dict[str, List[int]]) -> Dict[str, List[Brand]]:
+            return {
+                code: [records[i] for i in group] for code, group in positions.items()
+            }
+
+        index = cls()
+        index.records = records
+        index._by_brand_id = {
+            code: records[i] for code, i in payload["brand_id"].items()
+        }
+        index._by_sub_brand_id = {
+            code: records[i] for code, i in payload["sub_brand_id"].items()
+        }
+        index._by_parent_id = lists(payload["parent_id"])
+        index._sub_brands = lists(payload["sub_brands"])
+        index._by_name = lists(payload["name"])
+        index._resolve = {**index._by_sub_brand_id, **index._by_brand_id}
+        return index
@@ -54,3 +54,34 @@ class PartAttributeAssignment(CulturedModel):
     PartTerminologyID: Optional[int] = None
     PAID: Optional[int] = None
     StyleID: Optional[int] = None
+    PAPTID: Optional[int] = None
+    MetaID: Optional[int] = None
+
+
+@dataclass
+class ValidValueAssignment(CulturedModel):
+    """PAdb ValidValueAssignment record."""
+
+    ValidValueAssignmentID: Optional[int] = None
+    PAPTID: Optional[int] = None
+    ValidValueID: Optional[int] = None
+
+
+@dataclass
+class MetaUOMCode(CulturedModel):
+    """PAdb MetaUOMCodes record."""
+
+    MetaUOMID: Optional[int] = None
+    UOMCode: Optional[str] = None
+    UOMDescription: Optional[str] = None
+    UOMLabel: Optional[str] = None
+    MeasurementGroupID: Optional[int] = None
+
+
+@dataclass
+class MetaUOMCodeAssignment(CulturedModel):
+    """PAdb MetaUOMCodeAssignment record."""
+
+    MetaUOMCodeAssignmentID: Optional[int] = None
+    PAPTID: Optional[int] = None
+    MetaUOMID: Optional[int] = None
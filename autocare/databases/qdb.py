@@ -1,9 +1,10 @@
-"""Qdb (Qualifier Database) models and constants."""
+"""Qdb (Qualifier Database) models, constants, and qualifier rendering."""
 
+import re
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
-from autocare.databases.base import CulturedModel
+from autocare.databases.base import CulturedModel, record_value
 
 # Table names available in Qdb
 TABLES = [
@@ -30,3 +31,252 @@ class QualifierType(CulturedModel):
 
     QualifierTypeID: Optional[int] = None
     QualifierTypeName: Optional[str] = None
+
+
+# Matches template parameters like <p1/> or <p2 type="num"/>
+_PARAM_PATTERN = re.compile(r"<p(\d+)((?:\s+\w+\s*=\s*\"[^\"]*\")*)\s*/>")
+_PARAM_TYPE_PATTERN = re.compile(r"type\s*=\s*\"([^\"]*)\"")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+_PARAM_MATCH_PATTERNS = {
+    "num": r"([-+]?\d+(?:\.\d+)?)",
+}
+_DEFAULT_PARAM_MATCH_PATTERN = r"(.+?)"
+
+
+def _normalize_text(text: str) -> str:
+    """Collapse whitespace and casefold text for reverse matching."""
+    return _WHITESPACE_PATTERN.sub(" ", text).strip().casefold()
+
+
+@dataclass(frozen=True)
+class CompiledQualifier:
+    """A Qdb qualifier template parsed into literal and parameter slots.
+
+    literals always has one more entry than param_slots: rendering interleaves
+    literals[0], params[slot 0], literals[1], ... literals[-1].
+    """
+
+    qualifier_id: int
+    template: str
+    literals: Tuple[str, ...]
+    param_slots: Tuple[int, ...]
+    param_types: Tuple[Optional[str], ...]
+
+    @classmethod
+    def parse(cls, qualifier_id: int, template: str) -> "CompiledQualifier":
+        """Parse a QualifierText template into its compiled form."""
+        literals = []
+        slots = []
+        types = []
+        position = 0
+        for match in _PARAM_PATTERN.finditer(template):
+            literals.append(template[position : match.start()])
+            slots.append(int(match.group(1)) - 1)
+            type_match = _PARAM_TYPE_PATTERN.search(match.group(2))
+            types.append(type_match.group(1) if type_match else None)
+            position = match.end()
+        literals.append(template[position:])
+        return cls(
+            qualifier_id=qualifier_id,
+            template=template,
+            literals=tuple(literals),
+            param_slots=tuple(slots),
+            param_types=tuple(types),
+        )
+
+    @property
+    def param_count(self) -> int:
+        """Number of distinct parameters the template expects."""
+        return max(self.param_slots) + 1 if self.param_slots else 0
+
+    def render(self, params: Sequence[Any] = ()) -> str:
+        """
+        Render the template with positional parameters (p1 = params[0]).
+
+        Raises:
+            ValueError: If fewer parameters are given than the template uses
+        """
+        literals = self.literals
+        if not self.param_slots:
+            return literals[0]
+        if len(params) < self.param_count:
+            raise ValueError(
+                f"Qualifier {self.qualifier_id} expects {self.param_count} "
+                f"parameters, got {len(params)}"
+            )
+        parts = [literals[0]]
+        for index, slot in enumerate(self.param_slots, start=1):
+            parts.append(str(params[slot]))
+            parts.append(literals[index])
+        return "".join(parts)
+
+    def match_pattern(self) -> "re.Pattern[str]":
+        """Build a case-insensitive regex that matches rendered text."""
+        pieces = []
+        for index, literal in enumerate(self.literals):
+            words = literal.split()
+            if words:
+                pieces.append(r"\s+".join(re.escape(word) for word in words))
+            if index < len(self.param_slots):
+                param_type = self.param_types[index] or ""
+                pieces.append(
+                    _PARAM_MATCH_PATTERNS.get(param_type, _DEFAULT_PARAM_MATCH_PATTERN)
+                )
+        return re.compile(r"\s*".join(pieces), re.IGNORECASE)
+
+
+class QualifierRenderer:
+    """Renders Qdb qualifier templates and matches rendered text back to IDs.
+
+    Templates are parsed once per QualifierID on first use and cached, so
+    rendering an application only joins precomputed literal segments.
+    """
+
+    def __init__(self, qualifiers: Iterable[Any] = ()):
+        """
+        Initialize the renderer.
+
+        Args:
+            qualifiers: Qualifier records (dicts or Qualifier models)
+        """
+        self._templates: Dict[int, str] = {}
+        self._compiled: Dict[int, CompiledQualifier] = {}
+        self._exact_index: Optional[Dict[str, List[int]]] = None
+        self._prefix_index: Optional[Dict[str, List[int]]] = None
+        self._match_patterns: Dict[int, "re.Pattern[str]"] = {}
+
+        for record in qualifiers:
+            qualifier_id = record_value(record, "QualifierID")
+            text = record_value(record, "QualifierText")
+            if qualifier_id is not None and text:
+                self.add(int(qualifier_id), text)
+
+    @classmethod
+    def from_client(
+        cls, client: Any, version: Optional[str] = None
+    ) -> "QualifierRenderer":
+        """Build a renderer from the Qdb Qualifier table."""
+        return cls(client.fetch_records("qdb", "Qualifier", version=version))
+
+    def add(self, qualifier_id: int, template: str) -> None:
+        """Register or replace the template for a QualifierID."""
+        self._templates[qualifier_id] = template
+        self._compiled.pop(qualifier_id, None)
+        self._match_patterns.pop(qualifier_id, None)
+        self._exact_index = None
+        self._prefix_index = None
+
+    def __len__(self) -> int:
+        """Number of registered qualifier templates."""
+        return len(self._templates)
+
+    def __contains__(self, qualifier_id: object) -> bool:
+        """Check whether a QualifierID has a registered template."""
+        return qualifier_id in self._templates
+
+    def compile(self, qualifier_id: int) -> CompiledQualifier:
+        """
+        Get the compiled template for a QualifierID, parsing it on first use.
+
+        Raises:
+            KeyError: If the QualifierID is unknown
+        """
+        compiled = self._compiled.get(qualifier_id)
+        if compiled is None:
+            compiled = CompiledQualifier.parse(
+                qualifier_id, self._templates[qualifier_id]
+            )
+            self._compiled[qualifier_id] = compiled
+        return compiled
+
+    def render(self, qualifier_id: int, params: Sequence[Any] = ()) -> str:
+        """
+        Render a qualifier with its parameters.
+
+        Args:
+            qualifier_id: QualifierID to render
+            params: Positional parameter values (p1 first)
+
+        Returns:
+            Rendered qualifier text
+
+        Raises:
+            KeyError: If the QualifierID is unknown
+            ValueError: If too few parameters are given
+        """
+        compiled = self._compiled.get(qualifier_id) or self.compile(qualifier_id)
+        return compiled.render(params)
+
+    def render_many(self, items: Iterable[Tuple[int, Sequence[Any]]]) -> List[str]:
+        """
+        Render a batch of (QualifierID, params) pairs.
+
+        Returns:
+            Rendered texts in input order
+        """
+        compiled_get = self._compiled.get
+        compile_ = self.compile
+        return [
+            (compiled_get(qualifier_id) or compile_(qualifier_id)).render(params)
+            for qualifier_id, params in items
+        ]
+
+    def _build_index(self) -> None:
+        """Index templates by normalized text or leading literal word."""
+        exact: Dict[str, List[int]] = {}
+        prefix: Dict[str, List[int]] = {}
+        for qualifier_id in self._templates:
+            compiled = self.compile(qualifier_id)
+            if not compiled.param_slots:
+                key = _normalize_text(compiled.literals[0])
+                exact.setdefault(key, []).append(qualifier_id)
+            else:
+                words = _normalize_text(compiled.literals[0]).split(" ")
+                # Templates that start with a parameter go under ""
+                first_word = words[0] if compiled.literals[0].strip() else ""
+                prefix.setdefault(first_word, []).append(qualifier_id)
+        self._exact_index = exact
+        self._prefix_index = prefix
+
+    def match(self, text: str) -> List[Tuple[int, List[str]]]:
+        """
+        Match rendered qualifier text back to QualifierIDs.
+
+        Matching ignores case and whitespace differences.
+
+        Args:
+            text: Rendered qualifier text from supplier data
+
+        Returns:
+            List of (QualifierID, extracted params) candidates; parameterless
+            templates match with an empty params list
+        """
+        if self._exact_index is None or self._prefix_index is None:
+            self._build_index()
+        assert self._exact_index is not None and self._prefix_index is not None
+
+        collapsed = _WHITESPACE_PATTERN.sub(" ", text).strip()
+        normalized = collapsed.casefold()
+        results: List[Tuple[int, List[str]]] = [
+            (qualifier_id, []) for qualifier_id in self._exact_index.get(normalized, [])
+        ]
+
+        first_word = normalized.split(" ", 1)[0]
+        candidates = self._prefix_index.get(first_word, [])
+        if first_word:
+            candidates = candidates + self._prefix_index.get("", [])
+
+        for qualifier_id in candidates:
+            pattern = self._match_patterns.get(qualifier_id)
+            if pattern is None:
+                pattern = self.compile(qualifier_id).match_pattern()
+                self._match_patterns[qualifier_id] = pattern
+            found = pattern.fullmatch(collapsed)
+            if found:
+                compiled = self._compiled[qualifier_id]
+                params: List[str] = [""] * compiled.param_count
+                for slot, value in zip(compiled.param_slots, found.groups()):
+                    params[slot] = value
+                results.append((qualifier_id, params))
+        return results
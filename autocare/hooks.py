@@ -0,0 +1,173 @@
+"""Instrumentation hooks for AutoCareAPI requests.
+
+Subclass ClientHooks, override the events of interest and pass instances
+to AutoCareAPI(hooks=[...]) or client.add_hook(). Hooks run synchronously
+on the requesting thread; an exception raised by a hook is logged and does
+not fail the request.
+
+Example:
+    class SlowRequestLogger(ClientHooks):
+        def after_response(self, event):
+            if event.elapsed > 2.0:
+                print(f"slow: {event.url} {event.elapsed:.1f}s")
+
+    client = AutoCareAPI(..., hooks=[SlowRequestLogger()])
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlsplit
+
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RequestEvent:
+    """One HTTP request, before it is sent or after it completed.
+
+    Attributes:
+        method: HTTP method
+        url: Request URL
+        host: Host name from the URL
+        table: Table the request fetches records of, if any
+        params: Query parameters
+        status_code: Response status (None before sending or on failure)
+        elapsed: Seconds from sending to a complete response (or failure)
+        bytes: Response body size
+        from_cache: Body served from the HTTP cache after a 304
+        error: Connection error message, if the request failed
+    """
+
+    method: str
+    url: str
+    host: str
+    table: Optional[str] = None
+    params: Optional[Dict[str, Any]] = None
+    status_code: Optional[int] = None
+    elapsed: float = 0.0
+    bytes: int = 0
+    from_cache: bool = False
+    error: Optional[str] = None
+
+
+@dataclass
+class RetryEvent:
+    """A retry scheduled by the session's retry policy.
+
+    Attributes:
+        method: HTTP method
+        url: Request path
+        host: Host name
+        attempt: Retry number (1 for the first retry)
+        status_code: Status that triggered the retry (None for errors)
+        error: Connection or read error that triggered the retry
+        backoff: Seconds the policy waits before retrying (Retry-After
+                 headers on 429 / 503 responses may extend this)
+    """
+
+    method: Optional[str]
+    url: Optional[str]
+    host: Optional[str]
+    attempt: int
+    status_code: Optional[int] = None
+    error: Optional[str] = None
+    backoff: float = 0.0
+
+    @property
+    def throttled(self) -> bool:
+        """The server asked the client to slow down (429)."""
+        return self.status_code == 429
+
+
+@dataclass
+class PageEvent:
+    """One page of records from fetch_records().
+
+    Attributes:
+        db_name: Database name
+        table: Table name
+        page: Page number, starting at 1
+        records: Records on the page
+        url: Page URL
+    """
+
+    db_name: str
+    table: str
+    page: int
+    records: int
+    url: str
+
+
+class ClientHooks:
+    """Base class for request instrumentation; every hook is a no-op."""
+
+    def before_request(self, event: RequestEvent) -> None:
+        """Called before a request is sent."""
+
+    def after_response(self, event: RequestEvent) -> None:
+        """Called when a request completed or failed to connect."""
+
+    def on_retry(self, event: RetryEvent) -> None:
+        """Called when the retry policy schedules another attempt."""
+
+    def on_page(self, event: PageEvent) -> None:
+        """Called for each page fetch_records() receives."""
+
+    def on_auth(self, refresh: bool) -> None:
+        """Called after a successful authentication or token refresh."""
+
+
+def host_of(url: str) -> str:
+    """Host name of a URL ("" if it has none)."""
+    return urlsplit(url).hostname or ""
+
+
+def emit(hooks: List[ClientHooks], name: str, *args: Any) -> None:
+    """Call one hook on every registered ClientHooks, logging failures."""
+    for hook in hooks:
+        try:
+            getattr(hook, name)(*args)
+        except Exception:
+            logger.warning(f"{type(hook).__name__}.{name} failed", exc_info=True)
+
+
+class HookedRetry(Retry):
+    """urllib3 Retry that reports every scheduled retry to on_retry hooks."""
+
+    def __init__(
+        self, *args: Any, notify: Optional[Callable[[RetryEvent], None]] = None, **kw
+    ):
+        super().__init__(*args, **kw)
+        self.notify = notify
+
+    def new(self, **kw: Any) -> "HookedRetry":
+        retry = super().new(**kw)
+        retry.notify = self.notify
+        return retry
+
+    def increment(  # type: ignore[override]
+        self,
+        method: Optional[str] = None,
+        url: Optional[str] = None,
+        response: Any = None,
+        error: Optional[Exception] = None,
+        _pool: Any = None,
+        _stacktrace: Any = None,
+    ) -> "HookedRetry":
+        retry = super().increment(method, url, response, error, _pool, _stacktrace)
+        if self.notify is not None:
+            self.notify(
+                RetryEvent(
+                    method=method,
+                    url=url,
+                    host=getattr(_pool, "host", None),
+                    attempt=len(retry.history),
+                    status_code=getattr(response, "status", None),
+                    error=str(error) if error is not None else None,
+                    backoff=retry.get_backoff_time(),
+                )
+            )
+        return retry
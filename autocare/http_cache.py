@@ -0,0 +1,266 @@
+"""On-disk HTTP response cache with conditional revalidation.
+
+AutoCare reference data changes rarely, so GET responses that carry an
+ETag or Last-Modified header are kept in a SQLite file keyed by URL and
+query parameters. The next request for the same key is sent with
+If-None-Match / If-Modified-Since; a 304 answer is served from the stored
+body. The store is bounded by total body size and evicts the least
+recently used entries first.
+
+Example:
+    cache = HTTPCache("~/.cache/autocare/http.sqlite", max_bytes=2 << 30)
+    client = AutoCareAPI(..., http_cache=cache)
+    ...
+    print(cache.stats)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Mapping, Optional, Union
+from urllib.parse import urlencode
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 1 << 30
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    used INTEGER NOT NULL
+)
+"""
+
+
+@dataclass
+class CachedResponse:
+    """A stored response and its validators."""
+
+    url: str
+    body: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    stored_at: float = 0.0
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for revalidating this response."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass
+class HTTPCacheStats:
+    """Counters for one HTTPCache.
+
+    Attributes:
+        hits: Requests answered 304 and served from the store
+        misses: Cacheable requests that downloaded a body
+        stores: Responses written to the store
+        evictions: Entries evicted to stay under max_bytes
+        bytes_saved: Body bytes served from the store instead of the network
+    """
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    bytes_saved: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of cacheable requests served from the store."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class HTTPCache:
+    """Size-bounded LRU store of GET responses, keyed by URL and parameters.
+
+    Safe to share between threads (e.g. a sink's prefetch thread and the
+    caller).
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        """
+        Open or create a cache file.
+
+        Args:
+            path: SQLite file for the store (parent directories are created)
+            max_bytes: Upper bound on the total size of stored bodies
+        """
+        self.path = os.path.expanduser(os.fspath(path))
+        self.max_bytes = max_bytes
+        self.stats = HTTPCacheStats()
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_used ON responses (used)"
+        )
+        size, used = self._conn.execute(
+            "SELECT coalesce(sum(size), 0), coalesce(max(used), 0) FROM responses"
+        ).fetchone()
+        self._size = size
+        self._clock = used
+
+    @staticmethod
+    def key(url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        """Cache key for a GET of url with the given query parameters."""
+        if params:
+            url = f"{url}?{urlencode(sorted((k, str(v)) for k, v in params.items()))}"
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    @property
+    def size(self) -> int:
+        """Total size of stored bodies in bytes."""
+        return self._size
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT count(*) FROM responses").fetchone()[0]
+
+    def _tick(self) -> int:
+        self._clock += 1
+        return self._clock
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Stored response for a key, marking it recently used."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, body, headers, etag, last_modified, stored_at "
+                "FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE responses SET used = ? WHERE key = ?", (self._tick(), key)
+            )
+        url, body, headers, etag, last_modified, stored_at = row
+        return CachedResponse(
+            url, body, json.loads(headers), etag, last_modified, stored_at
+        )
+
+    def put(
+        self,
+        key: str,
+        url: str,
+        body: bytes,
+        headers: Mapping[str, str],
+    ) -> bool:
+        """
+        Store a response if it carries a validator and fits the cache.
+
+        Args:
+            key: Cache key from key()
+            url: Request URL (kept for inspection)
+            body: Raw response body
+            headers: Response headers
+
+        Returns:
+            True if the response was stored
+        """
+        lookup = {name.lower(): value for name, value in headers.items()}
+        etag = lookup.get("etag")
+        last_modified = lookup.get("last-modified")
+        if (etag is None and last_modified is None) or len(body) > self.max_bytes:
+            return False
+
+        with self._lock:
+            previous = self._conn.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute("BEGIN")
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    url,
+                    etag,
+                    last_modified,
+                    json.dumps(dict(headers)),
+                    body,
+                    len(body),
+                    time.time(),
+                    self._tick(),
+                ),
+            )
+            self._size += len(body) - (previous[0] if previous else 0)
+            self._evict()
+            self._conn.execute("COMMIT")
+            self.stats.stores += 1
+        return True
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until under max_bytes."""
+        while self._size > self.max_bytes:
+            rows = self._conn.execute(
+                "SELECT key, size FROM responses ORDER BY used LIMIT 64"
+            ).fetchall()
+            if not rows:
+                self._size = 0
+                return
+            for key, size in rows:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._size -= size
+                self.stats.evictions += 1
+                if self._size <= self.max_bytes:
+                    return
+
+    def record_hit(self, entry: CachedResponse) -> None:
+        """Count a 304 answered from the store."""
+        self.stats.hits += 1
+        self.stats.bytes_saved += len(entry.body)
+
+    def record_miss(self) -> None:
+        """Count a cacheable request that downloaded a body."""
+        self.stats.misses += 1
+
+    def invalidate(self, key: str) -> None:
+        """Remove one entry."""
+        with self._lock:
+            row = self._conn.execute(
+                "DELETE FROM responses WHERE key = ? RETURNING size", (key,)
+            ).fetchone()
+            if row is not None:
+                self._size -= row[0]
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._size = 0
+
+    def close(self) -> None:
+        """Close the store."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,315 @@
+"""Two-tier cache for per-ID reference lookups (Make by MakeID, ...).
+
+Lookups are answered from an in-process LRU of decoded rows first, then
+from a SQLite store holding every row of the tables seen so far. A table
+that is not in the store yet (or is older than max_age) is bulk-loaded
+with one fetch_records() pass the first time any of its IDs is missed, so
+a cold lookup costs one table download rather than one request per ID.
+
+Example:
+    cache = LookupCache(client, "~/.cache/autocare/lookup.sqlite")
+    make = cache.get("vcdb", "Make", 54)
+    models = cache.get_many("vcdb", "Model", model_ids)
+    print(cache.stats)
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 64 << 20
+
+# Rows written per executemany() during a bulk load
+_LOAD_BATCH = 5_000
+# Bound on "?" parameters per IN (...) query
+_QUERY_BATCH = 500
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS rows (
+        db TEXT NOT NULL,
+        tbl TEXT NOT NULL,
+        id TEXT NOT NULL,
+        data TEXT NOT NULL,
+        PRIMARY KEY (db, tbl, id)
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS tables (
+        db TEXT NOT NULL,
+        tbl TEXT NOT NULL,
+        key TEXT NOT NULL,
+        rows INTEGER NOT NULL,
+        loaded_at REAL NOT NULL,
+        PRIMARY KEY (db, tbl)
+    )
+    """,
+)
+
+_Key = Tuple[str, str, str]
+
+
+@dataclass
+class LookupStats:
+    """Counters for one LookupCache.
+
+    Attributes:
+        hits: IDs answered from memory
+        disk_hits: IDs answered from the SQLite store
+        misses: IDs found in neither (after loading the table)
+        loads: Tables bulk-loaded from the API
+        evictions: Rows evicted from memory to stay under max_bytes
+        memory_bytes: Encoded size of the rows held in memory
+    """
+
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    loads: int = 0
+    evictions: int = 0
+    memory_bytes: int = 0
+
+    @property
+    def lookups(self) -> int:
+        """IDs looked up."""
+        return self.hits + self.disk_hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups answered from memory."""
+        return self.hits / self.lookups if self.lookups else 0.0
+
+
+def _id(value: Any) -> str:
+    """Store key for an ID value (1 and "1" are the same ID)."""
+    return str(value).strip()
+
+
+class LookupCache:
+    """LRU over a SQLite store of reference rows, keyed by table ID column.
+
+    Rows are returned as the raw API dicts. Safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        path: Optional[Union[str, os.PathLike]] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_age: Optional[float] = None,
+        page_size: Optional[int] = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            client: Authenticated AutoCareAPI instance used for bulk loads
+            path: SQLite file for the store; None keeps it in memory
+            max_bytes: Bound on the encoded size of rows held in the LRU
+            max_age: Seconds before a stored table is loaded again;
+                     None keeps it until invalidate()
+            page_size: Records per API page for bulk loads
+        """
+        self.client = client
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.page_size = page_size
+        self.stats = LookupStats()
+        if path is None:
+            self.path = ":memory:"
+        else:
+            self.path = os.path.expanduser(os.fspath(path))
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._memory: "OrderedDict[_Key, Tuple[Dict[str, Any], int]]" = OrderedDict()
+        self._conn = sqlite3.connect(
+            self.path, isolation_level=None, check_same_thread=False
+        )
+        if self.path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        for statement in _SCHEMA:
+            self._conn.execute(statement)
+
+    def get(
+        self, db_name: str, table: str, record_id: Any, key: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Row of a reference table by ID.
+
+        Args:
+            db_name: Database name (e.g. "vcdb")
+            table: Table name (e.g. "Make")
+            record_id: ID value
+            key: ID column; default "<table>ID"
+
+        Returns:
+            The row, or None if the table has no such ID
+        """
+        return self.get_many(db_name, table, [record_id], key).get(record_id)
+
+    def get_many(
+        self,
+        db_name: str,
+        table: str,
+        ids: Iterable[Any],
+        key: Optional[str] = None,
+    ) -> Dict[Any, Dict[str, Any]]:
+        """
+        Rows of a reference table for many IDs at once.
+
+        IDs missing from memory are read from the store in batched queries,
+        and the table is bulk-loaded at most once for the whole call.
+
+        Args:
+            db_name: Database name
+            table: Table name
+            ids: ID values
+            key: ID column; default "<table>ID"
+
+        Returns:
+            Row per requested ID; IDs the table does not have are left out
+        """
+        db = db_name.lower()
+        found: Dict[Any, Dict[str, Any]] = {}
+        with self._lock:
+            wanted: Dict[str, List[Any]] = {}
+            for value in ids:
+                cache_key = (db, table, _id(value))
+                entry = self._memory.get(cache_key)
+                if entry is not None:
+                    self._memory.move_to_end(cache_key)
+                    found[value] = entry[0]
+                    self.stats.hits += 1
+                else:
+                    wanted.setdefault(cache_key[2], []).append(value)
+            if not wanted:
+                return found
+
+            self._ensure_loaded(db, table, key or f"{table}ID")
+            for store_id, data in self._select(db, table, list(wanted)):
+                row = json.loads(data)
+                self._remember((db, table, store_id), row, len(data))
+                for value in wanted.pop(store_id):
+                    found[value] = row
+                    self.stats.disk_hits += 1
+            self.stats.misses += sum(len(values) for values in wanted.values())
+        return found
+
+    def _select(self, db: str, table: str, ids: List[str]) -> List[Tuple[str, str]]:
+        """Stored (id, data) pairs for the given IDs."""
+        rows: List[Tuple[str, str]] = []
+        for start in range(0, len(ids), _QUERY_BATCH):
+            batch = ids[start : start + _QUERY_BATCH]
+            rows.extend(
+                self._conn.execute(
+                    "SELECT id, data FROM rows WHERE db = ? AND tbl = ? "
+                    f"AND id IN ({', '.join('?' * len(batch))})",
+                    (db, table, *batch),
+                )
+            )
+        return rows
+
+    def _remember(self, cache_key: _Key, row: Dict[str, Any], size: int) -> None:
+        """Add a row to the LRU, evicting the least recently used rows."""
+        self._memory[cache_key] = (row, size)
+        self.stats.memory_bytes += size
+        while self.stats.memory_bytes > self.max_bytes and self._memory:
+            _, (_, evicted) = self._memory.popitem(last=False)
+            self.stats.memory_bytes -= evicted
+            self.stats.evictions += 1
+
+    def _ensure_loaded(self, db: str, table: str, key: str) -> None:
+        """Bulk-load a table into the store unless a fresh copy is there."""
+        stored = self._conn.execute(
+            "SELECT key, loaded_at FROM tables WHERE db = ? AND tbl = ?",
+            (db, table),
+        ).fetchone()
+        if stored is not None and stored[0] == key:
+            if self.max_age is None or time.time() - stored[1] < self.max_age:
+                return
+        self._load(db, table, key)
+
+    def _load(self, db: str, table: str, key: str) -> None:
+        """Replace a table's stored rows with a fresh fetch_records() pass."""
+        self._forget(db, table)
+        encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+        count = 0
+        self._conn.execute("BEGIN")
+        try:
+            self._conn.execute("DELETE FROM rows WHERE db = ? AND tbl = ?", (db, table))
+            batch = []
+            for record in self.client.fetch_records(
+                db, table, page_size=self.page_size
+            ):
+                value = record.get(key)
+                if value is None or value == "null":
+                    continue
+                batch.append((db, table, _id(value), encode(record)))
+                if len(batch) >= _LOAD_BATCH:
+                    self._insert(batch)
+                    count += len(batch)
+                    batch = []
+            self._insert(batch)
+            count += len(batch)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO tables VALUES (?, ?, ?, ?, ?)",
+                (db, table, key, count, time.time()),
+            )
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self.stats.loads += 1
+        logger.info(f"Loaded {count} {db} {table} rows into the lookup cache")
+
+    def _insert(self, batch: List[Tuple[str, str, str, str]]) -> None:
+        self._conn.executemany("INSERT OR REPLACE INTO rows VALUES (?, ?, ?, ?)", batch)
+
+    def _forget(self, db: str, table: Optional[str]) -> None:
+        """Drop a table's rows (every table of db if None) from memory."""
+        for cache_key in [
+            k for k in self._memory if k[0] == db and table in (None, k[1])
+        ]:
+            _, size = self._memory.pop(cache_key)
+            self.stats.memory_bytes -= size
+
+    def invalidate(self, db_name: str, table: Optional[str] = None) -> None:
+        """
+        Drop stored rows so the next lookup loads them again.
+
+        Args:
+            db_name: Database name
+            table: Only drop this table; default: every table of db_name
+        """
+        db = db_name.lower()
+        where = "db = ?" if table is None else "db = ? AND tbl = ?"
+        params = (db,) if table is None else (db, table)
+        with self._lock:
+            self._forget(db, table)
+            self._conn.execute("BEGIN")
+            self._conn.execute(f"DELETE FROM rows WHERE {where}", params)
+            self._conn.execute(f"DELETE FROM tables WHERE {where}", params)
+            self._conn.execute("COMMIT")
+
+    def __len__(self) -> int:
+        """Rows held in memory."""
+        return len(self._memory)
+
+    def close(self) -> None:
+        """Close the store."""
+        with self._lock:
+            self._memory.clear()
+            self.stats.memory_bytes = 0
+            self._conn.close()
@@ -0,0 +1,132 @@
+"""TTL cache for catalog metadata (databases, tables and their columns).
+
+Catalog calls such as list_tables() are cheap to answer locally and
+expensive to repeat over HTTP, and the catalog changes at most once per
+release. Entries expire after a TTL and can be invalidated explicitly.
+Entries can also be persisted as JSON so short-lived processes share one
+catalog fetch.
+
+Each entry holds JSON-compatible rows (what is persisted) plus the object
+built from them (what callers use, e.g. a name -> TableInfo dict). Entries
+read back from disk are rebuilt on first use.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
+
+T = TypeVar("T")
+
+DEFAULT_TTL = 900.0
+
+_CACHE_FORMAT_VERSION = 1
+_UNBUILT = object()
+
+
+class MetadataCache:
+    """In-memory TTL cache of catalog rows with optional JSON persistence."""
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_TTL,
+        path: Optional[Union[str, os.PathLike]] = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry stays fresh; 0 disables caching
+            path: JSON file to load entries from and save them to
+        """
+        self.ttl = ttl
+        self.path = os.path.expanduser(os.fspath(path)) if path is not None else None
+        self._lock = threading.Lock()
+        # key -> (stored_at, rows, built value or _UNBUILT)
+        self._entries: Dict[str, Tuple[float, List[Dict[str, Any]], Any]] = {}
+        if self.path is not None and os.path.exists(self.path):
+            self._load()
+
+    def get(self, key: str, build: Callable[[List[Dict[str, Any]]], T]) -> Optional[T]:
+        """
+        Fresh value for a key, or None if missing or expired.
+
+        Args:
+            key: Entry key
+            build: Rebuilds the value from persisted rows when needed
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, rows, value = entry
+            if time.time() - stored_at >= self.ttl:
+                del self._entries[key]
+                return None
+            if value is _UNBUILT:
+                value = build(rows)
+                self._entries[key] = (stored_at, rows, value)
+            return value
+
+    def put(self, key: str, rows: List[Dict[str, Any]], value: Any) -> None:
+        """
+        Store an entry (and persist all entries, if a path is set).
+
+        Args:
+            key: Entry key
+            rows: JSON-compatible rows the value is built from
+            value: Object handed back by get()
+        """
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.time(), rows, value)
+            self._save()
+
+    def invalidate(self, prefix: Optional[str] = None) -> None:
+        """
+        Drop entries whose key starts with prefix; all entries if None.
+        """
+        with self._lock:
+            if prefix is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if k.startswith(prefix)]:
+                    del self._entries[key]
+            self._save()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _save(self) -> None:
+        """Write every entry to the JSON file, replacing it atomically."""
+        if self.path is None:
+            return
+        payload = {
+            "format_version": _CACHE_FORMAT_VERSION,
+            "entries": {
+                key: {"stored_at": stored_at, "rows": rows}
+                for key, (stored_at, rows, _) in self._entries.items()
+            },
+        }
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(payload, f, separators=(",", ":"))
+        os.replace(tmp, self.path)
+
+    def _load(self) -> None:
+        """Read entries from the JSON file; unreadable files are ignored."""
+        assert self.path is not None
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return
+        if payload.get("format_version") != _CACHE_FORMAT_VERSION:
+            return
+        for key, entry in payload.get("entries", {}).items():
+            self._entries[key] = (entry["stored_at"], entry["rows"], _UNBUILT)
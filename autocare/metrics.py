@@ -0,0 +1,204 @@
+"""Built-in request metrics with a Prometheus text-format exporter.
+
+MetricsCollector is a ClientHooks implementation that keeps latency
+histograms and counters per host and table:
+
+    metrics = MetricsCollector()
+    client = AutoCareAPI(..., hooks=[metrics])
+    ...
+    with open("/var/lib/node_exporter/autocare.prom", "w") as f:
+        f.write(metrics.to_prometheus())
+"""
+
+import threading
+from collections import defaultdict
+from typing import DefaultDict, Dict, List, Sequence, Tuple
+
+from autocare.hooks import ClientHooks, PageEvent, RequestEvent, RetryEvent
+
+# Request latency buckets in seconds (Prometheus client defaults, plus 30s
+# and 60s for large pages)
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+_PREFIX = "autocare"
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class Histogram:
+    """Cumulative-bucket histogram of observed values."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Add one observation."""
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """(upper bound, observations <= bound) per bucket, without +Inf."""
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+    @property
+    def mean(self) -> float:
+        """Average observed value."""
+        return self.sum / self.count if self.count else 0.0
+
+
+def _labels(**labels: str) -> Labels:
+    return tuple(labels.items())
+
+
+def _format_labels(labels: Labels, extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in labels]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class MetricsCollector(ClientHooks):
+    """Request, page, retry and auth metrics for one or more clients.
+
+    Attributes:
+        latency: Request latency histogram per (host, table)
+        bytes_received: Response body bytes per (host, table)
+        requests: Completed requests per (host, status)
+        pages: Pages per (db, table)
+        records: Records per (db, table)
+        retries: Scheduled retries per host
+        throttles: 429 responses per host (retried or final)
+        auth: Authentications per kind ("login" or "refresh")
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        Initialize the collector.
+
+        Args:
+            buckets: Latency histogram bucket bounds in seconds
+        """
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self.latency: Dict[Labels, Histogram] = {}
+        self.bytes_received: DefaultDict[Labels, int] = defaultdict(int)
+        self.requests: DefaultDict[Labels, int] = defaultdict(int)
+        self.pages: DefaultDict[Labels, int] = defaultdict(int)
+        self.records: DefaultDict[Labels, int] = defaultdict(int)
+        self.retries: DefaultDict[Labels, int] = defaultdict(int)
+        self.throttles: DefaultDict[Labels, int] = defaultdict(int)
+        self.auth: DefaultDict[Labels, int] = defaultdict(int)
+
+    def after_response(self, event: RequestEvent) -> None:
+        """Record latency, size and status of a request."""
+        target = _labels(host=event.host, table=event.table or "")
+        status = "error" if event.status_code is None else str(event.status_code)
+        with self._lock:
+            histogram = self.latency.get(target)
+            if histogram is None:
+                histogram = self.latency[target] = Histogram(self.buckets)
+            histogram.observe(event.elapsed)
+            self.bytes_received[target] += event.bytes
+            self.requests[_labels(host=event.host, status=status)] += 1
+            if event.status_code == 429:
+                self.throttles[_labels(host=event.host)] += 1
+
+    def on_retry(self, event: RetryEvent) -> None:
+        """Count a retry (and a throttle, for 429)."""
+        host = _labels(host=event.host or "")
+        with self._lock:
+            self.retries[host] += 1
+            if event.throttled:
+                self.throttles[host] += 1
+
+    def on_page(self, event: PageEvent) -> None:
+        """Count a page and its records."""
+        target = _labels(db=event.db_name.lower(), table=event.table)
+        with self._lock:
+            self.pages[target] += 1
+            self.records[target] += event.records
+
+    def on_auth(self, refresh: bool) -> None:
+        """Count an authentication."""
+        with self._lock:
+            self.auth[_labels(kind="refresh" if refresh else "login")] += 1
+
+    def reset(self) -> None:
+        """Clear every metric."""
+        with self._lock:
+            self.latency.clear()
+            for counter in self._counters():
+                counter.clear()
+
+    def _counters(self) -> List[DefaultDict[Labels, int]]:
+        return [
+            self.bytes_received,
+            self.requests,
+            self.pages,
+            self.records,
+            self.retries,
+            self.throttles,
+            self.auth,
+        ]
+
+    def to_prometheus(self) -> str:
+        """Every metric in the Prometheus text exposition format."""
+        lines: List[str] = []
+        with self._lock:
+            name = f"{_PREFIX}_request_duration_seconds"
+            lines.append(f"# HELP {name} AutoCare API request latency.")
+            lines.append(f"# TYPE {name} histogram")
+            for labels, histogram in sorted(self.latency.items()):
+                for bound, count in histogram.cumulative():
+                    bucket = _format_labels(labels, f'le="{bound}"')
+                    lines.append(f"{name}_bucket{bucket} {count}")
+                bucket = _format_labels(labels, 'le="+Inf"')
+                lines.append(f"{name}_bucket{bucket} {histogram.count}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {histogram.sum!r}")
+                lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+
+            for suffix, help_text, values in (
+                ("response_bytes_total", "Response body bytes.", self.bytes_received),
+                ("requests_total", "Completed requests by status.", self.requests),
+                ("pages_total", "Record pages fetched.", self.pages),
+                ("records_total", "Records fetched.", self.records),
+                ("retries_total", "Retries scheduled.", self.retries),
+                ("throttles_total", "HTTP 429 responses.", self.throttles),
+                ("auth_total", "Authentications and token refreshes.", self.auth),
+            ):
+                name = f"{_PREFIX}_{suffix}"
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} counter")
+                for labels, value in sorted(values.items()):
+                    lines.append(f"{name}{_format_labels(labels)} {value}")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,306 @@
+"""Opt-in profiling mode for fetch, conversion, migration and sink runs.
+
+Set AUTOCARE_PROFILE to a directory (or to "1" for ./autocare-profiles),
+pass AutoCareAPI(profile=...), or call enable_profiling() to profile every
+fetch_records() run, record migration, document transform and sink load
+in the process. Each run writes two files to the directory:
+
+    <time>-<n>-fetch-vcdb.Vehicle.txt   top functions by cumulative time and
+                                        top allocation sites (tracemalloc)
+    <time>-<n>-fetch-vcdb.Vehicle.prof  raw cProfile data for pstats,
+                                        snakeviz, etc.
+
+cProfile only sees the thread a run executes on, so a sink that fetches on
+a background thread produces a fetch report and a sink report. A run nested
+inside another run on the same thread (a fetch consumed by a migration,
+say) is reported as part of the outer run. Lazy runs (fetch_records(),
+migrate_*_records()) are profiled from the first item until the iterator
+is exhausted or closed, so their reports also list the consumer's
+functions; the run's own cost is the cumulative time of its generator.
+
+Profiling slows runs down several times over; leave it off in normal use.
+"""
+
+import functools
+import inspect
+import logging
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator, List, Optional, TypeVar, Union
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ENV = "AUTOCARE_PROFILE"
+DEFAULT_DIRECTORY = "autocare-profiles"
+DEFAULT_TOP = 25
+
+F = TypeVar("F", bound=Callable[..., Any])
+T = TypeVar("T")
+
+
+class _Section:
+    """State of one profiled run."""
+
+    def __init__(self, label: str, memory: bool):
+        # cProfile and tracemalloc load with the first profiled run, so the
+        # many modules using @profiled do not import them when it is off
+        import cProfile
+        import tracemalloc
+
+        self.label = label
+        self.profile = cProfile.Profile()
+        self.started = time.perf_counter()
+        self.snapshot = None
+        if memory:
+            tracemalloc.reset_peak()
+            self.snapshot = tracemalloc.take_snapshot()
+
+
+class Profiler:
+    """Collects cProfile and tracemalloc data per run and writes reports."""
+
+    def __init__(
+        self,
+        directory: Union[str, os.PathLike] = DEFAULT_DIRECTORY,
+        top: int = DEFAULT_TOP,
+        memory: bool = True,
+    ):
+        """
+        Initialize the profiler.
+
+        Args:
+            directory: Report directory (created on first report)
+            top: Functions and allocation sites listed per report
+            memory: Record allocation sites with tracemalloc
+        """
+        self.directory = os.path.expanduser(os.fspath(directory))
+        self.top = top
+        self.memory = memory
+        self.reports: List[str] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._tracing = 0
+        self._started_tracing = False
+        self._sequence = 0
+
+    @property
+    def active(self) -> bool:
+        """A run is being profiled on the current thread."""
+        return getattr(self._local, "active", False)
+
+    def _begin(self, label: str) -> _Section:
+        if self.memory:
+            import tracemalloc
+
+            with self._lock:
+                if self._tracing == 0 and not tracemalloc.is_tracing():
+                    tracemalloc.start()
+                    self._started_tracing = True
+                self._tracing += 1
+        self._local.active = True
+        return _Section(label, self.memory)
+
+    def _end(self, section: _Section) -> None:
+        self._local.active = False
+        try:
+            self._write(section)
+        finally:
+            if self.memory:
+                import tracemalloc
+
+                with self._lock:
+                    self._tracing -= 1
+                    if self._tracing == 0 and self._started_tracing:
+                        tracemalloc.stop()
+                        self._started_tracing = False
+
+    @contextmanager
+    def profile(self, label: str) -> Iterator[None]:
+        """
+        Profile the enclosed block as one run.
+
+        Args:
+            label: Run name used in the report and its file names
+        """
+        if self.active:
+            yield
+            return
+        section = self._begin(label)
+        section.profile.enable()
+        try:
+            yield
+        finally:
+            section.profile.disable()
+            self._end(section)
+
+    def profile_iterator(self, label: str, items: Iterable[T]) -> Iterator[T]:
+        """
+        Profile a lazy run from its first item until it is exhausted.
+
+        Args:
+            label: Run name used in the report and its file names
+            items: Iterator to profile
+
+        Yields:
+            The items, unchanged
+        """
+        iterator = iter(items)
+        if self.active:
+            yield from iterator
+            return
+        # Toggling the profiler around every item would cost more than the
+        # work of most runs, so it stays on while the consumer runs too
+        with self.profile(label):
+            yield from iterator
+
+    def _write(self, section: _Section) -> None:
+        """Write the text report and raw profile of a finished run."""
+        # Only needed for reports; kept out of the import of every module
+        # that uses @profiled
+        import cProfile
+        import io
+        import pstats
+        import tracemalloc
+
+        elapsed = time.perf_counter() - section.started
+        with self._lock:
+            self._sequence += 1
+            sequence = self._sequence
+        name = re.sub(r"[^\w.-]+", "_", section.label)
+        stem = os.path.join(
+            self.directory,
+            f"{time.strftime('%Y%m%d-%H%M%S')}-{sequence:03d}-{name}",
+        )
+        os.makedirs(self.directory, exist_ok=True)
+
+        section.profile.create_stats()
+        section.profile.dump_stats(f"{stem}.prof")
+
+        stream = io.StringIO()
+        stream.write(f"autocare profile: {section.label}\n")
+        stream.write(f"wall time: {elapsed:.3f}s\n\n")
+        stream.write("Top functions by cumulative time\n")
+        stats = pstats.Stats(section.profile, stream=stream)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top)
+
+        if section.snapshot is not None and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            stream.write(
+                f"traced memory: {current / 2**20:,.1f} MiB at the end, "
+                f"{peak / 2**20:,.1f} MiB peak\n\n"
+            )
+            stream.write("Top allocation sites (net growth during the run)\n")
+            filters = [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+                tracemalloc.Filter(False, cProfile.__file__),
+                tracemalloc.Filter(False, pstats.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            ]
+            after = tracemalloc.take_snapshot().filter_traces(filters)
+            before = section.snapshot.filter_traces(filters)
+            differences = after.compare_to(before, "lineno")[: self.top]
+            for difference in differences:
+                frame = difference.traceback[0]
+                stream.write(
+                    f"{difference.size_diff / 1024:>12,.1f} KiB "
+                    f"{difference.count_diff:>+10,} blocks  "
+                    f"{frame.filename}:{frame.lineno}\n"
+                )
+
+        with open(f"{stem}.txt", "w", encoding="utf-8") as f:
+            f.write(stream.getvalue())
+        self.reports.append(f"{stem}.txt")
+        logger.info(f"Wrote profile of {section.label} to {stem}.txt")
+
+
+_profiler: Optional[Profiler] = None
+_configured = False
+
+
+def enable_profiling(
+    directory: Union[str, os.PathLike] = DEFAULT_DIRECTORY,
+    top: int = DEFAULT_TOP,
+    memory: bool = True,
+) -> Profiler:
+    """
+    Turn on profiling mode for the process.
+
+    Args:
+        directory: Report directory
+        top: Functions and allocation sites listed per report
+        memory: Record allocation sites with tracemalloc
+
+    Returns:
+        The process-wide Profiler
+    """
+    global _profiler, _configured
+    _profiler = Profiler(directory, top, memory)
+    _configured = True
+    return _profiler
+
+
+def disable_profiling() -> None:
+    """Turn off profiling mode, including one enabled by AUTOCARE_PROFILE."""
+    global _profiler, _configured
+    _profiler = None
+    _configured = True
+
+
+def get_profiler() -> Optional[Profiler]:
+    """The process-wide Profiler, or None when profiling mode is off."""
+    global _profiler, _configured
+    if not _configured:
+        _configured = True
+        value = os.environ.get(PROFILE_ENV, "").strip()
+        if value and value.lower() not in ("0", "false", "no", "off"):
+            directory = (
+                DEFAULT_DIRECTORY
+                if value.lower() in ("1", "true", "yes", "on")
+                else value
+            )
+            _profiler = Profiler(directory)
+    return _profiler
+
+
+class _LabelArguments(dict):
+    def __missing__(self, key: str) -> str:
+        return ""
+
+
+def profiled(label: str, lazy: bool = False) -> Callable[[F], F]:
+    """
+    Profile calls of a function while profiling mode is on.
+
+    Args:
+        label: Run name; "{argument}" placeholders are filled from the call
+               (e.g. "sqlite-{table}")
+        lazy: The function returns an iterator that does the work; profile
+              its iteration rather than the call
+
+    Returns:
+        Decorator; calls cost one global lookup when profiling is off
+    """
+
+    def decorate(func: F) -> F:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            profiler = get_profiler()
+            if profiler is None or profiler.active:
+                return func(*args, **kwargs)
+            bound = signature.bind_partial(*args, **kwargs)
+            bound.apply_defaults()
+            name = label.format_map(_LabelArguments(bound.arguments))
+            if lazy:
+                return profiler.profile_iterator(name, func(*args, **kwargs))
+            with profiler.profile(name):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
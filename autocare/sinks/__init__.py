@@ -0,0 +1 @@
+"""Sinks that load fetch_records() output into local stores and files."""
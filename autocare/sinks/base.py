@@ -0,0 +1,245 @@
+"""Shared schema and row helpers for the fetch_records() sinks."""
+
+import dataclasses
+import importlib
+import itertools
+import queue
+import threading
+import types
+import typing
+from operator import attrgetter
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
+
+from autocare.databases.base import BaseModel
+
+# (column name, Python type; None when only the name is known)
+Column = Tuple[str, Optional[type]]
+
+# The API sends the string "null" for missing values
+NULL = "null"
+
+DEFAULT_BATCH_ROWS = 5_000
+DEFAULT_PREFETCH = 8
+
+_PUT_TIMEOUT = 0.1
+
+
+def quote_identifier(name: str) -> str:
+    """Quote an SQL identifier (same rules in SQLite and PostgreSQL)."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _scalar_type(annotation: Any) -> Optional[type]:
+    """Reduce Optional[X] / X | None to X; None for anything non-scalar."""
+    if typing.get_origin(annotation) in (typing.Union, types.UnionType):
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) != 1:
+            return None
+        annotation = args[0]
+    return annotation if annotation in (int, float, str, bool) else None
+
+
+def model_columns(model: Type) -> List[Column]:
+    """
+    Columns of a typed model dataclass, in field order.
+
+    The extra field is skipped.
+
+    Args:
+        model: Dataclass model (e.g. vcdb.Vehicle)
+
+    Returns:
+        List of (name, type) pairs
+    """
+    hints = typing.get_type_hints(model)
+    return [
+        (f.name, _scalar_type(hints.get(f.name)))
+        for f in dataclasses.fields(model)
+        if f.name != "extra"
+    ]
+
+
+def default_model(db_name: str, table_name: str) -> Optional[Type[BaseModel]]:
+    """
+    Typed model for a table, if the database module defines one.
+
+    Example:
+        default_model("vcdb", "BaseVehicle")  # -> vcdb.BaseVehicle
+    """
+    try:
+        module = importlib.import_module(f"autocare.databases.{db_name.lower()}")
+    except ImportError:
+        return None
+    model = getattr(module, table_name, None)
+    if isinstance(model, type) and issubclass(model, BaseModel):
+        return model
+    return None
+
+
+def resolve_columns(
+    records: Iterable[Any],
+    model: Optional[Type] = None,
+    columns: Optional[Iterable[str]] = None,
+) -> Tuple[List[Column], Iterator[Any]]:
+    """
+    Decide a table's columns before loading it.
+
+    Model fields come first, typed; explicit column names the model lacks
+    are appended untyped. With neither, the keys of the first record are
+    used. Fields outside the resolved columns are not loaded.
+
+    Args:
+        records: Records from fetch_records() (dicts or model instances)
+        model: Typed model dataclass
+        columns: Column names (e.g. TableInfo.columns)
+
+    Returns:
+        (columns, records) — records is a fresh iterator that still
+        yields the first record
+    """
+    iterator = iter(records)
+    if model is not None:
+        resolved = model_columns(model)
+        known = {name for name, _ in resolved}
+        resolved.extend((name, None) for name in columns or () if name not in known)
+        return resolved, iterator
+    if columns:
+        return [(name, None) for name in columns], iterator
+
+    first = next(iterator, None)
+    if first is None:
+        return [], iterator
+    if isinstance(first, dict):
+        names = list(first)
+    elif dataclasses.is_dataclass(first):
+        return model_columns(type(first)), itertools.chain([first], iterator)
+    else:
+        names = list(vars(first))
+    return [(name, None) for name in names], itertools.chain([first], iterator)
+
+
+def row_getter(names: List[str]) -> Callable[[Any], Tuple[Any, ...]]:
+    """
+    Build a function that turns one record into a row tuple.
+
+    Dicts are read with .get() (missing keys become None), anything else
+    by attribute. The API's "null" strings become None.
+    """
+    from_attributes = attrgetter(*names) if names else (lambda record: ())
+    single = len(names) == 1
+
+    def get(record: Any) -> Tuple[Any, ...]:
+        if isinstance(record, dict):
+            row = tuple(map(record.get, names))
+        else:
+            row = (from_attributes(record),) if single else from_attributes(record)
+        if NULL in row:
+            row = tuple(None if value == NULL else value for value in row)
+        return row
+
+    return get
+
+
+def rows(records: Iterable[Any], names: List[str]) -> Iterator[Tuple[Any, ...]]:
+    """Stream row tuples for the given columns."""
+    return map(row_getter(names), records)
+
+
+def row_batches(
+    row_tuples: Iterable[Sequence[Any]],
+    text_columns: Sequence[int] = (),
+    batch_rows: int = DEFAULT_BATCH_ROWS,
+) -> Iterator[List[Sequence[Any]]]:
+    """
+    Group rows into lists, converting values of text columns to str.
+
+    Used where the target type is fixed up front (binary COPY, Arrow) and
+    untyped columns are stored as text.
+
+    Args:
+        row_tuples: Row tuples
+        text_columns: Indexes of columns stored as text
+        batch_rows: Rows per batch
+    """
+    iterator = iter(row_tuples)
+    while batch := list(itertools.islice(iterator, batch_rows)):
+        if text_columns:
+            for i, row in enumerate(batch):
+                if any(
+                    row[j] is not None and not isinstance(row[j], str)
+                    for j in text_columns
+                ):
+                    row = list(row)
+                    for j in text_columns:
+                        if row[j] is not None:
+                            row[j] = str(row[j])
+                    batch[i] = row
+        yield batch
+
+
+class _Done:
+    """End-of-stream marker put on the queue by the producer."""
+
+    def __init__(self, error: Optional[BaseException] = None):
+        self.error = error
+
+
+def _put(out: "queue.Queue[Any]", item: Any, stop: threading.Event) -> bool:
+    """Put with a bounded wait; False once the consumer has given up."""
+    while not stop.is_set():
+        try:
+            out.put(item, timeout=_PUT_TIMEOUT)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _produce(
+    items: Iterable[Any], out: "queue.Queue[Any]", stop: threading.Event
+) -> None:
+    """Producer thread body: drain items into the queue, then a _Done."""
+    error = None
+    try:
+        for item in items:
+            if not _put(out, item, stop):
+                return
+    except BaseException as e:
+        error = e
+    _put(out, _Done(error), stop)
+
+
+def prefetch(items: Iterable[Any], max_items: int = DEFAULT_PREFETCH) -> Iterator[Any]:
+    """
+    Iterate items produced on a background thread, at most max_items ahead.
+
+    Exceptions raised while producing are re-raised here. Closing the
+    iterator early stops the producer at its next put.
+    """
+    out: "queue.Queue[Any]" = queue.Queue(maxsize=max_items)
+    stop = threading.Event()
+    thread = threading.Thread(
+        target=_produce, args=(items, out, stop), name="autocare-prefetch", daemon=True
+    )
+    thread.start()
+    try:
+        while True:
+            item = out.get()
+            if isinstance(item, _Done):
+                if item.error is not None:
+                    raise item.error
+                return
+            yield item
+    finally:
+        stop.set()
+        thread.join()
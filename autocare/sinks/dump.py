@@ -0,0 +1,450 @@
+"""Sharded NDJSON / CSV dumps of fetched tables.
+
+Records are encoded into line chunks on a background thread while the
+next API pages are fetched, and the chunks are compressed (gzip or zstd)
+into shard files of about shard_mb megabytes each. Every shard is a
+complete file on its own (CSV shards repeat the header), so downstream
+loaders can pick them up in parallel. A JSON manifest next to the shards
+records each shard's size, record count and SHA-256 checksum; it is
+written last, so a manifest always describes a finished dump.
+
+zstd compression requires zstandard (pip install "autocare[zstd]").
+
+Example:
+    manifest = dump_records(
+        "exports/vcdb", "Vehicle", client.fetch_records("vcdb", "Vehicle"),
+        compression="zstd", shard_mb=128,
+    )
+"""
+
+import contextlib
+import csv
+import dataclasses
+import gzip
+import hashlib
+import io
+import itertools
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import (
+    IO,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
+
+from autocare.profiling import profiled
+from autocare.sinks.base import (
+    DEFAULT_PREFETCH,
+    default_model,
+    prefetch,
+    resolve_columns,
+    row_getter,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SHARD_MB = 64
+MANIFEST_VERSION = 1
+
+# Records encoded per chunk handed from the fetch thread to the writer
+_CHUNK_RECORDS = 2_000
+_HASH_BUFFER = 1 << 20
+
+
+class DumpFormat(str, Enum):
+    """Line format of the dump."""
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+_EXTENSIONS = {None: "", "gzip": ".gz", "zstd": ".zst"}
+
+
+@dataclass
+class Shard:
+    """One written shard file.
+
+    Attributes:
+        path: File name, relative to the manifest
+        records: Records in the shard
+        bytes: File size on disk
+        sha256: Hex SHA-256 of the file contents
+    """
+
+    path: str
+    records: int
+    bytes: int
+    sha256: str
+
+
+@dataclass
+class Manifest:
+    """Description of a finished dump."""
+
+    table: str
+    format: str
+    compression: Optional[str]
+    records: int = 0
+    columns: Optional[List[str]] = None
+    shards: List[Shard] = field(default_factory=list)
+    version: int = MANIFEST_VERSION
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict for JSON serialization."""
+        return dataclasses.asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Manifest":
+        """Rebuild a Manifest from to_dict() output."""
+        data = dict(data)
+        shards = [Shard(**shard) for shard in data.pop("shards", [])]
+        return cls(**data, shards=shards)
+
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        """Write the manifest as JSON, replacing any previous one atomically."""
+        tmp = os.fspath(path) + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+            f.write("\n")
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike]) -> "Manifest":
+        """Read a manifest written by save()."""
+        with open(path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+
+def file_sha256(path: Union[str, os.PathLike]) -> str:
+    """Hex SHA-256 of a file, for checking shards against a manifest."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while block := f.read(_HASH_BUFFER):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def verify_manifest(path: Union[str, os.PathLike]) -> List[str]:
+    """
+    Check every shard listed in a manifest.
+
+    Returns:
+        Shard paths that are missing or whose size or checksum differ
+    """
+    manifest = Manifest.load(path)
+    directory = os.path.dirname(os.fspath(path))
+    bad = []
+    for shard in manifest.shards:
+        shard_path = os.path.join(directory, shard.path)
+        if (
+            not os.path.exists(shard_path)
+            or os.path.getsize(shard_path) != shard.bytes
+            or file_sha256(shard_path) != shard.sha256
+        ):
+            bad.append(shard.path)
+    return bad
+
+
+def _json_record(record: Any) -> Dict[str, Any]:
+    """A raw API dict as-is; a model's fields merged with its extra."""
+    if isinstance(record, dict):
+        return record
+    data = {k: v for k, v in vars(record).items() if k != "extra"}
+    data.update(getattr(record, "extra", None) or {})
+    return data
+
+
+def ndjson_chunks(records: Iterable[Any]) -> Iterator[Tuple[bytes, int]]:
+    """Encode records as NDJSON; yields (chunk, record count)."""
+    encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    iterator = iter(records)
+    while batch := list(itertools.islice(iterator, _CHUNK_RECORDS)):
+        lines = "\n".join(encode(_json_record(record)) for record in batch)
+        yield (lines + "\n").encode("utf-8"), len(batch)
+
+
+def csv_chunks(records: Iterable[Any], names: List[str]) -> Iterator[Tuple[bytes, int]]:
+    """Encode records as CSV rows (no header); yields (chunk, record count)."""
+    get = row_getter(names)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    iterator = iter(records)
+    while batch := list(itertools.islice(iterator, _CHUNK_RECORDS)):
+        writer.writerows(map(get, batch))
+        yield buffer.getvalue().encode("utf-8"), len(batch)
+        buffer.seek(0)
+        buffer.truncate()
+
+
+class _HashingFile(io.RawIOBase):
+    """Binary file wrapper that hashes and counts everything written."""
+
+    def __init__(self, path: str):
+        super().__init__()
+        self._file = open(path, "wb")
+        self._digest = hashlib.sha256()
+        self.size = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        view = memoryview(data)
+        self._digest.update(view)
+        self.size += view.nbytes
+        return self._file.write(view)
+
+    def flush(self) -> None:
+        if not self.closed:
+            self._file.flush()
+
+    def close(self) -> None:
+        try:
+            super().close()
+        finally:
+            self._file.close()
+
+    def hexdigest(self) -> str:
+        return self._digest.hexdigest()
+
+
+def _compressor(
+    raw: _HashingFile, compression: Optional[str], level: Optional[int]
+) -> IO[bytes]:
+    """Compressing writer over a shard file (or the file itself)."""
+    # A RawIOBase is a binary file at runtime; typeshed does not model it as one
+    stream = cast(IO[bytes], raw)
+    if compression is None:
+        return stream
+    if compression == "gzip":
+        return gzip.GzipFile(  # type: ignore[return-value]
+            fileobj=stream, mode="wb", compresslevel=6 if level is None else level
+        )
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            'zstd compression requires zstandard: pip install "autocare[zstd]"'
+        ) from e
+    return zstandard.ZstdCompressor(level=3 if level is None else level).stream_writer(
+        stream, closefd=False
+    )
+
+
+class _ShardWriter:
+    """Writes chunks into size-capped shard files and collects their entries."""
+
+    def __init__(
+        self,
+        directory: str,
+        table: str,
+        extension: str,
+        compression: Optional[str],
+        level: Optional[int],
+        shard_bytes: int,
+        header: bytes = b"",
+    ):
+        self.directory = directory
+        self.table = table
+        self.extension = extension
+        self.compression = compression
+        self.level = level
+        self.shard_bytes = shard_bytes
+        self.header = header
+        self.shards: List[Shard] = []
+        self._created: List[str] = []
+        self._raw: Optional[_HashingFile] = None
+        self._out: Optional[IO[bytes]] = None
+        self._name = ""
+        self._records = 0
+
+    def write(self, chunk: bytes, records: int) -> None:
+        if self._out is None:
+            self._open()
+        assert self._out is not None and self._raw is not None
+        self._out.write(chunk)
+        self._records += records
+        # Compressed bytes reach the file in blocks, so shards overshoot
+        # shard_bytes by up to one compressor block plus one chunk
+        if self._raw.size >= self.shard_bytes:
+            self.close()
+
+    def _open(self) -> None:
+        self._name = f"{self.table}-{len(self.shards):05d}{self.extension}"
+        path = os.path.join(self.directory, self._name)
+        self._raw = _HashingFile(path)
+        self._created.append(path)
+        self._out = _compressor(self._raw, self.compression, self.level)
+        self._records = 0
+        if self.header:
+            self._out.write(self.header)
+
+    def close(self) -> None:
+        """Finish the current shard, if any."""
+        if self._out is None or self._raw is None:
+            return
+        if self._out is not self._raw:
+            self._out.close()
+        self._raw.close()
+        self.shards.append(
+            Shard(self._name, self._records, self._raw.size, self._raw.hexdigest())
+        )
+        self._out = self._raw = None
+
+    def abort(self) -> None:
+        """Close the open shard and delete every shard this writer created."""
+        if self._raw is not None:
+            self._raw.close()
+        self._out = self._raw = None
+        for path in self._created:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+        self._created.clear()
+        self.shards.clear()
+
+
+@profiled("dump-{table}")
+def dump_records(
+    directory: Union[str, os.PathLike],
+    table: str,
+    records: Iterable[Any],
+    format: DumpFormat = DumpFormat.NDJSON,
+    compression: Optional[str] = "gzip",
+    shard_mb: float = DEFAULT_SHARD_MB,
+    model: Optional[Type] = None,
+    columns: Optional[Iterable[str]] = None,
+    compresslevel: Optional[int] = None,
+    prefetch_chunks: int = DEFAULT_PREFETCH,
+) -> Manifest:
+    """
+    Dump a record stream into compressed shards plus "<table>.manifest.json".
+
+    Shards are named "<table>-00000.ndjson.gz", "<table>-00001.ndjson.gz",
+    ... Shards left over from an earlier, larger dump are not removed; the
+    manifest lists the shards that belong to this one. An earlier manifest
+    for the table is deleted before the first shard is written, and a
+    failed dump deletes the shards it wrote, so no manifest ever points at
+    partly overwritten shards.
+
+    Args:
+        directory: Output directory (created if missing)
+        table: Table name used for file names
+        records: Records from fetch_records() (dicts or model instances)
+        format: ndjson (records as-is) or csv (columns from model / columns
+                / first record, "null" written as an empty field)
+        compression: "gzip", "zstd" or None
+        shard_mb: Target compressed shard size in megabytes
+        model: Typed model dataclass for CSV columns
+        columns: CSV column names when there is no model
+        compresslevel: Compression level (default: gzip 6, zstd 3)
+        prefetch_chunks: Encoded chunks buffered ahead of the writer
+
+    Returns:
+        The manifest that was written
+
+    Raises:
+        ValueError: If the compression is unsupported
+    """
+    if compression not in _EXTENSIONS:
+        raise ValueError(
+            f"Unsupported compression: {compression}. "
+            f"Supported: {[c for c in _EXTENSIONS if c]} or None"
+        )
+    format = DumpFormat(format)
+    directory = os.fspath(directory)
+    os.makedirs(directory, exist_ok=True)
+    manifest_path = os.path.join(directory, f"{table}.manifest.json")
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(manifest_path)
+
+    names: Optional[List[str]] = None
+    header = b""
+    if format is DumpFormat.CSV:
+        resolved, records = resolve_columns(records, model, columns)
+        names = [name for name, _ in resolved]
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator="\n").writerow(names)
+        header = buffer.getvalue().encode("utf-8")
+        chunks = csv_chunks(records, names)
+    else:
+        chunks = ndjson_chunks(records)
+
+    writer = _ShardWriter(
+        directory,
+        table,
+        f".{format.value}{_EXTENSIONS[compression]}",
+        compression,
+        compresslevel,
+        max(1, int(shard_mb * 1024 * 1024)),
+        header,
+    )
+    total = 0
+    try:
+        for chunk, count in prefetch(chunks, prefetch_chunks):
+            writer.write(chunk, count)
+            total += count
+        writer.close()
+    except BaseException:
+        writer.abort()
+        raise
+
+    manifest = Manifest(
+        table=table,
+        format=format.value,
+        compression=compression,
+        records=total,
+        columns=names,
+        shards=writer.shards,
+    )
+    manifest.save(manifest_path)
+    logger.info(f"Dumped {total} {table} records into {len(writer.shards)} shards")
+    return manifest
+
+
+def dump_tables(
+    client: Any,
+    directory: Union[str, os.PathLike],
+    db_name: str,
+    tables: Optional[Iterable[str]] = None,
+    page_size: Optional[int] = None,
+    **options: Any,
+) -> Dict[str, Manifest]:
+    """
+    Dump AutoCare tables into sharded files, one manifest per table.
+
+    Args:
+        client: Authenticated AutoCareAPI instance
+        directory: Output directory
+        db_name: Database name (e.g. "vcdb")
+        tables: Table names; default: every table list_tables() reports
+        page_size: Records per API page
+        **options: dump_records() options (format, compression, shard_mb, ...)
+
+    Returns:
+        Manifest per table
+    """
+    infos = {info.name: info for info in client.list_tables(db_name)}
+    manifests: Dict[str, Manifest] = {}
+    for table in list(infos) if tables is None else tables:
+        info = infos.get(table)
+        manifests[table] = dump_records(
+            directory,
+            table,
+            client.fetch_records(db_name, table, page_size=page_size),
+            model=default_model(db_name, table),
+            columns=info.columns if info is not None else None,
+            **options,
+        )
+    return manifests
@@ -0,0 +1,210 @@
+"""Streaming Arrow / Parquet export of fetched tables.
+
+fetch_records() output is cut into Arrow record batches of a fixed number
+of rows, with the schema taken from the typed model fields, and each batch
+is written to Parquet as soon as it is full. Only one batch is held in
+memory at a time. Name columns (*Name) are dictionary-encoded, which keeps
+repeated values such as MakeName small on disk and fast to scan.
+
+Requires pyarrow (pip install "autocare[parquet]").
+
+Example:
+    write_parquet(
+        "Vehicle.parquet", client.fetch_records("vcdb", "Vehicle"), model=vcdb.Vehicle
+    )
+
+    export_parquet(client, "exports/vcdb", "vcdb")  # every table
+"""
+
+import logging
+import os
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
+
+from autocare.profiling import profiled
+from autocare.sinks.base import (
+    Column,
+    default_model,
+    resolve_columns,
+    row_batches,
+    rows,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ROW_GROUP_SIZE = 128 * 1024
+DEFAULT_COMPRESSION = "zstd"
+
+
+def _pyarrow() -> Any:
+    """Import pyarrow, with an install hint when it is missing."""
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            'Parquet export requires pyarrow: pip install "autocare[parquet]"'
+        ) from e
+    return pyarrow
+
+
+def dictionary_columns(names: Iterable[str]) -> List[str]:
+    """Columns dictionary-encoded by default: the *Name columns."""
+    return [name for name in names if name.endswith("Name")]
+
+
+def arrow_schema(columns: List[Column]) -> Any:
+    """
+    Arrow schema for the given columns; untyped columns are strings.
+
+    Args:
+        columns: (name, type) pairs, e.g. from model_columns(vcdb.Make)
+
+    Returns:
+        pyarrow.Schema
+    """
+    pa = _pyarrow()
+    types = {int: pa.int64(), float: pa.float64(), bool: pa.bool_(), str: pa.string()}
+    return pa.schema(
+        [pa.field(name, types.get(kind, pa.string())) for name, kind in columns]  # type: ignore[arg-type]
+    )
+
+
+def iter_record_batches(
+    records: Iterable[Any],
+    model: Optional[Type] = None,
+    columns: Optional[Iterable[str]] = None,
+    batch_rows: int = DEFAULT_ROW_GROUP_SIZE,
+) -> Tuple[Any, Iterator[Any]]:
+    """
+    Turn a record stream into Arrow record batches.
+
+    Args:
+        records: Records from fetch_records() (dicts or model instances)
+        model: Typed model dataclass that defines the schema
+        columns: Column names when there is no model (e.g.
+                 TableInfo.columns); default: keys of the first record
+        batch_rows: Rows per record batch
+
+    Returns:
+        (schema, batches) — batches is lazy and reads records as it goes
+    """
+    pa = _pyarrow()
+    resolved, records = resolve_columns(records, model, columns)
+    schema = arrow_schema(resolved)
+    names = [name for name, _ in resolved]
+    string_columns = [
+        i for i, field in enumerate(schema) if pa.types.is_string(field.type)
+    ]
+
+    def batches() -> Iterator[Any]:
+        for batch in row_batches(rows(records, names), string_columns, batch_rows):
+            arrays = [
+                pa.array(values, type=field.type)
+                for values, field in zip(zip(*batch), schema)
+            ]
+            yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+    return schema, batches()
+
+
+@profiled("parquet-{destination}")
+def write_parquet(
+    destination: Union[str, os.PathLike, Any],
+    records: Iterable[Any],
+    model: Optional[Type] = None,
+    columns: Optional[Iterable[str]] = None,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    compression: Optional[str] = DEFAULT_COMPRESSION,
+    dictionary: Optional[Iterable[str]] = None,
+) -> int:
+    """
+    Write a record stream to a Parquet file one row group at a time.
+
+    A path destination is written to "<path>.tmp" and renamed into place
+    once complete.
+
+    Args:
+        destination: Output path or writable binary file object
+        records: Records from fetch_records() (dicts or model instances)
+        model: Typed model dataclass that defines the schema
+        columns: Column names when there is no model
+        row_group_size: Rows per record batch and Parquet row group
+        compression: Parquet codec ("zstd", "snappy", "gzip", None, ...)
+        dictionary: Columns to dictionary-encode; default: the *Name columns
+
+    Returns:
+        Number of rows written
+    """
+    _pyarrow()
+    import pyarrow.parquet as pq
+
+    schema, batches = iter_record_batches(records, model, columns, row_group_size)
+    use_dictionary = (
+        dictionary_columns(schema.names) if dictionary is None else list(dictionary)
+    )
+
+    is_path = isinstance(destination, (str, os.PathLike))
+    target = os.fspath(destination) + ".tmp" if is_path else destination
+    count = 0
+    try:
+        with pq.ParquetWriter(
+            target,
+            schema,
+            compression=compression or "none",
+            use_dictionary=use_dictionary,
+        ) as writer:
+            for batch in batches:
+                writer.write_batch(batch, row_group_size=row_group_size)
+                count += batch.num_rows
+    except BaseException:
+        if is_path and os.path.exists(target):
+            os.remove(target)
+        raise
+
+    if is_path:
+        os.replace(target, destination)
+    return count
+
+
+def export_parquet(
+    client: Any,
+    directory: Union[str, os.PathLike],
+    db_name: str,
+    tables: Optional[Iterable[str]] = None,
+    page_size: Optional[int] = None,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    compression: Optional[str] = DEFAULT_COMPRESSION,
+) -> Dict[str, int]:
+    """
+    Export AutoCare tables to "<directory>/<table>.parquet".
+
+    Tables with a typed model in autocare.databases get its schema;
+    others use TableInfo.columns when the API reports them, else the keys
+    of the first record.
+
+    Args:
+        client: Authenticated AutoCareAPI instance
+        directory: Output directory (created if missing)
+        db_name: Database name (e.g. "vcdb")
+        tables: Table names; default: every table list_tables() reports
+        page_size: Records per API page
+        row_group_size: Rows per Parquet row group
+        compression: Parquet codec
+
+    Returns:
+        Rows written per table
+    """
+    os.makedirs(directory, exist_ok=True)
+    infos = {info.name: info for info in client.list_tables(db_name)}
+    counts: Dict[str, int] = {}
+    for table in list(infos) if tables is None else tables:
+        info = infos.get(table)
+        counts[table] = write_parquet(
+            os.path.join(directory, f"{table}.parquet"),
+            client.fetch_records(db_name, table, page_size=page_size),
+            model=default_model(db_name, table),
+            columns=info.columns if info is not None else None,
+            row_group_size=row_group_size,
+            compression=compression,
+        )
+        logger.info(f"Exported {counts[table]} rows of {table}")
+    return counts
@@ -0,0 +1,400 @@
+"""Streaming PostgreSQL loads with COPY FROM STDIN.
+
+Records are turned into COPY data (CSV text or binary rows) on a producer
+thread and handed to the connection through a bounded queue, so the next
+API pages are fetched and encoded while the previous chunk is being copied,
+and memory stays bounded however large the table is.
+
+Three load modes:
+
+- replace: COPY into an unindexed staging table, then drop the old table,
+  rename the staging table and rebuild the old table's indexes and
+  constraints under their original names, in the same transaction
+- merge: COPY into a temporary table, then INSERT ... ON CONFLICT (key)
+  DO UPDATE into the target, for delta loads
+- append: COPY straight into the target
+
+Requires psycopg 3 (pip install "autocare[postgres]").
+
+Example:
+    with psycopg.connect(dsn) as conn:
+        PostgresLoader(conn).load(
+            "Vehicle", client.fetch_records("vcdb", "Vehicle"), model=vcdb.Vehicle
+        )
+"""
+
+import csv
+import io
+import itertools
+import logging
+from enum import Enum
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Type
+
+from autocare.profiling import profiled
+from autocare.sinks.base import (
+    Column,
+    default_model,
+    quote_identifier,
+    prefetch,
+    resolve_columns,
+    row_batches,
+    rows,
+)
+
+logger = logging.getLogger(__name__)
+
+# Python type -> PostgreSQL column type; unknown types are stored as text
+_PG_TYPES = {int: "bigint", bool: "boolean", float: "double precision", str: "text"}
+
+# text, bpchar, varchar: binary COPY needs str values for these
+_TEXT_OIDS = frozenset({25, 1042, 1043})
+
+DEFAULT_CHUNK_BYTES = 1 << 20
+DEFAULT_QUEUE_CHUNKS = 8
+
+_ENCODE_ROWS = 1_000
+
+
+class LoadMode(str, Enum):
+    """How a load is applied to the target table."""
+
+    REPLACE = "replace"
+    MERGE = "merge"
+    APPEND = "append"
+
+
+class CopyFormat(str, Enum):
+    """COPY data format."""
+
+    CSV = "csv"
+    BINARY = "binary"
+
+
+def _connect(connection: Any) -> Any:
+    """Open a psycopg connection from a conninfo string."""
+    try:
+        import psycopg
+    except ImportError as e:
+        raise ImportError(
+            'PostgreSQL support requires psycopg: pip install "autocare[postgres]"'
+        ) from e
+    return psycopg.connect(connection)
+
+
+def create_table_sql(table: str, columns: List[Column], key: Sequence[str] = ()) -> str:
+    """
+    CREATE TABLE statement for the given columns and optional primary key.
+
+    Args:
+        table: Table name, already quoted / schema-qualified
+        columns: (name, type) pairs
+        key: Primary key columns
+    """
+    definitions = [
+        f"{quote_identifier(name)} {_PG_TYPES.get(kind, 'text')}"  # type: ignore[arg-type]
+        for name, kind in columns
+    ]
+    if key:
+        definitions.append(
+            f"PRIMARY KEY ({', '.join(quote_identifier(name) for name in key)})"
+        )
+    return f"CREATE TABLE {table} ({', '.join(definitions)})"
+
+
+def primary_key_sql(table: str, key: Sequence[str]) -> str:
+    """ALTER TABLE statement adding a primary key named after the table."""
+    columns = ", ".join(quote_identifier(name) for name in key)
+    return f"ALTER TABLE {table} ADD PRIMARY KEY ({columns})"
+
+
+def merge_sql(table: str, source: str, names: Sequence[str], key: Sequence[str]) -> str:
+    """INSERT ... ON CONFLICT (key) DO UPDATE from a source table."""
+    column_list = ", ".join(quote_identifier(name) for name in names)
+    updates = [
+        f"{quote_identifier(name)} = EXCLUDED.{quote_identifier(name)}"
+        for name in names
+        if name not in key
+    ]
+    action = f"DO UPDATE SET {', '.join(updates)}" if updates else "DO NOTHING"
+    return (
+        f"INSERT INTO {table} ({column_list}) SELECT {column_list} FROM {source} "
+        f"ON CONFLICT ({', '.join(quote_identifier(name) for name in key)}) {action}"
+    )
+
+
+def csv_chunks(
+    row_tuples: Iterable[Sequence[Any]], chunk_bytes: int = DEFAULT_CHUNK_BYTES
+) -> Iterator[bytes]:
+    """
+    Encode rows as COPY CSV data in chunks of about chunk_bytes.
+
+    None becomes an unquoted empty field (NULL); every other value is
+    quoted, so empty strings survive as empty strings.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, quoting=csv.QUOTE_NOTNULL, lineterminator="\n")
+    iterator = iter(row_tuples)
+    while batch := list(itertools.islice(iterator, _ENCODE_ROWS)):
+        writer.writerows(batch)
+        if buffer.tell() >= chunk_bytes:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+class PostgresLoader:
+    """COPY-based loader for fetch_records() output.
+
+    Each load() runs in its own transaction (a savepoint if one is already
+    open). A connection opened from a conninfo string is closed by close()
+    or on context exit; a passed-in connection is left open.
+    """
+
+    def __init__(
+        self,
+        connection: Any,
+        format: CopyFormat = CopyFormat.CSV,
+        schema: Optional[str] = None,
+        chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+        queue_chunks: int = DEFAULT_QUEUE_CHUNKS,
+    ):
+        """
+        Initialize the loader.
+
+        Args:
+            connection: psycopg Connection, or a conninfo string to connect with
+            format: COPY data format. CSV is encoded in bulk and accepts
+                    anything PostgreSQL can parse from text; binary skips
+                    server-side parsing but is encoded row by row and needs
+                    values that match the column types.
+            schema: Schema for the target tables (default: search_path)
+            chunk_bytes: Approximate CSV bytes per COPY write
+            queue_chunks: Encoded chunks buffered ahead of the connection
+        """
+        self._owned = isinstance(connection, str)
+        self.conn = _connect(connection) if self._owned else connection
+        self.format = CopyFormat(format)
+        self.schema = schema
+        self.chunk_bytes = chunk_bytes
+        self.queue_chunks = queue_chunks
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the connection if the loader opened it."""
+        if self._owned:
+            self.conn.close()
+
+    def _name(self, table: str) -> str:
+        """Quoted, optionally schema-qualified table name."""
+        if self.schema is None:
+            return quote_identifier(table)
+        return f"{quote_identifier(self.schema)}.{quote_identifier(table)}"
+
+    def _exists(self, cursor: Any, table: str) -> bool:
+        cursor.execute("SELECT to_regclass(%s)", (self._name(table),))
+        return cursor.fetchone()[0] is not None
+
+    def _index_statements(self, cursor: Any, table: str) -> List[str]:
+        """Statements that recreate a table's indexes under their current names.
+
+        Indexes backing a primary key, unique or exclusion constraint are
+        recreated through the constraint so it keeps its name too.
+        """
+        cursor.execute(
+            "SELECT pg_get_indexdef(i.indexrelid), c.conname, "
+            "pg_get_constraintdef(c.oid) FROM pg_index i "
+            "LEFT JOIN pg_constraint c "
+            "ON c.conindid = i.indexrelid AND c.conrelid = i.indrelid "
+            "WHERE i.indrelid = %s::regclass ORDER BY c.conname, i.indexrelid",
+            (self._name(table),),
+        )
+        target = self._name(table)
+        return [
+            index_definition
+            if constraint is None
+            else f"ALTER TABLE {target} "
+            f"ADD CONSTRAINT {quote_identifier(constraint)} {constraint_definition}"
+            for index_definition, constraint, constraint_definition in cursor.fetchall()
+        ]
+
+    def _column_oids(self, cursor: Any, table: str, names: List[str]) -> List[int]:
+        """Type OIDs of the named target columns, in order."""
+        cursor.execute(
+            "SELECT attname, atttypid FROM pg_attribute "
+            "WHERE attrelid = %s::regclass AND attnum > 0 AND NOT attisdropped",
+            (table,),
+        )
+        oids = dict(cursor.fetchall())
+        missing = [name for name in names if name not in oids]
+        if missing:
+            raise ValueError(f"Columns missing from {table}: {missing}")
+        return [int(oids[name]) for name in names]
+
+    @profiled("postgres-{table}")
+    def load(
+        self,
+        table: str,
+        records: Iterable[Any],
+        model: Optional[Type] = None,
+        columns: Optional[Iterable[str]] = None,
+        mode: LoadMode = LoadMode.REPLACE,
+        key: Optional[Sequence[str]] = None,
+    ) -> int:
+        """
+        Stream records into a table with COPY.
+
+        Tables that do not exist yet are created from the model / columns,
+        with the key as primary key. In replace mode the staging table is
+        created LIKE the existing target without its indexes; after the
+        swap the target's indexes and index-backed constraints are built
+        again under their original names. Views that depend on the target
+        block the swap.
+
+        Args:
+            table: Target table name
+            records: Records from fetch_records() (dicts or model instances)
+            model: Typed model dataclass that defines the schema
+            columns: Column names when there is no model (e.g.
+                     TableInfo.columns); default: keys of the first record
+            mode: replace, merge or append
+            key: Primary / conflict key columns; default: "<table>ID" when
+                 that column exists. Required for merge.
+
+        Returns:
+            Number of rows copied
+
+        Raises:
+            ValueError: If no columns can be resolved, or merge has no key
+        """
+        mode = LoadMode(mode)
+        resolved, records = resolve_columns(records, model, columns)
+        names = [name for name, _ in resolved]
+        if not names:
+            raise ValueError(f"No columns for table {table}")
+        if key is None:
+            key = [f"{table}ID"] if f"{table}ID" in names else []
+        if mode is LoadMode.MERGE and not key:
+            raise ValueError(f"Merge into {table} needs key columns")
+
+        target = self._name(table)
+        with self.conn.transaction(), self.conn.cursor() as cursor:
+            exists = self._exists(cursor, table)
+            if mode is LoadMode.REPLACE:
+                # Indexes are built after the swap so their names derive from
+                # the target, not the staging table (and COPY runs unindexed)
+                staging = self._name(f"{table}__staging")
+                cursor.execute(f"DROP TABLE IF EXISTS {staging}")
+                if exists:
+                    indexes = self._index_statements(cursor, table)
+                    cursor.execute(
+                        f"CREATE TABLE {staging} "
+                        f"(LIKE {target} INCLUDING ALL EXCLUDING INDEXES)"
+                    )
+                else:
+                    cursor.execute(create_table_sql(staging, resolved))
+                    indexes = [primary_key_sql(target, key)] if key else []
+                count = self._copy(cursor, staging, names, records)
+                cursor.execute(f"DROP TABLE IF EXISTS {target}")
+                cursor.execute(
+                    f"ALTER TABLE {staging} RENAME TO {quote_identifier(table)}"
+                )
+                for statement in indexes:
+                    cursor.execute(statement)
+            else:
+                if not exists:
+                    cursor.execute(create_table_sql(target, resolved, key))
+                if mode is LoadMode.APPEND:
+                    count = self._copy(cursor, target, names, records)
+                else:
+                    delta = quote_identifier(f"{table}__delta")
+                    cursor.execute(f"DROP TABLE IF EXISTS {delta}")
+                    cursor.execute(
+                        f"CREATE TEMP TABLE {delta} "
+                        f"(LIKE {target} INCLUDING DEFAULTS) ON COMMIT DROP"
+                    )
+                    count = self._copy(cursor, delta, names, records)
+                    cursor.execute(merge_sql(target, delta, names, key))
+
+        logger.info(f"Copied {count} rows into {table} ({mode.value})")
+        return count
+
+    def _copy(
+        self, cursor: Any, table: str, names: List[str], records: Iterable[Any]
+    ) -> int:
+        """COPY records into a table while the producer thread encodes ahead."""
+        column_list = ", ".join(quote_identifier(name) for name in names)
+        statement = (
+            f"COPY {table} ({column_list}) FROM STDIN (FORMAT {self.format.value})"
+        )
+        row_tuples = rows(records, names)
+
+        if self.format is CopyFormat.CSV:
+            with cursor.copy(statement) as copy:
+                for chunk in prefetch(
+                    csv_chunks(row_tuples, self.chunk_bytes), self.queue_chunks
+                ):
+                    copy.write(chunk)
+        else:
+            oids = self._column_oids(cursor, table, names)
+            text_columns = [i for i, oid in enumerate(oids) if oid in _TEXT_OIDS]
+            with cursor.copy(statement) as copy:
+                copy.set_types(oids)
+                write_row = copy.write_row
+                for batch in prefetch(
+                    row_batches(row_tuples, text_columns), self.queue_chunks
+                ):
+                    for row in batch:
+                        write_row(row)
+        return max(cursor.rowcount, 0)
+
+
+def load_postgres(
+    client: Any,
+    connection: Any,
+    db_name: str,
+    tables: Optional[Iterable[str]] = None,
+    mode: LoadMode = LoadMode.REPLACE,
+    format: CopyFormat = CopyFormat.CSV,
+    schema: Optional[str] = None,
+    page_size: Optional[int] = None,
+) -> Dict[str, int]:
+    """
+    Load AutoCare tables into PostgreSQL, one COPY transaction per table.
+
+    Tables with a typed model in autocare.databases get its schema;
+    others use TableInfo.columns when the API reports them, else the keys
+    of the first record.
+
+    Args:
+        client: Authenticated AutoCareAPI instance
+        connection: psycopg Connection or conninfo string
+        db_name: Database name (e.g. "vcdb")
+        tables: Table names; default: every table list_tables() reports
+        mode: replace, merge or append
+        format: COPY data format
+        schema: Schema for the target tables
+        page_size: Records per API page
+
+    Returns:
+        Rows copied per table
+    """
+    infos = {info.name: info for info in client.list_tables(db_name)}
+    counts: Dict[str, int] = {}
+    with PostgresLoader(connection, format=format, schema=schema) as loader:
+        for table in list(infos) if tables is None else tables:
+            info = infos.get(table)
+            counts[table] = loader.load(
+                table,
+                client.fetch_records(db_name, table, page_size=page_size),
+                model=default_model(db_name, table),
+                columns=info.columns if info is not None else None,
+                mode=mode,
+            )
+    return counts
@@ -0,0 +1,267 @@
+"""Local SQLite copies of AutoCare reference tables.
+
+SQLiteLoader builds a complete database into a temporary file next to the
+target, with journaling and syncs off while loading, one transaction per
+table and executemany() over streamed rows. Indexes on the ID columns are
+created once all rows are in, and the finished file is moved over the
+target with os.replace(), so readers see either the old or the new copy,
+never a partial one.
+
+Example:
+    with SQLiteLoader("vcdb.sqlite") as loader:
+        loader.load("Vehicle", client.fetch_records("vcdb", "Vehicle"),
+                    model=vcdb.Vehicle)
+
+    load_sqlite(client, "vcdb.sqlite", "vcdb")  # every table
+"""
+
+import logging
+import os
+import sqlite3
+from typing import Any, Dict, Iterable, List, Optional, Type, Union
+
+from autocare.profiling import profiled
+from autocare.sinks.base import (
+    Column,
+    default_model,
+    quote_identifier as _quote,
+    resolve_columns,
+    rows,
+)
+
+logger = logging.getLogger(__name__)
+
+# Python type -> declared SQLite column type; unknown types get no affinity
+_SQLITE_TYPES = {int: "INTEGER", bool: "INTEGER", float: "REAL", str: "TEXT"}
+
+# Pragmas for the build connection: the file is private until it is swapped
+# in, so a crash only loses the temporary copy
+_BUILD_PRAGMAS = (
+    "PRAGMA journal_mode = OFF",
+    "PRAGMA synchronous = OFF",
+    "PRAGMA locking_mode = EXCLUSIVE",
+    "PRAGMA temp_store = MEMORY",
+)
+
+DEFAULT_CACHE_SIZE_KB = 256 * 1024
+
+
+def create_table_sql(table: str, columns: List[Column]) -> str:
+    """
+    CREATE TABLE statement for the given columns.
+
+    Example:
+        create_table_sql("Make", model_columns(vcdb.Make))
+    """
+    definitions = ", ".join(
+        f"{_quote(name)} {_SQLITE_TYPES[kind]}"
+        if kind in _SQLITE_TYPES
+        else _quote(name)
+        for name, kind in columns
+    )
+    return f"CREATE TABLE {_quote(table)} ({definitions})"
+
+
+def id_columns(columns: Iterable[str]) -> List[str]:
+    """Columns indexed by default: every *ID column except CultureID."""
+    return [name for name in columns if name.endswith("ID") and name != "CultureID"]
+
+
+class SQLiteLoader:
+    """Bulk loader that atomically replaces a SQLite database file.
+
+    Tables are loaded into "<path>.loading"; close() indexes them and
+    swaps the file into place. Leaving the context with an exception
+    discards the temporary file and keeps the previous database.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        index: bool = True,
+        cache_size_kb: int = DEFAULT_CACHE_SIZE_KB,
+    ):
+        """
+        Initialize the loader.
+
+        Args:
+            path: Target database file
+            index: Create indexes on ID columns before swapping in
+            cache_size_kb: SQLite page cache used while building
+        """
+        self.path = os.fspath(path)
+        self.build_path = self.path + ".loading"
+        self.index = index
+        self.cache_size_kb = cache_size_kb
+        self.counts: Dict[str, int] = {}
+        self._index_columns: Dict[str, List[str]] = {}
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def open(self) -> None:
+        """Start a fresh build file."""
+        if self._conn is not None:
+            return
+        for suffix in ("", "-journal"):
+            if os.path.exists(self.build_path + suffix):
+                os.remove(self.build_path + suffix)
+        self.counts = {}
+        self._index_columns = {}
+        conn = sqlite3.connect(self.build_path, isolation_level=None)
+        for pragma in _BUILD_PRAGMAS:
+            conn.execute(pragma)
+        conn.execute(f"PRAGMA cache_size = {-int(self.cache_size_kb)}")
+        self._conn = conn
+
+    @profiled("sqlite-{table}")
+    def load(
+        self,
+        table: str,
+        records: Iterable[Any],
+        model: Optional[Type] = None,
+        columns: Optional[Iterable[str]] = None,
+        index_columns: Optional[Iterable[str]] = None,
+    ) -> int:
+        """
+        Create a table and bulk-load records into it.
+
+        Loading a table twice raises ValueError before anything is written.
+        Any error while the table is being created or filled, a ValueError
+        from a record included, discards the whole build file.
+
+        Args:
+            table: Table name
+            records: Records from fetch_records() (dicts or model instances)
+            model: Typed model dataclass that defines the schema
+            columns: Column names when there is no model (e.g.
+                     TableInfo.columns); default: keys of the first record
+            index_columns: Columns to index; default: the *ID columns
+
+        Returns:
+            Number of rows loaded
+
+        Raises:
+            ValueError: If the table was already loaded in this build
+        """
+        if table in self.counts:
+            raise ValueError(f"Table {table} was already loaded")
+        if self._conn is None:
+            self.open()
+        conn = self._conn
+        assert conn is not None
+
+        resolved, records = resolve_columns(records, model, columns)
+        names = [name for name, _ in resolved]
+        if not names:
+            logger.warning(f"No columns for table {table}; skipped")
+            self.counts[table] = 0
+            return 0
+
+        placeholders = ", ".join("?" * len(names))
+        # Without a journal a failed load cannot be rolled back: the whole
+        # build is discarded instead
+        try:
+            conn.execute("BEGIN")
+            conn.execute(create_table_sql(table, resolved))
+            cursor = conn.executemany(
+                f"INSERT INTO {_quote(table)} VALUES ({placeholders})",
+                rows(records, names),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            self.abort()
+            raise
+
+        count = max(cursor.rowcount, 0)
+        self.counts[table] = count
+        self._index_columns[table] = (
+            id_columns(names) if index_columns is None else list(index_columns)
+        )
+        logger.info(f"Loaded {count} rows into {table}")
+        return count
+
+    def create_indexes(self) -> None:
+        """Index the loaded tables (run once, after all rows are in)."""
+        conn = self._conn
+        assert conn is not None
+        conn.execute("BEGIN")
+        for table, columns in self._index_columns.items():
+            for column in columns:
+                conn.execute(
+                    f"CREATE INDEX {_quote(f'ix_{table}_{column}')} "
+                    f"ON {_quote(table)} ({_quote(column)})"
+                )
+        conn.execute("COMMIT")
+        conn.execute("ANALYZE")
+
+    def close(self) -> None:
+        """Index, finalize and atomically swap the new database into place."""
+        conn = self._conn
+        if conn is None:
+            return
+        if self.index:
+            self.create_indexes()
+        # Readers get a normal rollback journal once the file is live
+        conn.execute("PRAGMA journal_mode = DELETE")
+        conn.close()
+        self._conn = None
+        os.replace(self.build_path, self.path)
+        logger.info(f"Replaced {self.path} ({len(self.counts)} tables)")
+
+    def abort(self) -> None:
+        """Discard the build file and keep the current database."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        if os.path.exists(self.build_path):
+            os.remove(self.build_path)
+
+
+def load_sqlite(
+    client: Any,
+    path: Union[str, os.PathLike],
+    db_name: str,
+    tables: Optional[Iterable[str]] = None,
+    page_size: Optional[int] = None,
+    index: bool = True,
+) -> Dict[str, int]:
+    """
+    Refresh a local SQLite copy of an AutoCare database.
+
+    Tables with a typed model in autocare.databases get its schema;
+    others use TableInfo.columns when the API reports them, else the keys
+    of the first record.
+
+    Args:
+        client: Authenticated AutoCareAPI instance
+        path: Target database file, replaced atomically on success
+        db_name: Database name (e.g. "vcdb")
+        tables: Table names; default: every table list_tables() reports
+        page_size: Records per API page
+        index: Create indexes on ID columns
+
+    Returns:
+        Rows loaded per table
+    """
+    infos = {info.name: info for info in client.list_tables(db_name)}
+    names = list(infos) if tables is None else list(tables)
+
+    with SQLiteLoader(path, index=index) as loader:
+        for table in names:
+            info = infos.get(table)
+            loader.load(
+                table,
+                client.fetch_records(db_name, table, page_size=page_size),
+                model=default_model(db_name, table),
+                columns=info.columns if info is not None else None,
+            )
+    return loader.counts
@@ -0,0 +1,408 @@
+"""Delta (adds / deletes / changes) between two ACES submissions.
+
+Each App is reduced to two digests:
+
+- a key digest over its canonical identity: vehicle (BaseVehicle or
+  Years/Make/Model), vehicle attributes, part type, position, qualifiers,
+  part number and brand
+- a content digest over everything else that downstream loads care about:
+  quantity, notes, display order and other App children
+
+Apps with the same key and content are unchanged; the same key with
+different content is a modification. Inputs larger than memory are split
+into on-disk hash partitions by key digest, and each partition pair is
+compared in memory, so peak memory is bounded by the largest partition
+rather than by file size.
+
+A previous submission can also be kept as a compact baseline file (see
+write_baseline()) instead of re-parsing the old XML every week. Baselines
+are gzipped JSON lines holding only data, so loading one never runs code;
+the partition files written during a diff are private temporary files.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import (
+    IO,
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from autocare.standards.aces_reader import App, AppQualifier, iter_apps
+
+Source = Union[str, os.PathLike, IO[bytes]]
+# (key digest, content digest, app)
+SignedApp = Tuple[bytes, bytes, App]
+
+_DIGEST_SIZE = 16
+_BASELINE_MAGIC = "autocare-aces-baseline"
+_BASELINE_FORMAT_VERSION = 1
+
+# Partitions used when comparing out of core; 1 compares fully in memory
+DEFAULT_PARTITIONS = 64
+
+
+class DeltaKind(str, Enum):
+    """Kind of change between the old and new submission."""
+
+    ADD = "add"
+    DELETE = "delete"
+    MODIFY = "modify"
+
+
+@dataclass
+class AppDelta:
+    """One changed application.
+
+    Attributes:
+        kind: Added, deleted or modified
+        key: Canonical key digest shared by old and new
+        old: App from the old submission (None for adds)
+        new: App from the new submission (None for deletes)
+    """
+
+    kind: DeltaKind
+    key: bytes
+    old: Optional[App] = None
+    new: Optional[App] = None
+
+
+def _digest(value: object) -> bytes:
+    """Hash the repr of a canonical tuple."""
+    return hashlib.blake2b(
+        repr(value).encode("utf-8"), digest_size=_DIGEST_SIZE
+    ).digest()
+
+
+def app_key(app: App) -> bytes:
+    """
+    Digest of an App's canonical identity.
+
+    Attribute and qualifier order within the App does not affect the key.
+
+    Args:
+        app: App record
+
+    Returns:
+        16-byte key digest
+    """
+    return _digest(
+        (
+            app.base_vehicle_id,
+            app.years,
+            tuple(sorted(app.vehicle_attributes.items())),
+            app.part_type_id,
+            app.position_id,
+            tuple(
+                sorted((q.qualifier_id or 0, tuple(q.params)) for q in app.qualifiers)
+            ),
+            app.part_number,
+            app.brand_id,
+        )
+    )
+
+
+def app_content(app: App) -> bytes:
+    """
+    Digest of the non-key content of an App.
+
+    Note order does not affect the digest. The App id and action are
+    submission bookkeeping and are ignored.
+
+    Args:
+        app: App record
+
+    Returns:
+        16-byte content digest
+    """
+    return _digest(
+        (
+            app.qty,
+            tuple(sorted(app.notes)),
+            app.display_order,
+            tuple(sorted(app.extra.items())),
+        )
+    )
+
+
+def sign_apps(apps: Iterable[App]) -> Iterator[SignedApp]:
+    """Attach key and content digests to each App."""
+    for app in apps:
+        yield app_key(app), app_content(app), app
+
+
+def _encode_app(app: App) -> List[Any]:
+    """App as a JSON-compatible list, in App field order."""
+    return [
+        app.id,
+        app.action,
+        app.base_vehicle_id,
+        app.years,
+        app.vehicle_attributes,
+        [[q.qualifier_id, q.params, q.text] for q in app.qualifiers],
+        app.notes,
+        app.part_type_id,
+        app.position_id,
+        app.qty,
+        app.part_number,
+        app.brand_id,
+        app.display_order,
+        app.extra,
+    ]
+
+
+def _decode_app(values: List[Any]) -> App:
+    """Rebuild an App from _encode_app() output."""
+    (
+        app_id,
+        action,
+        base_vehicle_id,
+        years,
+        vehicle_attributes,
+        qualifiers,
+        notes,
+        part_type_id,
+        position_id,
+        qty,
+        part_number,
+        brand_id,
+        display_order,
+        extra,
+    ) = values
+    return App(
+        id=app_id,
+        action=action,
+        base_vehicle_id=base_vehicle_id,
+        years=tuple(years) if years is not None else None,
+        vehicle_attributes=vehicle_attributes,
+        qualifiers=[AppQualifier(*qualifier) for qualifier in qualifiers],
+        notes=notes,
+        part_type_id=part_type_id,
+        position_id=position_id,
+        qty=qty,
+        part_number=part_number,
+        brand_id=brand_id,
+        display_order=display_order,
+        extra=extra,
+    )
+
+
+def write_baseline(
+    source: Union[Source, Iterable[App]], path: Union[str, os.PathLike]
+) -> int:
+    """
+    Store a submission as a baseline for later diffs.
+
+    The baseline is gzipped JSON lines: a header line, then one
+    [key digest, content digest, app] line per app with the digests in
+    hex. Later diffs skip XML parsing and hashing for the old side, and
+    reading a baseline from shared storage only ever decodes data.
+
+    Args:
+        source: ACES file path / binary stream, or an iterable of Apps
+        path: Baseline output path
+
+    Returns:
+        Number of apps written
+    """
+    count = 0
+    with gzip.open(path, "wt", encoding="utf-8", compresslevel=1) as f:
+        header = {"format": _BASELINE_MAGIC, "version": _BASELINE_FORMAT_VERSION}
+        f.write(json.dumps(header) + "\n")
+        for key, content, app in sign_apps(_apps(source)):
+            line = [key.hex(), content.hex(), _encode_app(app)]
+            f.write(json.dumps(line, separators=(",", ":")) + "\n")
+            count += 1
+    return count
+
+
+def iter_baseline(path: Union[str, os.PathLike]) -> Iterator[SignedApp]:
+    """
+    Stream signed apps from a baseline file.
+
+    Raises:
+        ValueError: If the file is not a supported baseline
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        try:
+            header = json.loads(f.readline())
+        except (OSError, UnicodeDecodeError, ValueError):
+            header = None
+        if header != {"format": _BASELINE_MAGIC, "version": _BASELINE_FORMAT_VERSION}:
+            raise ValueError(f"Not a supported ACES baseline file: {path}")
+        for line in f:
+            key, content, app = json.loads(line)
+            yield bytes.fromhex(key), bytes.fromhex(content), _decode_app(app)
+
+
+def _apps(source: Union[Source, Iterable[App]]) -> Iterable[App]:
+    """Treat paths and binary streams as ACES documents."""
+    if isinstance(source, (str, os.PathLike)) or hasattr(source, "read"):
+        return iter_apps(source)  # type: ignore[arg-type]
+    return source  # type: ignore[return-value]
+
+
+def _compare(
+    old: Dict[bytes, Deque[Tuple[bytes, App]]],
+    new: Iterable[SignedApp],
+) -> Iterator[AppDelta]:
+    """Compare one partition: old apps indexed by key, new apps streamed.
+
+    Apps repeated under the same key are matched by content first, so
+    duplicate apps in both submissions do not show up as changes.
+    """
+    for key, content, app in new:
+        candidates = old.get(key)
+        if not candidates:
+            yield AppDelta(DeltaKind.ADD, key, new=app)
+            continue
+        for i, (old_content, old_app) in enumerate(candidates):
+            if old_content == content:
+                del candidates[i]
+                break
+        else:
+            _, old_app = candidates.popleft()
+            yield AppDelta(DeltaKind.MODIFY, key, old=old_app, new=app)
+
+    for key, candidates in old.items():
+        for _, old_app in candidates:
+            yield AppDelta(DeltaKind.DELETE, key, old=old_app)
+
+
+def _index(signed: Iterable[SignedApp]) -> Dict[bytes, Deque[Tuple[bytes, App]]]:
+    """Index signed apps by key digest, keeping repeats in order."""
+    index: Dict[bytes, Deque[Tuple[bytes, App]]] = {}
+    for key, content, app in signed:
+        entry = index.get(key)
+        if entry is None:
+            index[key] = deque([(content, app)])
+        else:
+            entry.append((content, app))
+    return index
+
+
+def _partition(signed: Iterable[SignedApp], paths: List[str]) -> None:
+    """Spill signed apps into partition files by key digest."""
+    files = [open(path, "wb", buffering=1 << 16) for path in paths]
+    try:
+        count = len(files)
+        for record in signed:
+            pickle.dump(record, files[record[0][0] % count], pickle.HIGHEST_PROTOCOL)
+    finally:
+        for f in files:
+            f.close()
+
+
+def _read_partition(path: str) -> Iterator[SignedApp]:
+    """Stream signed apps back from a partition file."""
+    with open(path, "rb", buffering=1 << 16) as f:
+        while True:
+            try:
+                yield pickle.load(f)
+            except EOFError:
+                return
+
+
+def diff_signed(
+    old: Iterable[SignedApp],
+    new: Iterable[SignedApp],
+    partitions: int = DEFAULT_PARTITIONS,
+    workdir: Optional[str] = None,
+) -> Iterator[AppDelta]:
+    """
+    Diff two streams of signed apps.
+
+    Args:
+        old: Signed apps of the previous submission
+        new: Signed apps of the new submission
+        partitions: On-disk hash partitions (max 256); 1 compares in memory
+        workdir: Directory for partition files (default: system temp dir)
+
+    Yields:
+        AppDelta for every added, deleted and modified app. With one
+        partition, adds and modifications follow new-file order; with
+        several, order is by partition.
+    """
+    if not 1 <= partitions <= 256:
+        raise ValueError("partitions must be between 1 and 256")
+
+    if partitions == 1:
+        yield from _compare(_index(old), new)
+        return
+
+    with tempfile.TemporaryDirectory(prefix="aces-delta-", dir=workdir) as tmp:
+        old_paths = [os.path.join(tmp, f"old-{i}.pkl") for i in range(partitions)]
+        new_paths = [os.path.join(tmp, f"new-{i}.pkl") for i in range(partitions)]
+        _partition(old, old_paths)
+        _partition(new, new_paths)
+        for old_path, new_path in zip(old_paths, new_paths):
+            yield from _compare(
+                _index(_read_partition(old_path)), _read_partition(new_path)
+            )
+            os.remove(old_path)
+            os.remove(new_path)
+
+
+def diff_aces(
+    old: Union[Source, Iterable[App]],
+    new: Union[Source, Iterable[App]],
+    partitions: int = DEFAULT_PARTITIONS,
+    workdir: Optional[str] = None,
+) -> Iterator[AppDelta]:
+    """
+    Diff two ACES submissions.
+
+    Example:
+        for delta in diff_aces("last_week.xml.gz", "this_week.xml.gz"):
+            if delta.kind is DeltaKind.DELETE:
+                ...
+
+    Args:
+        old: Previous ACES file path / binary stream, or iterable of Apps
+        new: New ACES file path / binary stream, or iterable of Apps
+        partitions: On-disk hash partitions (max 256); 1 compares in memory
+        workdir: Directory for partition files (default: system temp dir)
+
+    Yields:
+        AppDelta for every added, deleted and modified app
+    """
+    return diff_signed(
+        sign_apps(_apps(old)), sign_apps(_apps(new)), partitions, workdir
+    )
+
+
+def diff_baseline(
+    baseline: Union[str, os.PathLike],
+    new: Union[Source, Iterable[App]],
+    partitions: int = DEFAULT_PARTITIONS,
+    workdir: Optional[str] = None,
+) -> Iterator[AppDelta]:
+    """
+    Diff a new submission against a baseline from write_baseline().
+
+    Args:
+        baseline: Baseline file path
+        new: New ACES file path / binary stream, or iterable of Apps
+        partitions: On-disk hash partitions (max 256); 1 compares in memory
+        workdir: Directory for partition files (default: system temp dir)
+
+    Yields:
+        AppDelta for every added, deleted and modified app
+    """
+    return diff_signed(
+        iter_baseline(baseline), sign_apps(_apps(new)), partitions, workdir
+    )
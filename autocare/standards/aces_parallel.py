@@ -0,0 +1,367 @@
+"""Process-parallel ACES processing over <App>-aligned byte ranges.
+
+An uncompressed ACES file is split into byte ranges that start on <App>
+boundaries. Each worker process parses its range as a small standalone
+document made of the shared prefix (XML declaration, <ACES> root and
+<Header>), the range itself, and a closing </ACES> tag. Results are merged
+in file order.
+
+Chunk boundaries are only placed on "<App" tags outside comments and CDATA
+sections, so commented-out applications never split a chunk.
+
+Worker callables must be importable top-level functions so they can be
+sent to the process pool.
+"""
+
+import mmap
+import os
+import re
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from io import BytesIO
+from typing import Any, Callable, Iterator, List, Optional, Tuple, Union
+
+from autocare.client import DataValidationError
+from autocare.compatibility.aces_transform import transform_aces
+from autocare.standards.aces_reader import ACESReader, App
+
+PathLike = Union[str, os.PathLike]
+
+# Start of an <App> element (but not e.g. <AppFoo>)
+_APP_START = re.compile(rb"<App[\s>/]")
+_APP_END = b"</App>"
+_ROOT_END = b"</ACES>"
+# Markup whose content is not parsed as elements: opener -> closer
+_OPAQUE_SPANS = ((b"<!--", b"-->"), (b"<![CDATA[", b"]]>"))
+
+_COPY_BLOCK_SIZE = 1 << 20
+# Upper bound on bytes per chunk, which bounds per-worker buffering
+DEFAULT_MAX_CHUNK_BYTES = 64 << 20
+
+
+@dataclass(frozen=True)
+class AppChunk:
+    """A byte range of an ACES file that starts on an <App> boundary.
+
+    The last chunk runs to end of file and includes the trailer (Footer
+    and closing </ACES> tag); all other chunks end just before an <App>.
+    """
+
+    index: int
+    start: int
+    end: int
+    is_last: bool
+
+
+@dataclass(frozen=True)
+class ChunkPlan:
+    """How an ACES file is split for parallel processing."""
+
+    path: str
+    prefix: bytes
+    chunks: Tuple[AppChunk, ...]
+
+
+def _skip_markup(data: Any, opener: int) -> Optional[int]:
+    """Offset just past the "<!" markup at opener, or None if it never ends."""
+    head = data[opener : opener + 9]
+    for start, close in _OPAQUE_SPANS:
+        if head.startswith(start):
+            end = data.find(close, opener + len(start))
+            return None if end == -1 else end + len(close)
+    # <!DOCTYPE and other declarations hold no <App> tags worth skipping
+    return opener + 2
+
+
+def _find_app_start(data: Any, offset: int, target: int, limit: int) -> Optional[int]:
+    """
+    Find the first <App start at or after target (before limit).
+
+    Bytes from offset on are scanned for comments and CDATA sections so that
+    "<App" text inside them is skipped; offset itself must lie outside any.
+
+    Args:
+        data: Memory-mapped file
+        offset: Scan start, outside comments and CDATA (e.g. a previous boundary)
+        target: Earliest acceptable boundary
+        limit: End of the searched range
+
+    Returns:
+        Byte offset of the <App tag, or None if there is none
+    """
+    position = offset
+    while True:
+        match = _APP_START.search(data, max(position, target), limit)
+        if match is None:
+            return None
+        opener = data.find(b"<!", position, match.start())
+        if opener == -1:
+            return match.start()
+        skipped = _skip_markup(data, opener)
+        if skipped is None:
+            return None
+        position = skipped
+
+
+def plan_chunks(
+    path: PathLike,
+    chunk_count: int,
+    max_chunk_bytes: int = DEFAULT_MAX_CHUNK_BYTES,
+) -> ChunkPlan:
+    """
+    Split an ACES file into <App>-aligned byte ranges.
+
+    Args:
+        path: Uncompressed ACES file path
+        chunk_count: Minimum number of chunks to produce
+        max_chunk_bytes: Upper bound on chunk size; raises the chunk count
+                         for large files
+
+    Returns:
+        ChunkPlan with the shared prefix bytes and ordered chunks
+
+    Raises:
+        ValueError: If the file is gzip-compressed (no random access)
+    """
+    path = os.fspath(path)
+    if path.endswith(".gz"):
+        raise ValueError("Parallel processing requires an uncompressed ACES file")
+
+    size = os.path.getsize(path)
+    if size == 0:
+        return ChunkPlan(path, b"", ())
+    with (
+        open(path, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data,
+    ):
+        first_app = _find_app_start(data, 0, 0, size)
+        if first_app is None:
+            # No apps: nothing to split, callers fall back to one process
+            return ChunkPlan(path, data[:], ())
+
+        prefix = data[:first_app]
+        last_app_end = data.rfind(_APP_END)
+        last_app_end = size if last_app_end == -1 else last_app_end + len(_APP_END)
+
+        span = last_app_end - first_app
+        count = max(1, chunk_count, -(-span // max_chunk_bytes))
+        boundaries = [first_app]
+        for i in range(1, count):
+            target = first_app + (span * i) // count
+            if target <= boundaries[-1]:
+                continue
+            # Scanning on from the previous boundary keeps track of comments
+            boundary = _find_app_start(data, boundaries[-1], target, last_app_end)
+            if boundary is None:
+                break
+            boundaries.append(boundary)
+
+    chunks = []
+    for index, start in enumerate(boundaries):
+        is_last = index == len(boundaries) - 1
+        end = size if is_last else boundaries[index + 1]
+        chunks.append(AppChunk(index=index, start=start, end=end, is_last=is_last))
+    return ChunkPlan(path, prefix, tuple(chunks))
+
+
+class _ChunkStream:
+    """Read-only stream presenting one chunk as a standalone ACES document."""
+
+    def __init__(self, path: str, prefix: bytes, chunk: AppChunk):
+        self._file = open(path, "rb")
+        self._file.seek(chunk.start)
+        self._remaining = chunk.end - chunk.start
+        self._head = prefix
+        self._tail = b"" if chunk.is_last else _ROOT_END
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = 1 << 62
+        if self._head:
+            data, self._head = self._head[:size], self._head[size:]
+            return data
+        if self._remaining > 0:
+            data = self._file.read(min(size, self._remaining))
+            self._remaining -= len(data)
+            if data:
+                return data
+            self._remaining = 0
+        data, self._tail = self._tail[:size], self._tail[size:]
+        return data
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def iter_chunk_apps(plan: ChunkPlan, chunk: AppChunk) -> Iterator[App]:
+    """
+    Stream the App records of one chunk.
+
+    Args:
+        plan: Chunk plan from plan_chunks()
+        chunk: Chunk to read
+
+    Yields:
+        App records in file order
+    """
+    stream = _ChunkStream(plan.path, plan.prefix, chunk)
+    try:
+        yield from ACESReader(stream)  # type: ignore[arg-type]
+    finally:
+        stream.close()
+
+
+def _run_chunk(task: Tuple[ChunkPlan, AppChunk, Callable[..., Any]]) -> Any:
+    """Process-pool entry point: apply func to one chunk's apps."""
+    plan, chunk, func = task
+    return func(iter_chunk_apps(plan, chunk))
+
+
+def default_workers() -> int:
+    """Number of worker processes used when none is given (all cores)."""
+    return os.cpu_count() or 1
+
+
+def map_app_chunks(
+    path: PathLike,
+    func: Callable[[Iterator[App]], Any],
+    workers: Optional[int] = None,
+    chunks_per_worker: int = 4,
+) -> Iterator[Any]:
+    """
+    Apply func to every chunk of an ACES file on a process pool.
+
+    func receives an iterator of App records for one chunk and returns a
+    picklable result (e.g. a count, a list of errors, validated apps).
+
+    Args:
+        path: Uncompressed ACES file path
+        func: Importable top-level function called once per chunk
+        workers: Worker processes; defaults to all cores
+        chunks_per_worker: Chunks created per worker for load balancing
+
+    Yields:
+        func results in file order
+    """
+    workers = workers or default_workers()
+    plan = plan_chunks(path, workers * chunks_per_worker)
+    tasks = [(plan, chunk, func) for chunk in plan.chunks]
+
+    if workers == 1 or len(tasks) <= 1:
+        for task in tasks:
+            yield _run_chunk(task)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(_run_chunk, tasks)
+
+
+def _transform_chunk(
+    task: Tuple[ChunkPlan, AppChunk, str, str, bytes, str],
+) -> Tuple[int, str]:
+    """Process-pool entry point: convert one chunk into a part file."""
+    plan, chunk, from_version, to_version, output_prefix, part_path = task
+    out = BytesIO()
+    stream = _ChunkStream(plan.path, plan.prefix, chunk)
+    try:
+        apps = transform_aces(stream, out, from_version, to_version)  # type: ignore[arg-type]
+    finally:
+        stream.close()
+
+    data = out.getvalue()
+    if not data.startswith(output_prefix):
+        raise ValueError(f"Chunk {chunk.index} produced an unexpected header")
+    # Drop the synthetic </ACES> closing tag added to non-final chunks
+    end = len(data) if chunk.is_last else data.rfind(_ROOT_END)
+    if end == -1:
+        raise DataValidationError(
+            f"Chunk {chunk.index} produced no closing </ACES> tag to split on"
+        )
+    with open(part_path, "wb") as f:
+        f.write(memoryview(data)[len(output_prefix) : end])
+    return apps, part_path
+
+
+def transform_aces_parallel(
+    source: PathLike,
+    destination: PathLike,
+    from_version: str = "4.2",
+    to_version: str = "5.0",
+    workers: Optional[int] = None,
+    chunks_per_worker: int = 4,
+) -> int:
+    """
+    Convert an ACES file between versions using all cores.
+
+    Produces the same output as transform_aces(). Each chunk is converted
+    in a worker process into a temporary part file next to the destination,
+    and the parts are concatenated in order.
+
+    Args:
+        source: Uncompressed input path
+        destination: Output path
+        from_version: Source ACES version
+        to_version: Target ACES version
+        workers: Worker processes; defaults to all cores
+        chunks_per_worker: Chunks created per worker for load balancing
+
+    Returns:
+        Number of App elements written
+    """
+    workers = workers or default_workers()
+    plan = plan_chunks(source, workers * chunks_per_worker)
+    if not plan.chunks:
+        return transform_aces(source, destination, from_version, to_version)
+
+    # The converted prefix is identical for every chunk: compute it once
+    header_out = BytesIO()
+    transform_aces(
+        BytesIO(plan.prefix + _ROOT_END), header_out, from_version, to_version
+    )
+    header_bytes = header_out.getvalue()
+    root_end = header_bytes.rfind(_ROOT_END)
+    if root_end == -1:
+        raise DataValidationError(
+            "Cannot split the ACES file: the converted document prefix has no "
+            "closing </ACES> tag to split on; use transform_aces() instead"
+        )
+    output_prefix = header_bytes[:root_end]
+
+    destination = os.fspath(destination)
+    tasks = [
+        (
+            plan,
+            chunk,
+            from_version,
+            to_version,
+            output_prefix,
+            f"{destination}.part{chunk.index}",
+        )
+        for chunk in plan.chunks
+    ]
+
+    total = 0
+    part_paths: List[str] = []
+    try:
+        if workers == 1 or len(tasks) == 1:
+            for apps, part_path in map(_transform_chunk, tasks):
+                total += apps
+                part_paths.append(part_path)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for apps, part_path in executor.map(_transform_chunk, tasks):
+                    total += apps
+                    part_paths.append(part_path)
+
+        with open(destination, "wb") as out:
+            out.write(output_prefix)
+            for part_path in part_paths:
+                with open(part_path, "rb") as part:
+                    shutil.copyfileobj(part, out, _COPY_BLOCK_SIZE)
+    finally:
+        for task in tasks:
+            if os.path.exists(task[-1]):
+                os.remove(task[-1])
+
+    return total
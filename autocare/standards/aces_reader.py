@@ -0,0 +1,258 @@
+"""Streaming ACES 4.2 / 5.0 XML reader.
+
+Parses ACES files incrementally with an ElementTree pull parser and yields one
+typed App at a time. Each App element is cleared as soon as it has been
+converted, so memory stays flat regardless of file size.
+"""
+
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from typing import IO, Dict, Iterator, List, Optional, Tuple, cast
+
+from autocare.standards.aces import VERSIONS
+from autocare.standards.xml_reading import (
+    Source,
+    element_text,
+    int_or_none,
+    local_name,
+    open_source,
+)
+
+# Part element names per version (4.2 / 5.0)
+_PART_TAGS = {"Part", "PartNumber"}
+_PART_TYPE_TAGS = {"PartType", "PartTerminology"}
+_QUALIFIER_TAGS = {"Qual", "Qualifier"}
+_BRAND_ATTRIBUTES = ("BrandAAIAID", "BrandID")
+
+# App children stored as plain text in App.extra
+_TEXT_TAGS = {"MfrLabel", "AssetName", "AssetItemOrder", "AssetItemRef"}
+
+
+@dataclass
+class AppQualifier:
+    """A Qdb qualifier applied to an App."""
+
+    qualifier_id: Optional[int]
+    params: List[str] = field(default_factory=list)
+    text: Optional[str] = None
+
+
+@dataclass
+class App:
+    """A single ACES application (fitment) record.
+
+    Field names are version-neutral: part_number holds <Part> (4.2) or
+    <PartNumber> (5.0), and part_type_id holds <PartType> (4.2) or
+    <PartTerminology> (5.0).
+    """
+
+    id: Optional[str] = None
+    action: Optional[str] = None
+    base_vehicle_id: Optional[int] = None
+    years: Optional[Tuple[int, int]] = None
+    vehicle_attributes: Dict[str, int] = field(default_factory=dict)
+    qualifiers: List[AppQualifier] = field(default_factory=list)
+    notes: List[str] = field(default_factory=list)
+    part_type_id: Optional[int] = None
+    position_id: Optional[int] = None
+    qty: Optional[int] = None
+    part_number: Optional[str] = None
+    brand_id: Optional[str] = None
+    display_order: Optional[int] = None
+    extra: Dict[str, str] = field(default_factory=dict)
+
+
+def _parse_qualifier(element: ET.Element) -> AppQualifier:
+    """Convert a <Qual> element into an AppQualifier."""
+    qualifier = AppQualifier(qualifier_id=int_or_none(element.get("id")))
+    for child in element:
+        tag = local_name(child.tag)
+        if tag == "param":
+            qualifier.params.append(child.get("value") or "")
+        elif tag == "text":
+            qualifier.text = element_text(child)
+    return qualifier
+
+
+def parse_app(element: ET.Element) -> App:
+    """
+    Convert an <App> element into an App record.
+
+    Args:
+        element: Parsed <App> element
+
+    Returns:
+        Typed App record
+    """
+    app = App(id=element.get("id"), action=element.get("action"))
+
+    for child in element:
+        tag = local_name(child.tag)
+
+        if tag == "BaseVehicle":
+            app.base_vehicle_id = int_or_none(child.get("id"))
+        elif tag in _PART_TYPE_TAGS:
+            app.part_type_id = int_or_none(child.get("id"))
+        elif tag == "Position":
+            app.position_id = int_or_none(child.get("id"))
+        elif tag == "Qty":
+            app.qty = int_or_none(child.text)
+        elif tag in _PART_TAGS:
+            app.part_number = element_text(child)
+            for attribute in _BRAND_ATTRIBUTES:
+                if attribute in child.attrib:
+                    app.brand_id = child.attrib[attribute]
+        elif tag in _QUALIFIER_TAGS:
+            app.qualifiers.append(_parse_qualifier(child))
+        elif tag == "Note":
+            note = element_text(child)
+            if note:
+                app.notes.append(note)
+        elif tag == "DisplayOrder":
+            app.display_order = int_or_none(child.text)
+        elif tag == "Years":
+            start = int_or_none(child.get("from"))
+            end = int_or_none(child.get("to"))
+            if start is not None and end is not None:
+                app.years = (start, end)
+        elif "id" in child.attrib:
+            # SubModel, EngineBase, Make, Model, ... all carry VCdb ids
+            vehicle_id = int_or_none(child.get("id"))
+            if vehicle_id is not None:
+                app.vehicle_attributes[tag] = vehicle_id
+        elif tag in _TEXT_TAGS or len(child) == 0:
+            text = element_text(child)
+            if text is not None:
+                app.extra[tag] = text
+
+    return app
+
+
+class ACESReader:
+    """Incremental reader for ACES 4.2 and 5.0 files.
+
+    Iterating the reader yields App records in document order. The Header
+    is available as a flat dict once the first App has been read (or after
+    iteration finishes for files without apps), and the Footer record count
+    after iteration finishes.
+
+    Example:
+        reader = ACESReader("fitment.xml.gz")
+        for app in reader:
+            ...
+        print(reader.version, reader.header.get("Company"), reader.app_count)
+    """
+
+    DEFAULT_CHUNK_SIZE = 1 << 20
+
+    def __init__(
+        self,
+        source: Source,
+        version: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        """
+        Initialize the reader.
+
+        Args:
+            source: File path (".gz" is decompressed) or binary file object
+            version: ACES version override. When None, read from the root
+                     element's version attribute.
+            chunk_size: Bytes read from the source per parser feed
+
+        Raises:
+            ValueError: If the version is unsupported
+        """
+        if version is not None and version not in VERSIONS:
+            raise ValueError(
+                f"Unsupported ACES version: {version}. Supported: {VERSIONS}"
+            )
+        self.source = source
+        self.version = version
+        self.chunk_size = chunk_size
+        self.header: Dict[str, str] = {}
+        self.footer_record_count: Optional[int] = None
+        self.app_count = 0
+
+    def __iter__(self) -> Iterator[App]:
+        """Parse the document and yield each App."""
+        stream, owned = open_source(self.source)
+        try:
+            yield from self._iter_apps(stream)
+        finally:
+            if owned:
+                stream.close()
+
+    def _iter_apps(self, stream: IO[bytes]) -> Iterator[App]:
+        """Feed the stream through a pull parser in fixed-size chunks."""
+        parser: ET.XMLPullParser[ET.Element] = ET.XMLPullParser(events=("start", "end"))
+        root: Optional[ET.Element] = None
+        depth = 0
+
+        while True:
+            chunk = stream.read(self.chunk_size)
+            if chunk:
+                parser.feed(chunk)
+            else:
+                parser.close()
+
+            for queued in parser.read_events():
+                # Only "start" / "end" are requested, and both carry an Element
+                event, element = cast(Tuple[str, ET.Element], queued)
+                if event == "start":
+                    if root is None:
+                        root = element
+                        self._read_root(element)
+                    depth += 1
+                    continue
+
+                depth -= 1
+                # Only direct children of <ACES> are complete records
+                if depth != 1:
+                    continue
+
+                tag = local_name(element.tag)
+                if tag == "App":
+                    self.app_count += 1
+                    yield parse_app(element)
+                elif tag == "Header":
+                    self.header = {
+                        local_name(child.tag): child.text.strip()
+                        for child in element
+                        if child.text and child.text.strip()
+                    }
+                elif tag == "Footer":
+                    for child in element:
+                        if local_name(child.tag) == "RecordCount":
+                            self.footer_record_count = int_or_none(child.text)
+
+                # Drop the processed subtree so the root never accumulates
+                assert root is not None
+                root.clear()
+
+            if not chunk:
+                break
+
+    def _read_root(self, root: ET.Element) -> None:
+        """Capture the document version from the <ACES> root element."""
+        if self.version is None:
+            version = root.get("version")
+            if version is not None and version not in VERSIONS:
+                raise ValueError(
+                    f"Unsupported ACES version: {version}. Supported: {VERSIONS}"
+                )
+            self.version = version
+
+
+def iter_apps(source: Source, version: Optional[str] = None) -> Iterator[App]:
+    """
+    Stream App records from an ACES file.
+
+    Args:
+        source: File path (".gz" is decompressed) or binary file object
+        version: ACES version override
+
+    Yields:
+        App records in document order
+    """
+    return iter(ACESReader(source, version=version))
@@ -0,0 +1,184 @@
+"""Streaming ACES 4.2 / 5.0 XML writer.
+
+Writes the Header, then one App at a time, then the Footer, straight to a
+buffered (optionally gzipped) output stream. Only the App being serialized
+is held in memory, so export size is bounded by disk, not RAM.
+"""
+
+from typing import Iterable, List, Mapping, Optional
+
+from autocare.standards.aces import (
+    V4_TO_V5_ATTRIBUTE_RENAMES,
+    V4_TO_V5_ELEMENT_RENAMES,
+    VERSIONS,
+)
+from autocare.standards.aces_reader import App
+from autocare.standards.xml_writing import (
+    DEFAULT_BUFFER_SIZE,
+    Destination,
+    XMLWriter,
+    escape_text,
+    quote_attribute,
+    render_header,
+)
+
+# App children written from App.extra ahead of Position / Part, per the XSD
+_LEADING_EXTRA = ("MfrLabel",)
+
+
+class ACESWriter(XMLWriter):
+    """Incremental writer for ACES 4.2 and 5.0 documents.
+
+    Element and attribute names follow the target version (e.g. <Part> /
+    BrandAAIAID for 4.2, <PartNumber> / BrandID for 5.0), whatever version
+    the App records were read from.
+
+    Example:
+        with ACESWriter("export.xml.gz", header={"Company": "Acme"}) as writer:
+            writer.write_all(iter_apps_from_store())
+    """
+
+    def __init__(
+        self,
+        destination: Destination,
+        version: str = "5.0",
+        header: Optional[Mapping[str, object]] = None,
+        compresslevel: Optional[int] = None,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            destination: Output path (".gz" is compressed) or binary file object
+            version: ACES version to write
+            header: Header element name -> text, written in order
+            compresslevel: gzip level; None compresses only ".gz" paths
+            buffer_size: Output buffer size in bytes
+
+        Raises:
+            ValueError: If the version is unsupported
+        """
+        if version not in VERSIONS:
+            raise ValueError(
+                f"Unsupported ACES version: {version}. Supported: {VERSIONS}"
+            )
+        super().__init__(destination, compresslevel, buffer_size)
+        self.version = version
+        self.header = header
+
+        if version == "4.2":
+            self._part_tag, self._part_type_tag = "Part", "PartType"
+            self._brand_attribute = "BrandAAIAID"
+        else:
+            self._part_tag = V4_TO_V5_ELEMENT_RENAMES["Part"]
+            self._part_type_tag = V4_TO_V5_ELEMENT_RENAMES["PartType"]
+            self._brand_attribute = V4_TO_V5_ATTRIBUTE_RENAMES["BrandAAIAID"]
+
+    def _prologue(self) -> str:
+        return f'<ACES version="{self.version}">\n{render_header(self.header)}'
+
+    def _epilogue(self) -> str:
+        return f"<Footer><RecordCount>{self.count}</RecordCount></Footer>\n</ACES>\n"
+
+    def write(self, app: App) -> None:
+        """Serialize one App."""
+        self.count += 1
+        self._write(self.serialize(app))
+
+    def write_all(self, apps: Iterable[App]) -> int:
+        """
+        Serialize every App from an iterable.
+
+        Returns:
+            Number of apps written by this call
+        """
+        if self._out is None:
+            self.open()
+        assert self._out is not None
+        write = self._out.write
+        serialize = self.serialize
+        written = 0
+        for app in apps:
+            write(serialize(app))
+            written += 1
+        self.count += written
+        return written
+
+    def serialize(self, app: App) -> str:
+        """Render one App element (with trailing newline)."""
+        parts: List[str] = ["<App"]
+        if app.action is not None:
+            parts.append(f" action={quote_attribute(app.action)}")
+        if app.id is not None:
+            parts.append(f" id={quote_attribute(app.id)}")
+        parts.append(">")
+
+        if app.base_vehicle_id is not None:
+            parts.append(f'<BaseVehicle id="{app.base_vehicle_id}"/>')
+        elif app.years is not None:
+            parts.append(f'<Years from="{app.years[0]}" to="{app.years[1]}"/>')
+        for name, attribute_id in app.vehicle_attributes.items():
+            parts.append(f'<{name} id="{attribute_id}"/>')
+
+        for qualifier in app.qualifiers:
+            parts.append(f'<Qual id="{qualifier.qualifier_id}">')
+            for param in qualifier.params:
+                parts.append(f"<param value={quote_attribute(param)}/>")
+            if qualifier.text is not None:
+                parts.append(f"<text>{escape_text(qualifier.text)}</text>")
+            parts.append("</Qual>")
+        for note in app.notes:
+            parts.append(f"<Note>{escape_text(note)}</Note>")
+
+        if app.qty is not None:
+            parts.append(f"<Qty>{app.qty}</Qty>")
+        if app.part_type_id is not None:
+            parts.append(f'<{self._part_type_tag} id="{app.part_type_id}"/>')
+        extra = app.extra
+        for name in _LEADING_EXTRA:
+            if name in extra:
+                parts.append(f"<{name}>{escape_text(extra[name])}</{name}>")
+        if app.position_id is not None:
+            parts.append(f'<Position id="{app.position_id}"/>')
+
+        part_tag = self._part_tag
+        if app.brand_id is not None:
+            parts.append(
+                f"<{part_tag} {self._brand_attribute}={quote_attribute(app.brand_id)}>"
+            )
+        else:
+            parts.append(f"<{part_tag}>")
+        parts.append(f"{escape_text(app.part_number or '')}</{part_tag}>")
+
+        if app.display_order is not None:
+            parts.append(f"<DisplayOrder>{app.display_order}</DisplayOrder>")
+        for name, value in extra.items():
+            if name not in _LEADING_EXTRA:
+                parts.append(f"<{name}>{escape_text(value)}</{name}>")
+        parts.append("</App>\n")
+        return "".join(parts)
+
+
+def write_aces(
+    destination: Destination,
+    apps: Iterable[App],
+    version: str = "5.0",
+    header: Optional[Mapping[str, object]] = None,
+    compresslevel: Optional[int] = None,
+) -> int:
+    """
+    Write a complete ACES document from an App iterator.
+
+    Args:
+        destination: Output path (".gz" is compressed) or binary file object
+        apps: App records, consumed one at a time
+        version: ACES version to write
+        header: Header element name -> text
+        compresslevel: gzip level; None compresses only ".gz" paths
+
+    Returns:
+        Number of apps written
+    """
+    with ACESWriter(destination, version, header, compresslevel) as writer:
+        return writer.write_all(apps)
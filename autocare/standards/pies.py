@@ -48,3 +48,23 @@ V8_NEW_TYPES = [
 # PIES 8.0 is backward compatible — no removed segments or renames
 V8_REMOVED_SEGMENTS: dict = {}
 V8_RENAMED_SEGMENTS: dict = {}
+
+# --- Item-level segment elements ---
+
+# Segment code -> (container element inside <Item>, repeated child element)
+ITEM_SEGMENT_ELEMENTS = {
+    "C01": ("Descriptions", "Description"),
+    "D01": ("Prices", "Pricing"),
+    "E01": ("ExtendedInformation", "ExtendedProductInformation"),
+    "F01": ("ProductAttributes", "ProductAttribute"),
+    "H01": ("Packages", "Package"),
+    "K01": ("Kits", "KitComponent"),
+    "N01": ("PartInterchangeInfo", "PartInterchange"),
+    "P01": ("DigitalAssets", "DigitalFileInformation"),
+}
+
+# PIES 8.0 adds packaging-item packages to the Item
+ITEM_SEGMENT_ELEMENTS_V8 = {
+    **ITEM_SEGMENT_ELEMENTS,
+    "I01": ("PackagingItems", "PackagingItemsPackage"),
+}
@@ -0,0 +1,385 @@
+"""Streaming PIES 7.2 / 8.0 XML reader.
+
+Parses PIES files incrementally with an ElementTree pull parser and yields one
+typed Item at a time. Each Item is cleared as soon as it has been converted,
+and item segments that were not selected are cleared as soon as they close,
+so memory stays flat regardless of file size.
+"""
+
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Tuple, cast
+
+from autocare.standards.pies import ITEM_SEGMENT_ELEMENTS_V8, VERSIONS
+from autocare.standards.xml_reading import (
+    Source,
+    element_text,
+    int_or_none,
+    local_name,
+    open_source,
+)
+
+_BRAND_ATTRIBUTES = ("BrandAAIAID", "BrandID")
+
+# Item container element -> segment code
+_CONTAINER_SEGMENTS = {
+    container: code for code, (container, _) in ITEM_SEGMENT_ELEMENTS_V8.items()
+}
+
+
+@dataclass
+class Description:
+    """A C01 Description segment."""
+
+    code: Optional[str]
+    value: Optional[str]
+    language: Optional[str] = None
+    sequence: Optional[int] = None
+    maintenance_type: Optional[str] = None
+
+
+@dataclass
+class ExtendedProductInfo:
+    """An E01 ExtendedProductInformation segment."""
+
+    code: Optional[str]
+    value: Optional[str]
+    language: Optional[str] = None
+    maintenance_type: Optional[str] = None
+
+
+@dataclass
+class ProductAttribute:
+    """An F01 ProductAttribute segment.
+
+    attribute_id is the PAdb attribute ID when padb_attribute is True,
+    otherwise a free-form attribute name.
+    """
+
+    attribute_id: Optional[str]
+    value: Optional[str]
+    padb_attribute: bool = False
+    uom: Optional[str] = None
+    record_number: Optional[int] = None
+    language: Optional[str] = None
+    maintenance_type: Optional[str] = None
+
+
+@dataclass
+class SegmentRecord:
+    """An element kept in generic form (Pricing, Package, ItemLevelGTIN, ...).
+
+    Attributes:
+        tag: Element name
+        attributes: XML attributes
+        value: Element text (e.g. the amount of a <Price UOM="PE">)
+        children: Child elements in document order; leaves are records
+            with a value and no children
+    """
+
+    tag: str
+    attributes: Dict[str, str] = field(default_factory=dict)
+    value: Optional[str] = None
+    children: List["SegmentRecord"] = field(default_factory=list)
+
+    def text(self, tag: str) -> Optional[str]:
+        """Value of the first child with the given tag, or None."""
+        return _first_value(self.children, tag)
+
+
+@dataclass
+class Item:
+    """A single PIES Item (B01) with its child segments.
+
+    Segments that were not selected when reading are left empty. Item
+    children other than the typed ones and the segments are kept in
+    fields, in document order and with their attributes.
+    """
+
+    maintenance_type: Optional[str] = None
+    part_number: Optional[str] = None
+    brand_id: Optional[str] = None
+    part_terminology_id: Optional[int] = None
+    fields: List[SegmentRecord] = field(default_factory=list)
+    descriptions: List[Description] = field(default_factory=list)
+    prices: List[SegmentRecord] = field(default_factory=list)
+    extended_info: List[ExtendedProductInfo] = field(default_factory=list)
+    attributes: List[ProductAttribute] = field(default_factory=list)
+    packages: List[SegmentRecord] = field(default_factory=list)
+    kits: List[SegmentRecord] = field(default_factory=list)
+    interchanges: List[SegmentRecord] = field(default_factory=list)
+    digital_assets: List[SegmentRecord] = field(default_factory=list)
+    packaging_items: List[SegmentRecord] = field(default_factory=list)
+
+    def text(self, tag: str) -> Optional[str]:
+        """Value of the first field with the given tag, or None."""
+        return _first_value(self.fields, tag)
+
+
+def _first_value(records: Iterable[SegmentRecord], tag: str) -> Optional[str]:
+    """Value of the first record with the given tag."""
+    for record in records:
+        if record.tag == tag:
+            return record.value
+    return None
+
+
+def _segment_record(element: ET.Element) -> SegmentRecord:
+    """Convert an element and its descendants into a SegmentRecord."""
+    return SegmentRecord(
+        local_name(element.tag),
+        dict(element.attrib),
+        element_text(element),
+        [_segment_record(child) for child in element],
+    )
+
+
+def _description(element: ET.Element) -> Description:
+    """Convert a <Description> element."""
+    get = element.get
+    return Description(
+        code=get("DescriptionCode"),
+        value=element_text(element),
+        language=get("LanguageCode"),
+        sequence=int_or_none(get("Sequence")),
+        maintenance_type=get("MaintenanceType"),
+    )
+
+
+def _extended_info(element: ET.Element) -> ExtendedProductInfo:
+    """Convert an <ExtendedProductInformation> element."""
+    get = element.get
+    return ExtendedProductInfo(
+        code=get("EXPICode"),
+        value=element_text(element),
+        language=get("LanguageCode"),
+        maintenance_type=get("MaintenanceType"),
+    )
+
+
+def _product_attribute(element: ET.Element) -> ProductAttribute:
+    """Convert a <ProductAttribute> element."""
+    get = element.get
+    return ProductAttribute(
+        attribute_id=get("AttributeID"),
+        value=element_text(element),
+        padb_attribute=get("PADBAttribute") == "Y",
+        uom=get("AttributeUOM"),
+        record_number=int_or_none(get("RecordNumber")),
+        language=get("LanguageCode"),
+        maintenance_type=get("MaintenanceType"),
+    )
+
+
+# Segment code -> (Item list field, child converter)
+_SEGMENT_PARSERS = {
+    "C01": ("descriptions", _description),
+    "D01": ("prices", _segment_record),
+    "E01": ("extended_info", _extended_info),
+    "F01": ("attributes", _product_attribute),
+    "H01": ("packages", _segment_record),
+    "K01": ("kits", _segment_record),
+    "N01": ("interchanges", _segment_record),
+    "P01": ("digital_assets", _segment_record),
+    "I01": ("packaging_items", _segment_record),
+}
+
+
+def parse_item(element: ET.Element, segments: Optional[Iterable[str]] = None) -> Item:
+    """
+    Convert an <Item> element into an Item record.
+
+    Args:
+        element: Parsed <Item> element
+        segments: Segment codes to convert (e.g. {"F01"}); None for all
+
+    Returns:
+        Typed Item record
+    """
+    selected = None if segments is None else set(segments)
+    item = Item(maintenance_type=element.get("MaintenanceType"))
+
+    for child in element:
+        tag = local_name(child.tag)
+        code = _CONTAINER_SEGMENTS.get(tag)
+        if code is not None:
+            if selected is not None and code not in selected:
+                continue
+            name, convert = _SEGMENT_PARSERS[code]
+            getattr(item, name).extend(convert(grandchild) for grandchild in child)
+        elif tag == "PartNumber":
+            item.part_number = element_text(child)
+        elif tag in _BRAND_ATTRIBUTES:
+            item.brand_id = element_text(child)
+        elif tag == "PartTerminologyID":
+            item.part_terminology_id = int_or_none(child.text)
+        else:
+            item.fields.append(_segment_record(child))
+
+    return item
+
+
+class PIESReader:
+    """Incremental reader for PIES 7.2 and 8.0 files.
+
+    Iterating the reader yields Item records in document order. The Header
+    is available as a flat dict once the first Item has been read, and the
+    Trailer item count after iteration finishes. Top-level PriceSheets and
+    MarketingCopy segments are skipped.
+
+    Example:
+        reader = PIESReader("items.xml.gz", segments={"F01"})
+        for item in reader:
+            for attribute in item.attributes:
+                ...
+    """
+
+    DEFAULT_CHUNK_SIZE = 1 << 20
+
+    def __init__(
+        self,
+        source: Source,
+        segments: Optional[Iterable[str]] = None,
+        version: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        """
+        Initialize the reader.
+
+        Args:
+            source: File path (".gz" is decompressed) or binary file object
+            segments: Item segment codes to convert (e.g. {"F01"}); None for
+                      all. Unselected segments are discarded unparsed.
+            version: PIES version override. When None, read from the root
+                     element's version attribute.
+            chunk_size: Bytes read from the source per parser feed
+
+        Raises:
+            ValueError: If the version or a segment code is unsupported
+        """
+        if version is not None and version not in VERSIONS:
+            raise ValueError(
+                f"Unsupported PIES version: {version}. Supported: {VERSIONS}"
+            )
+        self.segments = None if segments is None else frozenset(segments)
+        if self.segments is not None:
+            unknown = self.segments - set(_SEGMENT_PARSERS)
+            if unknown:
+                raise ValueError(
+                    f"Unsupported item segments: {sorted(unknown)}. "
+                    f"Supported: {sorted(_SEGMENT_PARSERS)}"
+                )
+        self.source = source
+        self.version = version
+        self.chunk_size = chunk_size
+        self.header: Dict[str, str] = {}
+        self.trailer: Dict[str, str] = {}
+        self.item_count = 0
+
+    @property
+    def trailer_item_count(self) -> Optional[int]:
+        """ItemCount declared in the Trailer, once iteration has finished."""
+        return int_or_none(self.trailer.get("ItemCount"))
+
+    def __iter__(self) -> Iterator[Item]:
+        """Parse the document and yield each Item."""
+        stream, owned = open_source(self.source)
+        try:
+            yield from self._iter_items(stream)
+        finally:
+            if owned:
+                stream.close()
+
+    def _iter_items(self, stream: IO[bytes]) -> Iterator[Item]:
+        """Feed the stream through a pull parser in fixed-size chunks."""
+        parser: ET.XMLPullParser[ET.Element] = ET.XMLPullParser(events=("start", "end"))
+        segments = self.segments
+        skipped = (
+            frozenset()
+            if segments is None
+            else frozenset(
+                container
+                for container, code in _CONTAINER_SEGMENTS.items()
+                if code not in segments
+            )
+        )
+        # Open elements: <PIES>, then e.g. <Items>, <Item>, <ProductAttributes>
+        path: List[ET.Element] = []
+
+        while True:
+            chunk = stream.read(self.chunk_size)
+            if chunk:
+                parser.feed(chunk)
+            else:
+                parser.close()
+
+            for queued in parser.read_events():
+                # Only "start" / "end" are requested, and both carry an Element
+                event, element = cast(Tuple[str, ET.Element], queued)
+                if event == "start":
+                    if not path:
+                        self._read_root(element)
+                    path.append(element)
+                    continue
+
+                path.pop()
+                depth = len(path)
+                if depth > 3:
+                    # Inside an Item segment: converted with its Item
+                    continue
+                tag = local_name(element.tag)
+
+                if depth == 3 and tag in skipped:
+                    # Unselected Item segment: drop it without converting
+                    element.clear()
+                elif depth == 2 and tag == "Item":
+                    self.item_count += 1
+                    yield parse_item(element, segments)
+                    path[1].clear()
+                elif depth == 1:
+                    if tag == "Header":
+                        self.header = _flat_text(element)
+                    elif tag == "Trailer":
+                        self.trailer = _flat_text(element)
+                    path[0].clear()
+
+            if not chunk:
+                break
+
+    def _read_root(self, root: ET.Element) -> None:
+        """Capture the document version from the <PIES> root element."""
+        if self.version is None:
+            version = root.get("version")
+            if version is not None and version not in VERSIONS:
+                raise ValueError(
+                    f"Unsupported PIES version: {version}. Supported: {VERSIONS}"
+                )
+            self.version = version
+
+
+def _flat_text(element: ET.Element) -> Dict[str, str]:
+    """Leaf child text of a Header / Trailer element."""
+    return {
+        local_name(child.tag): text
+        for child in element
+        if (text := element_text(child)) is not None
+    }
+
+
+def iter_items(
+    source: Source,
+    segments: Optional[Iterable[str]] = None,
+    version: Optional[str] = None,
+) -> Iterator[Item]:
+    """
+    Stream Item records from a PIES file.
+
+    Args:
+        source: File path (".gz" is decompressed) or binary file object
+        segments: Item segment codes to convert (e.g. {"F01"}); None for all
+        version: PIES version override
+
+    Yields:
+        Item records in document order
+    """
+    return iter(PIESReader(source, segments=segments, version=version))
@@ -0,0 +1,263 @@
+"""Streaming PIES 7.2 / 8.0 XML writer.
+
+Writes the Header, then one Item at a time inside <Items>, then the Trailer,
+straight to a buffered (optionally gzipped) output stream. Item segments are
+written in segment order from pies.ITEM_SEGMENT_ELEMENTS_V8.
+"""
+
+import datetime
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
+
+from autocare.standards.pies import (
+    ITEM_SEGMENT_ELEMENTS,
+    ITEM_SEGMENT_ELEMENTS_V8,
+    VERSIONS,
+)
+from autocare.standards.pies_reader import (
+    Description,
+    ExtendedProductInfo,
+    Item,
+    ProductAttribute,
+    SegmentRecord,
+)
+from autocare.standards.xml_writing import (
+    DEFAULT_BUFFER_SIZE,
+    Destination,
+    XMLWriter,
+    escape_text,
+    quote_attribute,
+    render_header,
+)
+
+# Item fields written ahead of PartNumber, per the XSD
+_LEADING_FIELDS = ("HazardousMaterialCode", "BaseItemID", "ItemLevelGTIN")
+
+# Segment code -> Item list field
+_SEGMENT_FIELDS = {
+    "C01": "descriptions",
+    "D01": "prices",
+    "E01": "extended_info",
+    "F01": "attributes",
+    "H01": "packages",
+    "K01": "kits",
+    "N01": "interchanges",
+    "P01": "digital_assets",
+    "I01": "packaging_items",
+}
+
+
+def _open_tag(tag: str, attributes: Mapping[str, object]) -> str:
+    """Render a start tag, skipping None attributes."""
+    rendered = "".join(
+        f" {name}={quote_attribute(value)}"
+        for name, value in attributes.items()
+        if value is not None
+    )
+    return f"<{tag}{rendered}>"
+
+
+def _leaf(tag: str, attributes: Mapping[str, object], value: Optional[str]) -> str:
+    """Render an element with attributes and text."""
+    return f"{_open_tag(tag, attributes)}{escape_text(value or '')}</{tag}>"
+
+
+def _description(record: Description) -> str:
+    """Render a <Description> element."""
+    return _leaf(
+        "Description",
+        {
+            "MaintenanceType": record.maintenance_type,
+            "DescriptionCode": record.code,
+            "LanguageCode": record.language,
+            "Sequence": record.sequence,
+        },
+        record.value,
+    )
+
+
+def _extended_info(record: ExtendedProductInfo) -> str:
+    """Render an <ExtendedProductInformation> element."""
+    return _leaf(
+        "ExtendedProductInformation",
+        {
+            "MaintenanceType": record.maintenance_type,
+            "EXPICode": record.code,
+            "LanguageCode": record.language,
+        },
+        record.value,
+    )
+
+
+def _product_attribute(record: ProductAttribute) -> str:
+    """Render a <ProductAttribute> element."""
+    return _leaf(
+        "ProductAttribute",
+        {
+            "MaintenanceType": record.maintenance_type,
+            "AttributeID": record.attribute_id,
+            "PADBAttribute": "Y" if record.padb_attribute else "N",
+            "AttributeUOM": record.uom,
+            "RecordNumber": record.record_number,
+            "LanguageCode": record.language,
+        },
+        record.value,
+    )
+
+
+def _segment_record(record: SegmentRecord) -> str:
+    """Render a generic element and its children, in order."""
+    parts = [_open_tag(record.tag, record.attributes)]
+    if record.value is not None:
+        parts.append(escape_text(record.value))
+    parts.extend(_segment_record(child) for child in record.children)
+    parts.append(f"</{record.tag}>")
+    return "".join(parts)
+
+
+_SEGMENT_SERIALIZERS: Dict[str, Callable[[Any], str]] = {
+    "C01": _description,
+    "E01": _extended_info,
+    "F01": _product_attribute,
+}
+
+
+class PIESWriter(XMLWriter):
+    """Incremental writer for PIES 7.2 and 8.0 documents.
+
+    Example:
+        with PIESWriter("items.xml.gz", header={"PIESVersion": "8.0"}) as writer:
+            writer.write_all(items_from_store())
+    """
+
+    def __init__(
+        self,
+        destination: Destination,
+        version: str = "8.0",
+        header: Optional[Mapping[str, object]] = None,
+        compresslevel: Optional[int] = None,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        transaction_date: Optional[datetime.date] = None,
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            destination: Output path (".gz" is compressed) or binary file object
+            version: PIES version to write
+            header: Header element name -> text, written in order
+            compresslevel: gzip level; None compresses only ".gz" paths
+            buffer_size: Output buffer size in bytes
+            transaction_date: Trailer TransactionDate (default: today)
+
+        Raises:
+            ValueError: If the version is unsupported
+        """
+        if version not in VERSIONS:
+            raise ValueError(
+                f"Unsupported PIES version: {version}. Supported: {VERSIONS}"
+            )
+        super().__init__(destination, compresslevel, buffer_size)
+        self.version = version
+        self.header = header
+        self.transaction_date = transaction_date or datetime.date.today()
+        self._segments = (
+            ITEM_SEGMENT_ELEMENTS_V8 if version == "8.0" else ITEM_SEGMENT_ELEMENTS
+        )
+
+    def _prologue(self) -> str:
+        return f'<PIES version="{self.version}">\n{render_header(self.header)}<Items>\n'
+
+    def _epilogue(self) -> str:
+        return (
+            "</Items>\n<Trailer>"
+            f"<ItemCount>{self.count}</ItemCount>"
+            f"<TransactionDate>{self.transaction_date.isoformat()}</TransactionDate>"
+            "</Trailer>\n</PIES>\n"
+        )
+
+    def write(self, item: Item) -> None:
+        """Serialize one Item."""
+        self.count += 1
+        self._write(self.serialize(item))
+
+    def write_all(self, items: Iterable[Item]) -> int:
+        """
+        Serialize every Item from an iterable.
+
+        Returns:
+            Number of items written by this call
+        """
+        written = 0
+        for item in items:
+            self.write(item)
+            written += 1
+        return written
+
+    def serialize(self, item: Item) -> str:
+        """
+        Render one Item element (with trailing newline).
+
+        Raises:
+            ValueError: If the item has segments the target version lacks
+        """
+        parts: List[str] = [
+            _open_tag("Item", {"MaintenanceType": item.maintenance_type})
+        ]
+        fields = item.fields
+        leading = [record for record in fields if record.tag in _LEADING_FIELDS]
+        leading.sort(key=lambda record: _LEADING_FIELDS.index(record.tag))
+        parts.extend(_segment_record(record) for record in leading)
+        if item.part_number is not None:
+            parts.append(f"<PartNumber>{escape_text(item.part_number)}</PartNumber>")
+        if item.brand_id is not None:
+            parts.append(f"<BrandAAIAID>{escape_text(item.brand_id)}</BrandAAIAID>")
+        parts.extend(
+            _segment_record(record)
+            for record in fields
+            if record.tag not in _LEADING_FIELDS
+        )
+        if item.part_terminology_id is not None:
+            parts.append(
+                f"<PartTerminologyID>{item.part_terminology_id}</PartTerminologyID>"
+            )
+
+        for code, field_name in _SEGMENT_FIELDS.items():
+            records = getattr(item, field_name)
+            if not records:
+                continue
+            if code not in self._segments:
+                raise ValueError(
+                    f"Segment {code} is not supported in PIES {self.version}"
+                )
+            container = self._segments[code][0]
+            serialize = _SEGMENT_SERIALIZERS.get(code, _segment_record)
+            parts.append(f"<{container}>")
+            parts.extend(serialize(record) for record in records)
+            parts.append(f"</{container}>")
+
+        parts.append("</Item>\n")
+        return "".join(parts)
+
+
+def write_pies(
+    destination: Destination,
+    items: Iterable[Item],
+    version: str = "8.0",
+    header: Optional[Mapping[str, object]] = None,
+    compresslevel: Optional[int] = None,
+) -> int:
+    """
+    Write a complete PIES document from an Item iterator.
+
+    Args:
+        destination: Output path (".gz" is compressed) or binary file object
+        items: Item records, consumed one at a time
+        version: PIES version to write
+        header: Header element name -> text
+        compresslevel: gzip level; None compresses only ".gz" paths
+
+    Returns:
+        Number of items written
+    """
+    with PIESWriter(destination, version, header, compresslevel) as writer:
+        return writer.write_all(items)
@@ -0,0 +1,50 @@
+"""Helpers shared by the streaming ACES and PIES XML readers."""
+
+import gzip
+import os
+import xml.etree.ElementTree as ET
+from typing import IO, Optional, Tuple, Union, cast
+
+Source = Union[str, os.PathLike, IO[bytes]]
+
+
+def local_name(tag: str) -> str:
+    """Strip an XML namespace from a tag name."""
+    return tag.rsplit("}", 1)[-1] if tag[:1] == "{" else tag
+
+
+def int_or_none(value: Optional[str]) -> Optional[int]:
+    """Convert an attribute or text value to int.
+
+    Returns None for blank or non-numeric values so one malformed id does
+    not abort a multi-gigabyte parse; validators report the missing value.
+    """
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def element_text(element: ET.Element) -> Optional[str]:
+    """Get stripped element text, or None when empty."""
+    text = element.text
+    if text is None:
+        return None
+    text = text.strip()
+    return text or None
+
+
+def open_source(source: Source) -> Tuple[IO[bytes], bool]:
+    """Open a path (optionally gzipped) or pass through a file object.
+
+    Returns:
+        (file object, whether the caller owns and must close it)
+    """
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        if path.endswith(".gz"):
+            return cast(IO[bytes], gzip.open(path, "rb")), True
+        return open(path, "rb"), True
+    return source, False
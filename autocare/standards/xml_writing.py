@@ -0,0 +1,147 @@
+"""Helpers shared by the streaming ACES and PIES XML writers."""
+
+import gzip
+import io
+import os
+import re
+from abc import ABC, abstractmethod
+from typing import IO, List, Mapping, Optional, Tuple, Union
+from xml.sax.saxutils import escape, quoteattr
+
+Destination = Union[str, os.PathLike, IO[bytes]]
+
+DEFAULT_BUFFER_SIZE = 1 << 20
+
+# Characters that force the (slower) saxutils escaping path
+_ATTRIBUTE_ESCAPE = re.compile(r'[&<>"\n\r\t]')
+_TEXT_ESCAPE = re.compile(r"[&<>]")
+
+
+def quote_attribute(value: object) -> str:
+    """Quote an attribute value."""
+    text = str(value)
+    return quoteattr(text) if _ATTRIBUTE_ESCAPE.search(text) else f'"{text}"'
+
+
+def escape_text(value: object) -> str:
+    """Escape element text."""
+    text = str(value)
+    return escape(text) if _TEXT_ESCAPE.search(text) else text
+
+
+def render_header(header: Optional[Mapping[str, object]]) -> str:
+    """Serialize a flat Header mapping."""
+    parts = ["<Header>\n"]
+    for name, value in (header or {}).items():
+        if value is not None:
+            parts.append(f"  <{name}>{escape_text(value)}</{name}>\n")
+    parts.append("</Header>\n")
+    return "".join(parts)
+
+
+def open_output(
+    destination: Destination,
+    compresslevel: Optional[int] = None,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+) -> Tuple[io.TextIOWrapper, List[IO[bytes]]]:
+    """
+    Open a buffered UTF-8 text stream for an XML export.
+
+    Args:
+        destination: Output path or binary file object
+        compresslevel: gzip level; None compresses only ".gz" paths (level 6)
+        buffer_size: Output buffer size in bytes
+
+    Returns:
+        (text stream, binary layers to close innermost first once the text
+        stream is detached; caller-provided streams are never closed)
+    """
+    closers: List[IO[bytes]] = []
+    if isinstance(destination, (str, os.PathLike)):
+        path = os.fspath(destination)
+        if compresslevel is None and path.endswith(".gz"):
+            compresslevel = 6
+        raw: IO[bytes] = open(path, "wb", buffering=buffer_size)
+        closers.append(raw)
+    else:
+        raw = destination
+
+    if compresslevel is not None:
+        raw = gzip.GzipFile(  # type: ignore[assignment]
+            fileobj=raw, mode="wb", compresslevel=compresslevel
+        )
+        closers.insert(0, raw)
+
+    return io.TextIOWrapper(raw, encoding="utf-8"), closers
+
+
+class XMLWriter(ABC):
+    """Shared document lifecycle for the streaming ACES and PIES writers.
+
+    Subclasses render the document start (declaration excluded) in
+    _prologue() and everything after the last record in _epilogue().
+    """
+
+    def __init__(
+        self,
+        destination: Destination,
+        compresslevel: Optional[int],
+        buffer_size: int,
+    ):
+        self.destination = destination
+        self.compresslevel = compresslevel
+        self.buffer_size = buffer_size
+        self.count = 0
+        self._out: Optional[io.TextIOWrapper] = None
+        self._closers: List[IO[bytes]] = []
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._release()
+
+    def open(self) -> None:
+        """Open the output and write everything up to the first record."""
+        if self._out is not None:
+            return
+        self._out, self._closers = open_output(
+            self.destination, self.compresslevel, self.buffer_size
+        )
+        self._out.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        self._out.write(self._prologue())
+
+    def close(self) -> None:
+        """Write the trailer and flush / close the output."""
+        self._write(self._epilogue())
+        self._release()
+
+    def _release(self) -> None:
+        out = self._out
+        if out is None:
+            return
+        self._out = None
+        out.flush()
+        out.detach()
+        for layer in self._closers:
+            layer.close()
+        if not self._closers and hasattr(self.destination, "flush"):
+            self.destination.flush()  # type: ignore[union-attr]
+
+    def _write(self, text: str) -> None:
+        if self._out is None:
+            self.open()
+        assert self._out is not None
+        self._out.write(text)
+
+    @abstractmethod
+    def _prologue(self) -> str:
+        """Root start tag and Header."""
+
+    @abstractmethod
+    def _epilogue(self) -> str:
+        """Footer / Trailer and root end tag."""
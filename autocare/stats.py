@@ -0,0 +1,153 @@
+"""Per-run statistics for fetch_records().
+
+A FetchStats object is filled in while records are fetched, so it can be
+read mid-stream (e.g. from a progress thread) as well as after the run.
+Wall time is split into time waiting on the network, decoding JSON,
+converting records to models and time spent in the consumer (the code
+iterating over fetch_records()):
+
+    stats = FetchStats()
+    for record in client.fetch_records("vcdb", "Vehicle", stats=stats):
+        sink.write(record)
+    print(stats.summary())
+
+A large consumer share means the sink is the bottleneck; a large network
+share means more concurrent fetches would help; a large decode share
+points at the JSON backend.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+
+@dataclass
+class FetchStats:
+    """Counters and timings for one fetch_records() run.
+
+    Attributes:
+        db_name: Database name
+        table: Table name
+        records: Records yielded so far
+        pages: Pages received
+        bytes: Response body bytes received
+        retries: Retries made by the session retry policy
+        throttles: Retries caused by 429 responses
+        network_seconds: Time in HTTP requests (including body download)
+        decode_seconds: Time parsing JSON response bodies
+        convert_seconds: Time converting records with model.from_dict()
+        consumer_seconds: Time the consumer spent between records
+        started: perf_counter() when the first page was requested
+        finished: perf_counter() when the run ended, or None while running
+    """
+
+    db_name: str = ""
+    table: str = ""
+    records: int = 0
+    pages: int = 0
+    bytes: int = 0
+    retries: int = 0
+    throttles: int = 0
+    network_seconds: float = 0.0
+    decode_seconds: float = 0.0
+    convert_seconds: float = 0.0
+    consumer_seconds: float = 0.0
+    started: Optional[float] = None
+    finished: Optional[float] = None
+
+    def start(self, db_name: str, table: str) -> None:
+        """Mark the start of a run."""
+        self.db_name = db_name
+        self.table = table
+        self.started = time.perf_counter()
+        self.finished = None
+
+    def finish(self) -> None:
+        """Mark the end of a run."""
+        self.finished = time.perf_counter()
+
+    @property
+    def running(self) -> bool:
+        """The run has started and not finished."""
+        return self.started is not None and self.finished is None
+
+    @property
+    def elapsed(self) -> float:
+        """Wall seconds since the start (until the end, once finished)."""
+        if self.started is None:
+            return 0.0
+        end = self.finished if self.finished is not None else time.perf_counter()
+        return end - self.started
+
+    @property
+    def other_seconds(self) -> float:
+        """Wall time not attributed to network, decoding, conversion or consumer."""
+        return max(
+            0.0,
+            self.elapsed
+            - self.network_seconds
+            - self.decode_seconds
+            - self.convert_seconds
+            - self.consumer_seconds,
+        )
+
+    @property
+    def records_per_second(self) -> float:
+        """Records per wall second."""
+        elapsed = self.elapsed
+        return self.records / elapsed if elapsed else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Response bytes per wall second."""
+        elapsed = self.elapsed
+        return self.bytes / elapsed if elapsed else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Counters, timings and rates as a plain dict (e.g. for JSON logs)."""
+        return {
+            "db_name": self.db_name,
+            "table": self.table,
+            "records": self.records,
+            "pages": self.pages,
+            "bytes": self.bytes,
+            "retries": self.retries,
+            "throttles": self.throttles,
+            "elapsed": self.elapsed,
+            "network_seconds": self.network_seconds,
+            "decode_seconds": self.decode_seconds,
+            "convert_seconds": self.convert_seconds,
+            "consumer_seconds": self.consumer_seconds,
+            "other_seconds": self.other_seconds,
+            "records_per_second": self.records_per_second,
+            "bytes_per_second": self.bytes_per_second,
+        }
+
+    def summary(self) -> str:
+        """Multi-line, human readable summary."""
+        elapsed = self.elapsed
+
+        def share(seconds: float) -> str:
+            percent = 100 * seconds / elapsed if elapsed else 0.0
+            return f"{seconds:8.3f}s {percent:5.1f}%"
+
+        state = "running" if self.running else "done"
+        return "\n".join(
+            [
+                f"{self.db_name}.{self.table} ({state})",
+                f"  records   {self.records:>12,} {self.records_per_second:>12,.0f}/s",
+                f"  bytes     {self.bytes:>12,} "
+                f"{self.bytes_per_second / 1e6:>10,.2f} MB/s",
+                f"  pages     {self.pages:>12,}",
+                f"  retries   {self.retries:>12,} ({self.throttles} throttled)",
+                f"  elapsed   {elapsed:8.3f}s",
+                f"  network   {share(self.network_seconds)}",
+                f"  decode    {share(self.decode_seconds)}",
+                f"  convert   {share(self.convert_seconds)}",
+                f"  consumer  {share(self.consumer_seconds)}",
+                f"  other     {share(self.other_seconds)}",
+            ]
+        )
+
+    def __str__(self) -> str:
+        return self.summary()
@@ -0,0 +1 @@
+"""Validation engines built from local reference database snapshots."""
@@ -0,0 +1,437 @@
+"""ACES reference validation against local VCdb / PCdb / Qdb snapshots.
+
+Compiles the reference tables into integer ID sets and, per vehicle
+attribute, a map of packed (BaseVehicleID, attribute ID) to the bitmask of
+VCdb vehicles within that base vehicle having the value. Streamed App
+records are checked against them in batches; an app's attribute masks are
+ANDed, so attributes that are each valid but never occur together on one
+vehicle are reported too. The compiled validator is plain sets and
+dicts, so it can be shipped to worker processes together with
+autocare.standards.aces_parallel.map_app_chunks (e.g. via functools.partial).
+"""
+
+import gzip
+import json
+import os
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Union,
+)
+
+from autocare.databases.base import record_value
+from autocare.standards.aces_reader import App
+from autocare.validation.vehicle_index import VEHICLE_TO_TABLES, VehicleIndex, pack
+
+_ID_SETS = (
+    "base_vehicle_ids",
+    "engine_config_ids",
+    "part_type_ids",
+    "position_ids",
+    "qualifier_ids",
+)
+_SNAPSHOT_FORMAT_VERSION = 1
+
+
+class ACESErrorCode(IntEnum):
+    """Structured error codes reported by ACESValidator."""
+
+    UNKNOWN_BASE_VEHICLE = 1
+    UNKNOWN_VEHICLE = 2
+    MISSING_VEHICLE = 3
+    UNKNOWN_ENGINE_CONFIG = 4
+    UNKNOWN_PART_TYPE = 5
+    MISSING_PART_TYPE = 6
+    UNKNOWN_POSITION = 7
+    UNKNOWN_QUALIFIER = 8
+    INVALID_ATTRIBUTE_COMBINATION = 9
+
+
+@dataclass
+class AppError:
+    """One validation failure for an App.
+
+    Attributes:
+        index: Position of the app in the validated stream
+        app_id: The App's id attribute
+        code: Error code
+        element: ACES element the error refers to (e.g. "SubModel")
+        value: Offending ID value, if any
+    """
+
+    index: int
+    app_id: Optional[str]
+    code: ACESErrorCode
+    element: str
+    value: Optional[int] = None
+
+
+def _ids(records: Iterable[Any], column: str) -> Set[int]:
+    """Collect the integer values of one column."""
+    result = set()
+    for record in records:
+        value = record_value(record, column)
+        if value is not None:
+            result.add(int(value))
+    return result
+
+
+class ACESValidator:
+    """Validates App records against compiled reference ID sets.
+
+    Checks, per app:
+    - the BaseVehicle (or Years/Make/Model range) exists
+    - every vehicle attribute with a known VCdb mapping is valid for the
+      base vehicle, and at least one VehicleID of the base vehicle has all
+      of them together
+    - PartType/PartTerminology, Position and Qualifier IDs exist
+    """
+
+    def __init__(
+        self,
+        base_vehicle_ids: Set[int],
+        engine_config_ids: Set[int],
+        part_type_ids: Set[int],
+        position_ids: Set[int],
+        qualifier_ids: Set[int],
+        combinations: Optional[Dict[str, Dict[int, int]]] = None,
+        make_model_years: Optional[Set[int]] = None,
+    ):
+        """
+        Initialize from compiled sets.
+
+        Most callers should use from_records() or from_client() instead.
+
+        Args:
+            base_vehicle_ids: Known BaseVehicleIDs
+            engine_config_ids: Known EngineConfigIDs
+            part_type_ids: Known PCdb PartTerminologyIDs
+            position_ids: Known PCdb PositionIDs
+            qualifier_ids: Known Qdb QualifierIDs
+            combinations: ACES attribute -> packed (BaseVehicleID, ID) ->
+                          bitmask of the base vehicle's vehicles with that ID
+            make_model_years: Packed (MakeID, ModelID, YearID) set
+        """
+        self.base_vehicle_ids = base_vehicle_ids
+        self.engine_config_ids = engine_config_ids
+        self.part_type_ids = part_type_ids
+        self.position_ids = position_ids
+        self.qualifier_ids = qualifier_ids
+        self.combinations = combinations or {}
+        self.make_model_years = make_model_years or set()
+
+    @classmethod
+    def from_records(
+        cls,
+        base_vehicles: Iterable[Any] = (),
+        vehicles: Iterable[Any] = (),
+        vehicle_to: Optional[Mapping[str, Iterable[Any]]] = None,
+        engine_configs: Iterable[Any] = (),
+        parts: Iterable[Any] = (),
+        positions: Iterable[Any] = (),
+        qualifiers: Iterable[Any] = (),
+    ) -> "ACESValidator":
+        """
+        Compile a validator from reference table records.
+
+        Records may be raw API dicts or typed models.
+
+        Args:
+            base_vehicles: VCdb BaseVehicle records
+            vehicles: VCdb Vehicle records
+            vehicle_to: VCdb VehicleTo* table name -> records
+            engine_configs: VCdb EngineConfig records
+            parts: PCdb Parts records
+            positions: PCdb Positions records
+            qualifiers: Qdb Qualifier records
+
+        Returns:
+            Compiled ACESValidator
+        """
+        base_vehicle_ids: Set[int] = set()
+        make_model_years: Set[int] = set()
+        for record in base_vehicles:
+            base_vehicle_id = record_value(record, "BaseVehicleID")
+            if base_vehicle_id is None:
+                continue
+            base_vehicle_ids.add(int(base_vehicle_id))
+            make_id = record_value(record, "MakeID")
+            model_id = record_value(record, "ModelID")
+            year_id = record_value(record, "YearID")
+            if None not in (make_id, model_id, year_id):
+                make_model_years.add(
+                    pack(pack(int(make_id), int(model_id)), int(year_id))
+                )
+
+        vehicle_index = VehicleIndex.from_records(vehicles, vehicle_to, engine_configs)
+
+        return cls(
+            base_vehicle_ids=base_vehicle_ids,
+            engine_config_ids=vehicle_index.engine_config_ids,
+            part_type_ids=_ids(parts, "PartTerminologyID"),
+            position_ids=_ids(positions, "PositionID"),
+            qualifier_ids=_ids(qualifiers, "QualifierID"),
+            combinations=vehicle_index.attribute_masks,
+            make_model_years=make_model_years,
+        )
+
+    @classmethod
+    def from_client(
+        cls,
+        client: Any,
+        vehicle_to_tables: Optional[Iterable[str]] = None,
+    ) -> "ACESValidator":
+        """
+        Fetch reference snapshots through an AutoCareAPI client and compile them.
+
+        Args:
+            client: Authenticated AutoCareAPI instance
+            vehicle_to_tables: VehicleTo* tables to index; defaults to all
+                               tables in VEHICLE_TO_TABLES
+
+        Returns:
+            Compiled ACESValidator
+        """
+        if vehicle_to_tables is None:
+            vehicle_to_tables = [table for table, _ in VEHICLE_TO_TABLES.values()]
+
+        return cls.from_records(
+            base_vehicles=client.fetch_records("vcdb", "BaseVehicle"),
+            vehicles=client.fetch_records("vcdb", "Vehicle"),
+            vehicle_to={
+                table: client.fetch_records("vcdb", table)
+                for table in vehicle_to_tables
+            },
+            engine_configs=client.fetch_records("vcdb", "EngineConfig"),
+            parts=client.fetch_records("pcdb", "Parts"),
+            positions=client.fetch_records("pcdb", "Positions"),
+            qualifiers=client.fetch_records("qdb", "Qualifier"),
+        )
+
+    def validate(self, app: App, index: int = 0) -> List[AppError]:
+        """
+        Validate a single App.
+
+        Args:
+            app: App record
+            index: Position reported in the errors
+
+        Returns:
+            List of errors (empty when the app is valid)
+        """
+        errors: List[AppError] = []
+        self._check(app, index, errors)
+        return errors
+
+    def validate_batch(self, apps: Iterable[App], start: int = 0) -> List[AppError]:
+        """
+        Validate a batch of apps.
+
+        Args:
+            apps: App records
+            start: Index of the first app in the overall stream
+
+        Returns:
+            Errors for every failing app, in input order
+        """
+        errors: List[AppError] = []
+        check = self._check
+        for index, app in enumerate(apps, start):
+            check(app, index, errors)
+        return errors
+
+    def iter_errors(
+        self, apps: Iterable[App], batch_size: int = 50_000
+    ) -> Iterator[AppError]:
+        """
+        Stream errors for an unbounded App stream in fixed-size batches.
+
+        Args:
+            apps: App records, e.g. from ACESReader
+            batch_size: Apps validated per batch
+
+        Yields:
+            AppError records in stream order
+        """
+        batch: List[App] = []
+        start = 0
+        for app in apps:
+            batch.append(app)
+            if len(batch) >= batch_size:
+                yield from self.validate_batch(batch, start)
+                start += len(batch)
+                batch = []
+        if batch:
+            yield from self.validate_batch(batch, start)
+
+    def _check(self, app: App, index: int, errors: List[AppError]) -> None:
+        """Append every error found in one app to errors."""
+        base_vehicle_id = app.base_vehicle_id
+        if base_vehicle_id is not None:
+            if base_vehicle_id not in self.base_vehicle_ids:
+                errors.append(
+                    AppError(
+                        index,
+                        app.id,
+                        ACESErrorCode.UNKNOWN_BASE_VEHICLE,
+                        "BaseVehicle",
+                        base_vehicle_id,
+                    )
+                )
+            else:
+                self._check_attributes(app, index, base_vehicle_id, errors)
+        elif not self._check_make_model_years(app, index, errors):
+            errors.append(
+                AppError(index, app.id, ACESErrorCode.MISSING_VEHICLE, "BaseVehicle")
+            )
+
+        engine_config_id = app.vehicle_attributes.get("EngineConfig")
+        if (
+            engine_config_id is not None
+            and engine_config_id not in self.engine_config_ids
+        ):
+            errors.append(
+                AppError(
+                    index,
+                    app.id,
+                    ACESErrorCode.UNKNOWN_ENGINE_CONFIG,
+                    "EngineConfig",
+                    engine_config_id,
+                )
+            )
+
+        if app.part_type_id is None:
+            errors.append(
+                AppError(index, app.id, ACESErrorCode.MISSING_PART_TYPE, "PartType")
+            )
+        elif app.part_type_id not in self.part_type_ids:
+            errors.append(
+                AppError(
+                    index,
+                    app.id,
+                    ACESErrorCode.UNKNOWN_PART_TYPE,
+                    "PartType",
+                    app.part_type_id,
+                )
+            )
+
+        if app.position_id is not None and app.position_id not in self.position_ids:
+            errors.append(
+                AppError(
+                    index,
+                    app.id,
+                    ACESErrorCode.UNKNOWN_POSITION,
+                    "Position",
+                    app.position_id,
+                )
+            )
+
+        for qualifier in app.qualifiers:
+            if qualifier.qualifier_id not in self.qualifier_ids:
+                errors.append(
+                    AppError(
+                        index,
+                        app.id,
+                        ACESErrorCode.UNKNOWN_QUALIFIER,
+                        "Qual",
+                        qualifier.qualifier_id,
+                    )
+                )
+
+    def _check_attributes(
+        self, app: App, index: int, base_vehicle_id: int, errors: List[AppError]
+    ) -> None:
+        """Check the vehicle attributes are valid, alone and together."""
+        combinations = self.combinations
+        key_base = base_vehicle_id << 32
+        # Vehicles of the base vehicle having every attribute checked so far
+        common = -1
+        for attribute, value in app.vehicle_attributes.items():
+            masks = combinations.get(attribute)
+            # Attributes without a loaded VCdb mapping are not checked
+            if masks is None:
+                continue
+            mask = masks.get(key_base | value, 0)
+            # Reported once: invalid for the base vehicle on its own, or the
+            # first attribute no remaining vehicle shares
+            if not mask or (common and not common & mask):
+                errors.append(
+                    AppError(
+                        index,
+                        app.id,
+                        ACESErrorCode.INVALID_ATTRIBUTE_COMBINATION,
+                        attribute,
+                        value,
+                    )
+                )
+            if mask:
+                common &= mask
+
+    def _check_make_model_years(
+        self, app: App, index: int, errors: List[AppError]
+    ) -> bool:
+        """Check a Years/Make/Model app. Returns False if the app has none."""
+        make_id = app.vehicle_attributes.get("Make")
+        model_id = app.vehicle_attributes.get("Model")
+        if app.years is None or make_id is None or model_id is None:
+            return False
+
+        if self.make_model_years:
+            make_model = pack(make_id, model_id) << 32
+            start, end = app.years
+            if not any(
+                (make_model | year) in self.make_model_years
+                for year in range(start, end + 1)
+            ):
+                errors.append(
+                    AppError(index, app.id, ACESErrorCode.UNKNOWN_VEHICLE, "Years")
+                )
+        return True
+
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        """Persist the compiled snapshot as gzipped JSON."""
+        payload = {
+            "format_version": _SNAPSHOT_FORMAT_VERSION,
+            **{name: sorted(getattr(self, name)) for name in _ID_SETS},
+            "combinations": {
+                attribute: sorted(masks.items())
+                for attribute, masks in self.combinations.items()
+            },
+            "make_model_years": sorted(self.make_model_years),
+        }
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(payload, f, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike]) -> "ACESValidator":
+        """
+        Load a snapshot written by save().
+
+        Raises:
+            ValueError: If the file uses an unsupported format version
+        """
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            payload = json.load(f)
+
+        if payload.get("format_version") != _SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported ACESValidator snapshot format: "
+                f"{payload.get('format_version')}"
+            )
+
+        return cls(
+            **{name: set(payload[name]) for name in _ID_SETS},
+            combinations={
+                attribute: {key: mask for key, mask in masks}
+                for attribute, masks in payload["combinations"].items()
+            },
+            make_model_years=set(payload["make_model_years"]),
+        )
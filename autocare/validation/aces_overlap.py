@@ -0,0 +1,385 @@
+"""ACES overlap and duplicate application detection.
+
+Every App is expanded to the set of VCdb VehicleIDs it covers. Vehicles are
+numbered within their BaseVehicle, so an app's vehicle set is a small dict of
+BaseVehicleID -> bitmask and set operations are integer AND / OR.
+
+Apps are grouped by a hashed signature of part number, brand, part type,
+position, qualifiers and any vehicle attributes that cannot be expanded, then
+bucketed by BaseVehicle. Only apps sharing a bucket are compared, so the cost
+grows with the number of apps per part and vehicle rather than quadratically
+with file size.
+"""
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
+
+from autocare.databases.base import record_value
+from autocare.standards.aces_reader import App
+from autocare.validation.vehicle_index import VEHICLE_TO_TABLES, VehicleIndex, pack
+
+# Attributes used to expand Years/Make/Model apps instead of filtering
+_MAKE_MODEL = frozenset({"Make", "Model"})
+
+# BaseVehicleID -> bitmask of covered vehicles within that base vehicle
+VehicleSet = Dict[int, int]
+
+# (index, app id, vehicles, qty, content hash) of an analyzed app
+_Entry = Tuple[int, Optional[str], VehicleSet, Any, int]
+
+
+class OverlapKind(str, Enum):
+    """Kind of overlap between two apps for the same part."""
+
+    DUPLICATE = "duplicate"
+    SAME_VEHICLES = "same_vehicles"
+    SUBSET = "subset"
+    CONFLICTING_QTY = "conflicting_qty"
+    PARTIAL = "partial"
+
+
+@dataclass
+class OverlapFinding:
+    """Two apps for the same part that cover common vehicles.
+
+    For SUBSET findings, index is the narrower app and other_index the app
+    that covers it; otherwise index is the earlier app in the stream.
+
+    Attributes:
+        kind: Duplicate, same vehicles, subset, conflicting quantity or
+              partial overlap
+        index: Position of the first app in the analyzed stream
+        other_index: Position of the second app
+        app_id: id attribute of the first app
+        other_app_id: id attribute of the second app
+        shared_vehicles: Number of VehicleIDs covered by both apps
+    """
+
+    kind: OverlapKind
+    index: int
+    other_index: int
+    app_id: Optional[str]
+    other_app_id: Optional[str]
+    shared_vehicles: int
+
+
+def _contains(outer: VehicleSet, inner: VehicleSet) -> bool:
+    """Whether every vehicle of inner is also in outer."""
+    for base_vehicle_id, mask in inner.items():
+        if mask & ~outer.get(base_vehicle_id, 0):
+            return False
+    return True
+
+
+def _shared(first: VehicleSet, second: VehicleSet) -> int:
+    """Number of vehicles in both sets."""
+    return sum(
+        (mask & second.get(base_vehicle_id, 0)).bit_count()
+        for base_vehicle_id, mask in first.items()
+    )
+
+
+class OverlapAnalyzer:
+    """Finds duplicate and overlapping apps using VCdb vehicle expansion.
+
+    Example:
+        analyzer = OverlapAnalyzer.from_client(client)
+        for finding in analyzer.analyze(ACESReader("fitment.xml")):
+            print(finding.kind, finding.app_id, finding.other_app_id)
+    """
+
+    def __init__(
+        self,
+        vehicle_ids: Dict[int, List[int]],
+        attribute_masks: Dict[str, Dict[int, int]],
+        make_model_years: Optional[Dict[int, List[Tuple[int, int]]]] = None,
+    ):
+        """
+        Initialize from compiled vehicle indexes.
+
+        Most callers should use from_records() or from_client() instead.
+
+        Args:
+            vehicle_ids: BaseVehicleID -> VehicleIDs (bit position = list index)
+            attribute_masks: ACES attribute -> packed (BaseVehicleID, ID) ->
+                             bitmask of vehicles with that attribute value
+            make_model_years: Packed (MakeID, ModelID) -> [(YearID, BaseVehicleID)]
+        """
+        self.vehicle_ids = vehicle_ids
+        self.attribute_masks = attribute_masks
+        self.make_model_years = make_model_years or {}
+        self._all = {
+            base_vehicle_id: (1 << len(ids)) - 1
+            for base_vehicle_id, ids in vehicle_ids.items()
+        }
+
+    @classmethod
+    def from_records(
+        cls,
+        vehicles: Iterable[Any],
+        vehicle_to: Optional[Mapping[str, Iterable[Any]]] = None,
+        engine_configs: Iterable[Any] = (),
+        base_vehicles: Iterable[Any] = (),
+    ) -> "OverlapAnalyzer":
+        """
+        Compile vehicle indexes from VCdb records.
+
+        Records may be raw API dicts or typed models.
+
+        Args:
+            vehicles: VCdb Vehicle records
+            vehicle_to: VCdb VehicleTo* table name -> records
+            engine_configs: VCdb EngineConfig records, used to expand
+                            EngineBase, Aspiration, ... attributes
+            base_vehicles: VCdb BaseVehicle records, used to expand
+                           Years/Make/Model apps
+
+        Returns:
+            Compiled OverlapAnalyzer
+        """
+        vehicle_index = VehicleIndex.from_records(vehicles, vehicle_to, engine_configs)
+
+        make_model_years: Dict[int, List[Tuple[int, int]]] = {}
+        for record in base_vehicles:
+            base_vehicle_id = record_value(record, "BaseVehicleID")
+            make_id = record_value(record, "MakeID")
+            model_id = record_value(record, "ModelID")
+            year_id = record_value(record, "YearID")
+            if None in (base_vehicle_id, make_id, model_id, year_id):
+                continue
+            make_model_years.setdefault(pack(int(make_id), int(model_id)), []).append(
+                (int(year_id), int(base_vehicle_id))
+            )
+
+        return cls(
+            vehicle_index.vehicle_ids, vehicle_index.attribute_masks, make_model_years
+        )
+
+    @classmethod
+    def from_client(
+        cls,
+        client: Any,
+        vehicle_to_tables: Optional[Iterable[str]] = None,
+    ) -> "OverlapAnalyzer":
+        """
+        Fetch VCdb snapshots through an AutoCareAPI client and compile them.
+
+        Args:
+            client: Authenticated AutoCareAPI instance
+            vehicle_to_tables: VehicleTo* tables to index; defaults to all
+                               tables in VEHICLE_TO_TABLES
+
+        Returns:
+            Compiled OverlapAnalyzer
+        """
+        if vehicle_to_tables is None:
+            vehicle_to_tables = [table for table, _ in VEHICLE_TO_TABLES.values()]
+
+        return cls.from_records(
+            vehicles=client.fetch_records("vcdb", "Vehicle"),
+            vehicle_to={
+                table: client.fetch_records("vcdb", table)
+                for table in vehicle_to_tables
+            },
+            engine_configs=client.fetch_records("vcdb", "EngineConfig"),
+            base_vehicles=client.fetch_records("vcdb", "BaseVehicle"),
+        )
+
+    def _base_vehicles(self, app: App) -> List[int]:
+        """BaseVehicleIDs an app applies to before attribute filtering."""
+        if app.base_vehicle_id is not None:
+            return [app.base_vehicle_id]
+        attributes = app.vehicle_attributes
+        if app.years is None or not _MAKE_MODEL <= attributes.keys():
+            return []
+        start, end = app.years
+        candidates = self.make_model_years.get(
+            pack(attributes["Make"], attributes["Model"]), []
+        )
+        return [
+            base_vehicle_id
+            for year, base_vehicle_id in candidates
+            if start <= year <= end
+        ]
+
+    def expand(self, app: App) -> VehicleSet:
+        """
+        Expand an app to its covered vehicles.
+
+        Attributes without a VCdb mapping do not narrow the set.
+
+        Args:
+            app: App record
+
+        Returns:
+            BaseVehicleID -> bitmask over vehicle_ids[BaseVehicleID]
+        """
+        result: VehicleSet = {}
+        attribute_masks = self.attribute_masks
+        for base_vehicle_id in self._base_vehicles(app):
+            mask = self._all.get(base_vehicle_id, 0)
+            for attribute, value in app.vehicle_attributes.items():
+                masks = attribute_masks.get(attribute)
+                if masks is not None and mask:
+                    mask &= masks.get(pack(base_vehicle_id, value), 0)
+            if mask:
+                result[base_vehicle_id] = mask
+        return result
+
+    def vehicle_ids_for(self, app: App) -> Set[int]:
+        """
+        Expand an app to VCdb VehicleIDs.
+
+        Args:
+            app: App record
+
+        Returns:
+            Set of covered VehicleIDs
+        """
+        result = set()
+        for base_vehicle_id, mask in self.expand(app).items():
+            ids = self.vehicle_ids[base_vehicle_id]
+            while mask:
+                low = mask & -mask
+                result.add(ids[low.bit_length() - 1])
+                mask ^= low
+        return result
+
+    def _signature(self, app: App) -> int:
+        """Hash of everything that must match for two apps to be compared."""
+        attribute_masks = self.attribute_masks
+        unexpanded = tuple(
+            sorted(
+                item
+                for item in app.vehicle_attributes.items()
+                if item[0] not in attribute_masks and item[0] not in _MAKE_MODEL
+            )
+        )
+        qualifiers = tuple(
+            sorted((q.qualifier_id or 0, tuple(q.params)) for q in app.qualifiers)
+        )
+        return hash(
+            (
+                app.part_number,
+                app.brand_id,
+                app.part_type_id,
+                app.position_id,
+                qualifiers,
+                unexpanded,
+            )
+        )
+
+    def analyze(self, apps: Iterable[App]) -> Iterator[OverlapFinding]:
+        """
+        Find duplicate and overlapping apps.
+
+        Apps are compared when they share part number, brand, part type,
+        position, qualifiers and unexpandable attributes and cover at least
+        one common vehicle. Each overlapping pair is reported once:
+
+        - DUPLICATE: same vehicles, quantity and content (notes in any order)
+        - SAME_VEHICLES: same vehicles and quantity, different content
+          (notes, display order or extra elements)
+        - CONFLICTING_QTY: common vehicles with different quantities
+        - SUBSET: one app's vehicles are contained in the other's
+        - PARTIAL: vehicles overlap but neither contains the other
+
+        Apps that expand to no vehicles are skipped; use ACESValidator to
+        report them.
+
+        Args:
+            apps: App records, e.g. from ACESReader
+
+        Yields:
+            OverlapFinding records, ordered by bucket
+        """
+        # (signature, BaseVehicleID) -> [(index, app id, vehicles, qty, content)]
+        buckets: Dict[Tuple[int, int], List[_Entry]] = {}
+        for index, app in enumerate(apps):
+            vehicles = self.expand(app)
+            if not vehicles:
+                continue
+            entry = (
+                index,
+                app.id,
+                vehicles,
+                app.qty,
+                hash(
+                    (
+                        tuple(sorted(app.notes)),
+                        app.display_order,
+                        tuple(sorted(app.extra.items())),
+                    )
+                ),
+            )
+            signature = self._signature(app)
+            for base_vehicle_id in vehicles:
+                buckets.setdefault((signature, base_vehicle_id), []).append(entry)
+
+        # Pairs of apps spanning several base vehicles meet in several buckets
+        reported: Set[Tuple[int, int]] = set()
+        for entries in buckets.values():
+            if len(entries) < 2:
+                continue
+            yield from self._compare_bucket(entries, reported)
+
+    def _compare_bucket(
+        self,
+        entries: List[_Entry],
+        reported: Set[Tuple[int, int]],
+    ) -> Iterator[OverlapFinding]:
+        """Compare every pair of apps in one (signature, BaseVehicle) bucket."""
+        # Exact duplicates are reported against their first occurrence and
+        # not compared again
+        unique: Dict[Tuple[Tuple[Tuple[int, int], ...], Any, int], int] = {}
+        distinct: List[_Entry] = []
+        for entry in entries:
+            index, app_id, vehicles, qty, content = entry
+            key = (tuple(sorted(vehicles.items())), qty, content)
+            position = unique.get(key)
+            if position is None:
+                unique[key] = len(distinct)
+                distinct.append(entry)
+                continue
+            original = distinct[position]
+            pair = (original[0], index)
+            if pair in reported:
+                continue
+            reported.add(pair)
+            yield OverlapFinding(
+                OverlapKind.DUPLICATE,
+                original[0],
+                index,
+                original[1],
+                app_id,
+                _shared(vehicles, vehicles),
+            )
+
+        for i, first in enumerate(distinct):
+            first_index, _, first_vehicles, first_qty, _ = first
+            for second in distinct[i + 1 :]:
+                second_index, _, second_vehicles, second_qty, _ = second
+                shared = _shared(first_vehicles, second_vehicles)
+                if not shared:
+                    continue
+                pair = (first_index, second_index)
+                if pair in reported:
+                    continue
+                reported.add(pair)
+
+                narrow, broad = first, second
+                if first_qty != second_qty:
+                    kind = OverlapKind.CONFLICTING_QTY
+                elif first_vehicles == second_vehicles:
+                    kind = OverlapKind.SAME_VEHICLES
+                elif _contains(second_vehicles, first_vehicles):
+                    kind = OverlapKind.SUBSET
+                elif _contains(first_vehicles, second_vehicles):
+                    kind = OverlapKind.SUBSET
+                    narrow, broad = second, first
+                else:
+                    kind = OverlapKind.PARTIAL
+                yield OverlapFinding(
+                    kind, narrow[0], broad[0], narrow[1], broad[1], shared
+                )
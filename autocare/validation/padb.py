@@ -0,0 +1,341 @@
+"""PAdb attribute validation for PIES ProductAttribute (F01) values.
+
+Compiles the PAdb assignment tables into a single hashed lookup so that
+large batches of (PartTerminologyID, PAID, value, UOM) rows can be checked
+without re-scanning tables or calling the API per row.
+"""
+
+import sys
+from array import array
+from enum import IntEnum
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from autocare.databases.base import record_value
+
+# (valid values, UOM codes) for one PartTerminology/PAID assignment.
+# Either side is None when the assignment does not restrict it.
+_Rule = Tuple[Optional[FrozenSet[str]], Optional[FrozenSet[str]]]
+
+_FREE_FORM: _Rule = (None, None)
+
+
+class AttributeErrorCode(IntEnum):
+    """Per-row result codes returned by AttributeValidator."""
+
+    OK = 0
+    UNASSIGNED_ATTRIBUTE = 1
+    INVALID_VALUE = 2
+    MISSING_UOM = 3
+    INVALID_UOM = 4
+    MALFORMED_ROW = 5
+
+
+def _to_int(value: Any) -> Optional[int]:
+    """Coerce an API id value to int, treating blanks and "null" as missing."""
+    if value is None or value == "" or value == "null":
+        return None
+    return int(value)
+
+
+def _pack_key(part_terminology_id: int, paid: int) -> int:
+    """Pack a (PartTerminologyID, PAID) pair into a single int dict key."""
+    return (part_terminology_id << 32) | paid
+
+
+class AttributeValidator:
+    """Precompiled PAdb attribute validator.
+
+    Each (PartTerminologyID, PAID) assignment is packed into one int key that
+    maps to a rule of interned valid-value and UOM-code sets. Assignments that
+    share the same allowed values share a single frozenset, so the compiled
+    form stays small even for the full PAdb.
+
+    Validation rules, in order:
+    - the PAID must be assigned to the PartTerminologyID
+    - if the assignment has valid values, the value must be one of them
+    - if the assignment has UOM codes, a UOM must be given and be one of them
+    """
+
+    def __init__(
+        self,
+        rules: Dict[int, _Rule],
+        attribute_names: Optional[Dict[int, str]] = None,
+    ):
+        """
+        Initialize from precompiled rules.
+
+        Most callers should use from_records() or from_client() instead.
+
+        Args:
+            rules: Packed (PartTerminologyID, PAID) key -> (values, uoms) rule
+            attribute_names: Optional PAID -> PAName mapping
+        """
+        self._rules = rules
+        self.attribute_names = attribute_names or {}
+
+    @classmethod
+    def from_records(
+        cls,
+        assignments: Iterable[Any],
+        valid_values: Iterable[Any] = (),
+        valid_value_assignments: Iterable[Any] = (),
+        uom_codes: Iterable[Any] = (),
+        uom_code_assignments: Iterable[Any] = (),
+        attributes: Iterable[Any] = (),
+    ) -> "AttributeValidator":
+        """
+        Compile a validator from PAdb table records.
+
+        Records may be raw API dicts or the typed models from
+        autocare.databases.padb.
+
+        Args:
+            assignments: PartAttributeAssignment records
+            valid_values: ValidValues records
+            valid_value_assignments: ValidValueAssignment records
+            uom_codes: MetaUOMCodes records
+            uom_code_assignments: MetaUOMCodeAssignment records
+            attributes: PartAttributes records, used for PAID names only
+
+        Returns:
+            Compiled AttributeValidator
+        """
+        value_text: Dict[int, str] = {}
+        for record in valid_values:
+            value_id = _to_int(record_value(record, "ValidValueID"))
+            text = record_value(record, "ValidValue")
+            if value_id is not None and text is not None:
+                value_text[value_id] = sys.intern(str(text))
+
+        uom_text: Dict[int, str] = {}
+        for record in uom_codes:
+            uom_id = _to_int(record_value(record, "MetaUOMID"))
+            code = record_value(record, "UOMCode")
+            if uom_id is not None and code is not None:
+                uom_text[uom_id] = sys.intern(str(code))
+
+        values_by_paptid: Dict[int, set] = {}
+        for record in valid_value_assignments:
+            paptid = _to_int(record_value(record, "PAPTID"))
+            value_id = _to_int(record_value(record, "ValidValueID"))
+            if paptid is not None and value_id in value_text:
+                values_by_paptid.setdefault(paptid, set()).add(value_text[value_id])
+
+        uoms_by_paptid: Dict[int, set] = {}
+        for record in uom_code_assignments:
+            paptid = _to_int(record_value(record, "PAPTID"))
+            uom_id = _to_int(record_value(record, "MetaUOMID"))
+            if paptid is not None and uom_id in uom_text:
+                uoms_by_paptid.setdefault(paptid, set()).add(uom_text[uom_id])
+
+        # Intern identical sets and rules so shared value lists are stored once
+        interned_sets: Dict[FrozenSet[str], FrozenSet[str]] = {}
+        interned_rules: Dict[_Rule, _Rule] = {_FREE_FORM: _FREE_FORM}
+
+        def intern_set(values: Optional[set]) -> Optional[FrozenSet[str]]:
+            if not values:
+                return None
+            frozen = frozenset(values)
+            return interned_sets.setdefault(frozen, frozen)
+
+        rules: Dict[int, _Rule] = {}
+        for record in assignments:
+            ptid = _to_int(record_value(record, "PartTerminologyID"))
+            paid = _to_int(record_value(record, "PAID"))
+            if ptid is None or paid is None:
+                continue
+
+            paptid = _to_int(record_value(record, "PAPTID"))
+            # Without a PAPTID no value or UOM list applies
+            if paptid is None:
+                rule = _FREE_FORM
+            else:
+                rule = (
+                    intern_set(values_by_paptid.get(paptid)),
+                    intern_set(uoms_by_paptid.get(paptid)),
+                )
+            rules[_pack_key(ptid, paid)] = interned_rules.setdefault(rule, rule)
+
+        attribute_names: Dict[int, str] = {}
+        for record in attributes:
+            paid = _to_int(record_value(record, "PAID"))
+            name = record_value(record, "PAName")
+            if paid is not None and name is not None:
+                attribute_names[paid] = name
+
+        return cls(rules, attribute_names)
+
+    @classmethod
+    def from_client(
+        cls, client: Any, version: Optional[str] = None
+    ) -> "AttributeValidator":
+        """
+        Fetch the PAdb tables through an AutoCareAPI client and compile them.
+
+        Args:
+            client: Authenticated AutoCareAPI instance
+            version: PAdb API version override
+
+        Returns:
+            Compiled AttributeValidator
+        """
+
+        def fetch(table_name: str) -> Iterator[Any]:
+            return client.fetch_records("padb", table_name, version=version)
+
+        return cls.from_records(
+            assignments=fetch("PartAttributeAssignment"),
+            valid_values=fetch("ValidValues"),
+            valid_value_assignments=fetch("ValidValueAssignment"),
+            uom_codes=fetch("MetaUOMCodes"),
+            uom_code_assignments=fetch("MetaUOMCodeAssignment"),
+            attributes=fetch("PartAttributes"),
+        )
+
+    def __len__(self) -> int:
+        """Number of compiled (PartTerminologyID, PAID) assignments."""
+        return len(self._rules)
+
+    def is_assigned(self, part_terminology_id: int, paid: int) -> bool:
+        """Check whether a PAID is assigned to a PartTerminologyID."""
+        return _pack_key(int(part_terminology_id), int(paid)) in self._rules
+
+    def valid_values_for(
+        self, part_terminology_id: int, paid: int
+    ) -> Optional[FrozenSet[str]]:
+        """
+        Get the allowed values for an assignment.
+
+        Returns:
+            Frozenset of allowed values, or None if the assignment is
+            free-form or does not exist
+        """
+        rule = self._rules.get(_pack_key(int(part_terminology_id), int(paid)))
+        return rule[0] if rule else None
+
+    def uom_codes_for(
+        self, part_terminology_id: int, paid: int
+    ) -> Optional[FrozenSet[str]]:
+        """
+        Get the allowed UOM codes for an assignment.
+
+        Returns:
+            Frozenset of UOM codes, or None if the assignment has no units
+            or does not exist
+        """
+        rule = self._rules.get(_pack_key(int(part_terminology_id), int(paid)))
+        return rule[1] if rule else None
+
+    def validate(
+        self,
+        part_terminology_id: Any,
+        paid: Any,
+        value: Optional[str],
+        uom: Optional[str] = None,
+    ) -> AttributeErrorCode:
+        """
+        Validate a single attribute value.
+
+        Args:
+            part_terminology_id: PartTerminologyID of the item
+            paid: PAID of the ProductAttribute
+            value: Attribute value text
+            uom: Unit of measure code, if any
+
+        Returns:
+            AttributeErrorCode for the row
+        """
+        return AttributeErrorCode(
+            self.validate_batch(((part_terminology_id, paid, value, uom),))[0]
+        )
+
+    def validate_batch(self, rows: Iterable[Sequence[Any]]) -> array:
+        """
+        Validate a batch of attribute rows.
+
+        Each row is a (PartTerminologyID, PAID, value, UOM) sequence; the UOM
+        may be None. IDs may be ints or numeric strings as read from PIES XML.
+
+        Args:
+            rows: Iterable of attribute rows
+
+        Returns:
+            array('B') of AttributeErrorCode values, one per input row
+        """
+        rules_get = self._rules.get
+        codes = array("B")
+        append = codes.append
+
+        ok = AttributeErrorCode.OK.value
+        unassigned = AttributeErrorCode.UNASSIGNED_ATTRIBUTE.value
+        invalid_value = AttributeErrorCode.INVALID_VALUE.value
+        missing_uom = AttributeErrorCode.MISSING_UOM.value
+        invalid_uom = AttributeErrorCode.INVALID_UOM.value
+        malformed = AttributeErrorCode.MALFORMED_ROW.value
+
+        for row in rows:
+            try:
+                ptid, paid, value, uom = row
+                rule = rules_get((int(ptid) << 32) | int(paid))
+            except (TypeError, ValueError):
+                append(malformed)
+                continue
+
+            if rule is None:
+                append(unassigned)
+                continue
+
+            values, uoms = rule
+            if values is not None and value not in values:
+                append(invalid_value)
+            elif uoms is not None and not uom:
+                append(missing_uom)
+            elif uoms is not None and uom not in uoms:
+                append(invalid_uom)
+            else:
+                append(ok)
+
+        return codes
+
+    def iter_errors(
+        self, rows: Iterable[Sequence[Any]], batch_size: int = 100_000
+    ) -> Iterator[Tuple[int, AttributeErrorCode]]:
+        """
+        Stream failing rows from a (possibly unbounded) row iterable.
+
+        Rows are validated in batches of batch_size so memory stays bounded.
+
+        Args:
+            rows: Iterable of (PartTerminologyID, PAID, value, UOM) rows
+            batch_size: Rows validated per batch
+
+        Yields:
+            (row index, AttributeErrorCode) for every row that is not OK
+        """
+        offset = 0
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                yield from self._batch_errors(batch, offset)
+                offset += len(batch)
+                batch = []
+        if batch:
+            yield from self._batch_errors(batch, offset)
+
+    def _batch_errors(
+        self, batch: Sequence[Sequence[Any]], offset: int
+    ) -> Iterator[Tuple[int, AttributeErrorCode]]:
+        """Validate one batch and yield its failing rows."""
+        for index, code in enumerate(self.validate_batch(batch)):
+            if code:
+                yield offset + index, AttributeErrorCode(code)
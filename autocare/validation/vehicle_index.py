@@ -0,0 +1,146 @@
+"""Bitmask index of VCdb vehicles and their attribute values.
+
+Vehicles are numbered within their BaseVehicle, so the vehicles of one base
+vehicle having an attribute value are a bitmask, keyed by the packed
+(BaseVehicleID, attribute ID) pair. Intersecting attributes is then an
+integer AND. Used by ACESValidator and OverlapAnalyzer.
+"""
+
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from autocare.databases.base import record_value
+from autocare.databases.vcdb import EngineConfig
+
+# ACES vehicle attribute -> (VCdb VehicleTo* table, ID column)
+VEHICLE_TO_TABLES: Dict[str, Tuple[str, str]] = {
+    "BedConfig": ("VehicleToBedConfig", "BedConfigID"),
+    "BodyStyleConfig": ("VehicleToBodyStyleConfig", "BodyStyleConfigID"),
+    "BrakeConfig": ("VehicleToBrakeConfig", "BrakeConfigID"),
+    "DriveType": ("VehicleToDriveType", "DriveTypeID"),
+    "EngineConfig": ("VehicleToEngineConfig", "EngineConfigID"),
+    "MfrBodyCode": ("VehicleToMfrBodyCode", "MfrBodyCodeID"),
+    "SpringTypeConfig": ("VehicleToSpringTypeConfig", "SpringTypeConfigID"),
+    "SteeringConfig": ("VehicleToSteeringConfig", "SteeringConfigID"),
+    "Transmission": ("VehicleToTransmission", "TransmissionID"),
+    "WheelBase": ("VehicleToWheelBase", "WheelBaseID"),
+}
+
+# ACES vehicle attributes stored directly on the VCdb Vehicle record
+VEHICLE_COLUMNS = {"SubModel": "SubModelID", "Region": "RegionID"}
+
+# ACES engine attributes derived from EngineConfig (EngineBase, Aspiration, ...)
+ENGINE_CONFIG_COLUMNS = {
+    f.name[: -len("ID")]: f.name
+    for f in fields(EngineConfig)
+    if f.name.endswith("ID") and f.name != "EngineConfigID"
+}
+
+
+def pack(high: int, low: int) -> int:
+    """Pack two IDs into one int key."""
+    return (high << 32) | low
+
+
+@dataclass
+class VehicleIndex:
+    """VCdb vehicles per base vehicle, with attribute bitmasks.
+
+    Attributes:
+        vehicle_ids: BaseVehicleID -> VehicleIDs (bit position = list index)
+        attribute_masks: ACES attribute -> packed (BaseVehicleID, ID) ->
+                         bitmask of the base vehicle's vehicles with that ID
+        engine_config_ids: EngineConfigIDs of the EngineConfig records read
+    """
+
+    vehicle_ids: Dict[int, List[int]] = field(default_factory=dict)
+    attribute_masks: Dict[str, Dict[int, int]] = field(default_factory=dict)
+    engine_config_ids: Set[int] = field(default_factory=set)
+
+    @classmethod
+    def from_records(
+        cls,
+        vehicles: Iterable[Any],
+        vehicle_to: Optional[Mapping[str, Iterable[Any]]] = None,
+        engine_configs: Iterable[Any] = (),
+    ) -> "VehicleIndex":
+        """
+        Build the index from VCdb records (raw API dicts or typed models).
+
+        Every attribute of a VehicleTo* table that is passed gets an entry
+        in attribute_masks, even if the table is empty.
+
+        Args:
+            vehicles: VCdb Vehicle records
+            vehicle_to: VCdb VehicleTo* table name -> records
+            engine_configs: VCdb EngineConfig records, used to expand
+                            EngineBase, Aspiration, ... attributes
+
+        Returns:
+            Built VehicleIndex
+
+        Raises:
+            ValueError: If vehicle_to names a table not in VEHICLE_TO_TABLES
+        """
+        index = cls()
+        vehicle_ids = index.vehicle_ids
+        attribute_masks = index.attribute_masks
+        # VehicleID -> (BaseVehicleID, bit)
+        positions: Dict[int, Tuple[int, int]] = {}
+
+        def add(attribute: str, base_vehicle_id: int, value: Any, bit: int) -> None:
+            masks = attribute_masks.setdefault(attribute, {})
+            key = pack(base_vehicle_id, int(value))
+            masks[key] = masks.get(key, 0) | bit
+
+        for record in vehicles:
+            vehicle_id = record_value(record, "VehicleID")
+            base_vehicle_id = record_value(record, "BaseVehicleID")
+            if vehicle_id is None or base_vehicle_id is None:
+                continue
+            base_vehicle_id = int(base_vehicle_id)
+            ids = vehicle_ids.setdefault(base_vehicle_id, [])
+            bit = 1 << len(ids)
+            ids.append(int(vehicle_id))
+            positions[int(vehicle_id)] = (base_vehicle_id, bit)
+            for attribute, column in VEHICLE_COLUMNS.items():
+                value = record_value(record, column)
+                if value is not None:
+                    add(attribute, base_vehicle_id, value, bit)
+
+        engine_config_columns: Dict[int, Dict[str, Any]] = {}
+        for record in engine_configs:
+            engine_config_id = record_value(record, "EngineConfigID")
+            if engine_config_id is not None:
+                engine_config_columns[int(engine_config_id)] = {
+                    attribute: value
+                    for attribute, column in ENGINE_CONFIG_COLUMNS.items()
+                    if (value := record_value(record, column)) is not None
+                }
+        index.engine_config_ids.update(engine_config_columns)
+
+        tables = {
+            table: attribute for attribute, (table, _) in VEHICLE_TO_TABLES.items()
+        }
+        for table_name, records in (vehicle_to or {}).items():
+            table_attribute = tables.get(table_name)
+            if table_attribute is None:
+                raise ValueError(f"Unsupported VehicleTo table: {table_name}")
+            column = VEHICLE_TO_TABLES[table_attribute][1]
+            attribute_masks.setdefault(table_attribute, {})
+            for record in records:
+                vehicle_id = record_value(record, "VehicleID")
+                value = record_value(record, column)
+                if vehicle_id is None or value is None:
+                    continue
+                position = positions.get(int(vehicle_id))
+                if position is None:
+                    continue
+                base_vehicle_id, bit = position
+                add(table_attribute, base_vehicle_id, value, bit)
+                if table_attribute == "EngineConfig":
+                    engine = engine_config_columns.get(int(value), {})
+                    for engine_attribute, engine_value in engine.items():
+                        add(engine_attribute, base_vehicle_id, engine_value, bit)
+
+        return index
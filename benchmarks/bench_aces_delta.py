@@ -0,0 +1,58 @@
+"""Benchmark for diffing two ACES submissions.
+
+The new submission is the old file with about 1% of apps changed.
+
+Usage: python -m benchmarks.bench_aces_delta --apps 1000000
+"""
+
+import argparse
+import os
+import resource
+import tempfile
+import time
+from collections import Counter
+
+from autocare.standards.aces_delta import DEFAULT_PARTITIONS, diff_aces
+from autocare.standards.aces_reader import iter_apps
+from benchmarks.generate import write_aces
+
+
+def _changed(path: str):
+    """Stream the old file with every 100th app's quantity changed."""
+    for index, app in enumerate(iter_apps(path)):
+        if index % 100 == 0:
+            app.qty = (app.qty or 0) + 1
+        yield app
+
+
+def main() -> None:
+    """Generate a file, diff it against a 1%-changed copy, report apps/sec."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--apps", type=int, default=1_000_000)
+    parser.add_argument("--partitions", type=int, default=DEFAULT_PARTITIONS)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "old.xml")
+        write_aces(path, args.apps)
+
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        started = time.perf_counter()
+        kinds = Counter(
+            delta.kind.value
+            for delta in diff_aces(
+                path, _changed(path), partitions=args.partitions, workdir=tmp
+            )
+        )
+        elapsed = time.perf_counter() - started
+        rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    print(
+        f"diffed 2 x {args.apps:,} apps in {elapsed:.1f}s "
+        f"({2 * args.apps / elapsed:,.0f} apps/s): {dict(kinds)}"
+    )
+    print(f"peak RSS growth during diff: {(rss_after - rss_before) / 1024:,.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark for ACES overlap and duplicate detection.
+
+Builds a synthetic VCdb (base vehicles with several submodels each) and
+analyzes in-memory apps, so the number excludes XML parsing (see
+bench_aces_reader for that).
+
+Usage: python -m benchmarks.bench_aces_overlap --apps 5000000
+"""
+
+import argparse
+import random
+import time
+from collections import Counter
+
+from autocare.standards.aces_reader import App
+from autocare.validation.aces_overlap import OverlapAnalyzer
+
+_SUBMODELS_PER_BASE_VEHICLE = 4
+
+
+def _apps(count: int, base_vehicles: int, parts: int, seed: int):
+    """Yield apps at BaseVehicle or SubModel level for a pool of parts."""
+    rng = random.Random(seed)
+    for app_id in range(count):
+        attributes = {}
+        if rng.random() < 0.5:
+            attributes["SubModel"] = rng.randint(1, _SUBMODELS_PER_BASE_VEHICLE)
+        yield App(
+            id=str(app_id),
+            base_vehicle_id=rng.randint(1, base_vehicles),
+            vehicle_attributes=attributes,
+            part_type_id=1896,
+            position_id=22,
+            qty=rng.choice((1, 1, 1, 2)),
+            part_number=f"P{rng.randint(1, parts)}",
+        )
+
+
+def main() -> None:
+    """Analyze synthetic apps and report apps/sec and findings by kind."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--apps", type=int, default=5_000_000)
+    parser.add_argument("--base-vehicles", type=int, default=150_000)
+    parser.add_argument("--parts", type=int, default=500_000)
+    args = parser.parse_args()
+
+    vehicles = [
+        {
+            "VehicleID": base_vehicle * 10 + submodel,
+            "BaseVehicleID": base_vehicle,
+            "SubModelID": submodel,
+        }
+        for base_vehicle in range(1, args.base_vehicles + 1)
+        for submodel in range(1, _SUBMODELS_PER_BASE_VEHICLE + 1)
+    ]
+    analyzer = OverlapAnalyzer.from_records(vehicles)
+
+    started = time.perf_counter()
+    kinds = Counter(
+        finding.kind.value
+        for finding in analyzer.analyze(
+            _apps(args.apps, args.base_vehicles, args.parts, seed=1)
+        )
+    )
+    elapsed = time.perf_counter() - started
+    print(
+        f"analyzed {args.apps:,} apps in {elapsed:.1f}s "
+        f"({args.apps / elapsed:,.0f} apps/s): {dict(kinds)}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Single-process vs process-parallel ACES benchmark.
+
+Usage: python -m benchmarks.bench_aces_parallel --apps 5000000 --workers 8
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from typing import Iterator
+
+from autocare.compatibility.aces_transform import transform_aces
+from autocare.standards.aces_parallel import (
+    default_workers,
+    map_app_chunks,
+    transform_aces_parallel,
+)
+from autocare.standards.aces_reader import ACESReader, App
+from benchmarks.generate import write_aces
+
+
+def count_apps(apps: Iterator[App]) -> int:
+    """Chunk function: parse and count apps."""
+    return sum(1 for _ in apps)
+
+
+def _timed(label: str, apps: int, func) -> float:
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+    assert result == apps, f"{label}: expected {apps}, got {result}"
+    print(f"{label:<28} {elapsed:8.1f}s {apps / elapsed:>12,.0f} apps/s")
+    return elapsed
+
+
+def main() -> None:
+    """Generate an ACES file and compare single vs parallel parse/convert."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--apps", type=int, default=5_000_000)
+    parser.add_argument("--workers", type=int, default=default_workers())
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "aces42.xml")
+        destination = os.path.join(tmp, "aces50.xml")
+        write_aces(source, args.apps, version="4.2")
+        print(
+            f"{args.apps:,} apps, {os.path.getsize(source) / 1e6:,.1f} MB, "
+            f"{args.workers} workers"
+        )
+
+        single = _timed(
+            "parse (1 process)",
+            args.apps,
+            lambda: sum(1 for _ in ACESReader(source)),
+        )
+        parallel = _timed(
+            f"parse ({args.workers} processes)",
+            args.apps,
+            lambda: sum(map_app_chunks(source, count_apps, workers=args.workers)),
+        )
+        print(f"  parse speedup: {single / parallel:.2f}x")
+
+        single = _timed(
+            "convert (1 process)",
+            args.apps,
+            lambda: transform_aces(source, destination),
+        )
+        parallel = _timed(
+            f"convert ({args.workers} processes)",
+            args.apps,
+            lambda: transform_aces_parallel(source, destination, workers=args.workers),
+        )
+        print(f"  convert speedup: {single / parallel:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Throughput benchmark for the streaming ACES reader.
+
+Usage: python -m benchmarks.bench_aces_reader --apps 1000000
+"""
+
+import argparse
+import os
+import resource
+import tempfile
+import time
+
+from autocare.standards.aces_reader import ACESReader
+from benchmarks.generate import write_aces
+
+
+def main() -> None:
+    """Generate an ACES file, stream it, and report apps/sec and peak RSS."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--apps", type=int, default=1_000_000)
+    parser.add_argument("--version", default="4.2", choices=["4.2", "5.0"])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.xml")
+        started = time.perf_counter()
+        write_aces(path, args.apps, version=args.version)
+        size_mb = os.path.getsize(path) / 1e6
+        print(
+            f"generated {args.apps:,} apps ({size_mb:,.1f} MB) "
+            f"in {time.perf_counter() - started:.1f}s"
+        )
+
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        reader = ACESReader(path)
+        started = time.perf_counter()
+        count = sum(1 for _ in reader)
+        elapsed = time.perf_counter() - started
+        rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    print(
+        f"parsed {count:,} apps in {elapsed:.1f}s: "
+        f"{count / elapsed:,.0f} apps/s, {size_mb / elapsed:,.1f} MB/s"
+    )
+    print(f"peak RSS growth during parse: {(rss_after - rss_before) / 1024:,.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Throughput benchmark for the streaming ACES 4.2 -> 5.0 transformer.
+
+Usage: python -m benchmarks.bench_aces_transform --apps 1000000
+"""
+
+import argparse
+import os
+import resource
+import tempfile
+import time
+
+from autocare.compatibility.aces_transform import transform_aces
+from benchmarks.generate import write_aces
+
+
+def main() -> None:
+    """Generate an ACES 4.2 file, convert it to 5.0, and report MB/s."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--apps", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "aces42.xml")
+        destination = os.path.join(tmp, "aces50.xml")
+        write_aces(source, args.apps, version="4.2")
+        size_mb = os.path.getsize(source) / 1e6
+
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        started = time.perf_counter()
+        apps = transform_aces(source, destination, "4.2", "5.0")
+        elapsed = time.perf_counter() - started
+        rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    print(
+        f"converted {apps:,} apps ({size_mb:,.1f} MB) in {elapsed:.1f}s: "
+        f"{size_mb / elapsed:,.1f} MB/s, {apps / elapsed:,.0f} apps/s"
+    )
+    print(
+        f"peak RSS growth during transform: {(rss_after - rss_before) / 1024:,.1f} MB"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Throughput benchmark for the streaming ACES writer.
+
+Usage: python -m benchmarks.bench_aces_writer --apps 1000000 [--gzip]
+"""
+
+import argparse
+import os
+import resource
+import tempfile
+import time
+
+from autocare.standards.aces_reader import App, AppQualifier
+from autocare.standards.aces_writer import write_aces
+
+
+def _apps(count: int):
+    """Yield synthetic apps without holding them in memory."""
+    for app_id in range(1, count + 1):
+        yield App(
+            id=str(app_id),
+            action="A",
+            base_vehicle_id=app_id % 150_000 + 1,
+            vehicle_attributes={"SubModel": app_id % 2000 + 1},
+            qualifiers=[AppQualifier(1234, ["17"], "With 17 Inch Wheels")]
+            if app_id % 4 == 0
+            else [],
+            notes=["Bench note"] if app_id % 3 == 0 else [],
+            qty=1,
+            part_type_id=1896,
+            position_id=22,
+            part_number=f"P{app_id}",
+            brand_id="BBBB",
+        )
+
+
+def main() -> None:
+    """Write synthetic apps and report apps/sec, MB/s and peak RSS."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--apps", type=int, default=1_000_000)
+    parser.add_argument("--version", default="5.0", choices=["4.2", "5.0"])
+    parser.add_argument("--gzip", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "export.xml" + (".gz" if args.gzip else ""))
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        started = time.perf_counter()
+        count = write_aces(path, _apps(args.apps), version=args.version)
+        elapsed = time.perf_counter() - started
+        rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        size_mb = os.path.getsize(path) / 1e6
+
+    print(
+        f"wrote {count:,} apps ({size_mb:,.1f} MB) in {elapsed:.1f}s: "
+        f"{count / elapsed:,.0f} apps/s, {size_mb / elapsed:,.1f} MB/s"
+    )
+    print(f"peak RSS growth during write: {(rss_after - rss_before) / 1024:,.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Benchmark for list-then-dump vs streaming sharded NDJSON / CSV dumps.
+
+Records are replayed as API pages with a per-page delay (--page-latency)
+so the overlap of fetching and writing shows up in the timings.
+
+Usage: python -m benchmarks.bench_dump --scale 1.0 --page-latency 0.01
+"""
+
+import argparse
+import gzip
+import json
+import os
+import tempfile
+import time
+
+from autocare.sinks.dump import dump_records
+from benchmarks.generate import paged_records, vcdb_records
+
+_TABLE = "VehicleToEngineConfig"
+
+
+def _report(label: str, count: int, elapsed: float, files: int) -> None:
+    print(
+        f"{label:<24} {elapsed:6.2f}s {count / elapsed:>10,.0f} rec/s "
+        f"{files:>3} file(s)"
+    )
+
+
+def main() -> None:
+    """Dump one large synthetic VCdb table each way and report throughput."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--page-latency", type=float, default=0.005)
+    parser.add_argument("--shard-mb", type=float, default=1.0)
+    args = parser.parse_args()
+
+    records = list(vcdb_records(_TABLE, args.scale))
+    count = len(records)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        started = time.perf_counter()
+        fetched = list(paged_records(records, latency=args.page_latency))
+        with gzip.open(os.path.join(tmp, "all.json.gz"), "wt") as f:
+            json.dump(fetched, f)
+        _report("list + json.dump gzip", count, time.perf_counter() - started, 1)
+        del fetched
+
+        for label, options in (
+            ("ndjson gzip shards", {"compression": "gzip"}),
+            ("ndjson zstd shards", {"compression": "zstd"}),
+            ("csv gzip shards", {"format": "csv"}),
+        ):
+            started = time.perf_counter()
+            manifest = dump_records(
+                os.path.join(tmp, label.replace(" ", "-")),
+                _TABLE,
+                paged_records(records, latency=args.page_latency),
+                shard_mb=args.shard_mb,
+                **options,
+            )
+            _report(
+                label,
+                manifest.records,
+                time.perf_counter() - started,
+                len(manifest.shards),
+            )
+
+
+if __name__ == "__main__":
+    main()
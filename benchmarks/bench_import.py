@@ -0,0 +1,80 @@
+"""Import-time benchmark with a budget, for CLI and serverless cold starts.
+
+Runs `python -X importtime -c "import <module>"` in fresh interpreters,
+reports the best cumulative import time per module and the slowest
+imports underneath it, and exits with status 1 when `import autocare`
+exceeds --budget-ms or pulls in modules it should load lazily.
+
+Usage: python -m benchmarks.bench_import --budget-ms 50 --repeat 5
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+_MODULES = ("autocare", "autocare.client", "autocare.databases.vcdb")
+
+# Modules "import autocare" must not import (they load on first use)
+_LAZY = ("requests", "urllib3", "autocare.client", "autocare.databases.vcdb")
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def import_times(module: str) -> Dict[str, Tuple[int, int]]:
+    """(self, cumulative) microseconds per module imported by `import module`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            times[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+    return times
+
+
+def best_run(module: str, repeat: int) -> Dict[str, Tuple[int, int]]:
+    """Import times of the fastest of repeat runs."""
+    runs = [import_times(module) for _ in range(repeat)]
+    return min(runs, key=lambda times: times[module][1])
+
+
+def main() -> None:
+    """Report import times and check `import autocare` against the budget."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--budget-ms", type=float, default=50.0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=8)
+    args = parser.parse_args()
+
+    failures: List[str] = []
+    for module in _MODULES:
+        times = best_run(module, args.repeat)
+        total_ms = times[module][1] / 1000
+        print(f"import {module:<28} {total_ms:8.1f} ms ({len(times)} modules)")
+        slowest = sorted(times.items(), key=lambda item: item[1][0], reverse=True)
+        for name, (self_us, _) in slowest[: args.top]:
+            print(f"    {self_us / 1000:7.1f} ms  {name}")
+
+        if module == "autocare":
+            if total_ms > args.budget_ms:
+                failures.append(
+                    f"import autocare took {total_ms:.1f} ms "
+                    f"(budget {args.budget_ms:.1f} ms)"
+                )
+            eager = [name for name in _LAZY if name in times]
+            if eager:
+                failures.append(f"import autocare imported {', '.join(eager)}")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
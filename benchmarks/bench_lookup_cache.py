@@ -0,0 +1,73 @@
+"""Benchmark for per-ID reference lookups through LookupCache.
+
+Compares a plain dict built from fetch_all_records() (what services
+hand-roll today) with the two-tier cache: cold (bulk load + store reads),
+warm from memory, and from the SQLite store with a small memory budget.
+
+Usage: python -m benchmarks.bench_lookup_cache --scale 1.0 --lookups 200000
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from unittest.mock import MagicMock
+
+from autocare.lookup_cache import LookupCache
+from benchmarks.generate import vcdb_records
+
+_TABLE = "Vehicle"
+_KEY = "VehicleID"
+
+
+def _report(label: str, lookups: int, elapsed: float) -> None:
+    print(f"{label:<28} {elapsed:6.3f}s {lookups / elapsed:>12,.0f} lookups/s")
+
+
+def main() -> None:
+    """Look up random VehicleIDs each way and report lookups/s."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--lookups", type=int, default=200_000)
+    parser.add_argument("--batch", type=int, default=1_000)
+    args = parser.parse_args()
+
+    records = list(vcdb_records(_TABLE, args.scale))
+    client = MagicMock()
+    client.fetch_records.side_effect = lambda db, table, page_size=None: iter(records)
+    rng = random.Random(7)
+    ids = [rng.randint(1, len(records)) for _ in range(args.lookups)]
+
+    started = time.perf_counter()
+    index = {record[_KEY]: record for record in records}
+    for value in ids:
+        index.get(value)
+    _report("dict over all records", len(ids), time.perf_counter() - started)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "lookup.sqlite")
+        cache = LookupCache(client, path)
+        started = time.perf_counter()
+        for start in range(0, len(ids), args.batch):
+            cache.get_many("vcdb", _TABLE, ids[start : start + args.batch])
+        _report("cold get_many (load+store)", len(ids), time.perf_counter() - started)
+
+        started = time.perf_counter()
+        for value in ids:
+            cache.get("vcdb", _TABLE, value)
+        _report("warm get (memory)", len(ids), time.perf_counter() - started)
+        print(f"  {cache.stats}")
+        cache.close()
+
+        small = LookupCache(client, path, max_bytes=256 << 10)
+        started = time.perf_counter()
+        for start in range(0, len(ids), args.batch):
+            small.get_many("vcdb", _TABLE, ids[start : start + args.batch])
+        _report("get_many, 256 KiB memory", len(ids), time.perf_counter() - started)
+        print(f"  {small.stats}")
+        small.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark for per-record vs batch vs columnar record migration.
+
+Usage: python -m benchmarks.bench_migration --records 1000000
+"""
+
+import argparse
+import time
+
+from autocare.compatibility.field_mapping import (
+    migrate_aces_record,
+    migrate_aces_records,
+    migrate_columns,
+    migrate_vcdb_record,
+    migrate_vcdb_records,
+)
+
+
+def _report(label: str, count: int, started: float) -> None:
+    elapsed = time.perf_counter() - started
+    print(f"{label:<28} {elapsed:6.2f}s  {count / elapsed:>12,.0f} records/s")
+
+
+def main() -> None:
+    """Migrate synthetic VCdb and ACES records each way and report throughput."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=1_000_000)
+    args = parser.parse_args()
+    count = args.records
+
+    vcdb = [
+        {"VehicleID": i, "BaseVehicleID": i // 4, "SubModelID": 20, "RegionID": 1}
+        for i in range(count)
+    ]
+    aces = [
+        {"Part": f"P{i}", "PartType": 1896, "BrandAAIAID": "BBBB", "Qty": 1}
+        for i in range(count)
+    ]
+
+    started = time.perf_counter()
+    for record in vcdb:
+        migrate_vcdb_record(record, "1.0", "2.0")
+    _report("vcdb 1.0->2.0 per record", count, started)
+
+    started = time.perf_counter()
+    for _ in migrate_vcdb_records(vcdb, "1.0", "2.0"):
+        pass
+    _report("vcdb 1.0->2.0 batch", count, started)
+
+    started = time.perf_counter()
+    for record in aces:
+        migrate_aces_record(record, "4.2", "5.0")
+    _report("aces 4.2->5.0 per record", count, started)
+
+    started = time.perf_counter()
+    for _ in migrate_aces_records(aces, "4.2", "5.0"):
+        pass
+    _report("aces 4.2->5.0 batch", count, started)
+
+    columns = {name: [r[name] for r in vcdb] for name in vcdb[0]}
+    started = time.perf_counter()
+    migrate_columns(columns, "vcdb", "1.0", "2.0")
+    _report("vcdb 1.0->2.0 columnar", count, started)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Benchmark for JSON dumps vs streaming Parquet export of VCdb tables.
+
+Usage: python -m benchmarks.bench_parquet_export --scale 1.0
+"""
+
+import argparse
+import gzip
+import json
+import os
+import tempfile
+import time
+
+import pyarrow.parquet as pq
+
+from autocare.sinks.base import default_model
+from autocare.sinks.parquet import write_parquet
+from benchmarks.generate import vcdb_records
+
+_TABLES = ("Vehicle", "Model", "VehicleToEngineConfig")
+
+
+def main() -> None:
+    """Write each table as gzipped JSON and as Parquet; report time, size, scan."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--compression", default="zstd")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for table in _TABLES:
+            records = list(vcdb_records(table, args.scale))
+
+            json_path = os.path.join(tmp, f"{table}.json.gz")
+            started = time.perf_counter()
+            with gzip.open(json_path, "wt", encoding="utf-8", compresslevel=6) as f:
+                json.dump(records, f)
+            json_seconds = time.perf_counter() - started
+            started = time.perf_counter()
+            with gzip.open(json_path, "rt", encoding="utf-8") as f:
+                column = [record.get("VehicleID") for record in json.load(f)]
+            json_scan = time.perf_counter() - started
+
+            parquet_path = os.path.join(tmp, f"{table}.parquet")
+            started = time.perf_counter()
+            write_parquet(
+                parquet_path,
+                iter(records),
+                model=default_model("vcdb", table),
+                compression=args.compression,
+            )
+            parquet_seconds = time.perf_counter() - started
+            started = time.perf_counter()
+            names = pq.read_schema(parquet_path).names
+            column = pq.read_table(parquet_path, columns=names[-1:]).column(0)
+            parquet_scan = time.perf_counter() - started
+            del column
+
+            count = len(records)
+            print(
+                f"{table:<22} {count:>8,} rows | json.gz write "
+                f"{count / json_seconds:>9,.0f}/s "
+                f"{os.path.getsize(json_path) / 1e6:6.1f} MB scan {json_scan:5.2f}s"
+                f" | parquet write {count / parquet_seconds:>9,.0f}/s "
+                f"{os.path.getsize(parquet_path) / 1e6:6.1f} MB "
+                f"scan {parquet_scan:5.2f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
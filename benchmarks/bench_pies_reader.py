@@ -0,0 +1,48 @@
+"""Throughput benchmark for the streaming PIES reader.
+
+Usage: python -m benchmarks.bench_pies_reader --items 500000 --segments F01
+"""
+
+import argparse
+import os
+import resource
+import tempfile
+import time
+
+from autocare.standards.pies_reader import PIESReader
+from benchmarks.generate import write_pies
+
+
+def main() -> None:
+    """Generate a PIES file, stream it, and report items/sec and peak RSS."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=500_000)
+    parser.add_argument("--attributes", type=int, default=5)
+    parser.add_argument(
+        "--segments", nargs="*", help="Item segment codes to convert (default all)"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.xml")
+        write_pies(path, args.items, attributes_per_item=args.attributes)
+        size_mb = os.path.getsize(path) / 1e6
+
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        started = time.perf_counter()
+        values = 0
+        for item in PIESReader(path, segments=args.segments):
+            values += len(item.attributes)
+        elapsed = time.perf_counter() - started
+        rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    print(
+        f"parsed {args.items:,} items / {values:,} attribute values "
+        f"({size_mb:,.1f} MB) in {elapsed:.1f}s: "
+        f"{args.items / elapsed:,.0f} items/s, {size_mb / elapsed:,.1f} MB/s"
+    )
+    print(f"peak RSS growth during parse: {(rss_after - rss_before) / 1024:,.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Benchmark for row-by-row INSERT vs COPY loads into PostgreSQL.
+
+Needs a scratch database; the benchmark creates and drops its own schema.
+
+Usage: python -m benchmarks.bench_postgres_load --dsn postgresql://localhost/bench
+"""
+
+import argparse
+import os
+import time
+
+import psycopg
+
+from autocare.sinks.base import quote_identifier, rows
+from autocare.sinks.postgres import CopyFormat, PostgresLoader
+from benchmarks.generate import _vcdb_columns, paged_records, vcdb_records
+
+_SCHEMA = "autocare_bench"
+
+
+def _report(label: str, count: int, elapsed: float, baseline: float) -> None:
+    print(
+        f"{label:<24} {elapsed:6.2f}s  {count / elapsed:>10,.0f} rows/s  "
+        f"{baseline / elapsed:5.1f}x"
+    )
+
+
+def main() -> None:
+    """Load one large synthetic VCdb table each way and report rows/s."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dsn", default=os.getenv("AUTOCARE_BENCH_POSTGRES_DSN"))
+    parser.add_argument("--table", default="VehicleToEngineConfig")
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--insert-rows", type=int, default=20_000)
+    parser.add_argument(
+        "--page-latency", type=float, default=0.0, help="seconds per 1000-row page"
+    )
+    args = parser.parse_args()
+    if not args.dsn:
+        parser.error("--dsn or AUTOCARE_BENCH_POSTGRES_DSN is required")
+
+    table = args.table
+    records = list(vcdb_records(table, args.scale))
+    columns = _vcdb_columns(table)
+    names = [name for name, _ in columns]
+
+    with psycopg.connect(args.dsn, autocommit=True) as conn:
+        conn.execute(f"DROP SCHEMA IF EXISTS {_SCHEMA} CASCADE")
+        conn.execute(f"CREATE SCHEMA {_SCHEMA}")
+        loader = PostgresLoader(conn, schema=_SCHEMA)
+        try:
+            # Row-by-row INSERTs on a sample, extrapolated to rows/s
+            loader.load(table, [], columns=names)
+            sample = records[: args.insert_rows]
+            statement = (
+                f"INSERT INTO {_SCHEMA}.{quote_identifier(table)} VALUES "
+                f"({', '.join(['%s'] * len(names))})"
+            )
+            started = time.perf_counter()
+            with conn.transaction(), conn.cursor() as cursor:
+                for row in rows(sample, names):
+                    cursor.execute(statement, row)
+            insert_rate = len(sample) / (time.perf_counter() - started)
+            baseline = len(records) / insert_rate
+            _report("row-by-row INSERT", len(records), baseline, baseline)
+
+            for copy_format in CopyFormat:
+                loader.format = copy_format
+                started = time.perf_counter()
+                count = loader.load(
+                    table,
+                    paged_records(records, 1000, args.page_latency),
+                    columns=names,
+                )
+                _report(
+                    f"COPY {copy_format.value}",
+                    count,
+                    time.perf_counter() - started,
+                    baseline,
+                )
+        finally:
+            conn.execute(f"DROP SCHEMA {_SCHEMA} CASCADE")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark for loading the full VCdb table set into SQLite.
+
+Usage: python -m benchmarks.bench_sqlite_load --scale 1.0
+"""
+
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+
+from autocare.databases import vcdb
+from autocare.sinks.base import default_model
+from autocare.sinks.sqlite import SQLiteLoader, create_table_sql
+from benchmarks.generate import _vcdb_columns, vcdb_records
+
+
+def _naive_load(path: str, table: str, records: list) -> None:
+    """Row-at-a-time inserts with default pragmas, for comparison."""
+    columns = _vcdb_columns(table)
+    names = [name for name, _ in columns]
+    conn = sqlite3.connect(path)
+    conn.execute(create_table_sql(table, columns))
+    for record in records:
+        conn.execute(
+            f"INSERT INTO {table} VALUES ({', '.join('?' * len(names))})",
+            [record.get(name) for name in names],
+        )
+    conn.commit()
+    conn.close()
+
+
+def main() -> None:
+    """Load synthetic VCdb tables and report per-table and total rows/s."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--no-index", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "vcdb.sqlite")
+        total_rows = 0
+        load_seconds = 0.0
+        with SQLiteLoader(path, index=not args.no_index) as loader:
+            for table in vcdb.TABLES:
+                records = list(vcdb_records(table, args.scale))
+                started = time.perf_counter()
+                count = loader.load(table, records, model=default_model("vcdb", table))
+                elapsed = time.perf_counter() - started
+                load_seconds += elapsed
+                total_rows += count
+                if count >= 10_000:
+                    print(
+                        f"{table:<28} {count:>9,} rows {elapsed:6.2f}s "
+                        f"{count / elapsed:>12,.0f} rows/s"
+                    )
+            started = time.perf_counter()
+        # close() ran on context exit: indexes, ANALYZE and the file swap
+        finish_seconds = time.perf_counter() - started
+
+        print(
+            f"{len(vcdb.TABLES)} tables, {total_rows:,} rows: load "
+            f"{load_seconds:.2f}s ({total_rows / load_seconds:,.0f} rows/s), "
+            f"index + swap {finish_seconds:.2f}s, "
+            f"{os.path.getsize(path) / 1e6:.0f} MB"
+        )
+
+        table = "VehicleToEngineConfig"
+        records = list(vcdb_records(table, args.scale))
+        naive_path = os.path.join(tmp, "naive.sqlite")
+        started = time.perf_counter()
+        _naive_load(naive_path, table, records)
+        elapsed = time.perf_counter() - started
+        print(f"{table} row-at-a-time baseline: {len(records) / elapsed:,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+"""End-to-end throughput suite against the offline mock AutoCare server.
+
+Starts a MockAutoCareServer on a free local port and measures, through the
+real client and HTTP stack:
+
+    fetch            fetch_records() of raw dicts
+    fetch+model      fetch_records(model=...) (model conversion)
+    padb+model       the same over PAdb PartAttributeAssignment records
+    fetch+latency    fetch_records() with --latency seconds per request
+    fetch+faults     fetch_records() with 500s and 429s injected (retries)
+    migrate          migrate_vcdb_records() 1.0 -> 2.0 over fetched records
+    migrate+padb     migrate_padb_records() 4.0 -> 5.0 over PAdb records
+    sqlite           load_sqlite()
+    dump             dump_tables() to NDJSON
+    parquet          export_parquet() (skipped without pyarrow)
+
+Fetch scenarios also report the FetchStats split of wall time. Results can
+be saved with --json and compared with a saved run with --baseline; the
+suite exits with status 1 when any scenario's records/s falls more than
+--tolerance below the baseline.
+
+Usage: python -m benchmarks.bench_suite --scale 0.2 --json bench.json
+       python -m benchmarks.bench_suite --baseline bench.json --tolerance 0.2
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from autocare.compatibility.field_mapping import (
+    migrate_padb_records,
+    migrate_vcdb_records,
+)
+from autocare.sinks.base import default_model
+from autocare.sinks.dump import dump_tables
+from autocare.sinks.sqlite import load_sqlite
+from autocare.stats import FetchStats
+from benchmarks.mock_server import MockAutoCareServer, MockConfig
+
+_TABLE = "Vehicle"
+_PADB_TABLE = "PartAttributeAssignment"
+
+# (records, elapsed seconds, FetchStats of the run if it was a fetch)
+Result = Tuple[int, float, Optional[FetchStats]]
+
+
+def _fetch(
+    server: MockAutoCareServer,
+    args: argparse.Namespace,
+    db_name: str = "vcdb",
+    table: str = _TABLE,
+    **kwargs: Any,
+):
+    """Scenario fetching a table once with the given fetch_records() kwargs."""
+
+    def run() -> Result:
+        client = server.client()
+        stats = FetchStats()
+        count = sum(
+            1
+            for _ in client.fetch_records(
+                db_name, table, page_size=args.page_size, stats=stats, **kwargs
+            )
+        )
+        return count, stats.elapsed, stats
+
+    return run
+
+
+def _with_config(server: MockAutoCareServer, run: Callable[[], Result], **config):
+    """Scenario running another with server settings changed for its duration."""
+
+    def wrapped() -> Result:
+        saved = {name: getattr(server.config, name) for name in config}
+        for name, value in config.items():
+            setattr(server.config, name, value)
+        try:
+            return run()
+        finally:
+            for name, value in saved.items():
+                setattr(server.config, name, value)
+
+    return wrapped
+
+
+def _migrate(
+    server: MockAutoCareServer,
+    migrate: Callable[..., Any] = migrate_vcdb_records,
+    versions: Tuple[str, str] = ("1.0", "2.0"),
+    db_name: str = "vcdb",
+    table: str = _TABLE,
+) -> Callable[[], Result]:
+    def run() -> Result:
+        records = server.records(table, db_name)
+        started = time.perf_counter()
+        count = sum(1 for _ in migrate(records, *versions))
+        return count, time.perf_counter() - started, None
+
+    return run
+
+
+def _sink(
+    server: MockAutoCareServer, args: argparse.Namespace, tmp: str, name: str
+) -> Callable[[], Result]:
+    def run() -> Result:
+        client = server.client()
+        path = os.path.join(tmp, name)
+        started = time.perf_counter()
+        if name == "sqlite":
+            counts = load_sqlite(
+                client, path, "vcdb", tables=[_TABLE], page_size=args.page_size
+            )
+        elif name == "dump":
+            manifests = dump_tables(
+                client, path, "vcdb", tables=[_TABLE], page_size=args.page_size
+            )
+            counts = {table: m.records for table, m in manifests.items()}
+        else:
+            from autocare.sinks.parquet import export_parquet
+
+            counts = export_parquet(
+                client, path, "vcdb", tables=[_TABLE], page_size=args.page_size
+            )
+        return sum(counts.values()), time.perf_counter() - started, None
+
+    return run
+
+
+def _parquet_available() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _best(run: Callable[[], Result], repeat: int) -> Result:
+    """Fastest of repeat runs."""
+    return min((run() for _ in range(repeat)), key=lambda result: result[1])
+
+
+def _compare(
+    results: Dict[str, Dict[str, Any]], baseline: Dict[str, Any], tolerance: float
+) -> List[str]:
+    """Scenarios whose records/s fell more than tolerance below the baseline."""
+    failures = []
+    for name, result in results.items():
+        before = baseline.get("results", {}).get(name)
+        if not before:
+            continue
+        floor = before["records_per_second"] * (1 - tolerance)
+        if result["records_per_second"] < floor:
+            failures.append(
+                f"{name}: {result['records_per_second']:,.0f} records/s, "
+                f"baseline {before['records_per_second']:,.0f} "
+                f"(tolerance {tolerance:.0%})"
+            )
+    return failures
+
+
+def main() -> None:
+    """Run every scenario against a mock server and report records/s."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scale", type=float, default=0.2)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.005)
+    parser.add_argument("--error-rate", type=float, default=0.02)
+    parser.add_argument("--throttle-rate", type=float, default=0.05)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", nargs="*", help="Scenario names to run")
+    parser.add_argument("--json", help="Write results to this file")
+    parser.add_argument("--baseline", help="Compare with results saved by --json")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    with (
+        MockAutoCareServer(MockConfig(scale=args.scale)) as server,
+        tempfile.TemporaryDirectory() as tmp,
+    ):
+        fetch = _fetch(server, args)
+        scenarios: Dict[str, Callable[[], Result]] = {
+            "fetch": fetch,
+            "fetch+model": _fetch(server, args, model=default_model("vcdb", _TABLE)),
+            "padb+model": _fetch(
+                server,
+                args,
+                "padb",
+                _PADB_TABLE,
+                model=default_model("padb", _PADB_TABLE),
+            ),
+            "fetch+latency": _with_config(server, fetch, latency=args.latency),
+            "fetch+faults": _with_config(
+                server,
+                fetch,
+                error_rate=args.error_rate,
+                throttle_rate=args.throttle_rate,
+            ),
+            "migrate": _migrate(server),
+            "migrate+padb": _migrate(
+                server, migrate_padb_records, ("4.0", "5.0"), "padb", _PADB_TABLE
+            ),
+            "sqlite": _sink(server, args, tmp, "sqlite"),
+            "dump": _sink(server, args, tmp, "dump"),
+        }
+        if _parquet_available():
+            scenarios["parquet"] = _sink(server, args, tmp, "parquet")
+        if args.only:
+            scenarios = {k: v for k, v in scenarios.items() if k in args.only}
+
+        # Generates the records and fills the server's page cache
+        fetch()
+        print(f"{len(server.records(_TABLE)):,} vcdb.{_TABLE} records on {server.url}")
+
+        results: Dict[str, Dict[str, Any]] = {}
+        for name, run in scenarios.items():
+            count, elapsed, stats = _best(run, args.repeat)
+            rate = count / elapsed if elapsed else 0.0
+            print(f"{name:<16} {elapsed:7.3f}s {rate:>12,.0f} records/s")
+            results[name] = {
+                "records": count,
+                "elapsed": elapsed,
+                "records_per_second": rate,
+            }
+            if stats is not None:
+                results[name]["fetch"] = stats.to_dict()
+                print(
+                    f"{'':<16} network {stats.network_seconds / elapsed:5.1%}  "
+                    f"decode {stats.decode_seconds / elapsed:5.1%}  "
+                    f"convert {stats.convert_seconds / elapsed:5.1%}  "
+                    f"retries {stats.retries}"
+                )
+
+    report = {"scale": args.scale, "page_size": args.page_size, "results": results}
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    failures: List[str] = []
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            failures = _compare(results, json.load(f), args.tolerance)
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+"""Synthetic ACES / PIES files and VCdb / PCdb / PAdb records for benchmarks."""
+
+import gzip
+import random
+import time
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple
+
+from autocare.sinks.base import default_model, model_columns
+
+_HEADER = """<Header>
+<Company>Benchmark Parts Co</Company>
+<SenderName>Benchmark</SenderName>
+<SenderPhone>555-0100</SenderPhone>
+<TransferDate>2026-01-28</TransferDate>
+<BrandAAIAID>BBBB</BrandAAIAID>
+<DocumentTitle>Generated benchmark file</DocumentTitle>
+<EffectiveDate>2026-01-28</EffectiveDate>
+<SubmissionType>FULL</SubmissionType>
+<VcdbVersionDate>2026-01-01</VcdbVersionDate>
+<QdbVersionDate>2026-01-01</QdbVersionDate>
+<PcdbVersionDate>2026-01-01</PcdbVersionDate>
+</Header>
+"""
+
+
+def write_aces(
+    path: str,
+    apps: int,
+    version: str = "4.2",
+    seed: int = 1,
+    stream: Optional[IO[str]] = None,
+) -> None:
+    """
+    Write a synthetic ACES document with the given number of apps.
+
+    Args:
+        path: Output path (".gz" is compressed)
+        apps: Number of <App> elements to write
+        version: "4.2" or "5.0" element and attribute names
+        seed: Random seed so runs are reproducible
+        stream: Optional already-open text stream (path is then ignored)
+    """
+    rng = random.Random(seed)
+    part_tag = "Part" if version == "4.2" else "PartNumber"
+    part_type_tag = "PartType" if version == "4.2" else "PartTerminology"
+    brand_attribute = "BrandAAIAID" if version == "4.2" else "BrandID"
+
+    if stream is None:
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "wt", encoding="utf-8") as f:  # type: ignore[operator]
+            write_aces(path, apps, version, seed, stream=f)
+        return
+
+    stream.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+    stream.write(f'<ACES version="{version}">\n{_HEADER}')
+    write = stream.write
+    for app_id in range(1, apps + 1):
+        qualifier = ""
+        if app_id % 4 == 0:
+            qualifier = (
+                f'<Qual id="{rng.randint(1, 9000)}"><param value="17"/>'
+                "<text>With 17 Inch Wheels</text></Qual>"
+            )
+        note = "<Note>Bench note</Note>" if app_id % 3 == 0 else ""
+        write(
+            f'<App action="A" id="{app_id}">'
+            f'<BaseVehicle id="{rng.randint(1, 150000)}"/>'
+            f'<SubModel id="{rng.randint(1, 2000)}"/>'
+            f"{note}{qualifier}"
+            f"<Qty>{rng.randint(1, 4)}</Qty>"
+            f'<{part_type_tag} id="{rng.randint(1, 20000)}"/>'
+            f'<Position id="{rng.randint(1, 100)}"/>'
+            f'<{part_tag} {brand_attribute}="BBBB">P{rng.randint(1, 500000)}'
+            f"</{part_tag}>"
+            "</App>\n"
+        )
+    write(f"<Footer><RecordCount>{apps}</RecordCount></Footer>\n</ACES>\n")
+
+
+def write_pies(
+    path: str,
+    items: int,
+    attributes_per_item: int = 5,
+    version: str = "7.2",
+    seed: int = 1,
+) -> None:
+    """
+    Write a synthetic PIES document with the given number of items.
+
+    Args:
+        path: Output path (".gz" is compressed)
+        items: Number of <Item> elements to write
+        attributes_per_item: ProductAttribute segments per item
+        version: PIES version attribute
+        seed: Random seed so runs are reproducible
+    """
+    rng = random.Random(seed)
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "wt", encoding="utf-8") as stream:  # type: ignore[operator]
+        write = stream.write
+        write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        write(
+            f'<PIES version="{version}">\n<Header><PIESVersion>{version}'
+            "</PIESVersion></Header>\n<Items>\n"
+        )
+        for number in range(1, items + 1):
+            attributes = "".join(
+                f'<ProductAttribute AttributeID="{rng.randint(1, 3000)}" '
+                f'PADBAttribute="Y" RecordNumber="{i}">{rng.randint(1, 99)}'
+                "</ProductAttribute>"
+                for i in range(1, attributes_per_item + 1)
+            )
+            write(
+                f'<Item MaintenanceType="A"><PartNumber>P{number}</PartNumber>'
+                "<BrandAAIAID>BBBB</BrandAAIAID>"
+                f"<PartTerminologyID>{rng.randint(1, 20000)}</PartTerminologyID>"
+                '<Descriptions><Description DescriptionCode="DES" '
+                'LanguageCode="EN">Benchmark part</Description></Descriptions>'
+                '<Prices><Pricing PriceType="LST"><CurrencyCode>USD</CurrencyCode>'
+                f'<Price UOM="PE">{rng.randint(100, 99999) / 100}</Price>'
+                "</Pricing></Prices>"
+                f"<ProductAttributes>{attributes}</ProductAttributes>"
+                "<Packages><Package><PackageUOM>EA</PackageUOM>"
+                '<Dimensions UOM="IN"><MerchandisingHeight>2</MerchandisingHeight>'
+                "</Dimensions></Package></Packages>"
+                "</Item>\n"
+            )
+        write(f"</Items>\n<Trailer><ItemCount>{items}</ItemCount></Trailer>\n</PIES>\n")
+
+
+# Approximate row counts of a full VCdb release; other tables get 200 rows
+VCDB_TABLE_SIZES = {
+    "BaseVehicle": 80_000,
+    "Vehicle": 160_000,
+    "EngineConfig": 20_000,
+    "EngineConfig2": 20_000,
+    "EngineBase": 8_000,
+    "EngineBase2": 8_000,
+    "Model": 12_000,
+    "SubModel": 4_000,
+    "Transmission": 8_000,
+    "VehicleToBedConfig": 60_000,
+    "VehicleToBodyConfig": 220_000,
+    "VehicleToBodyStyleConfig": 180_000,
+    "VehicleToBrakeConfig": 200_000,
+    "VehicleToClass": 20_000,
+    "VehicleToDriveType": 200_000,
+    "VehicleToEngineConfig": 260_000,
+    "VehicleToMfrBodyCode": 120_000,
+    "VehicleToSpringTypeConfig": 120_000,
+    "VehicleToSteeringConfig": 180_000,
+    "VehicleToTransmission": 300_000,
+    "VehicleToWheelBase": 180_000,
+}
+
+
+# Approximate row counts of full PCdb / PAdb releases; other tables get 200 rows
+PCDB_TABLE_SIZES = {
+    "Categories": 60,
+    "Parts": 20_000,
+    "PartCategory": 25_000,
+    "PartsDescription": 8_000,
+    "PartPosition": 40_000,
+    "Positions": 400,
+    "Subcategories": 1_500,
+}
+
+PADB_TABLE_SIZES = {
+    "MetaUOMCodeAssignment": 40_000,
+    "PartAttributeAssignment": 300_000,
+    "PartAttributes": 3_000,
+    "ValidValueAssignment": 500_000,
+    "ValidValues": 60_000,
+}
+
+TABLE_SIZES = {
+    "vcdb": VCDB_TABLE_SIZES,
+    "pcdb": PCDB_TABLE_SIZES,
+    "padb": PADB_TABLE_SIZES,
+}
+
+
+def table_size(db_name: str, table: str, scale: float = 1.0) -> int:
+    """Number of records table_records() yields for a table at a scale."""
+    return max(1, int(TABLE_SIZES.get(db_name, {}).get(table, 200) * scale))
+
+
+def _columns(db_name: str, table: str) -> List[Tuple[str, Any]]:
+    """Column names and types for a table, from its model if it has one."""
+    model = default_model(db_name, table)
+    if model is not None:
+        return model_columns(model)
+    if table.startswith("VehicleTo"):
+        target = table[len("VehicleTo") :]
+        return [
+            (f"{table}ID", int),
+            ("VehicleID", int),
+            (f"{target}ID", int),
+            ("Source", str),
+        ]
+    return [(f"{table}ID", int), (f"{table}Name", str), ("CultureID", str)]
+
+
+def _vcdb_columns(table: str) -> List[Tuple[str, Any]]:
+    """Column names and types for a VCdb table."""
+    return _columns("vcdb", table)
+
+
+def table_records(
+    db_name: str, table: str, scale: float = 1.0, seed: int = 1
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield API-shaped records for a synthetic table of any database.
+
+    Args:
+        db_name: Database name (e.g. "vcdb", "padb")
+        table: Table name
+        scale: Multiplier on the approximate full-release row count
+        seed: Random seed so runs are reproducible
+    """
+    rng = random.Random(seed)
+    columns = _columns(db_name, table)
+    primary = f"{table}ID"
+    for number in range(1, table_size(db_name, table, scale) + 1):
+        record: Dict[str, Any] = {}
+        for name, kind in columns:
+            if name == primary:
+                record[name] = number
+            elif name == "CultureID":
+                record[name] = "en-US"
+            elif name.endswith("DateTime"):
+                record[name] = "2026-01-01T00:00:00" if name[0] == "E" else "null"
+            elif kind is int:
+                record[name] = rng.randint(1, 50_000)
+            else:
+                record[name] = f"{name} {rng.randint(1, 5_000)}"
+        yield record
+
+
+def vcdb_records(
+    table: str, scale: float = 1.0, seed: int = 1
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield API-shaped records for a synthetic VCdb table.
+
+    Args:
+        table: VCdb table name
+        scale: Multiplier on the approximate full-release row count
+        seed: Random seed so runs are reproducible
+    """
+    return table_records("vcdb", table, scale, seed)
+
+
+def paged_records(
+    records: List[Dict[str, Any]], page_size: int = 1000, latency: float = 0.0
+) -> Iterator[Dict[str, Any]]:
+    """Replay records as API pages, sleeping per page like a fetch would."""
+    for start in range(0, len(records), page_size):
+        if latency:
+            time.sleep(latency)
+        yield from records[start : start + page_size]
@@ -0,0 +1,369 @@
+"""Offline stand-in for the AutoCare API, for benchmarks and local testing.
+
+Serves the token endpoint, /databases, /databases/<db>/tables and paginated
+VCdb, PCdb and PAdb record endpoints with an X-Pagination header, using the
+synthetic records from benchmarks.generate or a record factory of your own.
+Latency per request, default page size, record volume (scale), the tables
+served per database and the share of record requests answered with 500 or
+429 are configurable. Pages are encoded once and cached, so the server
+adds little CPU of its own to a benchmark.
+
+In-process:
+    with MockAutoCareServer(MockConfig(scale=0.1, latency=0.005)) as server:
+        client = server.client()
+        records = client.fetch_all_records("vcdb", "Vehicle")
+
+Standalone (keeps the server's CPU out of the client's process):
+    python -m benchmarks.mock_server --port 8080 --scale 1.0
+    AutoCareAPI(..., **client_urls("http://127.0.0.1:8080"))
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from autocare.client import AutoCareAPI
+from autocare.databases import padb, pcdb, vcdb
+from benchmarks.generate import table_records, table_size
+
+DATABASES = ("vcdb", "pcdb", "padb", "qdb", "brand")
+MAX_PAGE_SIZE = 10_000
+_TOKEN = "mock-access-token"
+
+# (database, table, scale, seed) -> API-shaped record dicts
+RecordFactory = Callable[[str, str, float, int], Iterable[Dict[str, Any]]]
+
+
+@dataclass
+class MockConfig:
+    """Behavior of a MockAutoCareServer.
+
+    Attributes:
+        scale: Multiplier on the approximate full-release VCdb row counts
+        page_size: Records per page when the request has no pageSize
+        latency: Seconds each request waits before answering
+        error_rate: Share of record requests answered 500
+        throttle_rate: Share of record requests answered 429 (Retry-After 0)
+        token_ttl: expires_in of issued tokens, in seconds
+        seed: Seed for records and for which requests fail
+        tables: VCdb tables served; default: every table in vcdb.TABLES
+        databases: Tables served for other databases; default: every
+                   PCdb and PAdb table
+        record_factory: Builds a table's records, called once per table;
+                        default: benchmarks.generate.table_records
+    """
+
+    scale: float = 0.05
+    page_size: int = 1000
+    latency: float = 0.0
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    token_ttl: int = 3600
+    seed: int = 1
+    tables: List[str] = field(default_factory=lambda: list(vcdb.TABLES))
+    databases: Dict[str, List[str]] = field(
+        default_factory=lambda: {"pcdb": list(pcdb.TABLES), "padb": list(padb.TABLES)}
+    )
+    record_factory: Optional[RecordFactory] = None
+
+
+@dataclass
+class MockStats:
+    """Requests answered by a MockAutoCareServer."""
+
+    requests: int = 0
+    tokens: int = 0
+    pages: int = 0
+    errors: int = 0
+    throttles: int = 0
+    unauthorized: int = 0
+
+
+def client_urls(url: str) -> Dict[str, str]:
+    """AutoCareAPI base_url / auth_url / record_url arguments for a server."""
+    url = url.rstrip("/")
+    return {
+        "base_url": f"{url}/api/v1.0",
+        "auth_url": f"{url}/connect/token",
+        "record_url": f"{url}/{{subdomain}}/api/v{{version}}/{{db}}/{{table}}",
+    }
+
+
+class MockAutoCareServer:
+    """Threaded HTTP server emulating the AutoCare endpoints."""
+
+    def __init__(
+        self,
+        config: Optional[MockConfig] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """
+        Initialize the server (call start() or use it as a context manager).
+
+        Args:
+            config: Server behavior; defaults to MockConfig()
+            host: Interface to bind
+            port: Port to bind; 0 picks a free one
+        """
+        self.config = config or MockConfig()
+        self.stats = MockStats()
+        self._lock = threading.Lock()
+        self._rng = random.Random(self.config.seed)
+        self._records: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        self._pages: Dict[Tuple[str, str, int, int], bytes] = {}
+        self._httpd = ThreadingHTTPServer((host, port), _handler(self))
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockAutoCareServer":
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever,
+            args=(0.05,),
+            name="mock-autocare",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve requests on the calling thread until interrupted."""
+        try:
+            self._httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._httpd.server_close()
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "MockAutoCareServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def client(self, **kwargs: Any) -> AutoCareAPI:
+        """AutoCareAPI pointed at this server (credentials are not checked)."""
+        return AutoCareAPI(
+            "mock", "mock", "mock", "mock", **client_urls(self.url), **kwargs
+        )
+
+    def tables(self, db_name: str) -> List[str]:
+        """Tables served for a database."""
+        db_name = db_name.lower()
+        if db_name == "vcdb":
+            return self.config.tables
+        return self.config.databases.get(db_name, [])
+
+    def records(self, table: str, db_name: str = "vcdb") -> List[Dict[str, Any]]:
+        """Every record of a served table."""
+        key = (db_name.lower(), table)
+        config = self.config
+        with self._lock:
+            records = self._records.get(key)
+            if records is None:
+                factory = config.record_factory or table_records
+                records = list(factory(key[0], table, config.scale, config.seed))
+                self._records[key] = records
+            return records
+
+    def record_count(self, table: str, db_name: str = "vcdb") -> int:
+        """Number of records of a served table, without building them if known."""
+        if self.config.record_factory is None:
+            return table_size(db_name.lower(), table, self.config.scale)
+        return len(self.records(table, db_name))
+
+    def page(
+        self, table: str, number: int, size: int, db_name: str = "vcdb"
+    ) -> Tuple[bytes, int]:
+        """Encoded page body and the table's record count."""
+        records = self.records(table, db_name)
+        key = (db_name.lower(), table, number, size)
+        body = self._pages.get(key)
+        if body is None:
+            start = (number - 1) * size
+            body = json.dumps(records[start : start + size]).encode("utf-8")
+            with self._lock:
+                self._pages[key] = body
+        return body, len(records)
+
+    def fault(self) -> Optional[int]:
+        """Status of an injected failure for a record request, if any."""
+        with self._lock:
+            roll = self._rng.random()
+        if roll < self.config.throttle_rate:
+            return 429
+        if roll < self.config.throttle_rate + self.config.error_rate:
+            return 500
+        return None
+
+    def count(self, **counters: int) -> None:
+        with self._lock:
+            for name, value in counters.items():
+                setattr(self.stats, name, getattr(self.stats, name) + value)
+
+
+def _handler(server: MockAutoCareServer) -> type:
+    """Request handler class bound to a server."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body go out in separate writes; without this, delayed
+        # ACKs add ~40 ms to every small response
+        disable_nagle_algorithm = True
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+        def _send(
+            self,
+            status: int,
+            body: bytes = b"",
+            headers: Optional[Dict[str, str]] = None,
+        ) -> None:
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _json(self, status: int, data: Any) -> None:
+            self._send(status, json.dumps(data).encode("utf-8"))
+
+        def _begin(self) -> None:
+            server.count(requests=1)
+            if server.config.latency:
+                time.sleep(server.config.latency)
+
+        def do_POST(self) -> None:
+            self._begin()
+            length = int(self.headers.get("Content-Length") or 0)
+            form = parse_qs(self.rfile.read(length).decode("utf-8"))
+            if urlsplit(self.path).path != "/connect/token":
+                return self._json(404, {"error": "Not found"})
+            if form.get("grant_type", [""])[0] not in ("password", "refresh_token"):
+                return self._json(400, {"error": "unsupported_grant_type"})
+            server.count(tokens=1)
+            self._json(
+                200,
+                {
+                    "access_token": _TOKEN,
+                    "expires_in": server.config.token_ttl,
+                    "refresh_token": "mock-refresh-token",
+                },
+            )
+
+        def do_GET(self) -> None:
+            self._begin()
+            if self.headers.get("Authorization") != f"Bearer {_TOKEN}":
+                server.count(unauthorized=1)
+                return self._json(401, {"error": "Unauthorized"})
+
+            parts = urlsplit(self.path)
+            segments = [s for s in parts.path.split("/") if s]
+            if segments == ["api", "v1.0", "databases"]:
+                return self._json(
+                    200, [{"databaseName": db, "version": ""} for db in DATABASES]
+                )
+            if segments[:3] == ["api", "v1.0", "databases"] and segments[4:] == [
+                "tables"
+            ]:
+                db_name = segments[3]
+                return self._json(
+                    200,
+                    [
+                        {
+                            "TableName": table,
+                            "recordCount": server.record_count(table, db_name),
+                        }
+                        for table in server.tables(db_name)
+                    ],
+                )
+            # /<subdomain>/api/v<version>/<db>/<table>
+            if (
+                len(segments) == 5
+                and segments[1] == "api"
+                and segments[4] in server.tables(segments[3])
+            ):
+                return self._records(parts.query, segments[3], segments[4])
+            self._json(404, {"error": f"Not found: {parts.path}"})
+
+        def _records(self, query: str, db_name: str, table: str) -> None:
+            status = server.fault()
+            if status == 429:
+                server.count(throttles=1)
+                return self._send(
+                    429, b'{"error": "Too many requests"}', {"Retry-After": "0"}
+                )
+            if status is not None:
+                server.count(errors=1)
+                return self._json(status, {"error": "Injected server error"})
+
+            params = parse_qs(query)
+            size = int(params.get("pageSize", [server.config.page_size])[0])
+            size = max(1, min(size, MAX_PAGE_SIZE))
+            number = max(1, int(params.get("pageNumber", ["1"])[0]))
+            body, total = server.page(table, number, size, db_name)
+            pages = max(1, -(-total // size))
+            link = f"{server.url}{urlsplit(self.path).path}?pageNumber={{}}&pageSize={size}"
+            pagination = {
+                "totalCount": total,
+                "pageSize": size,
+                "currentPage": number,
+                "totalPages": pages,
+                "previousPageLink": link.format(number - 1) if number > 1 else None,
+                "nextPageLink": link.format(number + 1) if number < pages else None,
+            }
+            server.count(pages=1)
+            self._send(200, body, {"X-Pagination": json.dumps(pagination)})
+
+    return Handler
+
+
+def main() -> None:
+    """Run a mock server in the foreground."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--scale", type=float, default=0.05)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    config = MockConfig(
+        scale=args.scale,
+        page_size=args.page_size,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+    )
+    server = MockAutoCareServer(config, args.host, args.port)
+    print(f"Mock AutoCare API on {server.url} (Ctrl+C to stop)")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,9 @@
+import logging
 import os
 from autocare.client import AutoCareAPI
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     client_id = os.getenv("AUTOCARE_CLIENT_ID")
     client_secret = os.getenv("AUTOCARE_CLIENT_SECRET")
     username = os.getenv("AUTOCARE_USERNAME")
@@ -0,0 +1,378 @@
+"""Tests for streaming, process-parallel and delta ACES reading and writing."""
+
+import gzip
+import io
+import pickle
+from unittest.mock import patch
+
+import pytest
+
+from autocare.client import DataValidationError
+from autocare.standards import aces_parallel
+from autocare.compatibility.aces_transform import transform_aces
+from autocare.standards.aces_delta import (
+    DeltaKind,
+    app_key,
+    diff_aces,
+    diff_baseline,
+    iter_baseline,
+    write_baseline,
+)
+from autocare.standards.aces_parallel import (
+    map_app_chunks,
+    plan_chunks,
+    transform_aces_parallel,
+)
+from autocare.standards.aces_writer import ACESWriter, write_aces
+from autocare.standards.aces_reader import ACESReader, App, AppQualifier, iter_apps
+
+ACES_42 = b"""<?xml version="1.0" encoding="UTF-8"?>
+<ACES version="4.2">
+  <Header>
+    <Company>Test Parts Co</Company>
+    <TransferDate>2026-01-28</TransferDate>
+  </Header>
+  <App action="A" id="1">
+    <BaseVehicle id="6036"/>
+    <SubModel id="20"/>
+    <EngineBase id="553"/>
+    <Note>Front Disc</Note>
+    <Qual id="1234"><param value="17"/><text>With 17 Inch Wheels</text></Qual>
+    <Qty>2</Qty>
+    <PartType id="1896"/>
+    <MfrLabel>Premium</MfrLabel>
+    <Position id="22"/>
+    <Part BrandAAIAID="BBBB">ABC123</Part>
+  </App>
+  <App action="D" id="2">
+    <Years from="2010" to="2012"/>
+    <Make id="54"/>
+    <Model id="664"/>
+    <Qty>1</Qty>
+    <PartType id="1684"/>
+    <Part>XYZ789</Part>
+  </App>
+  <Footer><RecordCount>2</RecordCount></Footer>
+</ACES>
+"""
+
+ACES_50 = b"""<?xml version="1.0" encoding="UTF-8"?>
+<ACES version="5.0">
+  <Header><Company>Test Parts Co</Company></Header>
+  <App action="A" id="1">
+    <BaseVehicle id="6036"/>
+    <Qty>1</Qty>
+    <PartTerminology id="1896"/>
+    <Position id="22"/>
+    <PartNumber BrandID="BBBB">ABC123</PartNumber>
+    <DisplayOrder>3</DisplayOrder>
+  </App>
+</ACES>
+"""
+
+
+class TestACESReader:
+    """Test incremental ACES parsing."""
+
+    def test_parse_v42_apps(self):
+        """Test typed App records from an ACES 4.2 document."""
+        reader = ACESReader(io.BytesIO(ACES_42))
+        apps = list(reader)
+
+        assert len(apps) == 2
+        first = apps[0]
+        assert isinstance(first, App)
+        assert first.id == "1"
+        assert first.action == "A"
+        assert first.base_vehicle_id == 6036
+        assert first.vehicle_attributes == {"SubModel": 20, "EngineBase": 553}
+        assert first.notes == ["Front Disc"]
+        assert first.qualifiers[0].qualifier_id == 1234
+        assert first.qualifiers[0].params == ["17"]
+        assert first.qualifiers[0].text == "With 17 Inch Wheels"
+        assert first.qty == 2
+        assert first.part_type_id == 1896
+        assert first.position_id == 22
+        assert first.part_number == "ABC123"
+        assert first.brand_id == "BBBB"
+        assert first.extra == {"MfrLabel": "Premium"}
+
+        second = apps[1]
+        assert second.base_vehicle_id is None
+        assert second.years == (2010, 2012)
+        assert second.vehicle_attributes == {"Make": 54, "Model": 664}
+
+    def test_header_footer_and_version(self):
+        """Test document metadata captured while streaming."""
+        reader = ACESReader(io.BytesIO(ACES_42))
+        list(reader)
+        assert reader.version == "4.2"
+        assert reader.header == {
+            "Company": "Test Parts Co",
+            "TransferDate": "2026-01-28",
+        }
+        assert reader.footer_record_count == 2
+        assert reader.app_count == 2
+
+    def test_parse_v50_apps(self):
+        """Test ACES 5.0 element and attribute names map to the same fields."""
+        apps = list(iter_apps(io.BytesIO(ACES_50)))
+        assert apps[0].part_number == "ABC123"
+        assert apps[0].part_type_id == 1896
+        assert apps[0].brand_id == "BBBB"
+        assert apps[0].display_order == 3
+
+    def test_small_chunks(self):
+        """Test that elements split across feed chunks parse correctly."""
+        apps = list(ACESReader(io.BytesIO(ACES_42), chunk_size=7))
+        assert [app.part_number for app in apps] == ["ABC123", "XYZ789"]
+
+    def test_gzip_path(self, tmp_path):
+        """Test reading a gzipped file by path."""
+        path = tmp_path / "fitment.xml.gz"
+        with gzip.open(path, "wb") as f:
+            f.write(ACES_50)
+        assert [app.part_number for app in iter_apps(str(path))] == ["ABC123"]
+
+    def test_unsupported_version(self):
+        """Test that an unsupported document version raises ValueError."""
+        document = ACES_50.replace(b'version="5.0"', b'version="3.0"')
+        with pytest.raises(ValueError, match="Unsupported ACES version"):
+            list(iter_apps(io.BytesIO(document)))
+
+
+def _count_apps(apps):
+    """Top-level chunk function so it can be sent to worker processes."""
+    return sum(1 for _ in apps)
+
+
+def _part_numbers(apps):
+    """Collect part numbers for one chunk."""
+    return [app.part_number for app in apps]
+
+
+class TestParallelACES:
+    """Test <App>-aligned chunking and process-parallel processing."""
+
+    def _write_document(self, tmp_path, apps=50, header="", between=""):
+        body = "".join(
+            f'{between}<App action="A" id="{i}"><BaseVehicle id="{i}"/><Qty>1</Qty>'
+            f'<PartType id="1896"/><Part BrandAAIAID="BBBB">P{i}</Part></App>\n'
+            for i in range(1, apps + 1)
+        )
+        path = tmp_path / "aces.xml"
+        path.write_text(
+            '<?xml version="1.0" encoding="UTF-8"?>\n<ACES version="4.2">\n'
+            f"{header}<Header><Company>Test</Company></Header>\n"
+            f"{body}<Footer><RecordCount>{apps}</RecordCount></Footer>\n</ACES>\n"
+        )
+        return path
+
+    def test_plan_chunks_aligned_on_apps(self, tmp_path):
+        """Test that every chunk starts on an <App> element."""
+        path = self._write_document(tmp_path)
+        plan = plan_chunks(path, chunk_count=7)
+        data = path.read_bytes()
+
+        assert len(plan.chunks) == 7
+        assert plan.prefix.endswith(b"</Header>\n")
+        for chunk in plan.chunks:
+            assert data[chunk.start : chunk.start + 5] == b"<App "
+        assert plan.chunks[-1].is_last
+        assert plan.chunks[-1].end == len(data)
+
+    def test_map_app_chunks_preserves_order(self, tmp_path):
+        """Test that results from worker processes merge in file order."""
+        path = self._write_document(tmp_path)
+        counts = list(map_app_chunks(path, _count_apps, workers=2))
+        assert sum(counts) == 50
+
+        part_numbers = [
+            number
+            for chunk in map_app_chunks(path, _part_numbers, workers=2)
+            for number in chunk
+        ]
+        assert part_numbers == [f"P{i}" for i in range(1, 51)]
+
+    def test_transform_parallel_matches_single_process(self, tmp_path):
+        """Test that parallel conversion output is byte-identical."""
+        path = self._write_document(tmp_path)
+        single = tmp_path / "single.xml"
+        parallel = tmp_path / "parallel.xml"
+
+        assert transform_aces(path, single) == 50
+        assert transform_aces_parallel(path, parallel, workers=2) == 50
+        assert parallel.read_bytes() == single.read_bytes()
+        assert not list(tmp_path.glob("parallel.xml.part*"))
+
+    def test_plan_chunks_skips_comments_and_cdata(self, tmp_path):
+        """Test that "<App" inside comments and CDATA never starts a chunk."""
+        commented = '<!-- <App action="D" id="0"><Qty>1</Qty></App> -->\n'
+        path = self._write_document(
+            tmp_path,
+            header="<!-- <App id='x'> -->",
+            between=commented + "<![CDATA[<App -->]]>\n",
+        )
+        plan = plan_chunks(path, chunk_count=40)
+        data = path.read_bytes()
+
+        assert len(plan.chunks) > 1
+        for chunk in plan.chunks:
+            assert data[chunk.start : chunk.start + 13] == b'<App action="'
+            assert data[chunk.start + 13] == ord("A")
+
+        single = tmp_path / "single.xml"
+        parallel = tmp_path / "parallel.xml"
+        assert transform_aces(path, single) == 50
+        assert transform_aces_parallel(path, parallel, workers=1) == 50
+        assert parallel.read_bytes() == single.read_bytes()
+
+    def test_transform_parallel_rejects_unsplittable_prefix(self, tmp_path):
+        """Test a clear error when the converted prefix has no </ACES> to cut."""
+        path = self._write_document(tmp_path)
+
+        def self_closing(source, destination, from_version, to_version):
+            destination.write(b'<ACES version="5.0"/>')
+            return 0
+
+        with patch.object(aces_parallel, "transform_aces", self_closing):
+            with pytest.raises(DataValidationError, match="closing </ACES> tag"):
+                transform_aces_parallel(path, tmp_path / "out.xml", workers=1)
+
+    def test_gzip_not_supported(self, tmp_path):
+        """Test that compressed inputs are rejected."""
+        with pytest.raises(ValueError, match="uncompressed"):
+            plan_chunks(tmp_path / "aces.xml.gz", chunk_count=2)
+
+
+def _delta_app(number, qty=1, notes=(), **kwargs):
+    """Build an App for delta tests."""
+    return App(
+        id=str(number),
+        base_vehicle_id=number,
+        part_type_id=1896,
+        part_number=f"P{number}",
+        qty=qty,
+        notes=list(notes),
+        **kwargs,
+    )
+
+
+class TestACESDelta:
+    """Test diffing two ACES submissions."""
+
+    @pytest.mark.parametrize("partitions", [1, 8])
+    def test_adds_deletes_and_modifications(self, partitions):
+        """Test that only changed apps are reported."""
+        old = [_delta_app(i) for i in range(20)]
+        new = [_delta_app(i, qty=4 if i == 5 else 1) for i in range(20) if i != 3]
+        new.append(_delta_app(99))
+
+        deltas = list(diff_aces(old, new, partitions=partitions))
+        changes = sorted((d.kind.value, (d.new or d.old).part_number) for d in deltas)
+        assert changes == [("add", "P99"), ("delete", "P3"), ("modify", "P5")]
+        modified = next(d for d in deltas if d.kind is DeltaKind.MODIFY)
+        assert (modified.old.qty, modified.new.qty) == (1, 4)
+
+    def test_canonical_ordering_ignored(self):
+        """Test attribute, qualifier and note order do not produce changes."""
+        old = _delta_app(
+            1,
+            notes=["Front", "Left"],
+            vehicle_attributes={"SubModel": 20, "EngineBase": 553},
+            qualifiers=[AppQualifier(1), AppQualifier(2, ["17"])],
+        )
+        new = _delta_app(
+            1,
+            notes=["Left", "Front"],
+            vehicle_attributes={"EngineBase": 553, "SubModel": 20},
+            qualifiers=[AppQualifier(2, ["17"]), AppQualifier(1)],
+        )
+        new.id, new.action = "77", "A"
+        assert app_key(old) == app_key(new)
+        assert list(diff_aces([old], [new], partitions=1)) == []
+
+    def test_repeated_keys(self):
+        """Test duplicate apps are matched one-to-one."""
+        old = [_delta_app(1), _delta_app(1, qty=2)]
+        new = [_delta_app(1, qty=2), _delta_app(1, qty=2)]
+        deltas = list(diff_aces(old, new, partitions=1))
+        assert [(d.kind, d.old.qty, d.new.qty) for d in deltas] == [
+            (DeltaKind.MODIFY, 1, 2)
+        ]
+
+    def test_documents_and_baseline(self, tmp_path):
+        """Test diffing XML documents and a stored baseline."""
+        new_document = ACES_42.replace(b"<Qty>2</Qty>", b"<Qty>3</Qty>")
+        baseline = tmp_path / "baseline.jsonl.gz"
+        assert write_baseline(io.BytesIO(ACES_42), baseline) == 2
+        assert [app for _, _, app in iter_baseline(baseline)] == list(
+            iter_apps(io.BytesIO(ACES_42))
+        )
+
+        for deltas in (
+            diff_aces(io.BytesIO(ACES_42), io.BytesIO(new_document)),
+            diff_baseline(baseline, io.BytesIO(new_document), workdir=tmp_path),
+        ):
+            deltas = list(deltas)
+            assert [(d.kind, d.new.part_number) for d in deltas] == [
+                (DeltaKind.MODIFY, "ABC123")
+            ]
+        assert list(tmp_path.iterdir()) == [baseline]
+
+    def test_invalid_baseline(self, tmp_path):
+        """Test that non-baseline files are rejected."""
+        path = tmp_path / "fitment.xml.gz"
+        with gzip.open(path, "wb") as f:
+            f.write(ACES_50)
+        with pytest.raises(ValueError, match="baseline"):
+            list(diff_baseline(path, []))
+
+        # Baselines are data only: a pickle payload is never unpickled
+        pickled = tmp_path / "baseline.pkl.gz"
+        with gzip.open(pickled, "wb") as f:
+            pickle.dump(("autocare-aces-baseline", 1), f)
+        with pytest.raises(ValueError, match="baseline"):
+            list(diff_baseline(pickled, []))
+
+
+class TestACESWriter:
+    """Test streaming ACES serialization."""
+
+    def test_round_trip_v50(self):
+        """Test apps read from 4.2 are written as 5.0 and read back unchanged."""
+        apps = list(iter_apps(io.BytesIO(ACES_42)))
+        out = io.BytesIO()
+        assert write_aces(out, iter(apps), header={"Company": "A & B"}) == 2
+
+        document = out.getvalue()
+        assert b'<ACES version="5.0">' in document
+        assert b'<PartNumber BrandID="BBBB">ABC123</PartNumber>' in document
+        assert b'<PartTerminology id="1896"/>' in document
+        assert b"<Company>A &amp; B</Company>" in document
+
+        reader = ACESReader(io.BytesIO(document))
+        assert list(reader) == apps
+        assert reader.footer_record_count == 2
+        assert reader.header == {"Company": "A & B"}
+
+    def test_v42_gzip_and_incremental_writes(self, tmp_path):
+        """Test 4.2 names, gzip output and write() one app at a time."""
+        path = tmp_path / "export.xml.gz"
+        apps = list(iter_apps(io.BytesIO(ACES_50)))
+        with ACESWriter(path, version="4.2") as writer:
+            for app in apps:
+                writer.write(app)
+
+        with gzip.open(path, "rb") as f:
+            document = f.read()
+        assert b'<Part BrandAAIAID="BBBB">ABC123</Part>' in document
+        assert b"<RecordCount>1</RecordCount>" in document
+        assert list(iter_apps(str(path))) == apps
+
+    def test_caller_stream_left_open(self):
+        """Test that a caller-provided stream is flushed but not closed."""
+        out = io.BytesIO()
+        write_aces(out, [], compresslevel=1)
+        assert not out.closed
+        assert b"<RecordCount>0</RecordCount>" in gzip.decompress(out.getvalue())
@@ -0,0 +1,277 @@
+"""Tests for the HTTP response and metadata caches."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from autocare.client import AutoCareAPI
+from autocare.http_cache import HTTPCache
+from autocare.lookup_cache import LookupCache
+from autocare.metadata_cache import MetadataCache
+
+VEHICLE_URL = "https://vcdb.autocarevip.com/api/v2.0/vcdb/Vehicle"
+TABLES_URL = "https://common.autocarevip.com/api/v1.0/databases/vcdb/tables"
+
+
+def _conditional(body, etag):
+    """requests-mock callback answering 304 when the ETag matches."""
+
+    def respond(request, context):
+        if request.headers.get("If-None-Match") == etag:
+            context.status_code = 304
+            return ""
+        context.headers["ETag"] = etag
+        return body
+
+    return respond
+
+
+class TestHTTPCache:
+    """Test the on-disk store and conditional requests through the client."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        with patch.object(AutoCareAPI, "authenticate", return_value="test-token"):
+            self.client = AutoCareAPI("id", "secret", "user", "pass")
+        self.client.token_expires_at = float("inf")
+        self.client.token = "test-token"
+
+    def teardown_method(self):
+        """Clean up after tests."""
+        self.client.close()
+
+    def test_key_ignores_parameter_order(self):
+        assert HTTPCache.key("u", {"a": 1, "b": 2}) == HTTPCache.key(
+            "u", {"b": 2, "a": 1}
+        )
+        assert HTTPCache.key("u", {"a": 1}) != HTTPCache.key("u")
+
+    def test_revalidates_and_serves_304_from_store(self, requests_mock, tmp_path):
+        cache = HTTPCache(tmp_path / "http.sqlite")
+        self.client.http_cache = cache
+        requests_mock.get(VEHICLE_URL, text=_conditional('[{"VehicleID": 1}]', '"v1"'))
+
+        first = list(self.client.fetch_records("vcdb", "Vehicle"))
+        second = list(self.client.fetch_records("vcdb", "Vehicle"))
+
+        assert first == second == [{"VehicleID": 1}]
+        assert requests_mock.last_request.headers["If-None-Match"] == '"v1"'
+        assert (cache.stats.hits, cache.stats.misses, cache.stats.stores) == (1, 1, 1)
+        assert cache.stats.hit_rate == 0.5
+        cache.close()
+
+    def test_store_persists_across_instances(self, tmp_path):
+        path = tmp_path / "http.sqlite"
+        cache = HTTPCache(path)
+        cache.put("k", "u", b"[]", {"Last-Modified": "Wed, 01 Jan 2026 00:00:00 GMT"})
+        cache.close()
+
+        reopened = HTTPCache(path)
+        entry = reopened.get("k")
+        assert entry.validators() == {
+            "If-Modified-Since": "Wed, 01 Jan 2026 00:00:00 GMT"
+        }
+        assert reopened.size == 2
+        reopened.close()
+
+    def test_responses_without_validators_are_not_stored(self, tmp_path):
+        cache = HTTPCache(tmp_path / "http.sqlite")
+        assert not cache.put("k", "u", b"[]", {"Content-Type": "application/json"})
+        assert len(cache) == 0
+        cache.close()
+
+    def test_lru_eviction(self, tmp_path):
+        cache = HTTPCache(tmp_path / "http.sqlite", max_bytes=250)
+        for key in ("a", "b"):
+            cache.put(key, key, b"x" * 100, {"ETag": key})
+        cache.get("a")
+        cache.put("c", "c", b"x" * 100, {"ETag": "c"})
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None and cache.get("c") is not None
+        assert cache.stats.evictions == 1
+        assert cache.size == 200
+        cache.close()
+
+    def test_client_opens_cache_from_path(self, tmp_path):
+        with patch.object(AutoCareAPI, "authenticate", return_value="test-token"):
+            client = AutoCareAPI(
+                "id", "secret", "user", "pass", http_cache=tmp_path / "c.sqlite"
+            )
+        assert isinstance(client.http_cache, HTTPCache)
+        client.close()
+        assert (tmp_path / "c.sqlite").exists()
+
+
+class TestMetadataCache:
+    """Test the TTL cache behind list_tables / get_table_info."""
+
+    TABLES = [
+        {"TableName": "Vehicle", "recordCount": 1000, "columns": ["VehicleID"]},
+        {"TableName": "Make", "recordCount": 50},
+    ]
+
+    def _client(self, **kwargs):
+        with patch.object(AutoCareAPI, "authenticate", return_value="test-token"):
+            client = AutoCareAPI("id", "secret", "user", "pass", **kwargs)
+        client.token_expires_at = float("inf")
+        client.token = "test-token"
+        return client
+
+    def test_table_lookups_share_one_request(self, requests_mock):
+        requests_mock.get(TABLES_URL, json=self.TABLES)
+        client = self._client()
+
+        assert [t.name for t in client.list_tables("vcdb")] == ["Vehicle", "Make"]
+        assert client.get_table_info("vcdb", "Vehicle").record_count == 1000
+        assert client.get_table_info("vcdb", "Missing") is None
+        described = client.describe_database("vcdb")
+        assert described["Vehicle"].columns == ["VehicleID"]
+        assert requests_mock.call_count == 1
+
+        client.list_tables("vcdb", refresh=True)
+        assert requests_mock.call_count == 2
+        client.close()
+
+    def test_expiry_and_invalidation(self, requests_mock):
+        requests_mock.get(TABLES_URL, json=self.TABLES)
+        client = self._client()
+
+        with patch("autocare.metadata_cache.time.time", return_value=1000.0):
+            client.list_tables("vcdb")
+        with patch("autocare.metadata_cache.time.time", return_value=1899.0):
+            client.list_tables("vcdb")
+        assert requests_mock.call_count == 1
+        with patch("autocare.metadata_cache.time.time", return_value=1900.0):
+            client.list_tables("vcdb")
+        assert requests_mock.call_count == 2
+
+        client.invalidate_metadata("VCDB")
+        client.list_tables("vcdb")
+        assert requests_mock.call_count == 3
+        client.close()
+
+    def test_ttl_zero_disables_cache(self, requests_mock):
+        requests_mock.get(TABLES_URL, json=self.TABLES)
+        client = self._client(metadata_ttl=0)
+        client.list_tables("vcdb")
+        client.list_tables("vcdb")
+        assert requests_mock.call_count == 2
+        assert len(client.metadata_cache) == 0
+        client.close()
+
+    def test_persists_across_clients(self, requests_mock, tmp_path):
+        requests_mock.get(TABLES_URL, json=self.TABLES)
+        path = tmp_path / "metadata.json"
+        self._client(metadata_cache_path=path).list_tables("vcdb")
+
+        client = self._client(metadata_cache_path=path)
+        info = client.get_table_info("vcdb", "Make")
+        assert (info.name, info.database, info.record_count) == ("Make", "vcdb", 50)
+        assert requests_mock.call_count == 1
+        client.close()
+
+    def test_ignores_unreadable_file(self, tmp_path):
+        path = tmp_path / "metadata.json"
+        path.write_text("{not json")
+        assert len(MetadataCache(path=path)) == 0
+
+
+def _reference_client(rows):
+    """Client stub whose fetch_records() replays rows for any table."""
+    client = MagicMock()
+    client.fetch_records.side_effect = lambda db, table, page_size=None: iter(rows)
+    return client
+
+
+class TestLookupCache:
+    """Test the two-tier per-ID lookup cache."""
+
+    MAKES = [
+        {"MakeID": 1, "MakeName": "Acura"},
+        {"MakeID": 2, "MakeName": "Honda"},
+        {"MakeID": "null", "MakeName": "Unknown"},
+    ]
+
+    def test_miss_loads_table_once(self):
+        client = _reference_client(self.MAKES)
+        cache = LookupCache(client)
+
+        assert cache.get("vcdb", "Make", 1)["MakeName"] == "Acura"
+        assert cache.get("VCdb", "Make", "2")["MakeName"] == "Honda"
+        assert cache.get("vcdb", "Make", 1)["MakeName"] == "Acura"
+        assert cache.get("vcdb", "Make", 99) is None
+
+        assert client.fetch_records.call_count == 1
+        stats = cache.stats
+        assert (stats.hits, stats.disk_hits, stats.misses, stats.loads) == (
+            1,
+            2,
+            1,
+            1,
+        )
+        assert stats.hit_rate == 0.25
+        cache.close()
+
+    def test_get_many_coalesces_misses(self):
+        client = _reference_client(self.MAKES)
+        cache = LookupCache(client)
+        cache.get("vcdb", "Make", 1)
+
+        rows = cache.get_many("vcdb", "Make", [1, 2, 2, 3])
+        assert {k: v["MakeName"] for k, v in rows.items()} == {1: "Acura", 2: "Honda"}
+        assert client.fetch_records.call_count == 1
+        assert (cache.stats.hits, cache.stats.disk_hits, cache.stats.misses) == (
+            1,
+            3,
+            1,
+        )
+        cache.close()
+
+    def test_size_based_eviction(self):
+        cache = LookupCache(_reference_client(self.MAKES), max_bytes=40)
+        cache.get_many("vcdb", "Make", [1, 2])
+
+        assert len(cache) == 1
+        assert cache.stats.evictions == 1
+        assert 0 < cache.stats.memory_bytes <= 40
+        # Evicted rows come back from the store without another load
+        assert cache.get("vcdb", "Make", 1)["MakeName"] == "Acura"
+        assert cache.stats.loads == 1
+        cache.close()
+
+    def test_store_persists_and_expires(self, tmp_path):
+        path = tmp_path / "lookup.sqlite"
+        LookupCache(_reference_client(self.MAKES), path).get("vcdb", "Make", 1)
+
+        client = _reference_client(self.MAKES)
+        cache = LookupCache(client, path, max_age=60)
+        assert cache.get("vcdb", "Make", 2)["MakeName"] == "Honda"
+        assert client.fetch_records.call_count == 0
+
+        cache.invalidate("vcdb", "Make")
+        with patch("autocare.lookup_cache.time.time", return_value=0.0):
+            cache.get("vcdb", "Make", 1)
+        assert client.fetch_records.call_count == 1
+        cache.get("vcdb", "Make", 3)
+        assert client.fetch_records.call_count == 2
+        cache.close()
+
+    def test_failed_load_keeps_previous_rows(self, tmp_path):
+        path = tmp_path / "lookup.sqlite"
+        LookupCache(_reference_client(self.MAKES), path).get("vcdb", "Make", 1)
+
+        def failing(db, table, page_size=None):
+            yield {"MakeID": 5, "MakeName": "Partial"}
+            raise ConnectionError("dropped")
+
+        client = MagicMock()
+        client.fetch_records.side_effect = failing
+        cache = LookupCache(client, path, max_age=0)
+        with pytest.raises(ConnectionError):
+            cache.get("vcdb", "Make", 1)
+
+        cache.max_age = None
+        assert cache.get("vcdb", "Make", 1)["MakeName"] == "Acura"
+        assert cache.get("vcdb", "Make", 5) is None
+        cache.close()
@@ -62,12 +62,17 @@ class TestAutoCarAPIInitialization:
                 max_retries=5,
                 base_url="https://custom.api.com",
                 auth_url="https://custom.auth.com",
+                record_url="http://localhost:8080/{subdomain}/v{version}/{db}/{table}",
             )
 
             assert client.scope == "custom-scope"
             assert client.timeout == 60
             assert client.base_url == "https://custom.api.com"
             assert client.auth_url == "https://custom.auth.com"
+            assert (
+                client._build_record_url("vcdb", "Vehicle", "2.0")
+                == "http://localhost:8080/vcdb/v2.0/vcdb/Vehicle"
+            )
 
             client.close()
 
@@ -1,10 +1,23 @@
 """Tests for field mapping / compatibility layer."""
 
+import gzip
+import io
+
 import pytest
 
+from autocare.compatibility.aces_transform import build_plan, main, transform_aces
 from autocare.compatibility.field_mapping import (
+    MIGRATIONS,
+    ConstantColumn,
+    MigrationPlan,
+    MigrationRegistry,
+    build_vcdb_plan,
     migrate_aces_record,
+    migrate_aces_records,
+    migrate_columns,
+    migrate_padb_records,
     migrate_vcdb_record,
+    migrate_vcdb_records,
     migrate_padb_record,
 )
 
@@ -158,3 +171,217 @@ class TestMigratePAdbRecord:
     def test_invalid_version(self):
         with pytest.raises(ValueError, match="Unsupported"):
             migrate_padb_record({}, from_version="1.0", to_version="5.0")
+
+
+class TestBatchMigration:
+    """Test precompiled batch and columnar migration."""
+
+    def test_records_match_single_record_migration(self):
+        """Test batch output equals per-record output for every direction."""
+        aces = [{"Part": f"P{i}", "BrandAAIAID": "BBBB", "Qty": i} for i in range(3)]
+        assert list(migrate_aces_records(aces, "4.2", "5.0")) == [
+            migrate_aces_record(r, "4.2", "5.0") for r in aces
+        ]
+
+        vcdb = [{"VehicleID": 1}, {"VehicleID": 2, "CultureID": "en-US"}]
+        for from_version, to_version in [
+            ("1.0", "2.0"),
+            ("2.0", "1.0"),
+            ("2.0", "2.0"),
+        ]:
+            assert list(migrate_vcdb_records(vcdb, from_version, to_version)) == [
+                migrate_vcdb_record(r, from_version, to_version) for r in vcdb
+            ]
+
+        padb = [{"PAID": 1, "EndDateTime": None}]
+        assert list(migrate_padb_records(padb, "5.0", "4.0")) == [
+            migrate_padb_record(padb[0], "5.0", "4.0")
+        ]
+
+    def test_records_are_copies(self):
+        """Test that source records are never modified."""
+        records = [{"Part": "A"}, {"Qty": 1}]
+        migrated = list(migrate_aces_records(records, "4.2", "5.0"))
+        assert migrated == [{"PartNumber": "A"}, {"Qty": 1}]
+        assert records == [{"Part": "A"}, {"Qty": 1}]
+        assert migrated[1] is not records[1]
+
+    def test_invalid_version_raises_on_call(self):
+        """Test that versions are validated before iteration starts."""
+        with pytest.raises(ValueError, match="Unsupported VCdb version"):
+            migrate_vcdb_records(iter([]), "3.0", "1.0")
+
+    def test_plan_is_compiled_once(self):
+        """Test plans are cached per version pair."""
+        plan = build_vcdb_plan("1.0", "2.0")
+        assert plan is build_vcdb_plan("1.0", "2.0")
+        assert plan.add_fields == ("CultureID", "EffectiveDateTime", "EndDateTime")
+
+    def test_migrate_columns(self):
+        """Test columns are renamed, dropped and added without copying."""
+        part = ["A", "B", "C"]
+        columns = migrate_columns(
+            {"Part": part, "Qty": [1, 2, 3]}, "aces", "4.2", "5.0"
+        )
+        assert list(columns) == ["PartNumber", "Qty"]
+        assert columns["PartNumber"] is part
+
+        columns = migrate_columns({"VehicleID": [1, 2]}, "vcdb", "1.0", "2.0")
+        culture = columns["CultureID"]
+        assert isinstance(culture, ConstantColumn)
+        assert len(culture) == 2 and list(culture) == [None, None]
+        assert culture[-1] is None and culture[:5] == [None, None]
+        with pytest.raises(IndexError):
+            culture[2]
+
+        stripped = migrate_columns(
+            {"PAID": [1], "EndDateTime": [None]}, "padb", "5.0", "4.0"
+        )
+        assert stripped == {"PAID": [1]}
+
+        with pytest.raises(ValueError, match="Unsupported migration kind"):
+            migrate_columns({}, "pcdb", "1.0", "1.0")
+
+
+def _registry_with_vcdb_30():
+    """Default VCdb steps plus a hypothetical 3.0 release."""
+    registry = MigrationRegistry()
+    registry.register("vcdb", "1.0", "2.0", build_vcdb_plan("1.0", "2.0"), "VCdb")
+    registry.register("vcdb", "2.0", "1.0", build_vcdb_plan("2.0", "1.0"))
+    registry.register(
+        "vcdb",
+        "2.0",
+        "3.0",
+        MigrationPlan(
+            renames={"SubModelID": "SubmodelID", "CultureID": "Culture"},
+            strip_fields=frozenset({"EndDateTime"}),
+            add_fields=("SourceSystem",),
+        ),
+    )
+    return registry
+
+
+class TestMigrationRegistry:
+    """Test multi-hop migration plans."""
+
+    def test_shortest_path(self):
+        """Test chained paths through intermediate versions."""
+        registry = _registry_with_vcdb_30()
+        assert registry.path("vcdb", "1.0", "3.0") == ["1.0", "2.0", "3.0"]
+        assert registry.path("vcdb", "2.0", "2.0") == ["2.0"]
+        assert registry.versions("vcdb") == ["1.0", "2.0", "3.0"]
+        with pytest.raises(ValueError, match="No VCdb migration path"):
+            registry.path("vcdb", "3.0", "1.0")
+        with pytest.raises(ValueError, match="Unsupported VCdb version"):
+            registry.plan("vcdb", "0.9", "3.0")
+        with pytest.raises(ValueError, match="Unsupported migration kind"):
+            registry.plan("qdb", "1.0", "2.0")
+
+    def test_fused_plan_matches_sequential_steps(self):
+        """Test that a fused plan equals applying each step in turn."""
+        registry = _registry_with_vcdb_30()
+        records = [
+            {"VehicleID": 1, "SubModelID": 20},
+            {"VehicleID": 2, "SubModelID": 21, "CultureID": "en-US"},
+        ]
+        fused = registry.plan("vcdb", "1.0", "3.0")
+        sequential = [
+            registry.plan("vcdb", "2.0", "3.0").apply(
+                registry.plan("vcdb", "1.0", "2.0").apply(record)
+            )
+            for record in records
+        ]
+        assert [fused.apply(record) for record in records] == sequential
+        assert sequential[1] == {
+            "VehicleID": 2,
+            "SubmodelID": 21,
+            "Culture": "en-US",
+            "EffectiveDateTime": None,
+            "SourceSystem": None,
+        }
+        assert fused is registry.plan("vcdb", "1.0", "3.0")
+
+    def test_round_trip_fuses_to_identity_renames(self):
+        """Test that 4.2 -> 5.0 -> 4.2 renames cancel out."""
+        plan = MIGRATIONS.plan("aces", "4.2", "5.0").then(
+            MIGRATIONS.plan("aces", "5.0", "4.2")
+        )
+        record = {"Part": "A", "BrandAAIAID": "BBBB", "Qty": 1}
+        assert plan.apply(record) == record
+
+    def test_default_registry(self):
+        """Test the built-in steps."""
+        assert MIGRATIONS.kinds() == ["aces", "padb", "vcdb"]
+        assert MIGRATIONS.versions("aces") == ["4.2", "5.0"]
+
+
+ACES_42_DOCUMENT = b"""<?xml version="1.0" encoding="UTF-8"?>
+<ACES version="4.2">
+<Header><Company>Parts &amp; Co</Company></Header>
+<App action="A" id="1"><BaseVehicle id="6036"/><Qual id="5"><param value="17" lang="en"/></Qual><PartType id="1896"/><Part BrandAAIAID="BBBB">ABC123</Part><References><DiagramReference file="d.jpg"/><AssetReference>a1</AssetReference><AssetReference>a2</AssetReference></References></App>
+</ACES>
+"""
+
+
+class TestTransformACESDocument:
+    """Test streaming ACES document conversion."""
+
+    def _transform(self, document, from_version, to_version):
+        source = io.BytesIO(document)
+        destination = io.BytesIO()
+        apps = transform_aces(source, destination, from_version, to_version)
+        return apps, destination.getvalue().decode("utf-8")
+
+    def test_v42_to_v50(self):
+        """Test element/attribute renames, removals and asset mapping."""
+        apps, output = self._transform(ACES_42_DOCUMENT, "4.2", "5.0")
+
+        assert apps == 1
+        assert '<ACES version="5.0">' in output
+        assert '<PartTerminology id="1896"/>' in output
+        assert '<PartNumber BrandID="BBBB">ABC123</PartNumber>' in output
+        assert '<param value="17"/>' in output
+        assert "<Company>Parts &amp; Co</Company>" in output
+        assert '<DiagramAsset file="d.jpg"/>' in output
+        assert (
+            "<NonDiagramAssets><NonDiagramAsset>a1</NonDiagramAsset>"
+            "<NonDiagramAsset>a2</NonDiagramAsset></NonDiagramAssets>"
+        ) in output
+        assert "References" not in output
+        assert "<Part " not in output
+
+    def test_round_trip(self):
+        """Test converting to 5.0 and back restores the 4.2 structure."""
+        _, v50 = self._transform(ACES_42_DOCUMENT, "4.2", "5.0")
+        _, v42 = self._transform(v50.encode("utf-8"), "5.0", "4.2")
+
+        assert '<ACES version="4.2">' in v42
+        assert '<Part BrandAAIAID="BBBB">ABC123</Part>' in v42
+        assert (
+            '<References><DiagramReference file="d.jpg"/>'
+            "<AssetReference>a1</AssetReference>"
+            "<AssetReference>a2</AssetReference></References>"
+        ) in v42
+
+    def test_invalid_version(self):
+        """Test that unsupported versions raise ValueError."""
+        with pytest.raises(ValueError, match="Unsupported"):
+            build_plan("3.0", "5.0")
+
+    def test_cli(self, tmp_path, capsys):
+        """Test the command-line entry point with gzip output."""
+        source = tmp_path / "in.xml"
+        source.write_bytes(ACES_42_DOCUMENT)
+        destination = tmp_path / "out.xml.gz"
+
+        assert main([str(source), str(destination), "--to", "5.0"]) == 0
+        assert "Converted 1 apps" in capsys.readouterr().out
+        with gzip.open(destination, "rt", encoding="utf-8") as f:
+            assert "<PartNumber" in f.read()
+
+    def test_cli_reports_malformed_xml(self, tmp_path, capsys):
+        """Test that malformed input returns a non-zero exit code."""
+        source = tmp_path / "in.xml"
+        source.write_bytes(b"<ACES><App></ACES>")
+        assert main([str(source), str(tmp_path / "out.xml")]) == 1
+        assert "Error" in capsys.readouterr().err
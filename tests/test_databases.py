@@ -1,5 +1,9 @@
 """Tests for database-specific modules and typed response models."""
 
+from unittest.mock import patch
+
+import pytest
+
 from autocare.databases.base import BaseModel, VersionedModel, CulturedModel
 from autocare.databases import vcdb, pcdb, padb, qdb, brand
 
@@ -260,6 +264,60 @@ class TestQdbModels:
         assert q.CultureID == "en-US"
 
 
+class TestQualifierRenderer:
+    """Test compiled Qdb qualifier rendering and reverse matching."""
+
+    def setup_method(self):
+        """Set up a renderer with API-shaped qualifier records."""
+        self.renderer = qdb.QualifierRenderer(
+            [
+                {"QualifierID": 1, "QualifierText": "CV Joint with <p1/>"},
+                {
+                    "QualifierID": 2,
+                    "QualifierText": 'With <p1 type="num"/> Inch Wheels',
+                },
+                {"QualifierID": 3, "QualifierText": "Heavy Duty"},
+                qdb.Qualifier(QualifierID=4, QualifierText='<p2/> to <p1 type="num"/>'),
+            ]
+        )
+
+    def test_compile_is_cached(self):
+        """Test that a template is parsed once per QualifierID."""
+        compiled = self.renderer.compile(2)
+        assert compiled.literals == ("With ", " Inch Wheels")
+        assert compiled.param_types == ("num",)
+        assert self.renderer.compile(2) is compiled
+
+    def test_render(self):
+        """Test rendering with positional parameters."""
+        assert self.renderer.render(2, [17]) == "With 17 Inch Wheels"
+        assert self.renderer.render(3) == "Heavy Duty"
+        assert self.renderer.render(4, [3, "Front"]) == "Front to 3"
+
+    def test_render_missing_params(self):
+        """Test that too few parameters raise ValueError."""
+        with pytest.raises(ValueError, match="expects 1 parameters"):
+            self.renderer.render(1, [])
+
+    def test_render_many(self):
+        """Test batch rendering preserves input order."""
+        rendered = self.renderer.render_many([(3, ()), (1, ["Boot"]), (2, ["16"])])
+        assert rendered == ["Heavy Duty", "CV Joint with Boot", "With 16 Inch Wheels"]
+
+    def test_match_rendered_text(self):
+        """Test reverse matching ignores case and spacing."""
+        assert self.renderer.match("with  18 inch wheels") == [(2, ["18"])]
+        assert self.renderer.match("HEAVY DUTY") == [(3, [])]
+        assert self.renderer.match("Rear to 2") == [(4, ["2", "Rear"])]
+        assert self.renderer.match("Unknown text") == []
+
+    def test_add_invalidates_index(self):
+        """Test that registering a template makes it matchable."""
+        assert self.renderer.match("Sport Package") == []
+        self.renderer.add(5, "Sport Package")
+        assert self.renderer.match("Sport Package") == [(5, [])]
+
+
 class TestBrandModels:
     """Test Brand models."""
 
@@ -299,3 +357,92 @@ class TestBrandModels:
         b = brand.Brand.from_dict(data)
         assert b.BrandID == "TEST"
         assert b.extra == {"NewV3Field": "future"}
+
+
+class TestBrandIndex:
+    """Test brand hierarchy index."""
+
+    def setup_method(self):
+        """Set up an index with API-shaped Brand Table rows."""
+        self.index = brand.BrandIndex(
+            [
+                {
+                    "ParentID": "PPPP",
+                    "ParentCompany": "Parent Co",
+                    "BrandID": "AAAA",
+                    "BrandName": "Alpha",
+                    "SubBrandID": "null",
+                    "SubBrandName": "null",
+                },
+                {
+                    "ParentID": "PPPP",
+                    "ParentCompany": "Parent Co",
+                    "BrandID": "AAAA",
+                    "BrandName": "Alpha",
+                    "SubBrandID": "AAA1",
+                    "SubBrandName": "Alpha Pro",
+                },
+                {
+                    "ParentID": "PPPP",
+                    "ParentCompany": "Parent Co",
+                    "BrandID": "BBBB",
+                    "BrandName": "Beta",
+                    "SubBrandID": "null",
+                    "SubBrandName": "null",
+                },
+            ]
+        )
+
+    def test_lookup_by_ids(self):
+        """Test O(1) lookups by BrandID, SubBrandID and ParentID."""
+        assert self.index.brand("AAAA").SubBrandID == "null"
+        assert self.index.sub_brand("aaa1").SubBrandName == "Alpha Pro"
+        assert len(self.index.brands_for_parent("PPPP")) == 3
+        assert [b.SubBrandID for b in self.index.sub_brands_for("AAAA")] == ["AAA1"]
+        assert self.index.brand("ZZZZ") is None
+
+    def test_find_by_name(self):
+        """Test case-insensitive name lookup."""
+        assert self.index.find_by_name("  alpha   PRO")[0].SubBrandID == "AAA1"
+        assert self.index.find_by_name("beta")[0].BrandID == "BBBB"
+        assert self.index.find_by_name("null") == []
+
+    def test_resolve_many(self):
+        """Test batch resolution of brand and sub-brand codes."""
+        resolved = self.index.resolve_many(["BBBB", "AAA1", "XXXX", None])
+        assert resolved[0].BrandName == "Beta"
+        assert resolved[1].SubBrandID == "AAA1"
+        assert resolved[2:] == [None, None]
+        assert self.index.resolve_brand_ids(["aaa1", "BBBB", "XXXX"]) == [
+            "AAAA",
+            "BBBB",
+            None,
+        ]
+
+    def test_save_and_load(self, tmp_path):
+        """Test persisted index round-trip."""
+        path = tmp_path / "brands.json"
+        self.index.save(path)
+        loaded = brand.BrandIndex.load(path)
+        assert len(loaded) == 3
+        assert loaded.resolve("AAA1").BrandID == "AAAA"
+        assert loaded.brand("BBBB").ParentCompany == "Parent Co"
+        assert [b.SubBrandID for b in loaded.sub_brands_for("AAAA")] == ["AAA1"]
+        assert len(loaded.brands_for_parent("pppp")) == 3
+        assert loaded.find_by_name("alpha pro")[0] is loaded.sub_brand("AAA1")
+
+    def test_load_does_not_rebuild(self, tmp_path):
+        """Test that load() restores the saved maps instead of re-indexing rows."""
+        path = tmp_path / "brands.json"
+        self.index.save(path)
+        with patch.object(brand.BrandIndex, "_add") as add:
+            loaded = brand.BrandIndex.load(path)
+        add.assert_not_called()
+        assert loaded.brand("AAAA").SubBrandID == "null"
+
+    def test_load_rejects_other_formats(self, tmp_path):
+        """Test that files from another format version are refused."""
+        path = tmp_path / "brands.json"
+        path.write_text('{"format_version": 99, "fields": [], "rows": []}')
+        with pytest.raises(ValueError, match="Unsupported BrandIndex format"):
+            brand.BrandIndex.load(path)
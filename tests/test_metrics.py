@@ -0,0 +1,231 @@
+"""Tests for instrumentation hooks, the metrics collector and fetch stats."""
+
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from autocare.client import APIConnectionError, AutoCareAPI
+from autocare.hooks import ClientHooks, HookedRetry, RetryEvent
+from autocare.metrics import Histogram, MetricsCollector
+from autocare.stats import FetchStats
+
+VEHICLE_URL = "https://vcdb.autocarevip.com/api/v2.0/vcdb/Vehicle"
+
+
+class Recorder(ClientHooks):
+    """Hooks that remember every event."""
+
+    def __init__(self):
+        self.events = []
+
+    def before_request(self, event):
+        self.events.append(("before", event.url))
+
+    def after_response(self, event):
+        self.events.append(("after", event.status_code, event.bytes, event.table))
+        self.last_response = event
+
+    def on_page(self, event):
+        self.events.append(("page", event.page, event.records))
+
+    def on_auth(self, refresh):
+        self.events.append(("auth", refresh))
+
+
+def _mock_pages(requests_mock):
+    requests_mock.get(
+        VEHICLE_URL,
+        json=[{"VehicleID": 1}, {"VehicleID": 2}],
+        headers={"X-Pagination": f'{{"nextPageLink": "{VEHICLE_URL}?page=2"}}'},
+    )
+    requests_mock.get(f"{VEHICLE_URL}?page=2", json=[{"VehicleID": 3}])
+
+
+class TestHooks:
+    """Test hook dispatch from the client."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.recorder = Recorder()
+        with patch.object(AutoCareAPI, "authenticate", return_value="test-token"):
+            self.client = AutoCareAPI(
+                "id", "secret", "user", "pass", hooks=[self.recorder]
+            )
+        self.client.token_expires_at = float("inf")
+        self.client.token = "test-token"
+
+    def teardown_method(self):
+        """Clean up after tests."""
+        self.client.close()
+
+    def test_request_and_page_events(self, requests_mock):
+        _mock_pages(requests_mock)
+        assert len(list(self.client.fetch_records("vcdb", "Vehicle"))) == 3
+
+        size = len(b'[{"VehicleID": 1}, {"VehicleID": 2}]')
+        assert self.recorder.events == [
+            ("before", VEHICLE_URL),
+            ("after", 200, size, "Vehicle"),
+            ("page", 1, 2),
+            ("before", f"{VEHICLE_URL}?page=2"),
+            ("after", 200, len(b'[{"VehicleID": 3}]'), "Vehicle"),
+            ("page", 2, 1),
+        ]
+
+    def test_connection_error_reported(self, requests_mock):
+        requests_mock.get(VEHICLE_URL, exc=requests.exceptions.ConnectTimeout)
+        with pytest.raises(APIConnectionError):
+            list(self.client.fetch_records("vcdb", "Vehicle"))
+        assert self.recorder.events[1] == ("after", None, 0, "Vehicle")
+        assert self.recorder.last_response.error == "ConnectTimeout"
+
+    def test_failing_hook_does_not_fail_request(self, requests_mock):
+        _mock_pages(requests_mock)
+
+        class Broken(ClientHooks):
+            def on_page(self, event):
+                raise RuntimeError("boom")
+
+        self.client.add_hook(Broken())
+        assert len(list(self.client.fetch_records("vcdb", "Vehicle"))) == 3
+
+    def test_auth_events(self, requests_mock):
+        requests_mock.post(
+            AutoCareAPI.AUTH_URL,
+            json={"access_token": "t", "expires_in": 3600, "refresh_token": "r"},
+        )
+        self.client.authenticate()
+        self.client.refresh_access_token()
+        assert self.recorder.events == [("auth", False), ("auth", True)]
+
+    def test_retry_policy_reports_retries(self):
+        events = []
+        retry = HookedRetry(
+            total=3, status_forcelist=[429], backoff_factor=0.5, notify=events.append
+        )
+        pool = SimpleNamespace(host="vcdb.autocarevip.com")
+        response = SimpleNamespace(status=429, get_redirect_location=lambda: None)
+        retry = retry.increment("GET", "/v", response=response, _pool=pool)
+        retry = retry.increment("GET", "/v", response=response, _pool=pool)
+
+        assert [e.attempt for e in events] == [1, 2]
+        assert events[1].throttled and events[1].host == "vcdb.autocarevip.com"
+        assert events[1].backoff == 1.0
+        assert retry.notify == events.append
+
+
+class TestMetricsCollector:
+    """Test metric aggregation and the Prometheus exporter."""
+
+    def test_histogram_buckets(self):
+        histogram = Histogram([0.1, 1.0])
+        for value in (0.05, 0.5, 0.7, 3.0):
+            histogram.observe(value)
+        assert histogram.cumulative() == [(0.1, 1), (1.0, 3)]
+        assert histogram.count == 4 and histogram.mean == pytest.approx(1.0625)
+
+    def test_collects_client_metrics(self, requests_mock):
+        metrics = MetricsCollector()
+        with patch.object(AutoCareAPI, "authenticate", return_value="test-token"):
+            client = AutoCareAPI("id", "secret", "user", "pass", hooks=[metrics])
+        client.token_expires_at = float("inf")
+        client.token = "test-token"
+        _mock_pages(requests_mock)
+        list(client.fetch_records("vcdb", "Vehicle"))
+        metrics.on_retry(RetryEvent("GET", "/v", "vcdb.autocarevip.com", 1, 429))
+        client.close()
+
+        target = (("host", "vcdb.autocarevip.com"), ("table", "Vehicle"))
+        assert metrics.latency[target].count == 2
+        assert metrics.records[(("db", "vcdb"), ("table", "Vehicle"))] == 3
+
+        text = metrics.to_prometheus()
+        labels = 'host="vcdb.autocarevip.com",table="Vehicle"'
+        assert (
+            f'autocare_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+        )
+        assert f"autocare_request_duration_seconds_count{{{labels}}} 2" in text
+        assert 'autocare_pages_total{db="vcdb",table="Vehicle"} 2' in text
+        status = 'host="vcdb.autocarevip.com",status="200"'
+        assert f"autocare_requests_total{{{status}}} 2" in text
+        assert 'autocare_throttles_total{host="vcdb.autocarevip.com"} 1' in text
+        assert "# TYPE autocare_retries_total counter" in text
+
+        metrics.reset()
+        assert not metrics.latency and not metrics.records
+
+
+class TestFetchStats:
+    """Test per-run statistics from fetch_records()."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        with patch.object(AutoCareAPI, "authenticate", return_value="test-token"):
+            self.client = AutoCareAPI("id", "secret", "user", "pass")
+        self.client.token_expires_at = float("inf")
+        self.client.token = "test-token"
+
+    def teardown_method(self):
+        """Clean up after tests."""
+        self.client.close()
+
+    def test_live_counters_and_time_split(self, requests_mock):
+        _mock_pages(requests_mock)
+        stats = FetchStats()
+        records = self.client.fetch_records("vcdb", "Vehicle", stats=stats)
+
+        next(records)
+        assert stats.running and stats.pages == 1 and stats.records == 0
+        next(records)
+        assert stats.records == 1
+        assert list(records) == [{"VehicleID": 3}]
+
+        assert not stats.running
+        assert (stats.records, stats.pages) == (3, 2)
+        assert stats.bytes == len(b'[{"VehicleID": 1}, {"VehicleID": 2}]') + len(
+            b'[{"VehicleID": 3}]'
+        )
+        assert stats.network_seconds > 0 and stats.decode_seconds > 0
+        assert stats.convert_seconds == 0
+        assert stats.records_per_second > 0
+        assert self.client.last_fetch_stats is stats
+        assert "vcdb.Vehicle (done)" in stats.summary()
+        assert stats.to_dict()["records"] == 3
+
+    def test_consumer_and_convert_time(self, requests_mock):
+        _mock_pages(requests_mock)
+
+        class Slow:
+            @classmethod
+            def from_dict(cls, record):
+                time.sleep(0.01)
+                return record
+
+        for _ in self.client.fetch_records("vcdb", "Vehicle", model=Slow):
+            time.sleep(0.01)
+
+        stats = self.client.last_fetch_stats
+        assert stats.convert_seconds >= 0.03
+        assert stats.consumer_seconds >= 0.03
+        assert stats.elapsed >= stats.convert_seconds + stats.consumer_seconds
+
+    def test_limit_stops_without_another_request(self, requests_mock):
+        _mock_pages(requests_mock)
+        records = list(self.client.fetch_records("vcdb", "Vehicle", limit=2))
+        assert len(records) == 2
+        assert requests_mock.call_count == 1
+        assert self.client.last_fetch_stats.records == 2
+
+    def test_counts_retries_from_response_history(self, requests_mock):
+        _mock_pages(requests_mock)
+        history = (
+            SimpleNamespace(status=429),
+            SimpleNamespace(status=503),
+        )
+        with patch.object(AutoCareAPI, "_retry_history", return_value=history):
+            stats = FetchStats()
+            list(self.client.fetch_records("vcdb", "Vehicle", stats=stats))
+        assert (stats.retries, stats.throttles) == (4, 2)
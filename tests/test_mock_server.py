@@ -0,0 +1,112 @@
+"""Tests for the offline mock AutoCare server used by the benchmarks."""
+
+import pytest
+import requests
+
+from autocare.databases.padb import PartAttributeAssignment
+from autocare.databases.vcdb import Vehicle
+from autocare.stats import FetchStats
+from benchmarks.mock_server import MockAutoCareServer, MockConfig
+
+
+@pytest.fixture
+def server():
+    """Mock server with a few hundred records per table."""
+    config = MockConfig(
+        scale=0.002,
+        page_size=50,
+        tables=["Vehicle", "Make"],
+        databases={"padb": ["PartAttributeAssignment"]},
+    )
+    with MockAutoCareServer(config) as server:
+        yield server
+
+
+class TestMockServer:
+    """Test the mock server through the real client."""
+
+    def test_fetch_follows_pagination(self, server):
+        client = server.client()
+        expected = server.records("Vehicle")
+        stats = FetchStats()
+
+        records = list(client.fetch_records("vcdb", "Vehicle", stats=stats))
+
+        assert records == expected
+        assert stats.pages == -(-len(expected) // 50)
+        assert server.stats.pages == stats.pages
+        assert server.stats.tokens == 1
+        client.close()
+
+    def test_page_size_and_model(self, server):
+        client = server.client()
+        vehicles = list(
+            client.fetch_records("vcdb", "Vehicle", page_size=7, model=Vehicle)
+        )
+
+        assert len(vehicles) == len(server.records("Vehicle"))
+        assert isinstance(vehicles[0], Vehicle)
+        assert server.stats.pages == -(-len(vehicles) // 7)
+        client.close()
+
+    def test_metadata_endpoints(self, server):
+        client = server.client()
+
+        databases = client.list_databases()
+        tables = client.list_tables("vcdb")
+
+        assert "vcdb" in [db.name for db in databases]
+        assert [table.name for table in tables] == ["Vehicle", "Make"]
+        assert client.list_tables("pcdb") == []
+        client.close()
+
+    def test_serves_other_databases(self, server):
+        client = server.client()
+        tables = client.list_tables("padb")
+        assignments = list(
+            client.fetch_records(
+                "padb", "PartAttributeAssignment", model=PartAttributeAssignment
+            )
+        )
+
+        assert [table.name for table in tables] == ["PartAttributeAssignment"]
+        assert tables[0].record_count == len(assignments)
+        assert len(assignments) == len(
+            server.records("PartAttributeAssignment", "padb")
+        )
+        assert isinstance(assignments[0], PartAttributeAssignment)
+        client.close()
+
+    def test_record_factory(self):
+        def factory(db_name, table, scale, seed):
+            return ({"db": db_name, "table": table, "n": n} for n in range(120))
+
+        config = MockConfig(page_size=50, tables=["Make"], record_factory=factory)
+        with MockAutoCareServer(config) as server:
+            client = server.client()
+            records = list(client.fetch_records("pcdb", "Parts"))
+            tables = client.list_tables("vcdb")
+            client.close()
+
+        assert records == [{"db": "pcdb", "table": "Parts", "n": n} for n in range(120)]
+        assert [(table.name, table.record_count) for table in tables] == [("Make", 120)]
+
+    def test_requires_token(self, server):
+        response = requests.get(f"{server.url}/api/v1.0/databases", timeout=5)
+
+        assert response.status_code == 401
+        assert server.stats.unauthorized == 1
+
+    def test_injected_faults_are_retried(self, server):
+        server.config.throttle_rate = 0.2
+        server.config.error_rate = 0.05
+        client = server.client(max_retries=10)
+        client.session.adapters["http://"].max_retries.backoff_factor = 0
+        stats = FetchStats()
+
+        records = list(client.fetch_records("vcdb", "Vehicle", stats=stats))
+
+        assert records == server.records("Vehicle")
+        assert server.stats.throttles + server.stats.errors > 0
+        assert stats.retries == server.stats.throttles + server.stats.errors
+        client.close()
@@ -0,0 +1,73 @@
+"""Tests for the package namespace and its import-time behavior."""
+
+import subprocess
+import sys
+
+import pytest
+
+import autocare
+
+
+def _run(code):
+    """Run code in a fresh interpreter and return its stdout."""
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+class TestLazyImports:
+    """Test the lazy top-level namespace."""
+
+    def test_import_is_lazy_and_side_effect_free(self):
+        output = _run(
+            "import logging, sys, autocare; "
+            "print(sorted(m for m in ('requests', 'urllib3', 'autocare.client', "
+            "'autocare.databases.vcdb') if m in sys.modules)); "
+            "print(logging.getLogger().handlers, logging.getLogger().level)"
+        )
+        assert output.splitlines() == ["[]", "[] 30"]
+
+    def test_client_import_does_not_configure_logging(self):
+        output = _run(
+            "import logging, autocare.client; print(logging.getLogger().handlers)"
+        )
+        assert output == "[]"
+
+    def test_client_import_skips_optional_machinery(self):
+        output = _run(
+            "import sys, autocare.client; "
+            "print(sorted(m for m in ('cProfile', 'tracemalloc', 'sqlite3', "
+            "'autocare.http_cache') if m in sys.modules))"
+        )
+        assert output == "[]"
+
+    def test_sink_import_does_not_load_profilers(self):
+        output = _run(
+            "import sys, autocare.sinks.sqlite; "
+            "print(sorted(m for m in ('cProfile', 'tracemalloc') "
+            "if m in sys.modules))"
+        )
+        assert output == "[]"
+
+    def test_subpackages_resolve_as_attributes(self):
+        output = _run(
+            "import autocare; "
+            "print(autocare.databases.vcdb.TABLES[0], autocare.standards.aces.VERSIONS, "
+            "autocare.compatibility.field_mapping.MIGRATIONS is not None, "
+            "autocare.client.AutoCareAPI.__name__)"
+        )
+        assert output.split()[-2:] == ["True", "AutoCareAPI"]
+
+    def test_public_names_resolve(self):
+        for name in autocare.__all__:
+            assert getattr(autocare, name) is not None
+        from autocare.client import AutoCareAPI
+        from autocare.databases import vcdb
+
+        assert autocare.AutoCareAPI is AutoCareAPI
+        assert autocare.vcdb is vcdb
+        assert set(autocare.__all__) <= set(dir(autocare))
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError, match="no attribute 'missing'"):
+            autocare.missing  # noqa: B018
@@ -0,0 +1,220 @@
+"""Tests for streaming PIES reading and writing."""
+
+import gzip
+import io
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from autocare.standards.pies_reader import Item, PIESReader, SegmentRecord, iter_items
+from autocare.standards.pies_writer import PIESWriter, write_pies
+
+PIES_72 = b"""<?xml version="1.0" encoding="UTF-8"?>
+<PIES version="7.2">
+  <Header>
+    <PIESVersion>7.2</PIESVersion>
+    <BlanketEffectiveDate>2026-01-28</BlanketEffectiveDate>
+  </Header>
+  <PriceSheets>
+    <PriceSheet MaintenanceType="A"><PriceSheetNumber>PS1</PriceSheetNumber></PriceSheet>
+  </PriceSheets>
+  <Items>
+    <Item MaintenanceType="A">
+      <HazardousMaterialCode>N</HazardousMaterialCode>
+      <ItemLevelGTIN GTINQualifier="UP">00012345678905</ItemLevelGTIN>
+      <PartNumber>ABC123</PartNumber>
+      <BrandAAIAID>BBBB</BrandAAIAID>
+      <PartTerminologyID>1896</PartTerminologyID>
+      <Descriptions>
+        <Description MaintenanceType="A" DescriptionCode="DES" LanguageCode="EN">Brake Pad Set</Description>
+        <Description MaintenanceType="A" DescriptionCode="MKT" LanguageCode="EN" Sequence="2">Quiet &amp; clean</Description>
+      </Descriptions>
+      <Prices>
+        <Pricing MaintenanceType="A" PriceType="LST">
+          <CurrencyCode>USD</CurrencyCode>
+          <Price UOM="PE">49.99</Price>
+        </Pricing>
+      </Prices>
+      <ExtendedInformation>
+        <ExtendedProductInformation EXPICode="CTO" LanguageCode="EN">US</ExtendedProductInformation>
+      </ExtendedInformation>
+      <ProductAttributes>
+        <ProductAttribute AttributeID="Material" PADBAttribute="N">Ceramic</ProductAttribute>
+        <ProductAttribute AttributeID="2" PADBAttribute="Y" AttributeUOM="IN" RecordNumber="1">4.5</ProductAttribute>
+      </ProductAttributes>
+      <Packages>
+        <Package MaintenanceType="A">
+          <PackageUOM>EA</PackageUOM>
+          <Dimensions UOM="IN"><MerchandisingHeight>2</MerchandisingHeight></Dimensions>
+          <StackingFactor>4</StackingFactor>
+        </Package>
+      </Packages>
+      <PartInterchangeInfo>
+        <PartInterchange MaintenanceType="A" BrandAAIAID="CCCC">
+          <PartNumber>X-1</PartNumber>
+        </PartInterchange>
+      </PartInterchangeInfo>
+      <DigitalAssets>
+        <DigitalFileInformation MaintenanceType="A">
+          <FileName>abc123.jpg</FileName>
+          <AssetType>P04</AssetType>
+        </DigitalFileInformation>
+      </DigitalAssets>
+    </Item>
+    <Item MaintenanceType="D">
+      <PartNumber>XYZ789</PartNumber>
+      <ProductAttributes>
+        <ProductAttribute AttributeID="Color" PADBAttribute="N">Black</ProductAttribute>
+      </ProductAttributes>
+    </Item>
+  </Items>
+  <Trailer><ItemCount>2</ItemCount><TransactionDate>2026-01-28</TransactionDate></Trailer>
+</PIES>
+"""
+
+
+class TestPIESReader:
+    """Test incremental PIES parsing."""
+
+    def test_parse_items(self):
+        """Test typed Item records and their segments."""
+        items = list(PIESReader(io.BytesIO(PIES_72)))
+
+        assert len(items) == 2
+        item = items[0]
+        assert isinstance(item, Item)
+        assert item.maintenance_type == "A"
+        assert item.part_number == "ABC123"
+        assert item.brand_id == "BBBB"
+        assert item.part_terminology_id == 1896
+        assert item.fields == [
+            SegmentRecord("HazardousMaterialCode", value="N"),
+            SegmentRecord("ItemLevelGTIN", {"GTINQualifier": "UP"}, "00012345678905"),
+        ]
+        assert item.text("ItemLevelGTIN") == "00012345678905"
+        assert [(d.code, d.value) for d in item.descriptions] == [
+            ("DES", "Brake Pad Set"),
+            ("MKT", "Quiet & clean"),
+        ]
+        assert item.descriptions[1].sequence == 2
+        assert item.prices[0].attributes["PriceType"] == "LST"
+        assert item.prices[0].text("CurrencyCode") == "USD"
+        assert item.prices[0].children[1].attributes == {"UOM": "PE"}
+        assert item.prices[0].children[1].value == "49.99"
+        assert item.extended_info[0].code == "CTO"
+        assert item.extended_info[0].value == "US"
+
+        padb = item.attributes[1]
+        assert not item.attributes[0].padb_attribute
+        assert (padb.attribute_id, padb.value, padb.uom) == ("2", "4.5", "IN")
+        assert padb.padb_attribute and padb.record_number == 1
+
+        package = item.packages[0]
+        assert [child.tag for child in package.children] == [
+            "PackageUOM",
+            "Dimensions",
+            "StackingFactor",
+        ]
+        assert package.children[1].attributes == {"UOM": "IN"}
+        assert package.children[1].text("MerchandisingHeight") == "2"
+        assert item.interchanges[0].text("PartNumber") == "X-1"
+        assert item.digital_assets[0].text("AssetType") == "P04"
+
+    def test_repeated_and_interleaved_leaves(self):
+        """Test that leaf order, repeats and attributes are kept."""
+        document = b"""<PIES version="7.2"><Items><Item>
+          <ItemLevelGTIN GTINQualifier="UP">00012345678905</ItemLevelGTIN>
+          <PartNumber>P1</PartNumber>
+          <PartInterchangeInfo>
+            <PartInterchange BrandAAIAID="CCCC">
+              <PartNumber>X-1</PartNumber>
+              <InterchangeQuantity>1</InterchangeQuantity>
+              <PartNumber>X-2</PartNumber>
+            </PartInterchange>
+          </PartInterchangeInfo>
+        </Item></Items></PIES>"""
+        (item,) = iter_items(io.BytesIO(document))
+
+        assert item.fields == [
+            SegmentRecord("ItemLevelGTIN", {"GTINQualifier": "UP"}, "00012345678905")
+        ]
+        assert item.interchanges[0].children == [
+            SegmentRecord("PartNumber", value="X-1"),
+            SegmentRecord("InterchangeQuantity", value="1"),
+            SegmentRecord("PartNumber", value="X-2"),
+        ]
+
+    def test_header_trailer_and_version(self):
+        """Test document metadata captured while streaming."""
+        reader = PIESReader(io.BytesIO(PIES_72))
+        list(reader)
+        assert reader.version == "7.2"
+        assert reader.header["BlanketEffectiveDate"] == "2026-01-28"
+        assert reader.trailer_item_count == 2
+        assert reader.item_count == 2
+
+    def test_segment_selection(self):
+        """Test that only selected segments are converted."""
+        items = list(iter_items(io.BytesIO(PIES_72), segments={"F01"}))
+        assert [a.value for a in items[0].attributes] == ["Ceramic", "4.5"]
+        assert items[1].attributes[0].value == "Black"
+        assert items[0].descriptions == []
+        assert items[0].packages == []
+        assert items[0].part_number == "ABC123"
+
+    def test_small_chunks_and_gzip(self, tmp_path):
+        """Test chunked feeding and gzipped input."""
+        path = tmp_path / "items.xml.gz"
+        with gzip.open(path, "wb") as f:
+            f.write(PIES_72)
+        assert [i.part_number for i in PIESReader(str(path), chunk_size=11)] == [
+            "ABC123",
+            "XYZ789",
+        ]
+
+    def test_invalid_arguments(self):
+        """Test unsupported versions and segment codes."""
+        with pytest.raises(ValueError, match="Unsupported item segments"):
+            PIESReader(io.BytesIO(PIES_72), segments={"Z99"})
+        document = PIES_72.replace(b'version="7.2"', b'version="6.5"')
+        with pytest.raises(ValueError, match="Unsupported PIES version"):
+            list(iter_items(io.BytesIO(document)))
+
+
+class TestPIESWriter:
+    """Test streaming PIES serialization."""
+
+    def test_round_trip(self):
+        """Test items written and read back unchanged."""
+        items = list(iter_items(io.BytesIO(PIES_72)))
+        out = io.BytesIO()
+        assert write_pies(out, iter(items), header={"PIESVersion": "8.0"}) == 2
+
+        reader = PIESReader(io.BytesIO(out.getvalue()))
+        assert list(reader) == items
+        assert reader.version == "8.0"
+        assert reader.trailer_item_count == 2
+
+    def test_round_trip_preserves_items_xml(self):
+        """Test that written Items match the input XML exactly."""
+        out = io.BytesIO()
+        write_pies(out, iter_items(io.BytesIO(PIES_72)), version="7.2")
+
+        def items_xml(document):
+            items = ET.fromstring(document).find("Items")
+            return ET.canonicalize(ET.tostring(items), strip_text=True)
+
+        assert items_xml(out.getvalue()) == items_xml(PIES_72)
+
+    def test_v8_segment_rejected_for_v72(self, tmp_path):
+        """Test that 8.0-only segments cannot be written as 7.2."""
+        item = Item(
+            part_number="P1", packaging_items=[SegmentRecord("PackagingItemsPackage")]
+        )
+        with pytest.raises(ValueError, match="I01"):
+            write_pies(tmp_path / "items.xml", [item], version="7.2")
+
+        path = tmp_path / "items.xml.gz"
+        with PIESWriter(path) as writer:
+            writer.write(item)
+        assert list(iter_items(str(path))) == [item]
@@ -0,0 +1,111 @@
+"""Tests for the opt-in profiling mode."""
+
+from unittest.mock import patch
+
+import pytest
+
+from autocare import profiling
+from autocare.client import AutoCareAPI
+from autocare.compatibility.field_mapping import migrate_vcdb_records
+from autocare.profiling import Profiler, enable_profiling, get_profiler, profiled
+from autocare.sinks.sqlite import SQLiteLoader
+
+VEHICLE_URL = "https://vcdb.autocarevip.com/api/v2.0/vcdb/Vehicle"
+
+
+@pytest.fixture(autouse=True)
+def reset_profiling():
+    """Let each test configure profiling mode from scratch."""
+    profiling._profiler = None
+    profiling._configured = False
+    yield
+    profiling._profiler = None
+    profiling._configured = False
+
+
+def _client(**kwargs):
+    with patch.object(AutoCareAPI, "authenticate", return_value="test-token"):
+        client = AutoCareAPI("id", "secret", "user", "pass", **kwargs)
+    client.token_expires_at = float("inf")
+    client.token = "test-token"
+    return client
+
+
+def _read(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+class TestProfiling:
+    """Test report collection for fetches, migrations and sinks."""
+
+    def test_off_by_default(self, monkeypatch):
+        monkeypatch.delenv(profiling.PROFILE_ENV, raising=False)
+        assert get_profiler() is None
+        assert _client().profiler is None
+
+    def test_environment_variable(self, monkeypatch, tmp_path):
+        monkeypatch.setenv(profiling.PROFILE_ENV, str(tmp_path))
+        profiler = get_profiler()
+        assert profiler is not None and profiler.directory == str(tmp_path)
+        assert _client().profiler is profiler
+
+    def test_fetch_report(self, requests_mock, tmp_path):
+        requests_mock.get(VEHICLE_URL, json=[{"VehicleID": 1}, {"VehicleID": 2}])
+        profiler = Profiler(tmp_path, top=10)
+        client = _client(profile=profiler)
+
+        assert len(list(client.fetch_records("vcdb", "Vehicle"))) == 2
+
+        [report] = profiler.reports
+        assert report.endswith("-fetch-vcdb.Vehicle.txt")
+        text = _read(report)
+        assert "Top functions by cumulative time" in text
+        assert "_fetch_pages" in text
+        assert "Top allocation sites" in text
+        assert (tmp_path / report.replace(".txt", ".prof")).exists()
+        assert get_profiler() is None
+
+    def test_nested_runs_report_once(self, requests_mock, tmp_path):
+        requests_mock.get(VEHICLE_URL, json=[{"VehicleID": 1}])
+        profiler = enable_profiling(tmp_path, memory=False)
+        client = _client()
+
+        migrated = list(
+            migrate_vcdb_records(client.fetch_records("vcdb", "Vehicle"), "1.0", "2.0")
+        )
+        assert len(migrated) == 1
+        assert len(profiler.reports) == 1
+        assert "migrate-vcdb-1.0-2.0" in profiler.reports[0]
+        assert "_fetch_pages" in _read(profiler.reports[0])
+
+    def test_sink_report_per_table(self, tmp_path):
+        profiler = enable_profiling(tmp_path / "profiles", memory=False)
+        with SQLiteLoader(tmp_path / "db.sqlite") as loader:
+            loader.load("Make", [{"MakeID": 1, "MakeName": "Acura"}])
+            loader.load("Model", [{"ModelID": 1, "ModelName": "TLX"}])
+        assert [r.rsplit("-", 1)[-1] for r in profiler.reports] == [
+            "Make.txt",
+            "Model.txt",
+        ]
+
+    def test_decorator_label(self, tmp_path):
+        @profiled("work-{name}-{missing}")
+        def work(name, size=3):
+            return list(range(size))
+
+        assert work("a") == [0, 1, 2]
+        profiler = enable_profiling(tmp_path, memory=False)
+        assert work("b", size=2) == [0, 1]
+        assert profiler.reports[0].endswith("-work-b-.txt")
+
+    def test_decorator_label_uses_defaults(self, tmp_path):
+        @profiled("work-{name}-{source}-{target}")
+        def work(name, source="1.0", target="2.0"):
+            return name
+
+        profiler = enable_profiling(tmp_path, memory=False)
+        assert work("a") == "a"
+        assert work("b", target="3.0") == "b"
+        assert profiler.reports[0].endswith("-work-a-1.0-2.0.txt")
+        assert profiler.reports[1].endswith("-work-b-1.0-3.0.txt")
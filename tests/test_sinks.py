@@ -0,0 +1,419 @@
+"""Tests for fetch_records() sinks."""
+
+import gzip
+import json
+import os
+import sqlite3
+from unittest.mock import MagicMock
+
+import pytest
+
+from autocare.client import TableInfo
+from autocare.databases import vcdb
+from autocare.sinks.base import (
+    default_model,
+    model_columns,
+    prefetch,
+    resolve_columns,
+    row_batches,
+)
+from autocare.sinks.dump import Manifest, dump_records, dump_tables, verify_manifest
+from autocare.sinks.parquet import arrow_schema, export_parquet, write_parquet
+from autocare.sinks.postgres import (
+    CopyFormat,
+    PostgresLoader,
+    csv_chunks,
+    merge_sql,
+    primary_key_sql,
+)
+from autocare.sinks.sqlite import SQLiteLoader, create_table_sql, load_sqlite
+
+MAKES = [
+    {"MakeID": 1, "MakeName": "Ford", "CultureID": "en-US"},
+    {"MakeID": 2, "MakeName": "Honda", "CultureID": "null"},
+]
+
+
+def _fake_client(tables):
+    """Client stub serving table name -> records."""
+    client = MagicMock()
+    client.list_tables.return_value = [
+        TableInfo(name=name, database="vcdb") for name in tables
+    ]
+    client.fetch_records.side_effect = lambda db, table, **kwargs: iter(tables[table])
+    return client
+
+
+class TestSinkSchema:
+    """Test schema resolution shared by the sinks."""
+
+    def test_model_columns_unwrap_optional(self):
+        columns = dict(model_columns(vcdb.Make))
+        assert columns["MakeID"] is int
+        assert columns["MakeName"] is str
+        assert columns["EffectiveDateTime"] is str
+        assert "extra" not in columns
+
+    def test_default_model(self):
+        assert default_model("vcdb", "BaseVehicle") is vcdb.BaseVehicle
+        assert default_model("vcdb", "Abbreviation") is None
+        assert default_model("nope", "Make") is None
+
+    def test_model_columns_extended_by_table_info(self):
+        columns, _ = resolve_columns([], vcdb.Year, ["YearID", "Note"])
+        assert columns[-1] == ("Note", None)
+        assert [name for name, _ in columns].count("YearID") == 1
+
+    def test_columns_from_first_record(self):
+        columns, records = resolve_columns(iter(MAKES))
+        assert [name for name, _ in columns] == ["MakeID", "MakeName", "CultureID"]
+        assert list(records) == MAKES
+
+
+class TestSQLiteLoader:
+    """Test the SQLite bulk loader."""
+
+    def test_create_table_sql(self):
+        sql = create_table_sql("Make", [("MakeID", int), ("Misc", None)])
+        assert sql == 'CREATE TABLE "Make" ("MakeID" INTEGER, "Misc")'
+
+    def test_load_dicts_and_models(self, tmp_path):
+        path = tmp_path / "vcdb.sqlite"
+        with SQLiteLoader(path) as loader:
+            assert loader.load("Make", MAKES, model=vcdb.Make) == 2
+            years = [vcdb.Year(YearID=year) for year in (2020, 2021)]
+            assert loader.load("Year", years) == 2
+        assert not (tmp_path / "vcdb.sqlite.loading").exists()
+
+        conn = sqlite3.connect(path)
+        assert conn.execute(
+            "SELECT MakeName, CultureID FROM Make ORDER BY MakeID"
+        ).fetchall() == [("Ford", "en-US"), ("Honda", None)]
+        assert conn.execute("SELECT count(*) FROM Year").fetchone() == (2,)
+        indexes = {
+            row[0]
+            for row in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")
+        }
+        assert indexes == {"ix_Make_MakeID", "ix_Year_YearID"}
+        conn.close()
+
+    def test_failed_refresh_keeps_previous_database(self, tmp_path):
+        path = tmp_path / "vcdb.sqlite"
+        with SQLiteLoader(path) as loader:
+            loader.load("Make", MAKES)
+
+        def broken():
+            yield MAKES[0]
+            raise RuntimeError("connection lost")
+
+        with pytest.raises(RuntimeError):
+            with SQLiteLoader(path) as loader:
+                loader.load("Make", broken())
+
+        conn = sqlite3.connect(path)
+        assert conn.execute("SELECT count(*) FROM Make").fetchone() == (2,)
+        conn.close()
+        assert not (tmp_path / "vcdb.sqlite.loading").exists()
+
+    def test_duplicate_table_rejected(self, tmp_path):
+        with SQLiteLoader(tmp_path / "db.sqlite") as loader:
+            loader.load("Make", MAKES)
+            with pytest.raises(ValueError):
+                loader.load("Make", MAKES)
+
+    def test_load_sqlite_from_client(self, tmp_path):
+        client = _fake_client(
+            {
+                "Make": MAKES,
+                "Abbreviation": [{"Abbreviation": "4WD", "Description": "4 Wheel"}],
+            }
+        )
+        counts = load_sqlite(client, tmp_path / "vcdb.sqlite", "vcdb")
+        assert counts == {"Make": 2, "Abbreviation": 1}
+
+        conn = sqlite3.connect(tmp_path / "vcdb.sqlite")
+        declared = {row[1]: row[2] for row in conn.execute("PRAGMA table_info(Make)")}
+        assert declared["MakeID"] == "INTEGER"
+        conn.close()
+
+
+POSTGRES_DSN = os.getenv("AUTOCARE_TEST_POSTGRES_DSN")
+
+
+@pytest.fixture
+def pg_conn():
+    """Connection to a local PostgreSQL, with a scratch schema per test."""
+    psycopg = pytest.importorskip("psycopg")
+    if not POSTGRES_DSN:
+        pytest.skip("AUTOCARE_TEST_POSTGRES_DSN not set")
+    conn = psycopg.connect(POSTGRES_DSN, autocommit=True)
+    conn.execute("DROP SCHEMA IF EXISTS autocare_test CASCADE")
+    conn.execute("CREATE SCHEMA autocare_test")
+    yield conn
+    conn.execute("DROP SCHEMA autocare_test CASCADE")
+    conn.close()
+
+
+class TestPostgresCopy:
+    """Test COPY encoding and PostgreSQL loads."""
+
+    def test_csv_chunks_keep_nulls_and_empty_strings(self):
+        data = b"".join(csv_chunks([(1, None, ""), (2, 'say "hi"', "x")]))
+        assert data == b'"1",,""\n"2","say ""hi""","x"\n'
+
+    def test_csv_chunks_respect_chunk_size(self):
+        chunks = list(csv_chunks(((i, "x" * 100) for i in range(5000)), 64 * 1024))
+        assert len(chunks) > 1
+        assert sum(chunk.count(b"\n") for chunk in chunks) == 5000
+
+    def test_row_batches_coerce_text_columns(self):
+        batches = list(row_batches([(1, 2), (3, None), (5, "6")], [1], 2))
+        assert batches == [[[1, "2"], (3, None)], [(5, "6")]]
+
+    def test_prefetch_propagates_producer_errors(self):
+        def broken():
+            yield 1
+            raise RuntimeError("connection lost")
+
+        seen = []
+        with pytest.raises(RuntimeError):
+            for item in prefetch(broken(), max_items=1):
+                seen.append(item)
+        assert seen == [1]
+
+    def test_merge_sql(self):
+        sql = merge_sql('"t"', '"d"', ["ID", "Name"], ["ID"])
+        assert sql.endswith('ON CONFLICT ("ID") DO UPDATE SET "Name" = EXCLUDED."Name"')
+        assert merge_sql('"t"', '"d"', ["ID"], ["ID"]).endswith("DO NOTHING")
+
+    def test_primary_key_sql(self):
+        assert primary_key_sql('"t"', ["A", "B"]) == (
+            'ALTER TABLE "t" ADD PRIMARY KEY ("A", "B")'
+        )
+
+    @pytest.mark.parametrize("copy_format", list(CopyFormat))
+    def test_replace_then_merge(self, pg_conn, copy_format):
+        loader = PostgresLoader(pg_conn, format=copy_format, schema="autocare_test")
+        assert loader.load("Make", MAKES, model=vcdb.Make) == 2
+        assert loader.load("Make", MAKES[:1], model=vcdb.Make) == 1
+        assert pg_conn.execute(
+            'SELECT count(*) FROM autocare_test."Make"'
+        ).fetchone() == (1,)
+
+        delta = [
+            {"MakeID": 1, "MakeName": "Ford Motor"},
+            {"MakeID": 3, "MakeName": "Kia", "Extra": 1},
+        ]
+        assert loader.load("Make", delta, model=vcdb.Make, mode="merge") == 2
+        assert pg_conn.execute(
+            'SELECT "MakeID", "MakeName", "CultureID" '
+            'FROM autocare_test."Make" ORDER BY 1'
+        ).fetchall() == [(1, "Ford Motor", None), (3, "Kia", None)]
+
+    def test_replace_keeps_index_and_constraint_names(self, pg_conn):
+        def names():
+            indexes = pg_conn.execute(
+                "SELECT indexname FROM pg_indexes "
+                "WHERE schemaname = 'autocare_test' AND tablename = 'Make'"
+            ).fetchall()
+            constraints = pg_conn.execute(
+                "SELECT conname FROM pg_constraint "
+                "WHERE conrelid = 'autocare_test.\"Make\"'::regclass "
+                "AND contype IN ('p', 'u', 'x')"
+            ).fetchall()
+            return sorted(row[0] for row in indexes), sorted(
+                row[0] for row in constraints
+            )
+
+        loader = PostgresLoader(pg_conn, schema="autocare_test")
+        loader.load("Make", MAKES, model=vcdb.Make)
+        pg_conn.execute(
+            'CREATE INDEX make_name_idx ON autocare_test."Make" ("MakeName")'
+        )
+        pg_conn.execute(
+            'ALTER TABLE autocare_test."Make" '
+            'ADD CONSTRAINT make_name_key UNIQUE ("MakeName")'
+        )
+        before = names()
+
+        loader.load("Make", MAKES, model=vcdb.Make)
+        loader.load("Make", MAKES, model=vcdb.Make)
+        assert names() == before
+        assert before == (
+            ["Make_pkey", "make_name_idx", "make_name_key"],
+            ["Make_pkey", "make_name_key"],
+        )
+
+    def test_untyped_columns_and_append(self, pg_conn):
+        loader = PostgresLoader(pg_conn, schema="autocare_test")
+        records = [
+            {"Abbreviation": "4WD", "Code": 4},
+            {"Abbreviation": "", "Code": None},
+        ]
+        assert loader.load("Abbreviation", records) == 2
+        assert loader.load("Abbreviation", records, mode="append") == 2
+        assert pg_conn.execute(
+            'SELECT "Abbreviation", "Code" FROM autocare_test."Abbreviation" LIMIT 2'
+        ).fetchall() == [("4WD", "4"), ("", None)]
+
+    def test_failed_replace_keeps_previous_table(self, pg_conn):
+        loader = PostgresLoader(pg_conn, schema="autocare_test")
+        loader.load("Make", MAKES, model=vcdb.Make)
+
+        def broken():
+            yield MAKES[0]
+            raise RuntimeError("connection lost")
+
+        with pytest.raises(RuntimeError):
+            loader.load("Make", broken(), model=vcdb.Make)
+        assert pg_conn.execute(
+            'SELECT count(*) FROM autocare_test."Make"'
+        ).fetchone() == (2,)
+
+    def test_merge_requires_key(self, pg_conn):
+        loader = PostgresLoader(pg_conn, schema="autocare_test")
+        with pytest.raises(ValueError):
+            loader.load("Abbreviation", [{"Abbreviation": "4WD"}], mode="merge")
+
+
+class TestParquetExport:
+    """Test the streaming Parquet writer."""
+
+    def test_schema_from_model(self):
+        pa = pytest.importorskip("pyarrow")
+        schema = arrow_schema(model_columns(vcdb.Make))
+        assert schema.field("MakeID").type == pa.int64()
+        assert schema.field("MakeName").type == pa.string()
+
+    def test_write_in_row_groups(self, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        records = (
+            {"MakeID": i, "MakeName": f"Make {i % 3}", "CultureID": "null"}
+            for i in range(10)
+        )
+        path = tmp_path / "Make.parquet"
+        assert write_parquet(path, records, model=vcdb.Make, row_group_size=4) == 10
+
+        parquet = pq.ParquetFile(path)
+        assert parquet.metadata.num_row_groups == 3
+        name_column = parquet.metadata.row_group(0).column(
+            parquet.schema_arrow.get_field_index("MakeName")
+        )
+        assert "RLE_DICTIONARY" in name_column.encodings
+        table = parquet.read()
+        assert table.column("MakeID").to_pylist() == list(range(10))
+        assert table.column("CultureID").null_count == 10
+        assert not (tmp_path / "Make.parquet.tmp").exists()
+
+    def test_untyped_columns_become_strings(self, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        records = [{"Abbreviation": "4WD", "Code": 4}, {"Abbreviation": "AWD"}]
+        path = tmp_path / "Abbreviation.parquet"
+        write_parquet(path, records, compression=None)
+        assert pq.read_table(path).to_pylist() == [
+            {"Abbreviation": "4WD", "Code": "4"},
+            {"Abbreviation": "AWD", "Code": None},
+        ]
+
+    def test_export_from_client(self, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        client = _fake_client({"Make": MAKES, "Year": []})
+        counts = export_parquet(client, tmp_path / "vcdb", "vcdb")
+        assert counts == {"Make": 2, "Year": 0}
+        assert pq.read_table(tmp_path / "vcdb" / "Year.parquet").schema.names[-1] == (
+            "YearID"
+        )
+
+
+class TestShardedDump:
+    """Test sharded NDJSON / CSV dumps and their manifests."""
+
+    def test_ndjson_gzip_shards(self, tmp_path):
+        records = ({"VehicleID": i, "Note": f"n{i}" * 20} for i in range(5000))
+        manifest = dump_records(tmp_path, "Vehicle", records, shard_mb=0.02)
+
+        assert manifest.records == 5000
+        assert len(manifest.shards) > 1
+        assert sum(shard.records for shard in manifest.shards) == 5000
+        assert manifest.shards[0].path == "Vehicle-00000.ndjson.gz"
+
+        ids = []
+        for shard in manifest.shards:
+            with gzip.open(tmp_path / shard.path, "rt") as f:
+                lines = f.read().splitlines()
+            assert len(lines) == shard.records
+            ids.extend(json.loads(line)["VehicleID"] for line in lines)
+        assert ids == list(range(5000))
+
+        saved = Manifest.load(tmp_path / "Vehicle.manifest.json")
+        assert saved == manifest
+        assert verify_manifest(tmp_path / "Vehicle.manifest.json") == []
+
+    def test_verify_manifest_detects_changed_shard(self, tmp_path):
+        dump_records(tmp_path, "Make", MAKES, compression=None)
+        with open(tmp_path / "Make-00000.ndjson", "ab") as f:
+            f.write(b"{}\n")
+        assert verify_manifest(tmp_path / "Make.manifest.json") == ["Make-00000.ndjson"]
+
+    def test_failed_redump_leaves_no_stale_manifest(self, tmp_path):
+        def records():
+            for i in range(5000):
+                if i == 4000:
+                    raise RuntimeError("connection lost")
+                yield {"VehicleID": i, "Note": f"n{i}" * 20}
+
+        dump_records(tmp_path, "Vehicle", ({"VehicleID": 1},), compression=None)
+        assert (tmp_path / "Vehicle.manifest.json").exists()
+
+        with pytest.raises(RuntimeError, match="connection lost"):
+            dump_records(
+                tmp_path, "Vehicle", records(), compression=None, shard_mb=0.02
+            )
+        assert os.listdir(tmp_path) == []
+
+    def test_csv_shards_repeat_header(self, tmp_path):
+        records = [{"MakeID": i, "MakeName": "null"} for i in range(3000)]
+        manifest = dump_records(
+            tmp_path,
+            "Make",
+            records,
+            format="csv",
+            compression=None,
+            shard_mb=0.01,
+            model=vcdb.Make,
+        )
+        assert len(manifest.shards) > 1
+        for shard in manifest.shards:
+            with open(tmp_path / shard.path) as f:
+                lines = f.read().splitlines()
+            assert lines[0] == ",".join(manifest.columns)
+            assert len(lines) == shard.records + 1
+        assert lines[-1].endswith(",2999,")
+
+    def test_zstd_shards(self, tmp_path):
+        zstandard = pytest.importorskip("zstandard")
+        manifest = dump_records(tmp_path, "Make", MAKES, compression="zstd")
+        shard = tmp_path / manifest.shards[0].path
+        assert shard.name == "Make-00000.ndjson.zst"
+        with open(shard, "rb") as f:
+            data = zstandard.ZstdDecompressor().stream_reader(f).read()
+        assert [json.loads(line) for line in data.splitlines()] == MAKES
+
+    def test_model_records_and_errors(self, tmp_path):
+        manifest = dump_records(
+            tmp_path,
+            "Year",
+            [vcdb.Year(YearID=2020, extra={"Note": "x"})],
+            compression=None,
+        )
+        with open(tmp_path / manifest.shards[0].path) as f:
+            assert json.loads(f.read())["Note"] == "x"
+        with pytest.raises(ValueError):
+            dump_records(tmp_path, "Year", [], compression="lz4")
+
+    def test_dump_tables_from_client(self, tmp_path):
+        client = _fake_client({"Make": MAKES, "Year": []})
+        manifests = dump_tables(client, tmp_path, "vcdb", format="csv")
+        assert manifests["Make"].records == 2
+        assert manifests["Year"].shards == []
+        assert (tmp_path / "Year.manifest.json").exists()
@@ -0,0 +1,423 @@
+"""Tests for reference-data validation engines."""
+
+from autocare.databases import padb
+from autocare.standards.aces_reader import App, AppQualifier
+from autocare.validation.aces import ACESErrorCode, ACESValidator
+from autocare.validation.aces_overlap import OverlapAnalyzer, OverlapKind
+from autocare.validation.padb import AttributeErrorCode, AttributeValidator
+from autocare.validation.vehicle_index import VehicleIndex, pack
+
+
+def _build_attribute_validator():
+    """Build a small validator from API-shaped PAdb records."""
+    return AttributeValidator.from_records(
+        assignments=[
+            {"PAPTID": 1, "PartTerminologyID": 1896, "PAID": 10060},
+            {"PAPTID": 2, "PartTerminologyID": 1896, "PAID": 20001},
+            {"PAPTID": 3, "PartTerminologyID": 1896, "PAID": 30001},
+            {"PAPTID": 4, "PartTerminologyID": 1684, "PAID": 10060},
+        ],
+        valid_values=[
+            {"ValidValueID": 1, "ValidValue": "Yes"},
+            {"ValidValueID": 2, "ValidValue": "No"},
+        ],
+        valid_value_assignments=[
+            {"PAPTID": 1, "ValidValueID": 1},
+            {"PAPTID": 1, "ValidValueID": 2},
+            {"PAPTID": 4, "ValidValueID": 1},
+            {"PAPTID": 4, "ValidValueID": 2},
+        ],
+        uom_codes=[
+            {"MetaUOMID": 1, "UOMCode": "IN"},
+            {"MetaUOMID": 2, "UOMCode": "MM"},
+        ],
+        uom_code_assignments=[
+            {"PAPTID": 2, "MetaUOMID": 1},
+            {"PAPTID": 2, "MetaUOMID": 2},
+        ],
+        attributes=[{"PAID": 10060, "PAName": "12 Volt Compatible"}],
+    )
+
+
+class TestAttributeValidator:
+    """Test PAdb attribute validation."""
+
+    def test_from_records_compiles_assignments(self):
+        """Test that each assignment is compiled once."""
+        validator = _build_attribute_validator()
+        assert len(validator) == 4
+        assert validator.is_assigned(1896, 10060)
+        assert not validator.is_assigned(1896, 99999)
+        assert validator.attribute_names[10060] == "12 Volt Compatible"
+
+    def test_valid_value_sets_are_interned(self):
+        """Test that identical valid-value sets share one object."""
+        validator = _build_attribute_validator()
+        first = validator.valid_values_for(1896, 10060)
+        second = validator.valid_values_for(1684, 10060)
+        assert first == frozenset({"Yes", "No"})
+        assert first is second
+
+    def test_validate_single_rows(self):
+        """Test each error code for single-row validation."""
+        validator = _build_attribute_validator()
+        assert validator.validate(1896, 10060, "Yes") == AttributeErrorCode.OK
+        assert (
+            validator.validate(1896, 10060, "Maybe") == AttributeErrorCode.INVALID_VALUE
+        )
+        assert (
+            validator.validate(1896, 99999, "Yes")
+            == AttributeErrorCode.UNASSIGNED_ATTRIBUTE
+        )
+        assert validator.validate(1896, 20001, "12", "IN") == AttributeErrorCode.OK
+        assert validator.validate(1896, 20001, "12") == AttributeErrorCode.MISSING_UOM
+        assert (
+            validator.validate(1896, 20001, "12", "FT")
+            == AttributeErrorCode.INVALID_UOM
+        )
+        # No valid values or UOMs assigned: free-form text
+        assert validator.validate(1896, 30001, "anything") == AttributeErrorCode.OK
+
+    def test_validate_batch_accepts_string_ids(self):
+        """Test batch validation with IDs as read from XML text."""
+        validator = _build_attribute_validator()
+        codes = validator.validate_batch(
+            [
+                ("1896", "10060", "No", None),
+                ("1896", "abc", "No", None),
+                (1684, 10060, "Maybe", None),
+            ]
+        )
+        assert list(codes) == [
+            AttributeErrorCode.OK,
+            AttributeErrorCode.MALFORMED_ROW,
+            AttributeErrorCode.INVALID_VALUE,
+        ]
+
+    def test_iter_errors_reports_row_indexes(self):
+        """Test that iter_errors yields global row indexes across batches."""
+        validator = _build_attribute_validator()
+        rows = [(1896, 10060, "Yes", None)] * 5 + [(1896, 10060, "Bad", None)]
+        errors = list(validator.iter_errors(rows, batch_size=2))
+        assert errors == [(5, AttributeErrorCode.INVALID_VALUE)]
+
+    def test_from_records_accepts_models(self):
+        """Test building from typed padb models."""
+        validator = AttributeValidator.from_records(
+            assignments=[
+                padb.PartAttributeAssignment(
+                    PartTerminologyID=1896, PAID=10060, PAPTID=1
+                )
+            ],
+            valid_values=[padb.ValidValue(ValidValueID=1, ValidValue="Yes")],
+            valid_value_assignments=[
+                padb.ValidValueAssignment(PAPTID=1, ValidValueID=1)
+            ],
+        )
+        assert validator.validate(1896, 10060, "Yes") == AttributeErrorCode.OK
+        assert validator.validate(1896, 10060, "No") == AttributeErrorCode.INVALID_VALUE
+
+
+class TestVehicleIndex:
+    """Test the shared per-BaseVehicle bitmask index."""
+
+    def test_from_records(self):
+        """Test vehicle numbering and attribute masks, including EngineConfig."""
+        index = VehicleIndex.from_records(
+            vehicles=[
+                {"VehicleID": 1, "BaseVehicleID": 100, "SubModelID": 20},
+                {"VehicleID": 2, "BaseVehicleID": 100, "SubModelID": 20},
+                {"VehicleID": 3, "BaseVehicleID": 101},
+            ],
+            vehicle_to={
+                "VehicleToEngineConfig": [{"VehicleID": 2, "EngineConfigID": 500}],
+                "VehicleToDriveType": [],
+            },
+            engine_configs=[{"EngineConfigID": 500, "EngineBaseID": 55}],
+        )
+        assert index.vehicle_ids == {100: [1, 2], 101: [3]}
+        assert index.attribute_masks["SubModel"] == {pack(100, 20): 0b11}
+        assert index.attribute_masks["EngineConfig"] == {pack(100, 500): 0b10}
+        assert index.attribute_masks["EngineBase"] == {pack(100, 55): 0b10}
+        assert index.attribute_masks["DriveType"] == {}
+        assert index.engine_config_ids == {500}
+
+
+def _build_aces_validator():
+    """Build a small ACES validator from API-shaped reference records."""
+    return ACESValidator.from_records(
+        base_vehicles=[
+            {"BaseVehicleID": 100, "YearID": 2010, "MakeID": 1, "ModelID": 10},
+            {"BaseVehicleID": 101, "YearID": 2011, "MakeID": 1, "ModelID": 10},
+        ],
+        vehicles=[
+            {"VehicleID": 1, "BaseVehicleID": 100, "SubModelID": 20, "RegionID": 1},
+            {"VehicleID": 2, "BaseVehicleID": 101, "SubModelID": 21, "RegionID": 1},
+        ],
+        vehicle_to={
+            "VehicleToEngineConfig": [{"VehicleID": 1, "EngineConfigID": 500}],
+            "VehicleToDriveType": [{"VehicleID": 2, "DriveTypeID": 7}],
+        },
+        engine_configs=[{"EngineConfigID": 500, "EngineBaseID": 55}],
+        parts=[{"PartTerminologyID": 1896}],
+        positions=[{"PositionID": 22}],
+        qualifiers=[{"QualifierID": 1234}],
+    )
+
+
+class TestACESValidator:
+    """Test ACES reference validation."""
+
+    def test_valid_app(self):
+        """Test that an app referencing known IDs has no errors."""
+        validator = _build_aces_validator()
+        app = App(
+            id="1",
+            base_vehicle_id=100,
+            vehicle_attributes={"SubModel": 20, "EngineConfig": 500, "EngineBase": 55},
+            qualifiers=[AppQualifier(qualifier_id=1234)],
+            part_type_id=1896,
+            position_id=22,
+        )
+        assert validator.validate(app) == []
+
+    def test_unknown_references(self):
+        """Test structured errors for unknown reference IDs."""
+        validator = _build_aces_validator()
+        app = App(
+            id="7",
+            base_vehicle_id=999,
+            vehicle_attributes={"EngineConfig": 501},
+            qualifiers=[AppQualifier(qualifier_id=1)],
+            part_type_id=2,
+            position_id=3,
+        )
+        codes = {(e.code, e.value) for e in validator.validate(app, index=4)}
+        assert codes == {
+            (ACESErrorCode.UNKNOWN_BASE_VEHICLE, 999),
+            (ACESErrorCode.UNKNOWN_ENGINE_CONFIG, 501),
+            (ACESErrorCode.UNKNOWN_PART_TYPE, 2),
+            (ACESErrorCode.UNKNOWN_POSITION, 3),
+            (ACESErrorCode.UNKNOWN_QUALIFIER, 1),
+        }
+        assert {e.index for e in validator.validate(app, index=4)} == {4}
+
+    def test_invalid_attribute_combinations(self):
+        """Test attributes not valid for the base vehicle are rejected."""
+        validator = _build_aces_validator()
+        app = App(
+            id="1",
+            base_vehicle_id=100,
+            vehicle_attributes={"SubModel": 21, "DriveType": 7, "EngineBase": 55},
+            part_type_id=1896,
+        )
+        errors = validator.validate(app)
+        assert [(e.code, e.element) for e in errors] == [
+            (ACESErrorCode.INVALID_ATTRIBUTE_COMBINATION, "SubModel"),
+            (ACESErrorCode.INVALID_ATTRIBUTE_COMBINATION, "DriveType"),
+        ]
+
+    def test_attributes_must_share_a_vehicle(self):
+        """Test attributes valid on their own but never on the same vehicle."""
+        validator = ACESValidator.from_records(
+            base_vehicles=[{"BaseVehicleID": 100}],
+            vehicles=[
+                {"VehicleID": 1, "BaseVehicleID": 100, "SubModelID": 20},
+                {"VehicleID": 2, "BaseVehicleID": 100, "SubModelID": 21},
+            ],
+            vehicle_to={
+                "VehicleToEngineConfig": [
+                    {"VehicleID": 1, "EngineConfigID": 500},
+                    {"VehicleID": 2, "EngineConfigID": 501},
+                ],
+                "VehicleToDriveType": [
+                    {"VehicleID": 1, "DriveTypeID": 7},
+                    {"VehicleID": 2, "DriveTypeID": 7},
+                ],
+            },
+            engine_configs=[{"EngineConfigID": 500}, {"EngineConfigID": 501}],
+            parts=[{"PartTerminologyID": 1896}],
+        )
+
+        def errors(**attributes):
+            app = App(
+                base_vehicle_id=100, vehicle_attributes=attributes, part_type_id=1896
+            )
+            return [(e.element, e.value) for e in validator.validate(app)]
+
+        assert errors(SubModel=20, EngineConfig=500, DriveType=7) == []
+        assert errors(SubModel=21, EngineConfig=501) == []
+        assert errors(SubModel=20, DriveType=7, EngineConfig=501) == [
+            ("EngineConfig", 501)
+        ]
+        # Reported once, plus any attribute invalid on its own
+        assert errors(SubModel=20, EngineConfig=501, DriveType=8) == [
+            ("EngineConfig", 501),
+            ("DriveType", 8),
+        ]
+
+    def test_years_make_model_apps(self):
+        """Test apps that use Years/Make/Model instead of BaseVehicle."""
+        validator = _build_aces_validator()
+        valid = App(
+            years=(2009, 2010),
+            vehicle_attributes={"Make": 1, "Model": 10},
+            part_type_id=1896,
+        )
+        unknown = App(
+            years=(2015, 2016),
+            vehicle_attributes={"Make": 1, "Model": 10},
+            part_type_id=1896,
+        )
+        missing = App(part_type_id=1896)
+        assert validator.validate(valid) == []
+        assert validator.validate(unknown)[0].code == ACESErrorCode.UNKNOWN_VEHICLE
+        assert validator.validate(missing)[0].code == ACESErrorCode.MISSING_VEHICLE
+
+    def test_iter_errors_streams_batches(self):
+        """Test streamed validation keeps global app indexes."""
+        validator = _build_aces_validator()
+        apps = [App(base_vehicle_id=100, part_type_id=1896)] * 4
+        apps.append(App(base_vehicle_id=100, part_type_id=5))
+        errors = list(validator.iter_errors(apps, batch_size=2))
+        assert [(e.index, e.code) for e in errors] == [
+            (4, ACESErrorCode.UNKNOWN_PART_TYPE)
+        ]
+
+    def test_save_and_load(self, tmp_path):
+        """Test snapshot persistence round-trip."""
+        path = tmp_path / "aces-snapshot.json.gz"
+        _build_aces_validator().save(path)
+        validator = ACESValidator.load(path)
+        app = App(base_vehicle_id=100, vehicle_attributes={"SubModel": 21})
+        assert [e.code for e in validator.validate(app)] == [
+            ACESErrorCode.INVALID_ATTRIBUTE_COMBINATION,
+            ACESErrorCode.MISSING_PART_TYPE,
+        ]
+
+
+def _build_overlap_analyzer():
+    """Two base vehicles: 100 with two submodels, 101 with one vehicle."""
+    return OverlapAnalyzer.from_records(
+        vehicles=[
+            {"VehicleID": 1, "BaseVehicleID": 100, "SubModelID": 20, "RegionID": 1},
+            {"VehicleID": 2, "BaseVehicleID": 100, "SubModelID": 21, "RegionID": 1},
+            {"VehicleID": 3, "BaseVehicleID": 101, "SubModelID": 20, "RegionID": 1},
+        ],
+        vehicle_to={
+            "VehicleToEngineConfig": [
+                {"VehicleID": 1, "EngineConfigID": 500},
+                {"VehicleID": 2, "EngineConfigID": 501},
+            ],
+        },
+        engine_configs=[
+            {"EngineConfigID": 500, "EngineBaseID": 55},
+            {"EngineConfigID": 501, "EngineBaseID": 56},
+        ],
+        base_vehicles=[
+            {"BaseVehicleID": 100, "YearID": 2010, "MakeID": 1, "ModelID": 10},
+            {"BaseVehicleID": 101, "YearID": 2011, "MakeID": 1, "ModelID": 10},
+        ],
+    )
+
+
+def _overlap_app(app_id, qty=1, notes=(), **kwargs):
+    """Build an App for part P1 with the given vehicle fields."""
+    return App(
+        id=app_id,
+        part_type_id=1896,
+        position_id=22,
+        part_number="P1",
+        qty=qty,
+        notes=list(notes),
+        **kwargs,
+    )
+
+
+class TestOverlapAnalyzer:
+    """Test duplicate and overlap detection."""
+
+    def test_expand_to_vehicle_ids(self):
+        """Test BaseVehicle, attribute and Years/Make/Model expansion."""
+        analyzer = _build_overlap_analyzer()
+        assert analyzer.vehicle_ids_for(App(base_vehicle_id=100)) == {1, 2}
+        assert analyzer.vehicle_ids_for(
+            App(base_vehicle_id=100, vehicle_attributes={"SubModel": 21})
+        ) == {2}
+        assert analyzer.vehicle_ids_for(
+            App(base_vehicle_id=100, vehicle_attributes={"EngineBase": 55})
+        ) == {1}
+        assert analyzer.vehicle_ids_for(
+            App(years=(2010, 2011), vehicle_attributes={"Make": 1, "Model": 10})
+        ) == {1, 2, 3}
+        assert analyzer.vehicle_ids_for(App(base_vehicle_id=999)) == set()
+
+    def test_duplicates_ignore_note_order(self):
+        """Test apps differing only in note order are duplicates."""
+        analyzer = _build_overlap_analyzer()
+        apps = [
+            _overlap_app("1", base_vehicle_id=100, notes=["A", "B"]),
+            _overlap_app("2", base_vehicle_id=100, notes=["B", "A"]),
+        ]
+        findings = list(analyzer.analyze(apps))
+        assert [(f.kind, f.app_id, f.other_app_id) for f in findings] == [
+            (OverlapKind.DUPLICATE, "1", "2")
+        ]
+        assert findings[0].shared_vehicles == 2
+
+    def test_same_vehicles_with_different_notes(self):
+        """Test apps covering the same vehicles are not reported as subsets."""
+        analyzer = _build_overlap_analyzer()
+        apps = [
+            _overlap_app("1", base_vehicle_id=100, notes=["A"]),
+            _overlap_app("2", base_vehicle_id=100, notes=["B"]),
+        ]
+        findings = list(analyzer.analyze(apps))
+        assert [(f.kind, f.app_id, f.other_app_id) for f in findings] == [
+            (OverlapKind.SAME_VEHICLES, "1", "2")
+        ]
+        assert findings[0].shared_vehicles == 2
+
+    def test_subset_conflicting_qty_and_partial(self):
+        """Test subset, quantity conflict and partial overlap findings."""
+        analyzer = _build_overlap_analyzer()
+        apps = [
+            _overlap_app(
+                "sub", base_vehicle_id=100, vehicle_attributes={"SubModel": 20}
+            ),
+            _overlap_app("base", base_vehicle_id=100),
+            _overlap_app(
+                "qty", qty=2, base_vehicle_id=100, vehicle_attributes={"SubModel": 21}
+            ),
+        ]
+        findings = {(f.kind, f.app_id, f.other_app_id) for f in analyzer.analyze(apps)}
+        assert findings == {
+            (OverlapKind.SUBSET, "sub", "base"),
+            (OverlapKind.CONFLICTING_QTY, "base", "qty"),
+        }
+
+        ymm = [
+            _overlap_app(
+                "ymm", years=(2010, 2011), vehicle_attributes={"Make": 1, "Model": 10}
+            ),
+            _overlap_app("base", base_vehicle_id=100),
+            _overlap_app(
+                "other", base_vehicle_id=101, vehicle_attributes={"SubModel": 20}
+            ),
+        ]
+        findings = [(f.kind, f.app_id, f.other_app_id) for f in analyzer.analyze(ymm)]
+        assert sorted(findings) == [
+            (OverlapKind.SUBSET, "base", "ymm"),
+            (OverlapKind.SUBSET, "other", "ymm"),
+        ]
+
+    def test_different_parts_and_qualifiers_not_compared(self):
+        """Test that apps for different parts or qualifiers never overlap."""
+        analyzer = _build_overlap_analyzer()
+        apps = [
+            _overlap_app("1", base_vehicle_id=100),
+            _overlap_app("2", base_vehicle_id=100, qualifiers=[AppQualifier(5)]),
+            App(id="3", base_vehicle_id=100, part_type_id=1896, part_number="P2"),
+            _overlap_app("4", base_vehicle_id=100, vehicle_attributes={"BedLength": 9}),
+        ]
+        assert list(analyzer.analyze(apps)) == []